@@ -104,6 +104,13 @@ namespace chimera::library::asdl {
         Ensures(!value->valueless_by_exception());
         std::visit(std::forward<Visitor>(visitor), *value);
       }
+      //! visits the value in place so a pass over the tree can change it
+      template <typename Visitor>
+      void rewrite(Visitor &&visitor) {
+        Ensures(value);
+        Ensures(!value->valueless_by_exception());
+        std::visit(std::forward<Visitor>(visitor), *value);
+      }
 
     private:
       std::shared_ptr<ValueT> value;
@@ -119,6 +126,10 @@ namespace chimera::library::asdl {
       struct UnpackDict, struct Yield, struct YieldFrom>;
   struct Name {
     std::string value;
+    //! interned once at parse time so lookups never hash the text
+    object::Symbol symbol{value};
+    //! where this name was last found when it is read
+    object::InlineCache cache{};
   };
   struct ModuleName {
     std::string value;
@@ -448,6 +459,9 @@ namespace chimera::library::asdl {
            const char *source);
     [[nodiscard]] auto doc() const -> const std::optional<DocString> &;
     [[nodiscard]] auto iter() const -> const std::vector<StmtImpl> &;
+    //! folds constants and drops code that can never run, along with
+    //! asserts and, at DISCARD_DOCS, doc strings
+    void optimize(const options::Optimize &level);
     template <typename Stack>
     void finalize(const Module & /*unused*/, Stack &&stack) {
       body.reserve(stack.size());
@@ -471,6 +485,9 @@ namespace chimera::library::asdl {
     Interactive(const options::Optimize &optimize, std::istream &input,
                 const char *source);
     [[nodiscard]] auto iter() const -> const std::vector<StmtImpl> &;
+    //! folds constants and drops code that can never run, along with
+    //! asserts and, at DISCARD_DOCS, doc strings
+    void optimize(const options::Optimize &level);
     template <typename Stack>
     void finalize(const Interactive & /*unused*/, Stack &&stack) {
       body.reserve(stack.size());
@@ -485,6 +502,9 @@ namespace chimera::library::asdl {
     Expression(const options::Optimize &optimize, std::istream &input,
                const char *source);
     [[nodiscard]] auto expr() const -> const ExprImpl &;
+    //! folds constants and drops code that can never run, along with
+    //! asserts and, at DISCARD_DOCS, doc strings
+    void optimize(const options::Optimize &level);
     template <typename Stack>
     void finalize(const Expression & /*unused*/, Stack &&stack) {
       if (auto size = stack.size(); size > 1) {
@@ -0,0 +1,654 @@
+//! folds constants and removes code that can never run after parsing
+
+#include "asdl/asdl.hpp"
+#include "options.hpp"
+
+#include <gsl/gsl>
+
+#include <cstddef>
+#include <cstdint>
+#include <iterator>
+#include <optional>
+#include <tuple>
+#include <utility>
+#include <variant>
+#include <vector>
+
+namespace chimera::library::asdl {
+  namespace {
+    //! folded strings and shift or power operands past these are left for
+    //! run time, so parsing never builds huge constants
+    constexpr std::size_t MAX_STRING = 4096;
+    constexpr std::uint64_t MAX_EXPONENT = 128;
+    //! the value of expressions known before anything runs
+    struct ConstantOf {
+      auto operator()(const NameConstant &nameConstant) const
+          -> std::optional<object::Object> {
+        switch (nameConstant.value) {
+          case NameConstant::FALSE:
+            return object::singleton<object::False>();
+          case NameConstant::NONE:
+            return object::singleton<object::None>();
+          case NameConstant::TRUE:
+            return object::singleton<object::True>();
+        }
+        return {};
+      }
+      auto operator()(const object::Object &object) const
+          -> std::optional<object::Object> {
+        return object;
+      }
+      template <typename Type>
+      auto operator()(const Type & /*value*/) const
+          -> std::optional<object::Object> {
+        return {};
+      }
+    };
+    auto constant_of(const ExprImpl &asdlExpr)
+        -> std::optional<object::Object> {
+      std::optional<object::Object> constant;
+      asdlExpr.visit(
+          [&constant](const auto &value) { constant = ConstantOf{}(value); });
+      return constant;
+    }
+    auto truth(const ExprImpl &asdlExpr) -> std::optional<bool> {
+      auto constant = constant_of(asdlExpr);
+      if (!constant) {
+        return {};
+      }
+      if (constant->get<object::False>() || constant->get<object::None>()) {
+        return false;
+      }
+      if (constant->get<object::True>()) {
+        return true;
+      }
+      if (auto number = constant->get<object::Number>()) {
+        return !(*number == object::Number(0));
+      }
+      if (auto string = constant->get<object::String>()) {
+        return !string->empty();
+      }
+      if (auto bytes = constant->get<object::Bytes>()) {
+        return !bytes->empty();
+      }
+      return {};
+    }
+    auto boolean(bool value) -> ExprImpl {
+      return NameConstant{value ? NameConstant::TRUE : NameConstant::FALSE};
+    }
+    auto number(object::Number &&value) -> std::optional<object::Object> {
+      if (value.is_nan()) {
+        return {};
+      }
+      return object::Object(std::move(value), {});
+    }
+    auto is_zero(const object::Number &value) -> bool {
+      return value == object::Number(0);
+    }
+    auto is_negative(const object::Number &value) -> bool {
+      return value < object::Number(0);
+    }
+    //! operators that raise at run time, or that numbers leave to the
+    //! operator methods, are never folded
+    auto apply(Operator op, const object::Number &left,
+               const object::Number &right) -> std::optional<object::Object> {
+      const auto integers = left.is_int() && right.is_int();
+      switch (op) {
+        case Operator::ADD:
+          return number(left + right);
+        case Operator::SUB:
+          return number(left - right);
+        case Operator::MULT:
+          return number(left * right);
+        case Operator::MAT_MULT:
+          return {};
+        case Operator::DIV:
+          if (is_zero(right)) {
+            return {};
+          }
+          return number(left / right);
+        case Operator::MOD:
+          if (!integers || is_zero(right)) {
+            return {};
+          }
+          return number(left % right);
+        case Operator::POW:
+          if (!integers || is_negative(right) ||
+              !(right < object::Number(MAX_EXPONENT))) {
+            return {};
+          }
+          return number(left.pow(right));
+        case Operator::L_SHIFT:
+          if (!integers || is_negative(right) ||
+              !(right < object::Number(MAX_EXPONENT))) {
+            return {};
+          }
+          return number(left << right);
+        case Operator::R_SHIFT:
+          if (!integers || is_negative(right)) {
+            return {};
+          }
+          return number(left >> right);
+        case Operator::BIT_OR:
+          if (!integers) {
+            return {};
+          }
+          return number(left | right);
+        case Operator::BIT_XOR:
+          if (!integers) {
+            return {};
+          }
+          return number(left ^ right);
+        case Operator::BIT_AND:
+          if (!integers) {
+            return {};
+          }
+          return number(left & right);
+        case Operator::FLOOR_DIV:
+          if (!integers || is_zero(right)) {
+            return {};
+          }
+          return number(left.floor_div(right));
+      }
+      return {};
+    }
+    auto repeat(const object::String &string, const object::Number &count)
+        -> std::optional<object::Object> {
+      if (!count.is_int() || string.empty() || count < object::Number(0) ||
+          object::Number(MAX_STRING) < count) {
+        return {};
+      }
+      const auto times = static_cast<std::uint64_t>(count);
+      if (string.size() * times > MAX_STRING) {
+        return {};
+      }
+      object::String result;
+      for (std::uint64_t idx = 0; idx < times; ++idx) {
+        result.append(string);
+      }
+      return object::Object(std::move(result), {});
+    }
+    auto apply(Operator op, const object::Object &left,
+               const object::Object &right) -> std::optional<object::Object> {
+      const auto leftNumber = left.get<object::Number>();
+      const auto rightNumber = right.get<object::Number>();
+      if (leftNumber && rightNumber) {
+        return apply(op, *leftNumber, *rightNumber);
+      }
+      const auto leftString = left.get<object::String>();
+      const auto rightString = right.get<object::String>();
+      if (op == Operator::ADD && leftString && rightString) {
+        if (leftString->size() + rightString->size() > MAX_STRING) {
+          return {};
+        }
+        return object::Object(*leftString + *rightString, {});
+      }
+      if (op == Operator::MULT && leftString && rightNumber) {
+        return repeat(*leftString, *rightNumber);
+      }
+      if (op == Operator::MULT && leftNumber && rightString) {
+        return repeat(*rightString, *leftNumber);
+      }
+      return {};
+    }
+    class Optimizer {
+    public:
+      //! interactive input keeps expression statements so their values are
+      //! still shown
+      Optimizer(const options::Optimize &level, bool interactive) noexcept
+          : level(level), interactive(interactive) {}
+      void doc(std::optional<DocString> &docString) const {
+        if (level == options::Optimize::DISCARD_DOCS) {
+          docString.reset();
+        }
+      }
+      //! whether control can never continue past the end of stmts
+      auto body(std::vector<StmtImpl> &stmts) const -> bool {
+        std::vector<StmtImpl> kept;
+        kept.reserve(stmts.size());
+        auto terminal = false;
+        for (auto &asdlStmt : stmts) {
+          Result result;
+          asdlStmt.rewrite(
+              [this, &result](auto &value) { result = this->stmt(value); });
+          if (result.replace) {
+            for (auto &replacement : *result.replace) {
+              kept.push_back(std::move(replacement));
+            }
+          } else {
+            kept.push_back(std::move(asdlStmt));
+          }
+          if (result.terminal) {
+            terminal = true;
+            break;
+          }
+        }
+        stmts = std::move(kept);
+        return terminal;
+      }
+      void expr(ExprImpl &asdlExpr) const {
+        std::optional<ExprImpl> folded;
+        asdlExpr.rewrite(
+            [this, &folded](auto &value) { folded = this->fold(value); });
+        if (folded) {
+          asdlExpr = *std::move(folded);
+        }
+      }
+
+    private:
+      //! what replaces a statement, when not the statement itself, and
+      //! whether anything after it can run
+      struct Result {
+        std::optional<std::vector<StmtImpl>> replace{};
+        bool terminal = false;
+      };
+      void expr(std::optional<ExprImpl> &asdlExpr) const {
+        if (asdlExpr) {
+          expr(*asdlExpr);
+        }
+      }
+      void exprs(std::vector<ExprImpl> &asdlExprs) const {
+        for (auto &asdlExpr : asdlExprs) {
+          expr(asdlExpr);
+        }
+      }
+      void arguments(Arguments &args) const {
+        for (auto &arg : args.args) {
+          expr(arg.arg_default);
+        }
+        for (auto &arg : args.kwonlyargs) {
+          expr(arg.arg_default);
+        }
+      }
+      void generators(std::vector<Comprehension> &comprehensions) const {
+        for (auto &comprehension : comprehensions) {
+          expr(comprehension.iter);
+          exprs(comprehension.ifs);
+        }
+      }
+      void keywords(std::vector<Keyword> &asdlKeywords) const {
+        for (auto &keyword : asdlKeywords) {
+          expr(keyword.value);
+        }
+      }
+      void slice(SliceImpl &asdlSlice) const {
+        asdlSlice.rewrite([this](auto &value) { this->slice(value); });
+      }
+      void slice(ExtSlice &extSlice) const {
+        for (auto &dim : extSlice.dims) {
+          slice(dim);
+        }
+      }
+      void slice(Index &index) const { expr(index.value); }
+      void slice(Slice &asdlSlice) const {
+        expr(asdlSlice.lower);
+        expr(asdlSlice.upper);
+        expr(asdlSlice.step);
+      }
+      [[nodiscard]] auto fold(Bin &bin) const -> std::optional<ExprImpl> {
+        exprs(bin.values);
+        auto &values = bin.values;
+        // power binds to the right, chains of it are left alone
+        if (values.empty() || (bin.op == Operator::POW && values.size() != 2)) {
+          return {};
+        }
+        auto folded = constant_of(values.front());
+        if (!folded) {
+          return {};
+        }
+        // the other operators bind to the left, so a leading run of
+        // constants reduces to one
+        std::size_t next = 1;
+        for (; next < values.size(); ++next) {
+          auto right = constant_of(values[next]);
+          if (!right) {
+            break;
+          }
+          auto result = apply(bin.op, *folded, *right);
+          if (!result) {
+            break;
+          }
+          folded = std::move(result);
+        }
+        if (next == 1) {
+          return {};
+        }
+        if (next == values.size()) {
+          return ExprImpl(*std::move(folded));
+        }
+        values.erase(std::next(values.begin()),
+                     std::next(values.begin(),
+                               gsl::narrow<std::ptrdiff_t>(next)));
+        values.front() = *std::move(folded);
+        return {};
+      }
+      [[nodiscard]] auto fold(Bool &asdlBool) const
+          -> std::optional<ExprImpl> {
+        exprs(asdlBool.values);
+        auto &values = asdlBool.values;
+        // the first operand that decides the result is the result
+        const auto decides = asdlBool.op == Bool::OR;
+        std::size_t first = 0;
+        for (; first + 1 < values.size(); ++first) {
+          auto test = truth(values[first]);
+          if (!test) {
+            break;
+          }
+          if (*test == decides) {
+            return std::move(values[first]);
+          }
+        }
+        values.erase(values.begin(),
+                     std::next(values.begin(),
+                               gsl::narrow<std::ptrdiff_t>(first)));
+        if (values.size() == 1) {
+          return std::move(values.front());
+        }
+        return {};
+      }
+      [[nodiscard]] auto fold(Unary &unary) const -> std::optional<ExprImpl> {
+        expr(unary.operand);
+        if (unary.op == Unary::NOT) {
+          if (auto test = truth(unary.operand)) {
+            return boolean(!*test);
+          }
+          return {};
+        }
+        auto constant = constant_of(unary.operand);
+        if (!constant) {
+          return {};
+        }
+        auto operand = constant->get<object::Number>();
+        if (!operand) {
+          return {};
+        }
+        std::optional<object::Object> result;
+        switch (unary.op) {
+          case Unary::BIT_NOT:
+            if (operand->is_int()) {
+              result = number(~*operand);
+            }
+            break;
+          case Unary::ADD:
+            result = std::move(constant);
+            break;
+          case Unary::SUB:
+            result = number(-*operand);
+            break;
+          case Unary::NOT:
+            break;
+        }
+        if (!result) {
+          return {};
+        }
+        return ExprImpl(*std::move(result));
+      }
+      [[nodiscard]] auto fold(IfExp &ifExp) const -> std::optional<ExprImpl> {
+        expr(ifExp.test);
+        expr(ifExp.body);
+        expr(ifExp.orelse);
+        if (auto test = truth(ifExp.test)) {
+          return std::move(*test ? ifExp.body : ifExp.orelse);
+        }
+        return {};
+      }
+      [[nodiscard]] auto fold(Attribute &attribute) const
+          -> std::optional<ExprImpl> {
+        expr(attribute.value);
+        return {};
+      }
+      [[nodiscard]] auto fold(Await &await) const -> std::optional<ExprImpl> {
+        expr(await.value);
+        return {};
+      }
+      [[nodiscard]] auto fold(Call &call) const -> std::optional<ExprImpl> {
+        expr(call.func);
+        exprs(call.args);
+        keywords(call.keywords);
+        return {};
+      }
+      [[nodiscard]] auto fold(Compare &compare) const
+          -> std::optional<ExprImpl> {
+        expr(compare.left);
+        for (auto &comparator : compare.comparators) {
+          expr(comparator.value);
+        }
+        return {};
+      }
+      [[nodiscard]] auto fold(Dict &dict) const -> std::optional<ExprImpl> {
+        exprs(dict.keys);
+        exprs(dict.values);
+        return {};
+      }
+      [[nodiscard]] auto fold(DictComp &dictComp) const
+          -> std::optional<ExprImpl> {
+        expr(dictComp.key);
+        expr(dictComp.value);
+        generators(dictComp.generators);
+        return {};
+      }
+      [[nodiscard]] auto fold(FormattedValue &formattedValue) const
+          -> std::optional<ExprImpl> {
+        expr(formattedValue.value);
+        expr(formattedValue.format_spec);
+        return {};
+      }
+      [[nodiscard]] auto fold(GeneratorExp &generatorExp) const
+          -> std::optional<ExprImpl> {
+        expr(generatorExp.elt);
+        generators(generatorExp.generators);
+        return {};
+      }
+      [[nodiscard]] auto fold(JoinedStr &joinedStr) const
+          -> std::optional<ExprImpl> {
+        exprs(joinedStr.values);
+        return {};
+      }
+      [[nodiscard]] auto fold(Lambda &lambda) const
+          -> std::optional<ExprImpl> {
+        arguments(lambda.args);
+        expr(lambda.body);
+        return {};
+      }
+      [[nodiscard]] auto fold(List &list) const -> std::optional<ExprImpl> {
+        exprs(list.elts);
+        return {};
+      }
+      [[nodiscard]] auto fold(ListComp &listComp) const
+          -> std::optional<ExprImpl> {
+        expr(listComp.elt);
+        generators(listComp.generators);
+        return {};
+      }
+      [[nodiscard]] auto fold(Set &set) const -> std::optional<ExprImpl> {
+        exprs(set.elts);
+        return {};
+      }
+      [[nodiscard]] auto fold(SetComp &setComp) const
+          -> std::optional<ExprImpl> {
+        expr(setComp.elt);
+        generators(setComp.generators);
+        return {};
+      }
+      [[nodiscard]] auto fold(Starred &starred) const
+          -> std::optional<ExprImpl> {
+        expr(starred.value);
+        return {};
+      }
+      [[nodiscard]] auto fold(Subscript &subscript) const
+          -> std::optional<ExprImpl> {
+        expr(subscript.value);
+        slice(subscript.slice);
+        return {};
+      }
+      [[nodiscard]] auto fold(Tuple &tuple) const -> std::optional<ExprImpl> {
+        exprs(tuple.elts);
+        return {};
+      }
+      [[nodiscard]] auto fold(Yield &yield) const -> std::optional<ExprImpl> {
+        expr(yield.value);
+        return {};
+      }
+      [[nodiscard]] auto fold(YieldFrom &yieldFrom) const
+          -> std::optional<ExprImpl> {
+        expr(yieldFrom.value);
+        return {};
+      }
+      template <typename Type>
+      [[nodiscard]] auto fold(Type & /*value*/) const
+          -> std::optional<ExprImpl> {
+        return {};
+      }
+      [[nodiscard]] auto stmt(AnnAssign &annAssign) const -> Result {
+        expr(annAssign.annotation);
+        expr(annAssign.value);
+        return {};
+      }
+      [[nodiscard]] static auto stmt(Assert & /*assert*/) -> Result {
+        return Result{std::vector<StmtImpl>{}};
+      }
+      [[nodiscard]] auto stmt(Assign &assign) const -> Result {
+        expr(assign.value);
+        return {};
+      }
+      [[nodiscard]] auto stmt(AsyncFor &asyncFor) const -> Result {
+        expr(asyncFor.iter);
+        std::ignore = body(asyncFor.body);
+        std::ignore = body(asyncFor.orelse);
+        return {};
+      }
+      [[nodiscard]] auto stmt(AsyncFunctionDef &asyncFunctionDef) const
+          -> Result {
+        doc(asyncFunctionDef.doc_string);
+        arguments(asyncFunctionDef.args);
+        std::ignore = body(asyncFunctionDef.body);
+        exprs(asyncFunctionDef.decorator_list);
+        return {};
+      }
+      [[nodiscard]] auto stmt(AsyncWith &asyncWith) const -> Result {
+        for (auto &item : asyncWith.items) {
+          expr(item.context_expr);
+        }
+        std::ignore = body(asyncWith.body);
+        return {};
+      }
+      [[nodiscard]] auto stmt(AugAssign &augAssign) const -> Result {
+        expr(augAssign.value);
+        return {};
+      }
+      [[nodiscard]] static auto stmt(Break & /*asdlBreak*/) -> Result {
+        return Result{{}, true};
+      }
+      [[nodiscard]] auto stmt(ClassDef &classDef) const -> Result {
+        doc(classDef.doc_string);
+        exprs(classDef.bases);
+        keywords(classDef.keywords);
+        std::ignore = body(classDef.body);
+        exprs(classDef.decorator_list);
+        return {};
+      }
+      [[nodiscard]] static auto stmt(Continue & /*asdlContinue*/) -> Result {
+        return Result{{}, true};
+      }
+      //! an expression statement with a constant value does nothing
+      [[nodiscard]] auto stmt(Expr &asdlExpr) const -> Result {
+        expr(asdlExpr.value);
+        if (!interactive && constant_of(asdlExpr.value)) {
+          return Result{std::vector<StmtImpl>{}};
+        }
+        return {};
+      }
+      [[nodiscard]] auto stmt(For &asdlFor) const -> Result {
+        expr(asdlFor.iter);
+        std::ignore = body(asdlFor.body);
+        std::ignore = body(asdlFor.orelse);
+        return {};
+      }
+      [[nodiscard]] auto stmt(FunctionDef &functionDef) const -> Result {
+        doc(functionDef.doc_string);
+        arguments(functionDef.args);
+        std::ignore = body(functionDef.body);
+        exprs(functionDef.decorator_list);
+        return {};
+      }
+      //! branches with a false test are dropped and one with a true test
+      //! ends the chain as its else
+      [[nodiscard]] auto stmt(If &asdlIf) const -> Result {
+        std::vector<IfBranch> branches;
+        auto terminal = true;
+        for (auto &branch : asdlIf.body) {
+          expr(branch.test);
+          const auto test = truth(branch.test);
+          if (test && !*test) {
+            continue;
+          }
+          if (test) {
+            asdlIf.orelse = std::move(branch.body);
+            break;
+          }
+          terminal = body(branch.body) && terminal;
+          branches.push_back(std::move(branch));
+        }
+        terminal = body(asdlIf.orelse) && terminal;
+        if (branches.empty()) {
+          return Result{std::move(asdlIf.orelse), terminal};
+        }
+        asdlIf.body = std::move(branches);
+        return Result{{}, terminal};
+      }
+      [[nodiscard]] auto stmt(Raise &raise) const -> Result {
+        expr(raise.exc);
+        expr(raise.cause);
+        return Result{{}, true};
+      }
+      [[nodiscard]] auto stmt(Return &asdlReturn) const -> Result {
+        expr(asdlReturn.value);
+        return Result{{}, true};
+      }
+      [[nodiscard]] auto stmt(Try &asdlTry) const -> Result {
+        std::ignore = body(asdlTry.body);
+        for (auto &handler : asdlTry.handlers) {
+          auto &exceptHandler = std::get<ExceptHandler>(handler);
+          expr(exceptHandler.type);
+          std::ignore = body(exceptHandler.body);
+        }
+        std::ignore = body(asdlTry.orelse);
+        std::ignore = body(asdlTry.finalbody);
+        return {};
+      }
+      [[nodiscard]] auto stmt(While &asdlWhile) const -> Result {
+        expr(asdlWhile.test);
+        std::ignore = body(asdlWhile.body);
+        const auto terminal = body(asdlWhile.orelse);
+        if (const auto test = truth(asdlWhile.test); test && !*test) {
+          return Result{std::move(asdlWhile.orelse), terminal};
+        }
+        return {};
+      }
+      [[nodiscard]] auto stmt(With &with) const -> Result {
+        for (auto &item : with.items) {
+          expr(item.context_expr);
+        }
+        std::ignore = body(with.body);
+        return {};
+      }
+      template <typename Type>
+      [[nodiscard]] static auto stmt(Type & /*value*/) -> Result {
+        return {};
+      }
+      options::Optimize level;
+      bool interactive;
+    };
+  } // namespace
+  void Module::optimize(const options::Optimize &level) {
+    const Optimizer optimizer(level, false);
+    optimizer.doc(doc_string);
+    std::ignore = optimizer.body(body);
+  }
+  void Interactive::optimize(const options::Optimize &level) {
+    std::ignore = Optimizer(level, true).body(body);
+  }
+  void Expression::optimize(const options::Optimize &level) {
+    Optimizer(level, false).expr(body);
+  }
+} // namespace chimera::library::asdl
@@ -2,12 +2,37 @@
 
 #pragma once
 
+#include <atomic>       // for atomic
+#include <cstdint>      // for uint64_t
 #include <memory>       // for make_unique, unique_ptr
 #include <mutex>        // for unique_lock
 #include <shared_mutex> // for shared_mutex, shared_lock
-#include <utility>      // for forward
+#include <utility>      // for exchange, forward
 
 namespace chimera::library::container {
+  //! identifies the calling thread, unlike thread ids these are never reused
+  [[nodiscard]] inline auto thread_token() noexcept -> std::uint64_t {
+    static std::atomic<std::uint64_t> next = 1;
+    thread_local const std::uint64_t token = next.fetch_add(1);
+    return token;
+  }
+  //! while alive, containers that ask are confined to the calling thread
+  class Confine {
+  public:
+    Confine() noexcept : previous(std::exchange(active(), true)) {}
+    Confine(const Confine &other) = delete;
+    Confine(Confine &&other) = delete;
+    ~Confine() noexcept { active() = previous; }
+    auto operator=(const Confine &other) -> Confine & = delete;
+    auto operator=(Confine &&other) -> Confine & = delete;
+    [[nodiscard]] static auto active() noexcept -> bool & {
+      thread_local bool confining = false;
+      return confining;
+    }
+
+  private:
+    bool previous;
+  };
   template <typename Value>
   struct AtomicContainer {
     AtomicContainer() = default;
@@ -40,18 +65,37 @@ namespace chimera::library::container {
       Value &value;
     };
     // NOLINTEND(cppcoreguidelines-avoid-const-or-ref-data-members)
+    //! skip locking while only the calling thread can reach this container,
+    //! only valid before anything else can see it
+    void confine() noexcept {
+      owner.store(thread_token(), std::memory_order_relaxed);
+    }
+    [[nodiscard]] auto confined() const noexcept -> bool {
+      return owner.load(std::memory_order_relaxed) == thread_token();
+    }
+    //! lock on every access from now on, called by the owning thread before
+    //! the container is handed to another
+    void publish() noexcept { owner.store(0, std::memory_order_relaxed); }
     [[nodiscard]] auto read() const -> Read {
+      if (confined()) {
+        return Read{{}, value};
+      }
       return Read{std::shared_lock<std::shared_mutex>(
                       // NOLINTNEXTLINE(cppcoreguidelines-pro-type-const-cast)
                       const_cast<std::shared_mutex &>(mutex)),
                   value};
     }
     [[nodiscard]] auto write() -> Write {
+      if (confined()) {
+        return Write{{}, value};
+      }
       return Write{std::unique_lock<std::shared_mutex>(mutex), value};
     }
 
   private:
     std::shared_mutex mutex;
+    //! thread_token of the only thread using this container, 0 once shared
+    std::atomic<std::uint64_t> owner = 0;
     Value value;
   };
 } // namespace chimera::library::container
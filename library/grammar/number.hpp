@@ -9,6 +9,7 @@
 
 #include <cstdint>
 #include <numeric>
+#include <utility>
 #include <vector>
 
 namespace chimera::library::grammar {
@@ -158,6 +159,13 @@ namespace chimera::library::grammar {
         }
       };
     };
+    //! literals with the same value share one number handle for the life
+    //! of the process, each in an object of its own
+    [[nodiscard]] inline auto literal(object::Number &&number)
+        -> object::Object {
+      number.intern();
+      return object::Object(std::move(number), {});
+    }
     struct Numberliteral : sor<Imagnumber, Floatnumber, Integer> {
       struct Transform : NumberHolder, rules::VariantCapture<asdl::ExprImpl> {};
     };
@@ -165,7 +173,7 @@ namespace chimera::library::grammar {
     struct Action<Numberliteral> {
       template <typename Top, typename... Args>
       static void apply0(Top &&top, Args &&.../*args*/) {
-        top.push(object::Object(std::move(top.number), {}));
+        top.push(literal(std::move(top.number)));
       }
     };
   } // namespace token
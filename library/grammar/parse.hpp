@@ -10,15 +10,18 @@
 #include <tao/pegtl.hpp>
 
 namespace chimera::library::grammar {
-  template <typename Grammar, typename... Args>
-  void parse(const options::Optimize &optimize, Args &&...args) {
-    Ensures((tao::pegtl::parse<tao::pegtl::must<Grammar>, token::Action, Normal,
-                               tao::pegtl::apply_mode::action,
-                               tao::pegtl::rewind_mode::required>(args...)));
+  template <typename Grammar, typename Input, typename Root>
+  void parse(const options::Optimize &optimize, Input &&input, Root &&root) {
+    Ensures(
+        (tao::pegtl::parse<tao::pegtl::must<Grammar>, token::Action, Normal,
+                           tao::pegtl::apply_mode::action,
+                           tao::pegtl::rewind_mode::required>(input, root)));
     switch (optimize) {
       case options::Optimize::NONE:
+        break;
       case options::Optimize::BASIC:
       case options::Optimize::DISCARD_DOCS:
+        root.optimize(optimize);
         break;
     }
   }
@@ -2,20 +2,90 @@
 
 #include "number-rust.hpp"
 
+#include <algorithm>
+#include <cstdlib>
+
 // NOLINTBEGIN(cppcoreguidelines-macro-usage)
 
 namespace chimera::library::object::number {
-  Number::Number() : ref(r_create_number(0)) {}
-  Number::Number(std::uint64_t number) : ref(r_create_number(number)) {}
+  using detail::fits_small;
+  using detail::is_small;
+  using detail::make_small;
+  using detail::small;
+  // inline values have 62 bits, so these only need to guard the result
+  // rather than the machine word, and the caller still checks fits_small
+  static auto add_overflow(std::int64_t left, std::int64_t right,
+                           std::int64_t *value) noexcept -> bool {
+    *value = left + right;
+    return false;
+  }
+  static auto sub_overflow(std::int64_t left, std::int64_t right,
+                           std::int64_t *value) noexcept -> bool {
+    *value = left - right;
+    return false;
+  }
+  static auto mul_overflow(std::int64_t left, std::int64_t right,
+                           std::int64_t *value) noexcept -> bool {
+    if (left != 0 && std::abs(right) > detail::SMALL_MAX / std::abs(left)) {
+      return true;
+    }
+    *value = left * right;
+    return false;
+  }
+  static auto copy_number(PythonNumber ref) -> PythonNumber {
+    return is_small(ref) ? ref : r_copy_number(ref);
+  }
+  //! decrements are buffered per thread and handed over in batches
+  struct DeleteBuffer {
+    DeleteBuffer() = default;
+    DeleteBuffer(const DeleteBuffer &) = delete;
+    DeleteBuffer(DeleteBuffer &&) = delete;
+    ~DeleteBuffer() noexcept {
+      flush();
+      closed = true;
+    }
+    auto operator=(const DeleteBuffer &) -> DeleteBuffer & = delete;
+    auto operator=(DeleteBuffer &&) -> DeleteBuffer & = delete;
+    void flush() noexcept {
+      r_delete_numbers(refs.data(), refs.size());
+      refs.clear();
+    }
+    static constexpr std::size_t BATCH = 256;
+    std::vector<PythonNumber> refs;
+    static thread_local bool closed;
+  };
+  thread_local bool DeleteBuffer::closed = false;
+  static auto delete_buffer() -> DeleteBuffer & {
+    thread_local DeleteBuffer buffer;
+    return buffer;
+  }
+  static void delete_number(PythonNumber ref) {
+    if (is_small(ref) || ref == 0) {
+      return;
+    }
+    if (DeleteBuffer::closed) {
+      return r_delete_number(ref);
+    }
+    auto &buffer = delete_buffer();
+    buffer.refs.push_back(ref);
+    if (buffer.refs.size() >= DeleteBuffer::BATCH) {
+      buffer.flush();
+    }
+  }
+  Number::Number() : ref(make_small(0)) {}
+  Number::Number(std::uint64_t number)
+      : ref(number <= static_cast<std::uint64_t>(detail::SMALL_MAX)
+                ? make_small(static_cast<std::int64_t>(number))
+                : r_create_number(number)) {}
   Number::Number(PythonNumber ref, bool /*unused*/) noexcept : ref(ref) {}
-  Number::Number(const Number &other) : ref(r_copy_number(other.ref)) {}
+  Number::Number(const Number &other) : ref(copy_number(other.ref)) {}
   Number::Number(Number &&other) noexcept : ref(0) { swap(std::move(other)); }
   auto Number::operator=(const Number &other) -> Number & {
     if (this != &other) {
-      auto ptr = r_copy_number(other.ref);
+      auto ptr = copy_number(other.ref);
       using std::swap;
       swap(ptr, ref);
-      r_delete_number(ptr);
+      delete_number(ptr);
     }
     return *this;
   }
@@ -25,14 +95,29 @@ namespace chimera::library::object::number {
     }
     return *this;
   }
-  Number::~Number() { r_delete_number(ref); }
+  Number::~Number() { delete_number(ref); }
   void Number::swap(Number &&other) noexcept {
     using std::swap;
     swap(ref, other.ref);
   }
-  Number::operator int64_t() const noexcept { return r_cast_int(ref); }
-  Number::operator uint64_t() const noexcept { return r_cast_unsigned(ref); }
-  Number::operator double() const noexcept { return r_cast_float(ref); }
+  Number::operator int64_t() const noexcept {
+    if (is_small(ref)) {
+      return small(ref);
+    }
+    return r_cast_int(ref);
+  }
+  Number::operator uint64_t() const noexcept {
+    if (is_small(ref)) {
+      return static_cast<uint64_t>(std::max(small(ref), std::int64_t{0}));
+    }
+    return r_cast_unsigned(ref);
+  }
+  Number::operator double() const noexcept {
+    if (is_small(ref)) {
+      return static_cast<double>(small(ref));
+    }
+    return r_cast_float(ref);
+  }
 #define NUM_OP_MONO(op, name)                                                  \
   auto Number::operator op() const -> Number { return {name(ref), false}; }
 #define NUM_OP(op, name)                                                       \
@@ -40,7 +125,21 @@ namespace chimera::library::object::number {
     auto ptr = name(ref, right.ref);                                           \
     using std::swap;                                                           \
     swap(ptr, ref);                                                            \
-    r_delete_number(ptr);                                                      \
+    delete_number(ptr);                                                        \
+    return *this;                                                              \
+  }
+#define NUM_OP_SMALL(op, name, checked)                                        \
+  auto Number::operator op(const Number & right) -> Number & {                 \
+    if (std::int64_t value{};                                                  \
+        is_small(ref) && is_small(right.ref) &&                                \
+        !checked(small(ref), small(right.ref), &value) && fits_small(value)) { \
+      ref = make_small(value);                                                 \
+      return *this;                                                            \
+    }                                                                          \
+    auto ptr = name(ref, right.ref);                                           \
+    using std::swap;                                                           \
+    swap(ptr, ref);                                                            \
+    delete_number(ptr);                                                        \
     return *this;                                                              \
   }
 #define NUM_OP_NAMED(op, name)                                                 \
@@ -48,22 +147,34 @@ namespace chimera::library::object::number {
     return {name(ref, right.ref), false};                                      \
   }
   NUM_OP_MONO(-, r_neg)
-  NUM_OP_MONO(+, r_abs)
-  NUM_OP_MONO(~, r_bit_not)
-  NUM_OP(-=, r_sub)
-  NUM_OP(*=, r_mul)
+  auto Number::operator+() const -> Number { return *this; }
+  //! -(x + 1), which always fits when x does
+  auto Number::operator~() const -> Number {
+    if (is_small(ref)) {
+      return {make_small(~small(ref)), false};
+    }
+    return {r_bit_not(ref), false};
+  }
+  NUM_OP_SMALL(-=, r_sub, sub_overflow)
+  NUM_OP_SMALL(*=, r_mul, mul_overflow)
   NUM_OP(/=, r_div)
   NUM_OP(&=, r_bit_and)
   NUM_OP(%=, r_modu)
   NUM_OP(^=, r_bit_xor)
-  NUM_OP(+=, r_add)
+  NUM_OP_SMALL(+=, r_add, add_overflow)
   NUM_OP(<<=, r_bit_lshift)
   NUM_OP(>>=, r_bit_rshift)
   NUM_OP(|=, r_bit_or)
   [[nodiscard]] auto Number::operator==(const Number &right) const -> bool {
+    if (is_small(ref) && is_small(right.ref)) {
+      return ref == right.ref;
+    }
     return r_eq(ref, right.ref);
   }
   [[nodiscard]] auto Number::operator<(const Number &right) const -> bool {
+    if (is_small(ref) && is_small(right.ref)) {
+      return small(ref) < small(right.ref);
+    }
     return r_lt(ref, right.ref);
   }
   [[nodiscard]] auto Number::floor_div(const Number &right) const -> Number {
@@ -78,11 +189,38 @@ namespace chimera::library::object::number {
   [[nodiscard]] auto Number::is_complex() const -> bool {
     return r_is_complex(ref);
   }
-  [[nodiscard]] auto Number::is_int() const -> bool { return r_is_int(ref); }
+  [[nodiscard]] auto Number::is_int() const -> bool {
+    return is_small(ref) || r_is_int(ref);
+  }
   [[nodiscard]] auto Number::is_nan() const -> bool { return r_is_nan(ref); }
   [[nodiscard]] auto Number::imag() const -> Number {
     return {r_imag(ref), false};
   }
+#define NUM_OP_REDUCE(op, name)                                                \
+  [[nodiscard]] auto Number::op(gsl::span<const Number> numbers) -> Number {   \
+    std::vector<PythonNumber> refs;                                            \
+    refs.reserve(numbers.size());                                              \
+    for (const auto &number : numbers) {                                       \
+      refs.push_back(number.ref);                                              \
+    }                                                                          \
+    return {name(refs.data(), refs.size()), false};                            \
+  }
+  NUM_OP_REDUCE(product, r_product)
+  NUM_OP_REDUCE(sum, r_sum)
+  void Number::share() { ref = r_share_number(ref); }
+  void Number::intern() { ref = r_intern_number(ref); }
+  void Number::flush() {
+    if (!DeleteBuffer::closed) {
+      delete_buffer().flush();
+    }
+  }
+  [[nodiscard]] auto Number::stats() -> Stats {
+    flush();
+    NumberStats stats{};
+    r_number_stats(&stats);
+    return {stats.news,       stats.gets,   stats.deletes,   stats.live,
+            stats.peak_bytes, stats.stalls, stats.wait_nanos};
+  }
 } // namespace chimera::library::object::number
 
 // NOLINTEND(cppcoreguidelines-macro-usage)
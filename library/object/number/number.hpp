@@ -3,6 +3,8 @@
 #include <gsl/gsl>
 #include <tao/operators.hpp>
 
+#include <array>
+#include <charconv>
 #include <cstdint>
 #include <limits>
 #include <numeric>
@@ -12,12 +14,50 @@
 using PythonNumber = uint64_t;
 
 extern "C" {
-auto r_repr(uint8_t *buffer, size_t capacity, PythonNumber value) -> int32_t;
-auto r_repr_len(PythonNumber value) -> size_t;
+auto r_repr_into(uint8_t *buffer, size_t capacity, PythonNumber value)
+    -> size_t;
 } // extern "C"
 // NOLINTEND(readability-redundant-declaration)
 
 namespace chimera::library::object::number {
+  namespace detail {
+    // Mirrors oxidation/number/src/handle.rs: handles tagged 0b01 hold a
+    // signed 62 bit integer inline and never reach the number store, handles
+    // tagged 0b10 live in the arena of the thread that created them.
+    constexpr auto TAG_BITS = 2;
+    constexpr PythonNumber TAG_MASK = (PythonNumber{1} << TAG_BITS) - 1;
+    constexpr PythonNumber SMALL_TAG = 0b01;
+    constexpr std::int64_t SMALL_MAX =
+        (std::int64_t{1} << (std::numeric_limits<std::int64_t>::digits -
+                             TAG_BITS)) -
+        1;
+    constexpr std::int64_t SMALL_MIN = -SMALL_MAX - 1;
+    [[nodiscard]] constexpr auto is_small(PythonNumber ref) noexcept -> bool {
+      return (ref & TAG_MASK) == SMALL_TAG;
+    }
+    [[nodiscard]] constexpr auto fits_small(std::int64_t value) noexcept
+        -> bool {
+      return SMALL_MIN <= value && value <= SMALL_MAX;
+    }
+    [[nodiscard]] constexpr auto small(PythonNumber ref) noexcept
+        -> std::int64_t {
+      return static_cast<std::int64_t>(ref) >> TAG_BITS;
+    }
+    [[nodiscard]] constexpr auto make_small(std::int64_t value) noexcept
+        -> PythonNumber {
+      return (static_cast<PythonNumber>(value) << TAG_BITS) | SMALL_TAG;
+    }
+  } // namespace detail
+  //! traffic through the handle tables, see oxidation/number/src/stats.rs
+  struct Stats {
+    std::uint64_t news;
+    std::uint64_t gets;
+    std::uint64_t deletes;
+    std::uint64_t live;
+    std::uint64_t peak_bytes;
+    std::uint64_t stalls;
+    std::uint64_t wait_nanos;
+  };
   class Number : tao::operators::commutative_bitwise<Number>,
                  tao::operators::modable<Number>,
                  tao::operators::ordered_field<Number>,
@@ -59,16 +99,34 @@ namespace chimera::library::object::number {
     [[nodiscard]] auto is_int() const -> bool;
     [[nodiscard]] auto is_nan() const -> bool;
     [[nodiscard]] auto imag() const -> Number;
+    void share();
+    //! shares one handle between every number interned with the same value
+    void intern();
+    static void flush();
+    [[nodiscard]] static auto stats() -> Stats;
+    [[nodiscard]] static auto product(gsl::span<const Number> numbers)
+        -> Number;
+    [[nodiscard]] static auto sum(gsl::span<const Number> numbers) -> Number;
     template <typename OStream>
     [[nodiscard]] auto &debug(OStream &&ostream) const {
       return repr(ostream);
     }
     template <typename OStream>
     auto &repr(OStream &&ostream) const {
-      auto size = r_repr_len(ref);
-      auto buffer = std::vector<std::uint8_t>(size);
-      if (r_repr(buffer.data(), size, ref) != 0) {
-        throw std::runtime_error("Failed to represent number");
+      if (detail::is_small(ref)) {
+        std::array<char, std::numeric_limits<std::int64_t>::digits10 + 2>
+            buffer{};
+        auto *begin = buffer.data();
+        auto result =
+            // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+            std::to_chars(begin, begin + buffer.size(), detail::small(ref));
+        return ostream << std::string_view{begin, result.ptr};
+      }
+      auto buffer = std::vector<std::uint8_t>(REPR_BUFFER);
+      auto size = r_repr_into(buffer.data(), buffer.size(), ref);
+      if (size > buffer.size()) {
+        buffer.resize(size);
+        size = r_repr_into(buffer.data(), buffer.size(), ref);
       }
       // NOLINTNEXTLINE(cppcoreguidelines-pro-type-reinterpret-cast)
       return ostream << std::string_view{
@@ -76,6 +134,7 @@ namespace chimera::library::object::number {
     }
 
   private:
+    static constexpr std::size_t REPR_BUFFER = 64;
     Number(PythonNumber ref, bool /*unused*/) noexcept;
     PythonNumber ref;
   };
@@ -17,10 +17,10 @@ namespace chimera::library::object::internal {
                                const BaseException &context)
       : exception(anException.exception) {
     ObjectRef object(anException.exception);
-    object.set_attribute("__context__"s, context.exception);
+    object.set_attribute(object::symbols::CONTEXT, context.exception);
   }
   auto BaseException::class_id() const noexcept -> Id {
-    return exception.get_attribute("__class__"s).id();
+    return exception.get_attribute(object::symbols::CLASS).id();
   }
   auto BaseException::id() const noexcept -> Id { return exception.id(); }
   auto BaseException::what() const noexcept -> const char * {
@@ -2,17 +2,25 @@
 
 #pragma once
 
-#include "container/atomic_map.hpp" // for AtomicMap
+#include "container/atomic_container.hpp" // for AtomicContainer
 #include "object/number/number.hpp"
+#include "object/pool.hpp"
 #include "object/reference.hpp"
+#include "object/shape.hpp"
+#include "object/symbol.hpp"
+#include "object/tuple.hpp"
 
+#include <atomic>      // for atomic
 #include <cstdint>     // for uint64_t, uint8_t
 #include <exception>   // for exception
+#include <functional>  // for less
 #include <future>      // for future
 #include <iosfwd>      // for string
+#include <iterator>    // for make_move_iterator
 #include <map>         // for map
 #include <memory>      // for shared_ptr, make_shared, unique_ptr
 #include <optional>    // for optional
+#include <set>         // for set
 #include <string>      // for basic_string, operator<
 #include <type_traits> // for remove_extent_t
 #include <utility>     // for forward, move
@@ -31,8 +39,84 @@ namespace chimera::library::object {
 namespace chimera::library::object::internal {
   using Id = std::uint64_t;
   template <template <typename...> class Pointer>
+  struct ObjectPointer;
+  //! kept by a lookup site to remember the slot a name was found in on one
+  //! object, so later lookups read it back without searching while that
+  //! object keeps its shape and its class is unchanged. the entry is a seqlock,
+  //! so a hit is a handful of plain loads; a torn read counts as a miss and a
+  //! writer that finds another one mid-update leaves the entry to it
+  class InlineCache {
+  public:
+    InlineCache() noexcept = default;
+    InlineCache(const InlineCache &other) noexcept {
+      if (auto entry = other.load()) {
+        store(*entry);
+      }
+    }
+    InlineCache(InlineCache &&other) noexcept : InlineCache(other) {}
+    ~InlineCache() noexcept = default;
+    auto operator=(const InlineCache &other) noexcept -> InlineCache & {
+      if (auto entry = other.load(); entry && this != &other) {
+        store(*entry);
+      }
+      return *this;
+    }
+    auto operator=(InlineCache &&other) noexcept -> InlineCache & {
+      return *this = other;
+    }
+
+  private:
+    template <template <typename...> class Pointer>
+    friend struct ObjectPointer;
+    struct Entry {
+      Id object = 0;
+      std::uint64_t shape = 0;
+      std::size_t slot = 0;
+      Id type = 0;
+      std::uint64_t version = 0;
+    };
+    [[nodiscard]] auto load() const noexcept -> std::optional<Entry> {
+      const auto before = sequence.load(std::memory_order_acquire);
+      if ((before & 1U) != 0) {
+        return {};
+      }
+      const Entry entry{object.load(std::memory_order_relaxed),
+                        shape.load(std::memory_order_relaxed),
+                        slot.load(std::memory_order_relaxed),
+                        type.load(std::memory_order_relaxed),
+                        version.load(std::memory_order_relaxed)};
+      std::atomic_thread_fence(std::memory_order_acquire);
+      if (sequence.load(std::memory_order_relaxed) != before ||
+          entry.object == 0) {
+        return {};
+      }
+      return entry;
+    }
+    void store(const Entry &entry) const noexcept {
+      auto before = sequence.load(std::memory_order_relaxed);
+      if ((before & 1U) != 0 ||
+          !sequence.compare_exchange_strong(before, before + 1,
+                                            std::memory_order_relaxed)) {
+        return;
+      }
+      std::atomic_thread_fence(std::memory_order_release);
+      object.store(entry.object, std::memory_order_relaxed);
+      shape.store(entry.shape, std::memory_order_relaxed);
+      slot.store(entry.slot, std::memory_order_relaxed);
+      type.store(entry.type, std::memory_order_relaxed);
+      version.store(entry.version, std::memory_order_relaxed);
+      sequence.store(before + 2, std::memory_order_release);
+    }
+    mutable std::atomic<std::uint64_t> sequence = 0;
+    mutable std::atomic<Id> object = 0;
+    mutable std::atomic<std::uint64_t> shape = 0;
+    mutable std::atomic<std::size_t> slot = 0;
+    mutable std::atomic<Id> type = 0;
+    mutable std::atomic<std::uint64_t> version = 0;
+  };
+  template <template <typename...> class Pointer>
   struct ObjectPointer {
-    using BasicAttributes = std::map<std::string, ObjectPointer<Reference>>;
+    using BasicAttributes = std::map<Symbol, ObjectPointer<Reference>>;
     ObjectPointer() = default;
     explicit ObjectPointer(BasicAttributes &&attributes)
         : object(std::move(attributes)) {}
@@ -66,41 +150,61 @@ namespace chimera::library::object::internal {
     };
     auto operator=(ObjectPointer<Pointer> &&other) noexcept
         -> ObjectPointer & = default;
-    void delete_attribute(std::string &&key) noexcept { object->erase(key); }
-    void delete_attribute(const std::string &key) noexcept {
-      object->erase(key);
-    }
+    void delete_attribute(Symbol key) noexcept { object->erase(key); }
+    //! strips this object and everything reachable through attributes, one
+    //! object at a time so deep graphs never recurse
+    void destroy() noexcept;
     [[nodiscard]] auto dir() const -> std::vector<std::string> {
       return object->dir();
     }
     [[nodiscard]] auto dir_size() const -> std::size_t {
       return object->dir_size();
     }
+    //! removes every attribute, moving the values onto the end of todo
+    void drain_attributes(std::vector<ObjectPointer<Reference>> &todo) {
+      object->drain(todo);
+    }
     template <typename Type>
     [[nodiscard]] auto get() const noexcept -> std::optional<const Type> {
       return object->template get<Type>();
     }
-    [[nodiscard]] auto get_attribute(std::string &&key) const
-        -> const ObjectPointer<Reference> &;
-    [[nodiscard]] auto get_attribute(const std::string &key) const
-        -> const ObjectPointer<Reference> &;
+    [[nodiscard]] auto find_attribute(Symbol key) const
+        -> std::optional<ObjectPointer<Reference>>;
+    //! the value in the slot cache remembers when it was remembered for
+    //! this object in its current shape
+    [[nodiscard]] auto find_cached(const InlineCache &cache) const
+        -> std::optional<ObjectPointer<Reference>>;
+    [[nodiscard]] auto get_attribute(Symbol key) const
+        -> ObjectPointer<Reference>;
     [[nodiscard]] auto get_bool() const noexcept -> bool;
-    [[nodiscard]] auto has_attribute(std::string &&key) const noexcept -> bool {
+    [[nodiscard]] auto has_attribute(Symbol key) const noexcept -> bool {
       return object->contains(key);
     }
-    [[nodiscard]] auto has_attribute(const std::string &key) const noexcept
-        -> bool {
-      return object->contains(key);
-    }
-    [[nodiscard]] auto id() const noexcept -> Id {
-      using NumericLimits = std::numeric_limits<Id>;
-      return NumericLimits::max();
-    }
+    [[nodiscard]] auto id() const noexcept -> Id { return object->id(); }
+    //! finds key on the first type in this type's __mro__, remembering the
+    //! answer on this type until it or a type in its __mro__ changes
+    [[nodiscard]] auto lookup(Symbol key) const
+        -> std::optional<ObjectPointer<Reference>>;
+    //! makes this object and everything it reaches safe to hand to another
+    //! thread
+    void publish() const;
+    //! has cache remember the slot of key, unless this object has its own
+    //! __getattribute__ or keeps a dictionary. type is the id of the
+    //! __class__ this object had and version that class's version, both read
+    //! before key was resolved; 0 for an object whose class is implied by its
+    //! value.
+    void remember(Symbol key, Id type, std::uint64_t version,
+                  const InlineCache &cache) const;
     template <typename... Args>
     void set_attribute(Args &&...args) {
       object->insert_or_assign(std::forward<Args>(args)...);
     }
     [[nodiscard]] auto use_count() const noexcept { return object.use_count(); }
+    //! bumped whenever this object or a type in its __mro__ changes, once
+    //! it has been searched as a type
+    [[nodiscard]] auto version() const noexcept -> std::uint64_t {
+      return object->version();
+    }
     template <typename Visitor>
     auto visit(Visitor &&visitor) const -> decltype(auto) {
       return object->visit(std::forward<Visitor>(visitor));
@@ -139,49 +243,214 @@ namespace chimera::library::object::internal {
     ID,
     INPUT,
     LOCALS,
+    NUMBER_STATS,
     PRINT,
     OPEN
   };
   enum class TupleMethod {};
   struct True {};
-  using Tuple = std::vector<ObjectRef>;
+  using Tuple = BasicTuple<ObjectRef>;
   struct Object {
     using Value =
         std::variant<Instance, Bytes, BytesMethod, Expr, False, Future, None,
                      NullFunction, Number, NumberMethod, ObjectMethod, Stmt,
                      String, StringMethod, SysCall, True, Tuple, TupleMethod>;
-    using BasicAttributes = std::map<std::string, ObjectRef>;
-    using Attributes = container::AtomicMap<std::string, ObjectRef>;
-    Object() = default;
+    using BasicAttributes = std::map<Symbol, ObjectRef>;
+    //! result of a lookup through this type's __mro__, valid while the
+    //! type version it was found at is current
+    struct Cached {
+      std::uint64_t version = 0;
+      std::optional<ObjectRef> found;
+    };
+    //! kept only by objects that have been searched as a type, so instances
+    //! never pay for lookup caching
+    struct Type {
+      using Tag = std::atomic<std::uint64_t>;
+      struct Table {
+        std::map<Symbol, Cached> cache;
+        //! versions of the types with this one in their __mro__
+        std::set<std::weak_ptr<Tag>, std::owner_less<>> subclasses;
+      };
+      //! bumps this type and every subclass that is still alive
+      void changed() {
+        version->fetch_add(1);
+        auto write = table.write();
+        auto &subclasses = write.value.subclasses;
+        for (auto subclass = subclasses.begin();
+             subclass != subclasses.end();) {
+          if (auto tag = subclass->lock()) {
+            tag->fetch_add(1);
+            ++subclass;
+          } else {
+            subclass = subclasses.erase(subclass);
+          }
+        }
+      }
+      //! shared so subclasses can watch it without keeping this type alive
+      const std::shared_ptr<Tag> version = std::make_shared<Tag>(0);
+      container::AtomicContainer<Table> table;
+    };
+    using Values = std::vector<ObjectRef, PoolAllocator<ObjectRef>>;
+    //! values sit in the slots named by a shape shared with every object
+    //! that has the same attribute names, or by a dictionary of the object's
+    //! own once it has left the shapes
+    struct Layout {
+      //! null while dictionary is set
+      Shape::Pointer shape = Shape::root();
+      Values values;
+      std::unique_ptr<Dictionary> dictionary;
+      [[nodiscard]] auto find(Symbol key) const -> std::optional<std::size_t> {
+        return dictionary ? dictionary->find(key) : shape->find(key);
+      }
+      //! moves this object onto a dictionary of its own
+      void leave() {
+        if (!dictionary) {
+          dictionary = std::make_unique<Dictionary>(shape->order());
+          shape.reset();
+        }
+      }
+    };
+    using Attributes = container::AtomicContainer<Layout>;
+    Object() { adopt(); }
     explicit Object(BasicAttributes &&attributes)
-        : attributes(std::move(attributes)) {}
+        : attributes(layout(std::move(attributes))) {
+      adopt();
+    }
     template <typename Type>
     Object(BasicAttributes &&attributes, Type &&value)
-        : attributes(std::move(attributes)), value(std::forward<Type>(value)) {}
+        : attributes(layout(std::move(attributes))),
+          value(std::forward<Type>(value)) {
+      adopt();
+    }
     Object(const Object &other) = delete;
     Object(Object &&other) = delete;
-    ~Object() noexcept = default;
+    // NOLINTNEXTLINE(cppcoreguidelines-owning-memory)
+    ~Object() noexcept { delete type.load(); }
     auto operator=(const Object &other) -> Object & = delete;
     auto operator=(Object &&other) noexcept -> Object & = delete;
-    [[nodiscard]] auto at(const std::string &key) const -> const ObjectRef & {
-      return attributes.at(key);
+    //! the type record of this object, made the first time it is searched
+    //! as a type
+    [[nodiscard]] auto as_type() const -> Type & {
+      if (auto *found = type.load(std::memory_order_acquire);
+          found != nullptr) {
+        return *found;
+      }
+      auto created = std::make_unique<Type>();
+      Type *expected = nullptr;
+      if (type.compare_exchange_strong(expected, created.get(),
+                                       std::memory_order_acq_rel,
+                                       std::memory_order_acquire)) {
+        return *created.release();
+      }
+      return *expected;
+    }
+    [[nodiscard]] auto version() const noexcept -> std::uint64_t {
+      const auto *found = type.load(std::memory_order_acquire);
+      return found == nullptr ? 0 : found->version->load();
     }
-    [[nodiscard]] auto contains(const std::string &key) const -> bool {
-      return attributes.contains(key);
+    [[nodiscard]] auto contains(Symbol key) const -> bool {
+      auto read = attributes.read();
+      return read.value.find(key).has_value();
     }
     [[nodiscard]] auto dir() const -> std::vector<std::string> {
-      std::vector<std::string> keys(dir_size());
       auto read = attributes.read();
-      for (const auto &pair : read.value) {
-        keys.emplace_back(pair.first);
+      if (read.value.dictionary) {
+        return read.value.dictionary->keys();
       }
-      return keys;
+      return read.value.shape->keys();
     }
     [[nodiscard]] auto dir_size() const -> std::size_t {
       auto read = attributes.read();
-      return read.value.size();
+      return read.value.values.size();
+    }
+    //! null once this object keeps a dictionary
+    [[nodiscard]] auto shape() const -> Shape::Pointer {
+      auto read = attributes.read();
+      return read.value.shape;
+    }
+    [[nodiscard]] auto find(Symbol key) const
+        -> std::optional<ObjectRef> {
+      auto read = attributes.read();
+      if (auto slot = read.value.find(key)) {
+        return read.value.values[*slot];
+      }
+      return {};
+    }
+    //! the value in slot while this object still has the shape with id shape
+    //! and the __class__ with id classId at classVersion, if the shape names
+    //! one
+    [[nodiscard]] auto find(std::uint64_t shape, std::size_t slot, Id classId,
+                            std::uint64_t classVersion) const
+        -> std::optional<ObjectRef> {
+      auto read = attributes.read();
+      if (!read.value.shape || read.value.shape->id() != shape) {
+        return {};
+      }
+      if (auto classSlot = read.value.shape->find(symbols::CLASS)) {
+        const auto &current = read.value.values[*classSlot];
+        if (current.id() != classId || current.version() != classVersion) {
+          return {};
+        }
+      }
+      return read.value.values[slot];
+    }
+    //! moves every value onto the end of todo under a single lock
+    void drain(std::vector<ObjectRef> &todo) {
+      auto write = attributes.write();
+      auto &layout = write.value;
+      if (layout.values.empty()) {
+        return;
+      }
+      todo.insert(todo.end(), std::make_move_iterator(layout.values.begin()),
+                  std::make_move_iterator(layout.values.end()));
+      layout.shape = Shape::root();
+      layout.values.clear();
+      layout.dictionary.reset();
+      changed();
+    }
+    void erase(Symbol key) {
+      auto write = attributes.write();
+      auto &layout = write.value;
+      auto slot = layout.find(key);
+      if (!slot) {
+        return;
+      }
+      // dropping the newest name steps back along the transitions, any other
+      // would leave a hole so the object takes a dictionary instead
+      if (!layout.dictionary && *slot + 1 == layout.values.size()) {
+        layout.shape = layout.shape->parent();
+      } else {
+        layout.leave();
+        slot = layout.dictionary->remove(key);
+        if (*slot + 1 != layout.values.size()) {
+          layout.values[*slot] = std::move(layout.values.back());
+        }
+      }
+      layout.values.pop_back();
+      changed();
+    }
+    template <typename Type>
+    void insert_or_assign(Symbol key, Type &&value) {
+      ObjectRef stored(std::forward<Type>(value));
+      if (!attributes.confined()) {
+        stored.publish();
+      }
+      auto write = attributes.write();
+      auto &layout = write.value;
+      if (auto slot = layout.find(key)) {
+        layout.values[*slot] = std::move(stored);
+      } else {
+        if (auto next =
+                layout.dictionary ? Shape::Pointer() : layout.shape->add(key)) {
+          layout.shape = std::move(next);
+        } else {
+          layout.leave();
+          layout.dictionary->add(key);
+        }
+        layout.values.push_back(std::move(stored));
+      }
+      changed();
     }
-    void erase(const std::string &key) { attributes.erase(key); }
     template <typename Type>
     [[nodiscard]] auto get() const noexcept -> std::optional<const Type> {
       if (auto *result = std::get_if<Type>(&value); result != nullptr) {
@@ -192,18 +461,98 @@ namespace chimera::library::object::internal {
     [[nodiscard]] auto get_bool() const -> bool {
       return std::holds_alternative<True>(value);
     }
-    template <typename... Args>
-    void insert_or_assign(Args &&...args) {
-      attributes.insert_or_assign(std::forward<Args>(args)...);
-    }
+    //! unique for the life of the process, never 0
+    [[nodiscard]] auto id() const noexcept -> Id { return identity; }
     template <typename Visitor>
     auto visit(Visitor &&visitor) const {
       return std::visit(std::forward<Visitor>(visitor), value);
     }
+    [[nodiscard]] auto confined() const noexcept -> bool {
+      return attributes.confined();
+    }
+    //! starts locking, leaving the confined objects this one refers to in
+    //! todo
+    void publish(std::vector<ObjectRef> &todo) {
+      if (!attributes.confined()) {
+        return;
+      }
+      {
+        auto read = attributes.read();
+        todo.insert(todo.end(), read.value.values.begin(),
+                    read.value.values.end());
+      }
+      if (const auto *tuple = std::get_if<Tuple>(&value); tuple != nullptr) {
+        todo.insert(todo.end(), tuple->begin(), tuple->end());
+      }
+      share();
+      attributes.publish();
+    }
 
   private:
+    //! threads reserve ids in blocks so only one in every ID_BLOCK objects
+    //! touches the shared counter
+    [[nodiscard]] static auto next_id() noexcept -> Id {
+      static constexpr Id ID_BLOCK = 1U << 12U;
+      static std::atomic<Id> reserved = 1;
+      thread_local Id next = 0;
+      thread_local Id end = 0;
+      if (next == end) {
+        next = reserved.fetch_add(ID_BLOCK);
+        end = next + ID_BLOCK;
+      }
+      return next++;
+    }
+    //! objects built by an evaluator stay confined to its thread until
+    //! published, other objects must only refer to shared ones
+    void adopt() {
+      if (container::Confine::active()) {
+        attributes.confine();
+        return;
+      }
+      share();
+      auto read = attributes.read();
+      for (const auto &reference : read.value.values) {
+        reference.publish();
+      }
+      if (const auto *tuple = std::get_if<Tuple>(&value); tuple != nullptr) {
+        for (const auto &reference : *tuple) {
+          reference.publish();
+        }
+      }
+    }
+    //! numbers move out of their thread's arena once other threads can see
+    //! them
+    void share() {
+      if (auto *number = std::get_if<Number>(&value); number != nullptr) {
+        number->share();
+      }
+    }
+    void changed() const {
+      if (auto *found = type.load(std::memory_order_acquire);
+          found != nullptr) {
+        found->changed();
+      }
+    }
+    [[nodiscard]] static auto layout(BasicAttributes &&attributes) -> Layout {
+      std::vector<Symbol> keys;
+      keys.reserve(attributes.size());
+      Layout layout;
+      layout.values.reserve(attributes.size());
+      for (auto &&[key, value] : attributes) {
+        keys.push_back(key);
+        layout.values.push_back(std::move(value));
+      }
+      layout.shape = Shape::of(keys);
+      if (!layout.shape) {
+        layout.dictionary = std::make_unique<Dictionary>(keys);
+      }
+      return layout;
+    }
     Attributes attributes;
     Value value;
+    const Id identity = next_id();
+    //! owned, null until this object is searched as a type
+    mutable std::atomic<Type *> type = nullptr;
   };
   class BaseException : virtual public std::exception {
   public:
@@ -251,24 +600,116 @@ namespace chimera::library::object::internal {
     KeyboardInterrupt();
   };
   template <template <typename...> class Pointer>
+  [[nodiscard]] auto ObjectPointer<Pointer>::find_attribute(Symbol key) const
+      -> std::optional<ObjectRef> {
+    return object->find(key);
+  }
+  template <template <typename...> class Pointer>
   [[nodiscard]] auto
-  ObjectPointer<Pointer>::get_attribute(std::string &&key) const
-      -> const ObjectRef & {
-    return get_attribute(key);
+  ObjectPointer<Pointer>::find_cached(const InlineCache &cache) const
+      -> std::optional<ObjectRef> {
+    const auto entry = cache.load();
+    if (!entry || entry->object != object->id()) {
+      return {};
+    }
+    return object->find(entry->shape, entry->slot, entry->type, entry->version);
   }
   template <template <typename...> class Pointer>
   [[nodiscard]] auto
-  ObjectPointer<Pointer>::get_attribute(const std::string &key) const
-      -> const ObjectRef & {
-    if (!object->contains(key)) {
-      throw AttributeError("object", key);
+  ObjectPointer<Pointer>::get_attribute(Symbol key) const -> ObjectRef {
+    if (auto found = object->find(key)) {
+      return *std::move(found);
+    }
+    throw AttributeError("object", key.name());
+  }
+  template <template <typename...> class Pointer>
+  [[nodiscard]] auto ObjectPointer<Pointer>::lookup(Symbol key) const
+      -> std::optional<ObjectRef> {
+    auto &self = object->as_type();
+    // read before searching, so a change racing with the search below leaves
+    // this result already stale
+    const auto version = self.version->load();
+    {
+      auto read = self.table.read();
+      if (auto cached = read.value.cache.find(key);
+          cached != read.value.cache.end() &&
+          cached->second.version == version) {
+        return cached->second.found;
+      }
+    }
+    Object::Cached cached{version, {}};
+    if (auto mro = object->find(symbols::MRO)) {
+      if (const auto tuple = mro->template get<Tuple>()) {
+        for (const auto &type : *tuple) {
+          // a change to any type searched here bumps this one too
+          if (auto &base = type.object->as_type(); &base != &self) {
+            base.table.write().value.subclasses.insert(self.version);
+          }
+          if (auto found = type.object->find(key)) {
+            cached.found = std::move(found);
+            break;
+          }
+        }
+      }
+    }
+    self.table.write().value.cache.insert_or_assign(key, cached);
+    return cached.found;
+  }
+  template <template <typename...> class Pointer>
+  void ObjectPointer<Pointer>::publish() const {
+    if (!object->confined()) {
+      return;
+    }
+    std::vector<ObjectRef> todo;
+    object->publish(todo);
+    while (!todo.empty()) {
+      auto next = std::move(todo.back());
+      todo.pop_back();
+      next.object->publish(todo);
+    }
+  }
+  template <template <typename...> class Pointer>
+  void ObjectPointer<Pointer>::remember(Symbol key, Id type,
+                                        std::uint64_t version,
+                                        const InlineCache &cache) const {
+    auto shape = object->shape();
+    if (!shape) {
+      return;
+    }
+    auto slot = shape->find(key);
+    if (!slot || shape->find(symbols::GETATTRIBUTE)) {
+      return;
+    }
+    cache.store(
+        InlineCache::Entry{object->id(), shape->id(), *slot, type, version});
+  }
+  template <template <typename...> class Pointer>
+  void ObjectPointer<Pointer>::destroy() noexcept {
+    std::vector<ObjectRef> todo;
+    object->drain(todo);
+    while (!todo.empty()) {
+      auto next = std::move(todo.back());
+      todo.pop_back();
+      next.object->drain(todo);
     }
-    return object->at(key);
   }
   template <template <typename...> class Pointer>
   [[nodiscard]] auto ObjectPointer<Pointer>::get_bool() const noexcept -> bool {
     return object->get_bool();
   }
+  //! one object per process for values that never differ, such as None.
+  //! never freed and never given attributes, their class comes from the
+  //! value itself.
+  template <typename Type>
+  [[nodiscard]] auto singleton() -> const ObjectRef & {
+    static const ObjectRef *const object = [] {
+      // NOLINTNEXTLINE(cppcoreguidelines-owning-memory)
+      const auto *created = new ObjectRef(Type{}, {});
+      created->publish();
+      return created;
+    }();
+    return *object;
+  }
 } // namespace chimera::library::object::internal
 namespace chimera::library::object {
   using internal::AttributeError;
@@ -279,6 +720,7 @@ namespace chimera::library::object {
   using internal::False;
   using internal::Future;
   using internal::Id;
+  using internal::InlineCache;
   using internal::Instance;
   using internal::KeyboardInterrupt;
   using internal::None;
@@ -293,6 +735,8 @@ namespace chimera::library::object {
   using internal::True;
   using internal::Tuple;
   using internal::TupleMethod;
+  using internal::WeakObject;
+  using internal::singleton;
   using Object = internal::ObjectRef;
 } // namespace chimera::library::object
 namespace chimera {
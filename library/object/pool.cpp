@@ -0,0 +1,145 @@
+//! size class pools for objects and their reference counts
+
+#include "object/pool.hpp"
+
+#include <array>
+#include <algorithm>
+#include <atomic>
+#include <bit>
+#include <cstdint>
+#include <mutex>
+#include <new>
+#include <vector>
+
+namespace chimera::library::object::pool {
+  //! blocks are carved out of chunks aligned to their size, so the chunk
+  //! header and with it the owning heap can be found from any block
+  static constexpr std::size_t CHUNK = std::size_t{1} << 16U;
+  static constexpr std::size_t CLASSES = LARGEST / GRANULE;
+  struct Block {
+    Block *next;
+  };
+  struct Heap;
+  struct alignas(GRANULE) Chunk {
+    Heap *owner;
+  };
+  struct Heap {
+    //! only touched by the thread using this heap
+    std::array<Block *, CLASSES> free{};
+    //! blocks freed by other threads, taken back all at once
+    std::array<std::atomic<Block *>, CLASSES> remote{};
+    std::byte *cursor = nullptr;
+    std::byte *end = nullptr;
+    std::vector<Chunk *> chunks;
+  };
+  //! heaps of threads that have exited, reused by new threads since blocks
+  //! from them may still be in use anywhere
+  struct Orphans {
+    std::mutex mutex;
+    std::vector<Heap *> heaps;
+  };
+  static auto orphans() -> Orphans & {
+    // NOLINTNEXTLINE(cppcoreguidelines-owning-memory)
+    static auto *const orphans = new Orphans();
+    return *orphans;
+  }
+  static auto adopt() -> Heap * {
+    auto &pool = orphans();
+    const std::lock_guard<std::mutex> lock(pool.mutex);
+    if (pool.heaps.empty()) {
+      // NOLINTNEXTLINE(cppcoreguidelines-owning-memory)
+      return new Heap();
+    }
+    auto *heap = pool.heaps.back();
+    pool.heaps.pop_back();
+    return heap;
+  }
+  // NOLINTBEGIN(cppcoreguidelines-avoid-non-const-global-variables)
+  static thread_local Heap *CURRENT = nullptr;
+  static thread_local bool EXITED = false;
+  static std::atomic<bool> ENABLED = true;
+  // NOLINTEND(cppcoreguidelines-avoid-non-const-global-variables)
+  //! hands the thread's heap on when the thread exits
+  struct Release {
+    Release() = default;
+    Release(const Release &other) = delete;
+    Release(Release &&other) = delete;
+    ~Release() noexcept {
+      auto &pool = orphans();
+      const std::lock_guard<std::mutex> lock(pool.mutex);
+      pool.heaps.push_back(CURRENT);
+      CURRENT = nullptr;
+      EXITED = true;
+    }
+    auto operator=(const Release &other) -> Release & = delete;
+    auto operator=(Release &&other) -> Release & = delete;
+  };
+  static auto local() -> Heap * {
+    if (CURRENT == nullptr) {
+      CURRENT = adopt();
+      // blocks allocated while the thread's other destructors run keep the
+      // heap they got, it is never handed on
+      if (!EXITED) {
+        static thread_local const Release release;
+      }
+    }
+    return CURRENT;
+  }
+  static auto size_class(std::size_t bytes) noexcept -> std::size_t {
+    return (std::max(bytes, sizeof(Block)) - 1) / GRANULE;
+  }
+  static auto carve(Heap *heap, std::size_t bytes) -> void * {
+    if (heap->end - heap->cursor < static_cast<std::ptrdiff_t>(bytes)) {
+      auto *chunk = static_cast<Chunk *>(
+          ::operator new(CHUNK, std::align_val_t{CHUNK}));
+      chunk->owner = heap;
+      heap->chunks.push_back(chunk);
+      // NOLINTBEGIN(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+      heap->cursor = reinterpret_cast<std::byte *>(chunk) + sizeof(Chunk);
+      heap->end = reinterpret_cast<std::byte *>(chunk) + CHUNK;
+      // NOLINTEND(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+    }
+    auto *block = heap->cursor;
+    // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+    heap->cursor += bytes;
+    return block;
+  }
+  auto enabled() noexcept -> bool {
+    return ENABLED.load(std::memory_order_relaxed);
+  }
+  void enable(bool value) noexcept {
+    ENABLED.store(value, std::memory_order_relaxed);
+  }
+  auto allocate(std::size_t bytes) -> void * {
+    auto *heap = local();
+    const auto index = size_class(bytes);
+    auto &free = heap->free.at(index);
+    if (free == nullptr) {
+      free = heap->remote.at(index).exchange(nullptr, std::memory_order_acquire);
+    }
+    if (free == nullptr) {
+      return carve(heap, (index + 1) * GRANULE);
+    }
+    auto *block = free;
+    free = block->next;
+    return block;
+  }
+  void deallocate(void *block, std::size_t bytes) noexcept {
+    const auto index = size_class(bytes);
+    auto *freed = static_cast<Block *>(block);
+    auto *chunk = std::bit_cast<Chunk *>(std::bit_cast<std::uintptr_t>(block) &
+                                         ~(CHUNK - 1));
+    auto *heap = chunk->owner;
+    if (heap == CURRENT) {
+      freed->next = heap->free.at(index);
+      heap->free.at(index) = freed;
+      return;
+    }
+    auto &remote = heap->remote.at(index);
+    freed->next = remote.load(std::memory_order_relaxed);
+    while (!remote.compare_exchange_weak(freed->next, freed,
+                                         std::memory_order_release,
+                                         std::memory_order_relaxed)) {
+    }
+  }
+} // namespace chimera::library::object::pool
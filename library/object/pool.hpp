@@ -0,0 +1,60 @@
+//! size class pools for objects and their reference counts
+
+#pragma once
+
+#include <cstddef> // for size_t
+#include <memory>  // for allocator
+
+namespace chimera::library::object {
+  namespace pool {
+    //! blocks above this many bytes come from the default allocator
+    constexpr std::size_t LARGEST = 512;
+    //! blocks are aligned to this many bytes
+    constexpr std::size_t GRANULE = 16;
+    //! whether allocators built from now on draw from the pools
+    [[nodiscard]] auto enabled() noexcept -> bool;
+    void enable(bool value) noexcept;
+    //! a block of at least bytes from the calling thread's pools
+    [[nodiscard]] auto allocate(std::size_t bytes) -> void *;
+    //! returns a block to the pool of the thread that allocated it
+    void deallocate(void *block, std::size_t bytes) noexcept;
+  } // namespace pool
+  //! allocator drawing from per thread size class pools. an allocator
+  //! remembers whether pools were enabled when it was built, so a block is
+  //! always freed the way it was allocated.
+  template <typename Type>
+  struct PoolAllocator {
+    using value_type = Type;
+    PoolAllocator() noexcept : pooled(pool::enabled()) {}
+    template <typename Other>
+    // NOLINTNEXTLINE(google-explicit-constructor,hicpp-explicit-conversions)
+    PoolAllocator(const PoolAllocator<Other> &other) noexcept
+        : pooled(other.pooled) {}
+    [[nodiscard]] auto allocate(std::size_t count) -> Type * {
+      if (fits(count)) {
+        return static_cast<Type *>(pool::allocate(count * sizeof(Type)));
+      }
+      return std::allocator<Type>{}.allocate(count);
+    }
+    void deallocate(Type *block, std::size_t count) noexcept {
+      if (fits(count)) {
+        return pool::deallocate(block, count * sizeof(Type));
+      }
+      std::allocator<Type>{}.deallocate(block, count);
+    }
+    template <typename Other>
+    [[nodiscard]] auto operator==(const PoolAllocator<Other> &other) const
+        noexcept -> bool {
+      return pooled == other.pooled;
+    }
+
+  private:
+    template <typename Other>
+    friend struct PoolAllocator;
+    [[nodiscard]] auto fits(std::size_t count) const noexcept -> bool {
+      return pooled && alignof(Type) <= pool::GRANULE &&
+             count <= pool::LARGEST / sizeof(Type);
+    }
+    bool pooled;
+  };
+} // namespace chimera::library::object
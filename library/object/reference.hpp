@@ -2,6 +2,8 @@
 
 #pragma once
 
+#include "object/pool.hpp" // for PoolAllocator
+
 #include <memory>      // for shared_ptr, weak_ptr
 #include <type_traits> // for add_lvalue_reference, add_pointer_t, enable_if_t
 #include <utility>     // for declval, forward
@@ -28,10 +30,12 @@ namespace chimera::library::object {
     template <template <typename...> class Pointer, typename Type>
     struct BaseReference {
       using RawPointer = std::add_pointer_t<Type>;
-      BaseReference() : pointer(std::make_shared<Type>()) {}
+      BaseReference()
+          : pointer(std::allocate_shared<Type>(PoolAllocator<Type>{})) {}
       template <typename... Args>
       explicit BaseReference(Args &&...args)
-          : pointer(std::make_shared<Type>(std::forward<Args>(args)...)) {}
+          : pointer(std::allocate_shared<Type>(PoolAllocator<Type>{},
+                                               std::forward<Args>(args)...)) {}
       template <
           template <typename...> class InterPointer, typename InterType,
           typename = EnableIfMismatch<Pointer<Type>, InterPointer<InterType>>>
@@ -73,6 +77,9 @@ namespace chimera::library::object {
       [[nodiscard]] auto operator->() const noexcept -> RawPointer {
         return CopyReference<Pointer, Type>{}(pointer).get();
       }
+      [[nodiscard]] auto use_count() const noexcept -> long {
+        return pointer.use_count();
+      }
 
     private:
       friend BaseReference<std::shared_ptr, Type>;
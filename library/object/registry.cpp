@@ -0,0 +1,30 @@
+//! objects found by id without keeping them alive
+
+#include "object/registry.hpp"
+
+#include <map>
+#include <memory>
+
+namespace chimera::library::object {
+  void Registry::insert(const Object &object) {
+    objects.insert_or_assign(object.id(), object.weak());
+  }
+  auto Registry::find(Id id) const -> std::optional<Object> {
+    auto read = objects.read();
+    auto found = read.value.find(id);
+    if (found == read.value.end()) {
+      return {};
+    }
+    try {
+      return Object(found->second);
+    } catch (const std::bad_weak_ptr &) {
+      return {};
+    }
+  }
+  void Registry::prune() {
+    std::erase_if(objects.write().value, [](const auto &entry) {
+      return entry.second.use_count() == 0;
+    });
+  }
+  auto Registry::size() const -> std::size_t { return objects.size(); }
+} // namespace chimera::library::object
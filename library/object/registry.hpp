@@ -0,0 +1,25 @@
+//! objects found by id without keeping them alive
+
+#pragma once
+
+#include "container/atomic_map.hpp" // for AtomicMap
+#include "object/object.hpp"        // for Id, Object, WeakObject
+
+#include <cstddef>  // for size_t
+#include <optional> // for optional
+
+namespace chimera::library::object {
+  //! weak references to the objects inserted, keyed by their ids
+  class Registry {
+  public:
+    void insert(const Object &object);
+    //! the object with id if it was inserted and is still alive
+    [[nodiscard]] auto find(Id id) const -> std::optional<Object>;
+    //! drops the entries of objects that no longer exist
+    void prune();
+    [[nodiscard]] auto size() const -> std::size_t;
+
+  private:
+    container::AtomicMap<Id, WeakObject> objects;
+  };
+} // namespace chimera::library::object
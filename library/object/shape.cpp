@@ -0,0 +1,204 @@
+//! shared attribute layouts for objects
+
+#include "object/shape.hpp"
+
+#include <algorithm>
+#include <atomic>
+#include <bit>
+#include <utility>
+
+namespace chimera::library::object::internal {
+  namespace {
+    auto next_id() noexcept -> std::uint64_t {
+      static std::atomic<std::uint64_t> next = 1;
+      return next.fetch_add(1, std::memory_order_relaxed);
+    }
+  } // namespace
+  //! names in slot order for a chain of shapes, each shape reading only the
+  //! first size() of them. only the shape at the end of the chain appends, a
+  //! shape branching off earlier copies its part into a table of its own.
+  //! lookups go through an open addressed index without locking.
+  class Shape::Table {
+  public:
+    static constexpr std::size_t MIN_CAPACITY = 4;
+    explicit Table(std::size_t capacity)
+        : names(capacity), index(capacity * 2) {}
+    //! the first size names of other with slot size already claimed for
+    //! the shape making the copy
+    Table(const Table &other, std::size_t size)
+        : Table(std::max(MIN_CAPACITY, std::bit_ceil(size + 1))) {
+      for (std::size_t slot = 0; slot < size; ++slot) {
+        put(slot, other.names[slot]);
+      }
+      used.store(size + 1, std::memory_order_relaxed);
+    }
+    Table(const Table &other) = delete;
+    Table(Table &&other) = delete;
+    ~Table() noexcept = default;
+    auto operator=(const Table &other) -> Table & = delete;
+    auto operator=(Table &&other) -> Table & = delete;
+    [[nodiscard]] auto at(std::size_t slot) const -> Symbol {
+      return names[slot];
+    }
+    //! takes slot for the caller unless another shape already appended it
+    [[nodiscard]] auto claim(std::size_t slot) noexcept -> bool {
+      auto expected = slot;
+      return slot < names.size() &&
+             used.compare_exchange_strong(expected, slot + 1);
+    }
+    //! slot of key, if it is one of the first size names
+    [[nodiscard]] auto find(Symbol key, std::size_t size) const noexcept
+        -> std::optional<std::size_t> {
+      const auto mask = index.size() - 1;
+      for (auto bucket = hash(key) & mask;; bucket = (bucket + 1) & mask) {
+        const auto entry = index[bucket].load(std::memory_order_acquire);
+        if (entry == 0) {
+          return {};
+        }
+        if (entry >> SLOT_BITS == key.id()) {
+          const auto slot = (entry & SLOT_MASK) - 1;
+          if (slot < size) {
+            return slot;
+          }
+          return {};
+        }
+      }
+    }
+    //! only called for a slot the caller claimed
+    void put(std::size_t slot, Symbol key) {
+      names[slot] = key;
+      const auto mask = index.size() - 1;
+      auto bucket = hash(key) & mask;
+      while (index[bucket].load(std::memory_order_relaxed) != 0) {
+        bucket = (bucket + 1) & mask;
+      }
+      index[bucket].store((std::uint64_t{key.id()} << SLOT_BITS) | (slot + 1),
+                          std::memory_order_release);
+    }
+
+  private:
+    static constexpr std::uint64_t SLOT_BITS = 32;
+    static constexpr std::uint64_t SLOT_MASK = (1ULL << SLOT_BITS) - 1;
+    [[nodiscard]] static auto hash(Symbol key) noexcept -> std::size_t {
+      return static_cast<std::size_t>(
+          (std::uint64_t{key.id()} * 0x9E3779B97F4A7C15ULL) >> SLOT_BITS);
+    }
+    std::vector<Symbol> names;
+    //! id in the high bits and slot plus one in the low, 0 while empty.
+    //! twice the capacity, so a probe always meets an empty bucket.
+    std::vector<std::atomic<std::uint64_t>> index;
+    std::atomic<std::size_t> used = 0;
+  };
+  Shape::Shape(Pointer parent, Symbol key, std::shared_ptr<Table> table)
+      : identity(next_id()), previous(std::move(parent)),
+        count(previous ? previous->count + 1 : 0), table(std::move(table)) {
+    if (previous) {
+      this->table->put(previous->count, key);
+    }
+  }
+  auto Shape::root() -> const Pointer & {
+    static const Pointer shape = std::make_shared<const Shape>(
+        nullptr, Symbol(), std::make_shared<Table>(Table::MIN_CAPACITY));
+    return shape;
+  }
+  auto Shape::of(const std::vector<Symbol> &keys) -> Pointer {
+    auto shape = root();
+    for (const auto &key : keys) {
+      if (shape = shape->add(key); !shape) {
+        return {};
+      }
+    }
+    return shape;
+  }
+  auto Shape::add(Symbol key) const -> Pointer {
+    {
+      auto read = transitions.read();
+      if (auto found = read.value.find(key); found != read.value.end()) {
+        if (auto shape = found->second.lock()) {
+          return shape;
+        }
+      }
+    }
+    if (count >= MAX_SIZE) {
+      return {};
+    }
+    auto write = transitions.write();
+    auto &children = write.value;
+    if (auto found = children.find(key); found != children.end()) {
+      if (auto shape = found->second.lock()) {
+        return shape;
+      }
+    }
+    std::erase_if(children,
+                  [](const auto &child) { return child.second.expired(); });
+    // every object starts at root, so only later shapes are limited
+    if (previous && children.size() >= MAX_TRANSITIONS) {
+      return {};
+    }
+    // the end of a full table or a branch gets a table of its own
+    auto next = table;
+    if (!next->claim(count)) {
+      next = std::make_shared<Table>(*table, count);
+    }
+    auto shape =
+        std::make_shared<const Shape>(shared_from_this(), key, std::move(next));
+    children.insert_or_assign(key, shape);
+    return shape;
+  }
+  auto Shape::find(Symbol key) const noexcept
+      -> std::optional<std::size_t> {
+    return table->find(key, count);
+  }
+  auto Shape::keys() const -> std::vector<std::string> {
+    std::vector<std::string> keys;
+    keys.reserve(count);
+    for (std::size_t slot = 0; slot < count; ++slot) {
+      keys.push_back(table->at(slot).name());
+    }
+    std::ranges::sort(keys);
+    return keys;
+  }
+  auto Shape::order() const -> std::vector<Symbol> {
+    std::vector<Symbol> keys;
+    keys.reserve(count);
+    for (std::size_t slot = 0; slot < count; ++slot) {
+      keys.push_back(table->at(slot));
+    }
+    return keys;
+  }
+  Dictionary::Dictionary(const std::vector<Symbol> &keys) {
+    names.reserve(keys.size());
+    for (const auto &key : keys) {
+      add(key);
+    }
+  }
+  void Dictionary::add(Symbol key) {
+    slots.try_emplace(key, names.size());
+    names.push_back(key);
+  }
+  auto Dictionary::find(Symbol key) const -> std::optional<std::size_t> {
+    if (auto found = slots.find(key); found != slots.end()) {
+      return found->second;
+    }
+    return {};
+  }
+  auto Dictionary::keys() const -> std::vector<std::string> {
+    std::vector<std::string> keys;
+    keys.reserve(names.size());
+    for (const auto &name : names) {
+      keys.push_back(name.name());
+    }
+    std::ranges::sort(keys);
+    return keys;
+  }
+  auto Dictionary::remove(Symbol key) -> std::size_t {
+    const auto slot = slots.at(key);
+    slots.erase(key);
+    if (slot + 1 != names.size()) {
+      names[slot] = names.back();
+      slots.at(names[slot]) = slot;
+    }
+    names.pop_back();
+    return slot;
+  }
+} // namespace chimera::library::object::internal
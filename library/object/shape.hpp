@@ -0,0 +1,88 @@
+//! shared attribute layouts for objects
+
+#pragma once
+
+#include "container/atomic_map.hpp" // for AtomicMap
+#include "object/symbol.hpp"         // for Symbol
+
+#include <cstddef>       // for size_t
+#include <cstdint>       // for uint64_t
+#include <memory>        // for shared_ptr, weak_ptr
+#include <optional>      // for optional
+#include <string>        // for string
+#include <unordered_map> // for unordered_map
+#include <vector>        // for vector
+
+namespace chimera::library::object::internal {
+  //! names of an object's attributes and the slot each value lives in.
+  //! shapes never change once built, objects that gain the same names in the
+  //! same order follow the same transitions and end up sharing one shape.
+  //! a shape only records the shape it extends and the name it added, the
+  //! names themselves sit in a table shared along the chain.
+  class Shape : public std::enable_shared_from_this<Shape> {
+    class Table;
+
+  public:
+    using Pointer = std::shared_ptr<const Shape>;
+    //! objects with more attributes than this keep a dictionary instead
+    static constexpr std::size_t MAX_SIZE = 1024;
+    //! names past this many live transitions from any shape but root go to
+    //! dictionaries, so objects used as mappings do not grow the tree
+    static constexpr std::size_t MAX_TRANSITIONS = 64;
+    Shape(Pointer parent, Symbol key, std::shared_ptr<Table> table);
+    Shape(const Shape &other) = delete;
+    Shape(Shape &&other) = delete;
+    ~Shape() noexcept = default;
+    auto operator=(const Shape &other) -> Shape & = delete;
+    auto operator=(Shape &&other) -> Shape & = delete;
+    //! the shape of an object without attributes
+    [[nodiscard]] static auto root() -> const Pointer &;
+    //! shape reached from root by adding each of keys in order, null if
+    //! that is past what shapes hold
+    [[nodiscard]] static auto of(const std::vector<Symbol> &keys) -> Pointer;
+    //! shape with key appended in the next slot, shared by every caller
+    //! while any object has it. null once this shape is full or has too
+    //! many transitions.
+    [[nodiscard]] auto add(Symbol key) const -> Pointer;
+    [[nodiscard]] auto find(Symbol key) const noexcept
+        -> std::optional<std::size_t>;
+    //! unique for the life of the process, never reused by a later shape
+    [[nodiscard]] auto id() const noexcept -> std::uint64_t { return identity; }
+    //! names in sorted order
+    [[nodiscard]] auto keys() const -> std::vector<std::string>;
+    //! names in slot order
+    [[nodiscard]] auto order() const -> std::vector<Symbol>;
+    //! the shape this one added its name to, null for root
+    [[nodiscard]] auto parent() const noexcept -> const Pointer & {
+      return previous;
+    }
+    [[nodiscard]] auto size() const noexcept -> std::size_t { return count; }
+
+  private:
+    std::uint64_t identity;
+    Pointer previous;
+    std::size_t count;
+    std::shared_ptr<Table> table;
+    mutable container::AtomicMap<Symbol, std::weak_ptr<const Shape>>
+        transitions;
+  };
+  //! slots of one object that stopped sharing shapes, because it deleted a
+  //! name other than its newest or outgrew them. changed in place under the
+  //! object's lock.
+  class Dictionary {
+  public:
+    explicit Dictionary(const std::vector<Symbol> &keys);
+    //! puts key in the next slot
+    void add(Symbol key);
+    [[nodiscard]] auto find(Symbol key) const -> std::optional<std::size_t>;
+    //! names in sorted order
+    [[nodiscard]] auto keys() const -> std::vector<std::string>;
+    //! forgets key and moves the name in the last slot into its slot,
+    //! returning that slot
+    auto remove(Symbol key) -> std::size_t;
+
+  private:
+    std::unordered_map<Symbol, std::size_t> slots;
+    std::vector<Symbol> names;
+  };
+} // namespace chimera::library::object::internal
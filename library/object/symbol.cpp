@@ -0,0 +1,95 @@
+//! attribute names interned to integers
+
+#include "object/symbol.hpp"
+
+#include "container/atomic_container.hpp"
+
+#include <gsl/gsl>
+
+#include <array>
+#include <atomic>
+#include <bit>
+#include <cstddef>
+#include <functional>
+#include <map>
+#include <utility>
+#include <vector>
+
+namespace chimera::library::object {
+  //! names by id, appended under the table's write lock and read without
+  //! any lock; chunk k holds 2^k names, so a name never moves once written
+  class SymbolNames {
+  public:
+    SymbolNames() { push_back(""); }
+    //! only called with the table's write lock held
+    void push_back(std::string name) {
+      const auto [chunk, offset] = locate(size++);
+      auto &names = gsl::at(owned, chunk);
+      if (names.empty()) {
+        names.resize(std::size_t{1} << chunk);
+        gsl::at(chunks, chunk).store(names.data(), std::memory_order_release);
+      }
+      names[offset] = std::move(name);
+    }
+    //! index was handed out by intern, which happens before any read of it
+    [[nodiscard]] auto operator[](std::uint32_t index) const
+        -> const std::string & {
+      const auto [chunk, offset] = locate(index);
+      const auto *names =
+          gsl::at(chunks, chunk).load(std::memory_order_acquire);
+      // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-pointer-arithmetic)
+      return names[offset];
+    }
+
+  private:
+    static constexpr std::size_t CHUNKS = 33;
+    [[nodiscard]] static auto locate(std::uint32_t index)
+        -> std::pair<std::size_t, std::size_t> {
+      const auto position = std::uint64_t{index} + 1;
+      const auto chunk = std::bit_width(position) - 1;
+      return {chunk, position - (std::uint64_t{1} << chunk)};
+    }
+    std::array<std::atomic<std::string *>, CHUNKS> chunks{};
+    //! sized once when first used, so chunks keeps pointing at the data
+    std::array<std::vector<std::string>, CHUNKS> owned;
+    std::uint32_t size = 0;
+  };
+  struct SymbolTable {
+    //! the empty name is always 0 so default symbols never take the lock
+    SymbolTable() : ids{{"", 0}} {}
+    std::map<std::string, std::uint32_t, std::less<>> ids;
+    SymbolNames names;
+  };
+  static auto symbol_table() -> container::AtomicContainer<SymbolTable> & {
+    static container::AtomicContainer<SymbolTable> table;
+    return table;
+  }
+  //! the names outlive the table's lock, so reads go straight to them
+  static auto symbol_names() -> const SymbolNames & {
+    static const SymbolNames &names = symbol_table().read().value.names;
+    return names;
+  }
+  static auto intern(std::string_view name) -> std::uint32_t {
+    {
+      auto read = symbol_table().read();
+      if (auto found = read.value.ids.find(name);
+          found != read.value.ids.end()) {
+        return found->second;
+      }
+    }
+    auto write = symbol_table().write();
+    auto id = gsl::narrow<std::uint32_t>(write.value.ids.size());
+    auto [found, inserted] =
+        write.value.ids.try_emplace(std::string(name), id);
+    if (inserted) {
+      write.value.names.push_back(found->first);
+    }
+    return found->second;
+  }
+  Symbol::Symbol(const char *name) : Symbol(std::string_view(name)) {}
+  Symbol::Symbol(const std::string &name) : Symbol(std::string_view(name)) {}
+  Symbol::Symbol(std::string_view name) : index(intern(name)) {}
+  auto Symbol::name() const -> const std::string & {
+    return symbol_names()[index];
+  }
+} // namespace chimera::library::object
@@ -0,0 +1,94 @@
+//! attribute names interned to integers
+
+#pragma once
+
+#include <compare>     // for strong_ordering
+#include <cstddef>     // for size_t
+#include <cstdint>     // for uint32_t
+#include <functional>  // for hash
+#include <string>      // for string
+#include <string_view> // for string_view
+
+namespace chimera::library::object {
+  //! a name interned once per process, so comparing two is comparing their
+  //! ids and the text is only looked at to intern or print it
+  class Symbol {
+  public:
+    constexpr Symbol() noexcept = default;
+    //! explicit so every lookup of the table is visible at its call site
+    explicit Symbol(const char *name);
+    explicit Symbol(const std::string &name);
+    explicit Symbol(std::string_view name);
+    [[nodiscard]] auto id() const noexcept -> std::uint32_t { return index; }
+    [[nodiscard]] auto name() const -> const std::string &;
+    [[nodiscard]] auto operator==(const Symbol &other) const noexcept
+        -> bool = default;
+    [[nodiscard]] auto operator<=>(const Symbol &other) const noexcept
+        -> std::strong_ordering = default;
+
+  private:
+    std::uint32_t index = 0;
+  };
+  //! names the virtual machine looks up at run time
+  namespace symbols {
+    inline const Symbol ADD("__add__");
+    inline const Symbol AND("__and__");
+    inline const Symbol ANNOTATIONS("__annotations__");
+    inline const Symbol ASSERTION_ERROR("AssertionError");
+    inline const Symbol ATTRIBUTE_ERROR("AttributeError");
+    inline const Symbol BOOL("__bool__");
+    inline const Symbol CALL("__call__");
+    inline const Symbol CLASS("__class__");
+    inline const Symbol CLOSURE("__closure__");
+    inline const Symbol CODE("__code__");
+    inline const Symbol CONTEXT("__context__");
+    inline const Symbol DEBUG("__debug__");
+    inline const Symbol DEFAULTS("__defaults__");
+    inline const Symbol DICT("dict");
+    inline const Symbol DIV("__div__");
+    inline const Symbol DOC("__doc__");
+    inline const Symbol ELLIPSIS("Ellipsis");
+    inline const Symbol FLOORDIV("__floordiv__");
+    inline const Symbol GETATTR("__getattr__");
+    inline const Symbol GETATTRIBUTE("__getattribute__");
+    inline const Symbol GLOBALS("__globals__");
+    inline const Symbol INVERT("__invert__");
+    inline const Symbol ITER("__iter__");
+    inline const Symbol KWDEFAULTS("__kwdefaults__");
+    inline const Symbol LIST("list");
+    inline const Symbol LSHIFT("__lshift__");
+    inline const Symbol MATMUL("__matmul__");
+    inline const Symbol MEMORY_ERROR("MemoryError");
+    inline const Symbol MOD("__mod__");
+    inline const Symbol MODULE("__module__");
+    inline const Symbol MRO("__mro__");
+    inline const Symbol MUL("__mul__");
+    inline const Symbol NAME("__name__");
+    inline const Symbol NEG("__neg__");
+    inline const Symbol NEXT("__next__");
+    inline const Symbol OBJECT("object");
+    inline const Symbol OR("__or__");
+    inline const Symbol OVERFLOW_ERROR("OverflowError");
+    inline const Symbol POS("__pos__");
+    inline const Symbol POW("__pow__");
+    inline const Symbol QUALNAME("__qualname__");
+    inline const Symbol RSHIFT("__rshift__");
+    inline const Symbol RUNTIME_ERROR("RuntimeError");
+    inline const Symbol SET("set");
+    inline const Symbol STOP_ITERATION("StopIteration");
+    inline const Symbol SUB("__sub__");
+    inline const Symbol TYPE_ERROR("TypeError");
+    inline const Symbol VALUE_ERROR("ValueError");
+    inline const Symbol XOR("__xor__");
+    inline const Symbol ZERO_DIVISION_ERROR("ZeroDivisionError");
+  } // namespace symbols
+} // namespace chimera::library::object
+//! ids are already unique and dense
+template <>
+struct std::hash<chimera::library::object::Symbol> {
+  [[nodiscard]] auto
+  operator()(const chimera::library::object::Symbol &symbol) const noexcept
+      -> std::size_t {
+    return symbol.id();
+  }
+};
@@ -0,0 +1,78 @@
+//! immutable tuple values shared between copies and slices
+
+#pragma once
+
+#include "object/pool.hpp" // for PoolAllocator
+
+#include <algorithm>        // for min
+#include <cstddef>          // for size_t
+#include <initializer_list> // for initializer_list
+#include <memory>           // for shared_ptr, allocate_shared
+#include <span>             // for span
+#include <utility>          // for exchange, move
+#include <vector>           // for vector
+
+namespace chimera::library::object::internal {
+  //! items never change once built, so copies and slices share one block and
+  //! only take a reference to it
+  template <typename Value>
+  class BasicTuple {
+  public:
+    using Items = std::vector<Value>;
+    using View = std::span<const Value>;
+    using value_type = Value;
+    using size_type = std::size_t;
+    using iterator = typename View::iterator;
+    using const_iterator = iterator;
+    BasicTuple() noexcept = default;
+    explicit BasicTuple(Items &&items)
+        : storage(items.empty() ? nullptr
+                                : std::allocate_shared<Items>(
+                                      PoolAllocator<Items>{}, std::move(items))),
+          view(storage ? View(*storage) : View()) {}
+    BasicTuple(std::initializer_list<Value> items)
+        : BasicTuple(Items(items)) {}
+    BasicTuple(const BasicTuple &other) noexcept = default;
+    BasicTuple(BasicTuple &&other) noexcept
+        : storage(std::move(other.storage)), view(std::exchange(other.view, {})) {
+    }
+    ~BasicTuple() noexcept = default;
+    auto operator=(const BasicTuple &other) noexcept -> BasicTuple & = default;
+    auto operator=(BasicTuple &&other) noexcept -> BasicTuple & {
+      storage = std::move(other.storage);
+      view = std::exchange(other.view, {});
+      return *this;
+    }
+    [[nodiscard]] auto operator[](size_type index) const noexcept
+        -> const Value & {
+      return view[index];
+    }
+    [[nodiscard]] auto begin() const noexcept -> iterator {
+      return view.begin();
+    }
+    [[nodiscard]] auto empty() const noexcept -> bool { return view.empty(); }
+    [[nodiscard]] auto end() const noexcept -> iterator { return view.end(); }
+    [[nodiscard]] auto front() const noexcept -> const Value & {
+      return view.front();
+    }
+    [[nodiscard]] auto size() const noexcept -> size_type {
+      return view.size();
+    }
+    //! items [first, last) clamped to this tuple, without copying any of them
+    [[nodiscard]] auto slice(size_type first, size_type last) const noexcept
+        -> BasicTuple {
+      last = std::min(last, size());
+      first = std::min(first, last);
+      if (first == last) {
+        return {};
+      }
+      BasicTuple result(*this);
+      result.view = view.subspan(first, last - first);
+      return result;
+    }
+
+  private:
+    std::shared_ptr<const Items> storage;
+    View view;
+  };
+} // namespace chimera::library::object::internal
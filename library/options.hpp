@@ -24,6 +24,8 @@ namespace chimera::library {
   } // namespace options
   struct Options {
     gsl::span<const char *> argv{};
+    //! run scripts from compiled code rather than walking the syntax tree
+    bool bytecode = false;
     options::BytesCompare bytes_compare = options::BytesCompare::NONE;
     const char *chimera = nullptr;
     bool debug = false;
@@ -5,7 +5,313 @@
 
 #include "virtual_machine/evaluator.hpp"
 
+#include <algorithm>
+#include <cstdint>
+#include <iterator>
+#include <limits>
+#include <optional>
+#include <ranges>
+#include <vector>
+
 namespace chimera::library::virtual_machine {
+  namespace {
+    using Result = std::optional<object::Number>;
+    [[noreturn]] void raise(const Evaluator &evaluator, object::Symbol name) {
+      throw object::BaseException(evaluator.builtins().get_attribute(name));
+    }
+    auto is_zero(const object::Number &number) -> bool {
+      return number == object::Number(0);
+    }
+    auto is_negative(const object::Number &number) -> bool {
+      return number < object::Number(0);
+    }
+    template <auto Assign>
+    auto apply(const Evaluator & /*evaluator*/, const object::Number &left,
+               const object::Number &right) -> Result {
+      auto result = left;
+      (result.*Assign)(right);
+      return result;
+    }
+    //! operators Python only defines on numbers for integers
+    template <auto Assign>
+    auto apply_int(const Evaluator & /*evaluator*/, const object::Number &left,
+                   const object::Number &right) -> Result {
+      if (!left.is_int() || !right.is_int()) {
+        return {};
+      }
+      auto result = left;
+      (result.*Assign)(right);
+      return result;
+    }
+    auto divide(const Evaluator &evaluator, const object::Number &left,
+                const object::Number &right) -> Result {
+      if (is_zero(right)) {
+        raise(evaluator, object::symbols::ZERO_DIVISION_ERROR);
+      }
+      auto result = left;
+      result /= right;
+      return result;
+    }
+    auto modulo(const Evaluator &evaluator, const object::Number &left,
+                const object::Number &right) -> Result {
+      if (!left.is_int() || !right.is_int()) {
+        return {};
+      }
+      if (is_zero(right)) {
+        raise(evaluator, object::symbols::ZERO_DIVISION_ERROR);
+      }
+      auto result = left;
+      result %= right;
+      return result;
+    }
+    auto floor_div(const Evaluator &evaluator, const object::Number &left,
+                   const object::Number &right) -> Result {
+      if (!left.is_int() || !right.is_int()) {
+        return {};
+      }
+      if (is_zero(right)) {
+        raise(evaluator, object::symbols::ZERO_DIVISION_ERROR);
+      }
+      return left.floor_div(right);
+    }
+    template <auto Assign>
+    auto shift(const Evaluator &evaluator, const object::Number &left,
+               const object::Number &right) -> Result {
+      if (!left.is_int() || !right.is_int()) {
+        return {};
+      }
+      if (is_negative(right)) {
+        raise(evaluator, object::symbols::VALUE_ERROR);
+      }
+      auto result = left;
+      (result.*Assign)(right);
+      return result;
+    }
+    auto power(const Evaluator &evaluator, const object::Number &left,
+               const object::Number &right) -> Result {
+      if (!left.is_int() || !right.is_int()) {
+        return {};
+      }
+      if (is_zero(left) && is_negative(right)) {
+        raise(evaluator, object::symbols::ZERO_DIVISION_ERROR);
+      }
+      return left.pow(right);
+    }
+    using Iterator = std::vector<asdl::ExprImpl>::const_iterator;
+    //! evaluates the next operand and applies the operator to it, one
+    //! operand at a time so operator methods run in source order
+    struct BinChain {
+      BinOperation operation;
+      Iterator next;
+      Iterator end;
+      void operator()(Evaluator *evaluator) const {
+        if (next == end) {
+          return;
+        }
+        evaluator->push(BinChain{operation, std::next(next), end});
+        evaluator->push(BinApply{operation});
+        evaluator->evaluate_get(*next);
+      }
+    };
+    //! leaves operands on the stack while they are numbers so they reduce in
+    //! one call, the first that is not hands the rest over to BinChain
+    struct BinNumbers {
+      BinOperation operation;
+      Iterator next;
+      Iterator end;
+      //! operands evaluated so far, all on top of the stack
+      std::size_t size;
+      void operator()(Evaluator *evaluator) const {
+        if (evaluator->stack_top().get<object::Number>()) {
+          if (next == end) {
+            return reduce(evaluator, size);
+          }
+          evaluator->push(
+              BinNumbers{operation, std::next(next), end, size + 1});
+          return evaluator->evaluate_get(*next);
+        }
+        if (size == 1) {
+          return BinChain{operation, next, end}(evaluator);
+        }
+        auto value = evaluator->stack_remove();
+        reduce(evaluator, size - 1);
+        evaluator->stack_push(value);
+        evaluator->push(BinChain{operation, next, end});
+        evaluator->push(BinApply{operation});
+      }
+
+    private:
+      void reduce(Evaluator *evaluator, std::size_t count) const {
+        if (count == 1) {
+          return;
+        }
+        const auto first = evaluator->stack_size() - count;
+        std::vector<object::Number> numbers;
+        numbers.reserve(count);
+        for (const auto &value : evaluator->stack_window(first)) {
+          numbers.push_back(*value.get<object::Number>());
+        }
+        evaluator->stack_truncate(first);
+        evaluator->stack_push(object::Object(operation.reduce(numbers), {}));
+      }
+    };
+    //! combines the top count values pairwise from the right
+    struct BinPower {
+      BinOperation operation;
+      std::size_t count;
+      void operator()(Evaluator *evaluator) const {
+        if (count == 1) {
+          return;
+        }
+        evaluator->push(BinPower{operation, count - 1});
+        BinApply{operation}(evaluator);
+      }
+    };
+    void push_chain(Evaluator *evaluator, asdl::Operator op,
+                    const Iterator &begin, const Iterator &end) {
+      if (begin == end) {
+        return;
+      }
+      const auto operation = bin_operation(op);
+      if (op == asdl::Operator::POW) {
+        // every operand is evaluated before power binds to the right
+        evaluator->push(
+            BinPower{operation, gsl::narrow<std::size_t>(end - begin)});
+        std::ranges::for_each(
+            std::ranges::subrange(begin, end) | std::views::reverse,
+            [evaluator](const auto &expr) { evaluator->evaluate_get(expr); });
+        return;
+      }
+      if (operation.reduce != nullptr) {
+        evaluator->push(BinNumbers{operation, std::next(begin), end, 1});
+      } else {
+        evaluator->push(BinChain{operation, std::next(begin), end});
+      }
+      evaluator->evaluate_get(*begin);
+    }
+    auto concat(const Evaluator & /*evaluator*/, const object::Object &left,
+                const object::Object &right) -> std::optional<object::Object> {
+      const auto leftString = left.get<object::String>();
+      const auto rightString = right.get<object::String>();
+      if (!leftString || !rightString) {
+        return {};
+      }
+      return object::Object(*leftString + *rightString, {});
+    }
+    auto repeat(const Evaluator &evaluator, const object::String &string,
+                const object::Number &count) -> std::optional<object::Object> {
+      if (!count.is_int()) {
+        return {};
+      }
+      if (object::Number(std::numeric_limits<std::int64_t>::max()) < count) {
+        raise(evaluator, object::symbols::OVERFLOW_ERROR);
+      }
+      if (is_negative(count) || string.empty()) {
+        return object::Object(object::String{}, {});
+      }
+      const auto times = static_cast<std::uint64_t>(count);
+      if (object::String{}.max_size() / string.size() < times) {
+        raise(evaluator, object::symbols::MEMORY_ERROR);
+      }
+      object::String result;
+      result.reserve(string.size() * times);
+      for (std::uint64_t idx = 0; idx < times; ++idx) {
+        result.append(string);
+      }
+      return object::Object(std::move(result), {});
+    }
+    auto repeat(const Evaluator &evaluator, const object::Object &left,
+                const object::Object &right) -> std::optional<object::Object> {
+      if (const auto string = left.get<object::String>()) {
+        if (const auto count = right.get<object::Number>()) {
+          return repeat(evaluator, *string, *count);
+        }
+      }
+      if (const auto string = right.get<object::String>()) {
+        if (const auto count = left.get<object::Number>()) {
+          return repeat(evaluator, *string, *count);
+        }
+      }
+      return {};
+    }
+  } // namespace
+  auto bin_operation(asdl::Operator op) -> BinOperation {
+    using object::Number;
+    switch (op) {
+      case asdl::Operator::ADD:
+        return {object::symbols::ADD, &apply<&Number::operator+=>,
+                &Number::sum, &concat};
+      case asdl::Operator::SUB:
+        return {object::symbols::SUB, &apply<&Number::operator-=>};
+      case asdl::Operator::MULT:
+        return {object::symbols::MUL, &apply<&Number::operator*=>,
+                &Number::product, &repeat};
+      case asdl::Operator::MAT_MULT:
+        return {object::symbols::MATMUL};
+      case asdl::Operator::DIV:
+        return {object::symbols::DIV, &divide};
+      case asdl::Operator::MOD:
+        return {object::symbols::MOD, &modulo};
+      case asdl::Operator::POW:
+        return {object::symbols::POW, &power};
+      case asdl::Operator::L_SHIFT:
+        return {object::symbols::LSHIFT, &shift<&Number::operator<<=>};
+      case asdl::Operator::R_SHIFT:
+        return {object::symbols::RSHIFT, &shift<&Number::operator>>=>};
+      case asdl::Operator::BIT_OR:
+        return {object::symbols::OR, &apply_int<&Number::operator|=>};
+      case asdl::Operator::BIT_XOR:
+        return {object::symbols::XOR, &apply_int<&Number::operator^=>};
+      case asdl::Operator::BIT_AND:
+        return {object::symbols::AND, &apply_int<&Number::operator&=>};
+      case asdl::Operator::FLOOR_DIV:
+        return {object::symbols::FLOORDIV, &floor_div};
+    }
+    Expects(false);
+  }
+  auto bin_reduce(const Evaluator &evaluator, const BinOperation &operation,
+                  gsl::span<const object::Number> numbers)
+      -> std::optional<object::Number> {
+    if (operation.reduce != nullptr) {
+      return operation.reduce(numbers);
+    }
+    if (operation.method == object::symbols::POW) {
+      auto result = std::optional{numbers.back()};
+      for (auto idx = numbers.size() - 1; result && idx != 0; --idx) {
+        result = operation.apply(evaluator, numbers[idx - 1], *result);
+      }
+      return result;
+    }
+    auto result = std::optional{numbers.front()};
+    for (std::size_t idx = 1; result && idx != numbers.size(); ++idx) {
+      result = operation.apply(evaluator, *result, numbers[idx]);
+    }
+    return result;
+  }
+  void BinApply::operator()(Evaluator *evaluatorA) const {
+    auto right = evaluatorA->stack_remove();
+    if (operation.apply != nullptr) {
+      auto left = evaluatorA->stack_top().get<object::Number>();
+      auto number = right.get<object::Number>();
+      if (left && number) {
+        if (auto result = operation.apply(*evaluatorA, *left, *number)) {
+          return evaluatorA->stack_top_update(
+              object::Object(*std::move(result), {}));
+        }
+      }
+    }
+    if (operation.strings != nullptr) {
+      if (auto result =
+              operation.strings(*evaluatorA, evaluatorA->stack_top(), right)) {
+        return evaluatorA->stack_top_update(*std::move(result));
+      }
+    }
+    evaluatorA->push([right](Evaluator *evaluatorB) {
+      evaluatorB->push(CallEvaluator{evaluatorB->stack_remove(), {right}});
+    });
+    evaluatorA->get_attribute(evaluatorA->stack_top(), operation.method);
+    evaluatorA->stack_pop();
+  }
   BinAddEvaluator::BinAddEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
       : BinAddEvaluator(exprs.begin(), exprs.end()) {}
@@ -13,19 +319,8 @@ namespace chimera::library::virtual_machine {
       const BinAddEvaluator::Iterator &begin,
       const BinAddEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinAddEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinAddEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__add__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinAddEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::ADD, begin, end);
   }
   BinSubEvaluator::BinSubEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -34,19 +329,8 @@ namespace chimera::library::virtual_machine {
       const BinSubEvaluator::Iterator &begin,
       const BinSubEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinSubEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinSubEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__sub__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinSubEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::SUB, begin, end);
   }
   BinMultEvaluator::BinMultEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -55,19 +339,8 @@ namespace chimera::library::virtual_machine {
       const BinMultEvaluator::Iterator &begin,
       const BinMultEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinMultEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinMultEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__mul__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinMultEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::MULT, begin, end);
   }
   BinMatMultEvaluator::BinMatMultEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -76,19 +349,8 @@ namespace chimera::library::virtual_machine {
       const BinMatMultEvaluator::Iterator &begin,
       const BinMatMultEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinMatMultEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinMatMultEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__matmul__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinMatMultEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::MAT_MULT, begin, end);
   }
   BinDivEvaluator::BinDivEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -97,19 +359,8 @@ namespace chimera::library::virtual_machine {
       const BinDivEvaluator::Iterator &begin,
       const BinDivEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinDivEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinDivEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__div__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinDivEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::DIV, begin, end);
   }
   BinModEvaluator::BinModEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -118,19 +369,8 @@ namespace chimera::library::virtual_machine {
       const BinModEvaluator::Iterator &begin,
       const BinModEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinModEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinModEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__mod__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinModEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::MOD, begin, end);
   }
   BinPowEvaluator::BinPowEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -139,19 +379,8 @@ namespace chimera::library::virtual_machine {
       const BinPowEvaluator::Iterator &begin,
       const BinPowEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinPowEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinPowEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__pow__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinPowEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::POW, begin, end);
   }
   BinLShiftEvaluator::BinLShiftEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -160,19 +389,8 @@ namespace chimera::library::virtual_machine {
       const BinLShiftEvaluator::Iterator &begin,
       const BinLShiftEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinLShiftEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinLShiftEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__lshift__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinLShiftEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::L_SHIFT, begin, end);
   }
   BinRShiftEvaluator::BinRShiftEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -181,19 +399,8 @@ namespace chimera::library::virtual_machine {
       const BinRShiftEvaluator::Iterator &begin,
       const BinRShiftEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinRShiftEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinRShiftEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__rshift__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinRShiftEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::R_SHIFT, begin, end);
   }
   BinBitOrEvaluator::BinBitOrEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -202,19 +409,8 @@ namespace chimera::library::virtual_machine {
       const BinBitOrEvaluator::Iterator &begin,
       const BinBitOrEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinBitOrEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinBitOrEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__or__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinBitOrEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::BIT_OR, begin, end);
   }
   BinBitXorEvaluator::BinBitXorEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -223,19 +419,8 @@ namespace chimera::library::virtual_machine {
       const BinBitXorEvaluator::Iterator &begin,
       const BinBitXorEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinBitXorEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinBitXorEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__xor__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinBitXorEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::BIT_XOR, begin, end);
   }
   BinBitAndEvaluator::BinBitAndEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -244,19 +429,8 @@ namespace chimera::library::virtual_machine {
       const BinBitAndEvaluator::Iterator &begin,
       const BinBitAndEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinBitAndEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinBitAndEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__and__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinBitAndEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::BIT_AND, begin, end);
   }
   BinFloorDivEvaluator::BinFloorDivEvaluator(
       const std::vector<asdl::ExprImpl> &exprs) noexcept
@@ -265,18 +439,7 @@ namespace chimera::library::virtual_machine {
       const BinFloorDivEvaluator::Iterator &begin,
       const BinFloorDivEvaluator::Iterator &end) noexcept
       : begin(begin), end(end) {}
-  void BinFloorDivEvaluator::operator()(Evaluator *evaluatorA) const {
-    if (begin != end) {
-      const auto &expr = *begin;
-      evaluatorA->push(BinFloorDivEvaluator{begin + 1, end});
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
-      });
-      evaluatorA->push([](Evaluator *evaluatorB) {
-        evaluatorB->get_attribute(evaluatorB->stack_top(), "__floordiv__");
-        evaluatorB->stack_pop();
-      });
-      evaluatorA->evaluate_get(expr);
-    }
+  void BinFloorDivEvaluator::operator()(Evaluator *evaluator) const {
+    push_chain(evaluator, asdl::Operator::FLOOR_DIV, begin, end);
   }
 } // namespace chimera::library::virtual_machine
@@ -5,10 +5,46 @@
 
 #include "asdl/asdl.hpp"
 
+#include <gsl/gsl>
+
+#include <cstddef>
+#include <optional>
 #include <vector>
 
 namespace chimera::library::virtual_machine {
   struct Evaluator;
+  //! the operator method for op and, when numbers have it, how they combine
+  struct BinOperation {
+    //! raises what Python raises for a zero divisor or negative shift, empty
+    //! when the operands are left to the operator method
+    using Apply = std::optional<object::Number> (*)(
+        const Evaluator &evaluator, const object::Number &left,
+        const object::Number &right);
+    //! for operators that cannot fail on numbers, combines all of them at once
+    using Reduce = object::Number (*)(gsl::span<const object::Number>);
+    //! the same for strings, agreeing with what parsing folds
+    using Strings = std::optional<object::Object> (*)(
+        const Evaluator &evaluator, const object::Object &left,
+        const object::Object &right);
+    object::Symbol method;
+    Apply apply = nullptr;
+    Reduce reduce = nullptr;
+    Strings strings = nullptr;
+  };
+  [[nodiscard]] auto bin_operation(asdl::Operator op) -> BinOperation;
+  //! combines numbers left to right, or right to left for power, empty when
+  //! some pair is left to the operator method
+  [[nodiscard]] auto bin_reduce(const Evaluator &evaluator,
+                                const BinOperation &operation,
+                                gsl::span<const object::Number> numbers)
+      -> std::optional<object::Number>;
+  //! replaces the top two values of the stack with the operation applied to
+  //! them, through the operator method unless both are numbers or strings it
+  //! handles
+  struct BinApply {
+    BinOperation operation;
+    void operator()(Evaluator *evaluatorA) const;
+  };
   struct BinAddEvaluator {
     explicit BinAddEvaluator(const std::vector<asdl::ExprImpl> &exprs) noexcept;
     void operator()(Evaluator *evaluator) const;
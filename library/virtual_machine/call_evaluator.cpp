@@ -5,36 +5,100 @@
 
 #include "object/object.hpp"
 #include "virtual_machine/evaluator.hpp"
+#include "virtual_machine/push_stack.hpp"
 
 #include <gsl/gsl>
 
+#include <cstddef>
+
 namespace chimera::library::virtual_machine {
+  namespace {
+    using Native = void (*)(Evaluator *evaluator, const object::Tuple &args);
+    void arity(const Evaluator *evaluator, const object::Tuple &args,
+               std::size_t size) {
+      if (args.size() != size) {
+        throw object::BaseException(
+            evaluator->builtins().get_attribute(object::symbols::TYPE_ERROR));
+      }
+    }
+    //! id(object) -> int
+    void identity(Evaluator *evaluator, const object::Tuple &args) {
+      arity(evaluator, args, 1);
+      evaluator->push(
+          PushStack{object::Object(object::Number(args.front().id()), {})});
+    }
+    //! sys._number_stats() -> (news, gets, deletes, live, peak_bytes, stalls,
+    //! average wait in nanoseconds)
+    void number_stats(Evaluator *evaluator, const object::Tuple &args) {
+      arity(evaluator, args, 0);
+      const auto stats = object::Number::stats();
+      const auto average =
+          stats.stalls == 0 ? 0 : stats.wait_nanos / stats.stalls;
+      object::Tuple::Items tuple;
+      for (auto value : {stats.news, stats.gets, stats.deletes, stats.live,
+                         stats.peak_bytes, stats.stalls, average}) {
+        tuple.emplace_back(object::Number(value),
+                           object::Object::BasicAttributes{});
+      }
+      evaluator->push(
+          PushStack{object::Object(object::Tuple(std::move(tuple)), {})});
+    }
+    auto native(object::SysCall sysCall) -> Native {
+      switch (sysCall) {
+        case object::SysCall::ID:
+          return &identity;
+        case object::SysCall::NUMBER_STATS:
+          return &number_stats;
+        case object::SysCall::COMPILE:
+        case object::SysCall::EVAL:
+        case object::SysCall::EXEC:
+        case object::SysCall::GLOBALS:
+        case object::SysCall::INPUT:
+        case object::SysCall::LOCALS:
+        case object::SysCall::PRINT:
+        case object::SysCall::OPEN:
+          break;
+      }
+      return nullptr;
+    }
+  } // namespace
   struct UnpackCallObject {
     template <typename Value>
     [[noreturn]] void evaluate(const Evaluator * /*evaluator*/,
                                const Value & /*exprImpl*/) const {
       Expects(false);
     }
+    void evaluate(Evaluator *evaluator, const object::SysCall &sysCall) const {
+      const auto call = native(sysCall);
+      Expects(call != nullptr);
+      call(evaluator, args);
+    }
     void operator()(Evaluator *evaluator) const {
-      auto object = evaluator->stack_remove();
       object.visit([this, evaluator](auto &&value) {
         this->evaluate(evaluator, value);
       });
     }
+    object::Object object;
+    object::Tuple args;
   };
+  auto is_native(const object::Object &object) -> bool {
+    const auto sysCall = object.get<object::SysCall>();
+    return sysCall && native(*sysCall) != nullptr;
+  }
   CallEvaluator::CallEvaluator(object::Object object) noexcept
       : object(std::move(object)) {}
   CallEvaluator::CallEvaluator(object::Object object,
                                object::Tuple args) noexcept
       : object(std::move(object)), args(std::move(args)) {}
   void CallEvaluator::operator()(Evaluator *evaluatorA) const {
+    evaluatorA->safepoint();
     if (object.get<object::Instance>()) {
       evaluatorA->push([](Evaluator *evaluatorB) {
         std::ignore = evaluatorB->stack_remove();
       });
-      evaluatorA->get_attribute(object, "__call__");
+      evaluatorA->get_attribute(object, object::symbols::CALL);
     } else {
-      evaluatorA->push(UnpackCallObject{});
+      evaluatorA->push(UnpackCallObject{object, args});
     }
   }
 } // namespace chimera::library::virtual_machine
@@ -9,6 +9,9 @@
 
 namespace chimera::library::virtual_machine {
   struct Evaluator;
+  //! runtime calls with a native implementation, which CallEvaluator runs
+  //! with the arguments it was given, leaving the result on the stack
+  [[nodiscard]] auto is_native(const object::Object &object) -> bool;
   struct CallEvaluator {
     explicit CallEvaluator(object::Object object) noexcept;
     CallEvaluator(object::Object object, object::Tuple args) noexcept;
@@ -0,0 +1,233 @@
+//! compiles a module to a flat instruction array run by CodeEvaluator
+
+#include "virtual_machine/code.hpp"
+
+#include "asdl/asdl.hpp"
+
+#include <gsl/gsl>
+
+#include <cstddef>
+#include <cstdint>
+#include <ranges>
+#include <utility>
+#include <vector>
+
+namespace chimera::library::virtual_machine {
+  //! lowers statements and the expressions CodeEvaluator runs itself,
+  //! everything else is handed to the tree evaluator one node at a time
+  class Compiler {
+  public:
+    explicit Compiler(Code &code) noexcept : code(code) {}
+    void module(const asdl::Module &module) {
+      if (const auto &doc_string = module.doc(); doc_string) {
+        constant(doc_string->string);
+      } else {
+        constant(object::singleton<object::None>());
+      }
+      emit(OpCode::STORE_NAME, name(object::symbols::DOC));
+      body(module.iter());
+    }
+
+  private:
+    //! jumps out of the innermost loop that still need their target
+    struct Loop {
+      std::uint32_t start;
+      std::vector<std::size_t> breaks;
+    };
+    [[nodiscard]] auto here() const -> std::uint32_t {
+      return gsl::narrow<std::uint32_t>(code.instructions.size());
+    }
+    auto emit(OpCode op, std::uint32_t arg = 0, std::uint8_t flags = 0)
+        -> std::size_t {
+      code.instructions.push_back(Instruction{op, flags, arg});
+      return code.instructions.size() - 1;
+    }
+    void patch(std::size_t instruction) {
+      code.instructions[instruction].arg = here();
+    }
+    void constant(const object::Object &object) {
+      code.constants.push_back(object);
+      emit(OpCode::CONST,
+           gsl::narrow<std::uint32_t>(code.constants.size() - 1));
+    }
+    [[nodiscard]] auto name(object::Symbol symbol) -> std::uint32_t {
+      code.names.push_back(symbol);
+      code.caches.emplace_back();
+      return gsl::narrow<std::uint32_t>(code.names.size() - 1);
+    }
+    [[nodiscard]] auto expr(const asdl::ExprImpl &asdlExpr) -> std::uint32_t {
+      code.exprs.push_back(&asdlExpr);
+      return gsl::narrow<std::uint32_t>(code.exprs.size() - 1);
+    }
+    void body(const std::vector<asdl::StmtImpl> &stmts) {
+      for (const auto &stmt : stmts) {
+        stmt.visit([this, &stmt](const auto &value) { compile(value, stmt); });
+      }
+    }
+    void get(const asdl::ExprImpl &asdlExpr) {
+      asdlExpr.visit(
+          [this, &asdlExpr](const auto &value) { compile(value, asdlExpr); });
+    }
+    void set(const asdl::ExprImpl &target) {
+      target.visit(
+          [this, &target](const auto &value) { store(value, target); });
+    }
+    void store(const asdl::Attribute &attribute,
+               const asdl::ExprImpl & /*target*/) {
+      get(attribute.value);
+      emit(OpCode::STORE_ATTR, name(attribute.attr.symbol));
+    }
+    void store(const asdl::Name &asdlName, const asdl::ExprImpl & /*target*/) {
+      emit(OpCode::STORE_NAME, name(asdlName.symbol));
+    }
+    template <typename Type>
+    void store(const Type & /*value*/, const asdl::ExprImpl &target) {
+      emit(OpCode::STORE, expr(target));
+    }
+    //! power evaluates every operand before binding to the right, the rest
+    //! apply to each operand as soon as it is evaluated
+    void compile(const asdl::Bin &bin, const asdl::ExprImpl & /*asdlExpr*/) {
+      const auto op = static_cast<std::uint8_t>(bin.op);
+      if (bin.op == asdl::Operator::POW) {
+        for (const auto &value : bin.values) {
+          get(value);
+        }
+        emit(OpCode::BINARY, gsl::narrow<std::uint32_t>(bin.values.size()),
+             op);
+        return;
+      }
+      get(bin.values.front());
+      for (const auto &value : bin.values | std::views::drop(1)) {
+        get(value);
+        emit(OpCode::BINARY, 2, op);
+      }
+    }
+    void compile(const asdl::Attribute &attribute,
+                 const asdl::ExprImpl & /*asdlExpr*/) {
+      get(attribute.value);
+      emit(OpCode::LOAD_ATTR, name(attribute.attr.symbol));
+    }
+    //! calls with keywords go to the tree evaluator
+    void compile(const asdl::Call &call, const asdl::ExprImpl &asdlExpr) {
+      if (!call.keywords.empty()) {
+        return compile<asdl::Call>(call, asdlExpr);
+      }
+      get(call.func);
+      for (const auto &arg : call.args) {
+        get(arg);
+      }
+      emit(OpCode::CALL, gsl::narrow<std::uint32_t>(call.args.size()));
+    }
+    void compile(const asdl::Name &asdlName,
+                 const asdl::ExprImpl & /*asdlExpr*/) {
+      emit(OpCode::LOAD_NAME, name(asdlName.symbol));
+    }
+    void compile(const asdl::NameConstant &nameConstant,
+                 const asdl::ExprImpl & /*asdlExpr*/) {
+      switch (nameConstant.value) {
+        case asdl::NameConstant::FALSE:
+          return constant(object::singleton<object::False>());
+        case asdl::NameConstant::NONE:
+          return constant(object::singleton<object::None>());
+        case asdl::NameConstant::TRUE:
+          return constant(object::singleton<object::True>());
+      }
+    }
+    void compile(const object::Object &object,
+                 const asdl::ExprImpl & /*asdlExpr*/) {
+      constant(object);
+    }
+    void compile(const asdl::Tuple &tuple,
+                 const asdl::ExprImpl & /*asdlExpr*/) {
+      for (const auto &elt : tuple.elts) {
+        get(elt);
+      }
+      emit(OpCode::BUILD_TUPLE, gsl::narrow<std::uint32_t>(tuple.elts.size()));
+    }
+    template <typename Type>
+    void compile(const Type & /*value*/, const asdl::ExprImpl &asdlExpr) {
+      emit(OpCode::EXPR, expr(asdlExpr));
+    }
+    void compile(const asdl::Assign &assign, const asdl::StmtImpl & /*stmt*/) {
+      get(assign.value);
+      for (std::size_t idx = 0; idx < assign.targets.size(); ++idx) {
+        if (idx + 1 < assign.targets.size()) {
+          emit(OpCode::DUP);
+        }
+        set(assign.targets[idx]);
+      }
+    }
+    void compile(const asdl::Break &asdlBreak, const asdl::StmtImpl &stmt) {
+      if (loops.empty()) {
+        return compile<asdl::Break>(asdlBreak, stmt);
+      }
+      loops.back().breaks.push_back(emit(OpCode::JUMP));
+    }
+    void compile(const asdl::Continue &asdlContinue,
+                 const asdl::StmtImpl &stmt) {
+      if (loops.empty()) {
+        return compile<asdl::Continue>(asdlContinue, stmt);
+      }
+      emit(OpCode::JUMP, loops.back().start);
+    }
+    void compile(const asdl::Expr &asdlExpr, const asdl::StmtImpl & /*stmt*/) {
+      get(asdlExpr.value);
+      emit(OpCode::POP);
+    }
+    void compile(const asdl::For &asdlFor, const asdl::StmtImpl & /*stmt*/) {
+      get(asdlFor.iter);
+      emit(OpCode::GET_ITER);
+      loops.push_back(Loop{here(), {}});
+      const auto exhausted = emit(OpCode::FOR_ITER);
+      set(asdlFor.target);
+      body(asdlFor.body);
+      emit(OpCode::JUMP, loops.back().start);
+      // break leaves the iterator on the stack
+      for (const auto jump : loops.back().breaks) {
+        patch(jump);
+      }
+      loops.pop_back();
+      emit(OpCode::POP);
+      const auto end = emit(OpCode::JUMP);
+      patch(exhausted);
+      body(asdlFor.orelse);
+      patch(end);
+    }
+    void compile(const asdl::Return &asdlReturn,
+                 const asdl::StmtImpl & /*stmt*/) {
+      if (asdlReturn.value) {
+        get(*asdlReturn.value);
+        emit(OpCode::RETURN, 1);
+      } else {
+        emit(OpCode::RETURN);
+      }
+    }
+    void compile(const asdl::While &asdlWhile,
+                 const asdl::StmtImpl & /*stmt*/) {
+      loops.push_back(Loop{here(), {}});
+      get(asdlWhile.test);
+      const auto exhausted = emit(OpCode::JUMP_IF_FALSE);
+      body(asdlWhile.body);
+      emit(OpCode::JUMP, loops.back().start);
+      patch(exhausted);
+      auto breaks = std::move(loops.back().breaks);
+      loops.pop_back();
+      body(asdlWhile.orelse);
+      for (const auto jump : breaks) {
+        patch(jump);
+      }
+    }
+    template <typename Type>
+    void compile(const Type & /*value*/, const asdl::StmtImpl &stmt) {
+      code.stmts.push_back(&stmt);
+      emit(OpCode::STMT, gsl::narrow<std::uint32_t>(code.stmts.size() - 1));
+    }
+    Code &code;
+    std::vector<Loop> loops;
+  };
+  auto compile(const asdl::Module &module) -> Code {
+    Code code;
+    Compiler(code).module(module);
+    return code;
+  }
+} // namespace chimera::library::virtual_machine
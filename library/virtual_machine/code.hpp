@@ -0,0 +1,71 @@
+//! compiles a module to a flat instruction array run by CodeEvaluator
+
+#pragma once
+
+#include "asdl/asdl.hpp"
+#include "object/object.hpp"
+
+#include <cstdint> // for uint8_t, uint32_t
+#include <vector>  // for vector
+
+namespace chimera::library::virtual_machine {
+  enum class OpCode : std::uint8_t {
+    //! reduce arg operands with the operator in flags, which is two except
+    //! for power
+    BINARY,
+    //! form a tuple from the top arg values
+    BUILD_TUPLE,
+    //! call the value under the top arg values with them as positional
+    //! arguments, replacing all of them with the result
+    CALL,
+    //! push constants[arg]
+    CONST,
+    //! push the top value again
+    DUP,
+    //! push the value of exprs[arg] through the tree evaluator
+    EXPR,
+    //! replace the top value with the next item of it, or pop it and jump to
+    //! arg once it is exhausted
+    FOR_ITER,
+    //! replace the top value with its iterator
+    GET_ITER,
+    //! continue at arg
+    JUMP,
+    //! pop the top value and continue at arg when it is false
+    JUMP_IF_FALSE,
+    //! replace the top value with its attribute names[arg]
+    LOAD_ATTR,
+    //! push the attribute names[arg] of the scope
+    LOAD_NAME,
+    //! drop the top value
+    POP,
+    //! stop, first popping the top value as the return value when arg is one
+    RETURN,
+    //! run stmts[arg] through the tree evaluator
+    STMT,
+    //! pop the top value into the target exprs[arg] through the tree evaluator
+    STORE,
+    //! pop an object and then a value, storing the value in the attribute
+    //! names[arg] of the object
+    STORE_ATTR,
+    //! pop the top value into the attribute names[arg] of the scope
+    STORE_NAME,
+  };
+  struct Instruction {
+    OpCode op;
+    std::uint8_t flags = 0;
+    std::uint32_t arg = 0;
+  };
+  //! instructions and the tables their arguments index. refers into the
+  //! module it was compiled from, which must outlive it.
+  struct Code {
+    std::vector<Instruction> instructions;
+    std::vector<object::Object> constants;
+    std::vector<object::Symbol> names;
+    //! where each of names was last found by LOAD_NAME or LOAD_ATTR
+    std::vector<object::InlineCache> caches;
+    std::vector<const asdl::ExprImpl *> exprs;
+    std::vector<const asdl::StmtImpl *> stmts;
+  };
+  [[nodiscard]] auto compile(const asdl::Module &module) -> Code;
+} // namespace chimera::library::virtual_machine
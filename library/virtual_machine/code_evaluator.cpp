@@ -0,0 +1,230 @@
+//! runs compiled code in a single dispatch loop
+
+#include "virtual_machine/code_evaluator.hpp"
+
+#include "asdl/asdl.hpp"
+#include "virtual_machine/evaluator.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <utility>
+#include <vector>
+
+namespace chimera::library::virtual_machine {
+  CodeEvaluator::CodeEvaluator(Evaluator *evaluator) noexcept
+      : evaluator(evaluator) {}
+  // NOLINTNEXTLINE(readability-function-cognitive-complexity)
+  void CodeEvaluator::evaluate(const Code &code) {
+    const auto &thread_context = evaluator->thread_context;
+    evaluator->safepoint();
+    for (std::size_t pc = 0; pc < code.instructions.size();) {
+      const auto instruction = code.instructions[pc++];
+      switch (instruction.op) {
+        case OpCode::BINARY:
+          binary(instruction.arg, instruction.flags);
+          break;
+        case OpCode::BUILD_TUPLE: {
+          if (instruction.arg == 0) {
+            evaluator->stack_push(object::singleton<object::Tuple>());
+            break;
+          }
+          const auto first = evaluator->stack_size() - instruction.arg;
+          const auto items = evaluator->stack_window(first);
+          object::Tuple tuple(object::Tuple::Items(items.begin(), items.end()));
+          evaluator->stack_truncate(first);
+          evaluator->stack_push(object::Object(std::move(tuple), {}));
+          break;
+        }
+        case OpCode::CALL:
+          call(instruction.arg);
+          break;
+        case OpCode::CONST:
+          evaluator->stack_push(code.constants[instruction.arg]);
+          break;
+        case OpCode::DUP: {
+          auto top = evaluator->stack_top();
+          evaluator->stack_push(top);
+          break;
+        }
+        case OpCode::EXPR: {
+          const auto depth = evaluator->scope.depth();
+          const auto size = evaluator->stack_size() + 1;
+          evaluator->evaluate_get(*code.exprs[instruction.arg]);
+          run(depth, size);
+          break;
+        }
+        case OpCode::FOR_ITER: {
+          const auto size = evaluator->stack_size();
+          try {
+            call_method(evaluator->stack_top(), object::symbols::NEXT);
+          } catch (const object::BaseException &error) {
+            if (error.class_id() !=
+                evaluator->builtins()
+                    .get_attribute(object::symbols::STOP_ITERATION)
+                    .id()) {
+              throw;
+            }
+            evaluator->stack_truncate(size - 1);
+            pc = instruction.arg;
+          }
+          break;
+        }
+        case OpCode::GET_ITER:
+          call_method(evaluator->stack_remove(), object::symbols::ITER);
+          break;
+        case OpCode::JUMP:
+          evaluator->safepoint();
+          pc = instruction.arg;
+          break;
+        case OpCode::JUMP_IF_FALSE:
+          if (!to_bool(evaluator->stack_remove())) {
+            pc = instruction.arg;
+          }
+          break;
+        case OpCode::LOAD_ATTR:
+          load_attr(code.names[instruction.arg], code.caches[instruction.arg]);
+          break;
+        case OpCode::LOAD_NAME:
+          load_name(code.names[instruction.arg], code.caches[instruction.arg]);
+          break;
+        case OpCode::POP:
+          evaluator->stack_pop();
+          break;
+        case OpCode::RETURN:
+          if (instruction.arg != 0) {
+            thread_context->return_value(evaluator->stack_remove());
+          }
+          return;
+        case OpCode::STMT: {
+          const auto depth = evaluator->scope.depth();
+          const auto size = evaluator->stack_size();
+          evaluator->evaluate(*code.stmts[instruction.arg]);
+          run(depth, size);
+          break;
+        }
+        case OpCode::STORE: {
+          // the value is left on the stack for the target to take
+          const auto depth = evaluator->scope.depth();
+          const auto size = evaluator->stack_size() - 1;
+          evaluator->evaluate_set(*code.exprs[instruction.arg]);
+          run(depth, size);
+          break;
+        }
+        case OpCode::STORE_ATTR: {
+          auto object = evaluator->stack_remove();
+          object.set_attribute(code.names[instruction.arg],
+                               evaluator->stack_remove());
+          break;
+        }
+        case OpCode::STORE_NAME:
+          evaluator->self().set_attribute(code.names[instruction.arg],
+                                          evaluator->stack_remove());
+          break;
+      }
+    }
+  }
+  //! reduces numbers in one call, anything else goes through the operator
+  //! methods as the tree evaluator does
+  void CodeEvaluator::binary(std::uint32_t size, std::uint8_t op) {
+    const auto operation = bin_operation(static_cast<asdl::Operator>(op));
+    const auto first = evaluator->stack_size() - size;
+    const auto operands = evaluator->stack_window(first);
+    numbers.clear();
+    for (const auto &operand : operands) {
+      auto number = operand.get<object::Number>();
+      if (!number || operation.apply == nullptr) {
+        break;
+      }
+      numbers.push_back(*number);
+    }
+    if (numbers.size() == operands.size()) {
+      if (auto result = bin_reduce(*evaluator, operation, numbers)) {
+        evaluator->stack_truncate(first);
+        return evaluator->stack_push(object::Object(*std::move(result), {}));
+      }
+    }
+    // only power has more than two operands, and it binds to the right
+    const auto depth = evaluator->scope.depth();
+    for (std::size_t idx = 1; idx != size; ++idx) {
+      evaluator->push(BinApply{operation});
+    }
+    run(depth, first + 1);
+  }
+  void CodeEvaluator::call(std::uint32_t size) {
+    evaluator->safepoint();
+    const auto first = evaluator->stack_size() - size;
+    auto callee = evaluator->stack_window(first - 1).front();
+    const auto depth = evaluator->scope.depth();
+    if (is_native(callee)) {
+      const auto values = evaluator->stack_window(first);
+      object::Tuple args(object::Tuple::Items(values.begin(), values.end()));
+      evaluator->stack_truncate(first - 1);
+      evaluator->push(CallEvaluator{std::move(callee), std::move(args)});
+    } else {
+      evaluator->stack_truncate(first - 1);
+      evaluator->push([](Evaluator *evaluatorA) {
+        evaluatorA->stack_push(evaluatorA->return_value());
+      });
+      evaluator->enter_scope(callee);
+    }
+    run(depth, first);
+  }
+  void CodeEvaluator::call_method(const object::Object &object,
+                                  object::Symbol name) {
+    const auto depth = evaluator->scope.depth();
+    const auto size = evaluator->stack_size();
+    evaluator->push([](Evaluator *evaluatorA) {
+      evaluatorA->push(CallEvaluator{evaluatorA->stack_remove()});
+    });
+    evaluator->get_attribute(object, name);
+    run(depth, size + 1);
+    if (evaluator->stack_size() == size) {
+      evaluator->stack_push(object::singleton<object::None>());
+    }
+  }
+  void CodeEvaluator::load_attr(object::Symbol name,
+                                const object::InlineCache &cache) {
+    auto object = evaluator->stack_remove();
+    if (auto found = evaluator->find_attribute(object, name, cache)) {
+      return evaluator->stack_push(*found);
+    }
+    const auto depth = evaluator->scope.depth();
+    const auto size = evaluator->stack_size() + 1;
+    evaluator->get_attribute(object, name);
+    run(depth, size);
+  }
+  void CodeEvaluator::load_name(object::Symbol name,
+                                const object::InlineCache &cache) {
+    const auto &self = evaluator->self();
+    if (auto found = evaluator->find_attribute(self, name, cache)) {
+      return evaluator->stack_push(*found);
+    }
+    const auto depth = evaluator->scope.depth();
+    const auto size = evaluator->stack_size() + 1;
+    evaluator->get_attribute(self, name);
+    run(depth, size);
+  }
+  void CodeEvaluator::run(const Scopes::Depth &depth, std::size_t size) {
+    evaluator->run(depth);
+    if (evaluator->stack_size() > size) {
+      evaluator->stack_truncate(size);
+    }
+  }
+  auto CodeEvaluator::to_bool(const object::Object &object) -> bool {
+    if (object.get<object::False>() || object.get<object::None>()) {
+      return false;
+    }
+    if (object.get<object::True>()) {
+      return true;
+    }
+    if (auto number = object.get<object::Number>()) {
+      return !(*number == object::Number(0));
+    }
+    const auto depth = evaluator->scope.depth();
+    const auto size = evaluator->stack_size();
+    evaluator->push(ToBoolEvaluator{object});
+    run(depth, size + 1);
+    return evaluator->stack_size() != size &&
+           evaluator->stack_remove().get_bool();
+  }
+} // namespace chimera::library::virtual_machine
@@ -0,0 +1,34 @@
+//! runs compiled code in a single dispatch loop
+
+#pragma once
+
+#include "object/object.hpp"
+#include "virtual_machine/code.hpp"
+#include "virtual_machine/evaluator.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace chimera::library::virtual_machine {
+  struct CodeEvaluator {
+    explicit CodeEvaluator(Evaluator *evaluator) noexcept;
+    void evaluate(const Code &code);
+
+  private:
+    void binary(std::uint32_t size, std::uint8_t op);
+    //! calls the value under the top size values as a Call expression does
+    void call(std::uint32_t size);
+    //! pushes the result of calling the method name of object, or None
+    void call_method(const object::Object &object, object::Symbol name);
+    void load_attr(object::Symbol name, const object::InlineCache &cache);
+    void load_name(object::Symbol name, const object::InlineCache &cache);
+    //! runs what the tree evaluator was handed since depth in the scope of
+    //! the code, dropping any values beyond size it leaves behind
+    void run(const Scopes::Depth &depth, std::size_t size);
+    [[nodiscard]] auto to_bool(const object::Object &object) -> bool;
+    Evaluator *evaluator;
+    //! reused by every binary operation so loops do not allocate for them
+    std::vector<object::Number> numbers;
+  };
+} // namespace chimera::library::virtual_machine
@@ -13,7 +13,7 @@ namespace chimera::library::virtual_machine {
   void DelEvaluator::evaluate(const asdl::Attribute &attribute) const {
     evaluator->push([&attribute](Evaluator *evaluatorA) {
       auto top = evaluatorA->stack_top();
-      top.delete_attribute(attribute.attr.value);
+      top.delete_attribute(attribute.attr.symbol);
       evaluatorA->stack_pop();
     });
     evaluator->evaluate_get(attribute.value);
@@ -25,6 +25,6 @@ namespace chimera::library::virtual_machine {
     evaluator->evaluate_get(starred.value);
   }
   void DelEvaluator::evaluate(const asdl::Name &name) const {
-    evaluator->get_attribute(evaluator->self(), name.value);
+    evaluator->get_attribute(evaluator->self(), name.symbol);
   }
 } // namespace chimera::library::virtual_machine
@@ -4,6 +4,8 @@
 #include "virtual_machine/evaluator.hpp"
 
 #include "asdl/asdl.hpp"
+#include "container/atomic_container.hpp"
+#include "virtual_machine/code_evaluator.hpp"
 #include "virtual_machine/del_evaluator.hpp"
 #include "virtual_machine/get_evaluator.hpp"
 #include "virtual_machine/set_evaluator.hpp"
@@ -13,27 +15,13 @@
 #include <algorithm>
 #include <exception>
 #include <istream>
+#include <iterator>
+#include <optional>
 #include <ranges>
 
 using namespace std::literals;
 
 namespace chimera::library::virtual_machine {
-  void destroy_object(object::Object &leftover) noexcept {
-    std::vector<object::Object> todo = {leftover};
-    while (!todo.empty()) {
-      std::vector<object::Object> attributes;
-      for (auto &work : todo) {
-        attributes.reserve(attributes.size() + work.dir_size());
-        for (const auto &key : work.dir()) {
-          if (work.has_attribute(key)) {
-            attributes.push_back(work.get_attribute(key));
-            work.delete_attribute(key);
-          }
-        }
-      }
-      todo = attributes;
-    }
-  }
   class ReRaise final : virtual public std::exception {
     [[nodiscard]] auto what() const noexcept -> const char * override;
   };
@@ -41,6 +29,42 @@ namespace chimera::library::virtual_machine {
     return "ReRaise";
   }
   Scopes::operator bool() const { return !scopes.empty(); }
+  auto Scopes::busy(const Depth &depth) -> bool {
+    if (scopes.size() != depth.scopes || scopes.empty()) {
+      return scopes.size() > depth.scopes;
+    }
+    auto &bodies = scopes.top().bodies;
+    for (; bodies.size() < depth.bodies; bodies.emplace()) {
+    }
+    return bodies.size() > depth.bodies ||
+           bodies.top().steps.size() > depth.steps;
+  }
+  auto Scopes::depth() const -> Depth {
+    if (scopes.empty()) {
+      return {};
+    }
+    const auto &bodies = scopes.top().bodies;
+    return {scopes.size(), bodies.size(),
+            bodies.empty() ? 0 : bodies.top().steps.size()};
+  }
+  void Scopes::unwind(const Depth &depth) {
+    for (; scopes.size() > depth.scopes; scopes.pop()) {
+    }
+    if (scopes.size() < depth.scopes || scopes.empty()) {
+      return;
+    }
+    auto &bodies = scopes.top().bodies;
+    for (; bodies.size() > depth.bodies; bodies.pop()) {
+    }
+    for (; bodies.size() < depth.bodies; bodies.emplace()) {
+    }
+    if (depth.bodies == 0) {
+      return;
+    }
+    for (auto &steps = bodies.top().steps; steps.size() > depth.steps;
+         steps.pop()) {
+    }
+  }
   [[nodiscard]] auto Scopes::self() -> object::Object & {
     if (scopes.empty()) {
       enter_scope({});
@@ -70,10 +94,13 @@ namespace chimera::library::virtual_machine {
     }
   }
   Evaluator::Evaluator(ThreadContext &thread_context) noexcept
-      : thread_context(thread_context) {}
+      : thread_context(thread_context),
+        thread_safepoint(Safepoint::current()) {
+    stack.reserve(STACK_RESERVE);
+  }
   Evaluator::~Evaluator() noexcept {
-    for (; !stack.empty(); stack.pop()) {
-      destroy_object(stack.top());
+    for (; !stack.empty(); stack.pop_back()) {
+      stack.back().destroy();
     }
   }
   [[nodiscard]] auto Evaluator::self() -> object::Object & {
@@ -104,13 +131,15 @@ namespace chimera::library::virtual_machine {
   [[nodiscard]] auto Evaluator::return_value() const -> object::Object {
     return thread_context->return_value();
   }
-  void Evaluator::stack_pop() { stack.pop(); }
+  void Evaluator::safepoint() { thread_safepoint.poll(); }
+  void Evaluator::stack_pop() { stack.pop_back(); }
   void Evaluator::stack_push(const object::Object &object) {
-    stack.push(object);
+    stack.push_back(object);
   }
   [[nodiscard]] auto Evaluator::stack_remove() -> object::Object {
-    auto finally = gsl::finally([this] { this->stack.pop(); });
-    return std::move(stack.top());
+    auto object = std::move(stack.back());
+    stack.pop_back();
+    return object;
   }
   [[nodiscard]] auto Evaluator::stack_size() const -> std::size_t {
     return stack.size();
@@ -119,10 +148,20 @@ namespace chimera::library::virtual_machine {
     if (stack.empty()) {
       throw object::BaseException("stack is empty");
     }
-    return stack.top();
+    return stack.back();
   }
   void Evaluator::stack_top_update(const object::Object &object) {
-    stack.top() = object;
+    stack.back() = object;
+  }
+  void Evaluator::stack_truncate(std::size_t first) {
+    Expects(first <= stack.size());
+    stack.erase(std::next(stack.begin(), gsl::narrow<std::ptrdiff_t>(first)),
+                stack.end());
+  }
+  [[nodiscard]] auto Evaluator::stack_window(std::size_t first) const
+      -> gsl::span<const object::Object> {
+    Expects(first <= stack.size());
+    return gsl::span<const object::Object>(stack).subspan(first);
   }
   void Evaluator::evaluate(const asdl::StmtImpl &stmt) {
     stmt.visit([this](auto &&value) { this->evaluate(value); });
@@ -136,43 +175,117 @@ namespace chimera::library::virtual_machine {
   void Evaluator::evaluate_set(const asdl::ExprImpl &expr) {
     expr.visit([this](auto &&value) { SetEvaluator{this}.evaluate(value); });
   }
+  //! builtins class implied by a value that carries no __class__
+  struct ImpliedClass {
+    [[nodiscard]] auto operator()(const object::Bytes & /*bytes*/) const
+        -> std::optional<object::Symbol> {
+      static const object::Symbol BYTES("bytes");
+      return BYTES;
+    }
+    [[nodiscard]] auto operator()(const object::False & /*false*/) const
+        -> std::optional<object::Symbol> {
+      static const object::Symbol BOOL("bool");
+      return BOOL;
+    }
+    [[nodiscard]] auto operator()(const object::String & /*string*/) const
+        -> std::optional<object::Symbol> {
+      static const object::Symbol STR("str");
+      return STR;
+    }
+    [[nodiscard]] auto operator()(const object::True & /*true*/) const
+        -> std::optional<object::Symbol> {
+      return (*this)(object::False{});
+    }
+    [[nodiscard]] auto operator()(const object::Tuple & /*tuple*/) const
+        -> std::optional<object::Symbol> {
+      static const object::Symbol TUPLE("tuple");
+      return TUPLE;
+    }
+    template <typename Type>
+    [[nodiscard]] auto operator()(const Type & /*value*/) const
+        -> std::optional<object::Symbol> {
+      return {};
+    }
+  };
+  auto Evaluator::class_of(const object::Object &object) const
+      -> object::Object {
+    if (auto found = object.find_attribute(object::symbols::CLASS)) {
+      return *std::move(found);
+    }
+    if (auto name = object.visit(ImpliedClass{})) {
+      return builtins().get_attribute(*name);
+    }
+    throw object::AttributeError("object", object::symbols::CLASS.name());
+  }
   void Evaluator::get_attribute(const object::Object &object,
-                                const std::string &name) {
-    const std::string getAttribute("__getattribute__");
+                                object::Symbol name) {
+    const auto getAttribute = object::symbols::GETATTRIBUTE;
     if (object.has_attribute(getAttribute)) {
       return get_attribute(object, object.get_attribute(getAttribute), name);
     }
-    auto mro = object.get_attribute("__class__").get_attribute("__mro__");
-    if (const auto tuple = mro.get<object::Tuple>()) {
-      for (const auto &type : *tuple) {
-        if (type.has_attribute(getAttribute)) {
-          return get_attribute(object, type.get_attribute(getAttribute), name);
-        }
-      }
+    if (auto found = class_of(object).lookup(getAttribute)) {
+      return get_attribute(object, *found, name);
     }
-    throw object::BaseException(builtins().get_attribute("AttributeError"));
+    // every __mro__ ends with object, whether or not it is spelled out
+    get_attribute(object, thread_context->getattribute(), name);
   }
   void Evaluator::evaluate() {
+    // numbers released by runs nested in another wait for the outermost
+    const auto outermost = !container::Confine::active();
+    // objects built here skip locking until something publishes them
+    const container::Confine confine;
+    auto finally = gsl::finally([outermost] {
+      if (outermost) {
+        object::Number::flush();
+      }
+    });
     try {
+      safepoint();
       while (scope) {
-        thread_context->process_interrupts();
         //! where all defered work gets done
         scope.visit([this](auto &&value) { value(this); });
       }
     } catch (const ReRaise &) {
-      throw object::BaseException(builtins().get_attribute("RuntimeError"));
+      throw object::BaseException(
+          builtins().get_attribute(object::symbols::RUNTIME_ERROR));
+    }
+  }
+  void Evaluator::run(const Scopes::Depth &depth) {
+    try {
+      while (scope.busy(depth)) {
+        scope.visit([this](auto &&value) { value(this); });
+      }
+    } catch (const ReRaise &) {
+      scope.unwind(depth);
+      throw object::BaseException(
+          builtins().get_attribute(object::symbols::RUNTIME_ERROR));
+    } catch (...) {
+      scope.unwind(depth);
+      throw;
     }
   }
   void Evaluator::evaluate(const asdl::Module &module) {
     enter_scope(thread_context->body());
     if (const auto &doc_string = module.doc(); doc_string) {
-      self().set_attribute("__doc__"s, doc_string->string);
+      self().set_attribute(object::symbols::DOC, doc_string->string);
     } else {
-      self().set_attribute("__doc__"s, builtins().get_attribute("None"));
+      self().set_attribute(object::symbols::DOC,
+                           object::singleton<object::None>());
     }
     extend(module.iter());
     return evaluate();
   }
+  void Evaluator::evaluate(const Code &code) {
+    enter_scope(thread_context->body());
+    const auto outermost = !container::Confine::active();
+    const container::Confine confine;
+    auto finally = gsl::finally([outermost] {
+      if (outermost) {
+        object::Number::flush();
+      }
+    });
+    CodeEvaluator{this}.evaluate(code);
+  }
   void Evaluator::evaluate(const asdl::Interactive &interactive) {
     enter_scope(thread_context->body());
     extend(interactive.iter());
@@ -221,22 +334,23 @@ namespace chimera::library::virtual_machine {
     if (functionDef.doc_string) {
       push([&functionDef](Evaluator *evaluator) {
         auto top = evaluator->stack_top();
-        top.set_attribute("__doc__"s, functionDef.doc_string->string);
+        top.set_attribute(object::symbols::DOC, functionDef.doc_string->string);
       });
     }
     push(PushStack{object::Object(
-        {{"__doc__", builtins().get_attribute("None")},
-         {"__name__",
+        {{object::symbols::DOC, object::singleton<object::None>()},
+         {object::symbols::NAME,
           object::Object(object::String(functionDef.name.value), {})},
-         {"__qualname__",
+         {object::symbols::QUALNAME,
           object::Object(object::String(functionDef.name.value), {})},
-         {"__module__", thread_context->body().get_attribute("__name__")},
-         {"__defaults__", builtins().get_attribute("None")},
-         {"__code__", {}},
-         {"__globals__", thread_context->body()},
-         {"__closure__", self()},
-         {"__annotations__", {}},
-         {"__kwdefaults__", {}}})});
+         {object::symbols::MODULE,
+          thread_context->body().get_attribute(object::symbols::NAME)},
+         {object::symbols::DEFAULTS, object::singleton<object::None>()},
+         {object::symbols::CODE, {}},
+         {object::symbols::GLOBALS, thread_context->body()},
+         {object::symbols::CLOSURE, self()},
+         {object::symbols::ANNOTATIONS, {}},
+         {object::symbols::KWDEFAULTS, {}}})});
   }
   void
   Evaluator::evaluate(const asdl::AsyncFunctionDef & /*async_function_def*/) {}
@@ -260,11 +374,14 @@ namespace chimera::library::virtual_machine {
         evaluatorB.push([](Evaluator *evaluatorC) {
           evaluatorC->push(CallEvaluator{evaluatorC->stack_remove()});
         });
-        evaluatorB.get_attribute(evaluatorA->stack_top(), "__next__");
+        evaluatorB.get_attribute(evaluatorA->stack_top(),
+                                 object::symbols::NEXT);
         evaluatorB.evaluate();
       } catch (const object::BaseException &error) {
         if (error.class_id() ==
-            evaluatorA->builtins().get_attribute("StopIteration").id()) {
+            evaluatorA->builtins()
+                .get_attribute(object::symbols::STOP_ITERATION)
+                .id()) {
           evaluatorA->exit();
           evaluatorA->extend(asdlFor.orelse);
         } else {
@@ -274,6 +391,7 @@ namespace chimera::library::virtual_machine {
       evaluatorA->enter();
       evaluatorA->push([&asdlFor](Evaluator *evaluatorB) {
         evaluatorB->exit();
+        evaluatorB->safepoint();
         evaluatorB->evaluate(asdlFor);
       });
       evaluatorA->extend(asdlFor.body);
@@ -283,7 +401,7 @@ namespace chimera::library::virtual_machine {
       evaluatorA->push(CallEvaluator{evaluatorA->stack_remove()});
     });
     push([](Evaluator *evaluatorA) {
-      evaluatorA->get_attribute(evaluatorA->stack_top(), "__iter__");
+      evaluatorA->get_attribute(evaluatorA->stack_top(), object::symbols::ITER);
       evaluatorA->stack_pop();
     });
     evaluate_get(asdlFor.iter);
@@ -296,6 +414,7 @@ namespace chimera::library::virtual_machine {
         evaluatorA->enter();
         evaluatorA->push([&asdlWhile](Evaluator *evaluatorB) {
           evaluatorB->exit();
+          evaluatorB->safepoint();
           evaluatorB->evaluate(asdlWhile);
         });
         evaluatorA->extend(asdlWhile.body);
@@ -346,13 +465,13 @@ namespace chimera::library::virtual_machine {
         import.names | std::views::reverse, [this](const auto &alias) {
           if (alias.asname) {
             push([&alias](Evaluator *evaluator) {
-              evaluator->self().set_attribute(alias.asname->value,
+              evaluator->self().set_attribute(alias.asname->symbol,
                                               evaluator->stack_remove());
               evaluator->stack_pop();
             });
           } else {
             push([&alias](Evaluator *evaluator) {
-              evaluator->self().set_attribute(alias.name.value,
+              evaluator->self().set_attribute(alias.name.symbol,
                                               evaluator->stack_remove());
               evaluator->stack_pop();
             });
@@ -370,14 +489,14 @@ namespace chimera::library::virtual_machine {
           if (alias.asname) {
             push([&alias](Evaluator *evaluator) {
               evaluator->self().set_attribute(
-                  alias.asname->value,
-                  evaluator->stack_top().get_attribute(alias.name.value));
+                  alias.asname->symbol,
+                  evaluator->stack_top().get_attribute(alias.name.symbol));
             });
           } else {
             push([&alias](Evaluator *evaluator) {
               evaluator->self().set_attribute(
-                  alias.name.value,
-                  evaluator->stack_top().get_attribute(alias.name.value));
+                  alias.name.symbol,
+                  evaluator->stack_top().get_attribute(alias.name.symbol));
             });
           }
         });
@@ -432,19 +551,19 @@ namespace chimera::library::virtual_machine {
     extend(asdlTry.finalbody);
   }
   void Evaluator::evaluate(const asdl::Assert &assert) {
-    if (builtins().get_attribute("__debug__").get_bool()) {
+    if (builtins().get_attribute(object::symbols::DEBUG).get_bool()) {
       push([&assert](Evaluator *evaluatorA) {
         if (!evaluatorA->stack_top().get_bool()) {
           return evaluatorA->stack_pop();
         }
         evaluatorA->stack_pop();
         if (!assert.msg) {
-          throw object::BaseException(
-              evaluatorA->builtins().get_attribute("AssertionError"));
+          throw object::BaseException(evaluatorA->builtins().get_attribute(
+              object::symbols::ASSERTION_ERROR));
         }
         evaluatorA->push([](Evaluator *evaluatorB) {
-          throw object::BaseException(
-              evaluatorB->builtins().get_attribute("AssertionError"));
+          throw object::BaseException(evaluatorB->builtins().get_attribute(
+              object::symbols::ASSERTION_ERROR));
         });
         evaluatorA->evaluate_get(*assert.msg);
       });
@@ -489,7 +608,8 @@ namespace chimera::library::virtual_machine {
       if (context) {
         return context;
       }
-      return object::BaseException(builtins().get_attribute("RuntimeError"));
+      return object::BaseException(
+          builtins().get_attribute(object::symbols::RUNTIME_ERROR));
     } catch (const std::exception &exc) {
       auto exception = object::Object{object::String{exc.what()}, {}};
       object::BaseException error(exception);
@@ -500,51 +620,78 @@ namespace chimera::library::virtual_machine {
     }
     return {};
   }
+  auto Evaluator::is_default(const object::Object &getAttribute) const
+      -> bool {
+    return getAttribute.id() == thread_context->getattribute().id();
+  }
+  auto Evaluator::find_attribute(const object::Object &object,
+                                 object::Symbol name) const
+      -> std::optional<object::Object> {
+    const auto getAttribute = object::symbols::GETATTRIBUTE;
+    auto found = object.find_attribute(getAttribute);
+    if (!found) {
+      found = class_of(object).lookup(getAttribute);
+    }
+    if (found && !is_default(*found)) {
+      return {};
+    }
+    return find_default(object, name);
+  }
+  auto Evaluator::find_attribute(const object::Object &object,
+                                 object::Symbol name,
+                                 const object::InlineCache &cache) const
+      -> std::optional<object::Object> {
+    if (auto found = object.find_cached(cache)) {
+      return found;
+    }
+    // read before resolving, so a class changed meanwhile leaves the entry
+    // already stale
+    const auto type = object.find_attribute(object::symbols::CLASS);
+    const auto version = type ? type->version() : 0;
+    auto found = find_attribute(object, name);
+    if (found) {
+      object.remember(name, type ? type->id() : 0, version, cache);
+    }
+    return found;
+  }
+  auto Evaluator::find_default(const object::Object &object,
+                               object::Symbol name) const
+      -> std::optional<object::Object> {
+    if (auto found = object.find_attribute(name)) {
+      return found;
+    }
+    if (name == object::symbols::CLASS) {
+      return class_of(object);
+    }
+    return class_of(object).lookup(name);
+  }
   void Evaluator::get_attribute(const object::Object &object,
                                 const object::Object &getAttribute,
-                                const std::string &name) {
-    if (getAttribute.get<object::ObjectMethod>() ==
-        object::ObjectMethod::GETATTRIBUTE) {
-      if (getAttribute.get_attribute("__class__").id() == 0 /* method */) {
-        if (object.has_attribute(name)) {
-          return push(PushStack{object.get_attribute(name)});
-        }
-        auto mro = object.get_attribute("__class__").get_attribute("__mro__");
-        if (const auto tuple = mro.get<object::Tuple>()) {
-          for (const auto &type : *tuple) {
-            if (type.has_attribute(name)) {
-              return push(PushStack{type.get_attribute(name)});
-            }
-          }
-        }
-        return get_attr(object, name);
+                                object::Symbol name) {
+    if (is_default(getAttribute)) {
+      if (auto found = find_default(object, name)) {
+        return push(PushStack{*std::move(found)});
       }
+      return get_attr(object, name);
     }
     push(CallEvaluator{
         getAttribute,
-        {object::Object(object::String(name),
-                        {{"__class__", builtins().get_attribute("str")}})}});
+        {object::Object(object::String(name.name()), {})}});
   }
   void Evaluator::get_attr(const object::Object &object,
-                           const std::string &name) {
+                           object::Symbol name) {
     push([name](Evaluator *evaluator) {
       evaluator->push(CallEvaluator{
           evaluator->stack_remove(),
-          {object::Object(
-              object::String(name),
-              {{"__class__", evaluator->builtins().get_attribute("str")}})}});
+          {object::Object(object::String(name.name()), {})}});
     });
-    if (object.has_attribute("__getattr__")) {
-      return push(PushStack{object.get_attribute("__getattr__")});
-    }
-    auto mro = object.get_attribute("__class__").get_attribute("__mro__");
-    if (const auto tuple = mro.get<object::Tuple>()) {
-      for (const auto &type : *tuple) {
-        if (type.has_attribute("__getattr__")) {
-          return push(PushStack{type.get_attribute("__getattr__")});
-        }
-      }
+    if (object.has_attribute(object::symbols::GETATTR)) {
+      return push(PushStack{object.get_attribute(object::symbols::GETATTR)});
+    }
+    if (auto found = class_of(object).lookup(object::symbols::GETATTR)) {
+      return push(PushStack{*std::move(found)});
     }
-    throw object::BaseException(builtins().get_attribute("AttributeError"));
+    throw object::BaseException(
+        builtins().get_attribute(object::symbols::ATTRIBUTE_ERROR));
   }
 } // namespace chimera::library::virtual_machine
@@ -6,20 +6,41 @@
 #include "virtual_machine/bin_evaluator.hpp"
 #include "virtual_machine/bool_evaluator.hpp"
 #include "virtual_machine/call_evaluator.hpp"
+#include "virtual_machine/code.hpp"
 #include "virtual_machine/push_stack.hpp"
+#include "virtual_machine/safepoint.hpp"
 #include "virtual_machine/thread_context.hpp"
 #include "virtual_machine/to_bool_evaluator.hpp"
 #include "virtual_machine/tuple_evaluator.hpp"
 #include "virtual_machine/unary_evaluator.hpp"
 
+#include <gsl/gsl>
+
+#include <cstddef>
 #include <functional>
+#include <optional>
 #include <stack>
 #include <variant>
+#include <vector>
 
 namespace chimera::library::virtual_machine {
+  struct CodeEvaluator;
   struct Evaluator;
   struct Scopes {
+    //! how much work is pending, so work pushed after it can be run on its
+    //! own without running what was already there
+    struct Depth {
+      std::size_t scopes;
+      std::size_t bodies;
+      std::size_t steps;
+    };
     explicit operator bool() const;
+    //! whether work pushed since depth is still pending, reopening bodies
+    //! that a step exited past it
+    [[nodiscard]] auto busy(const Depth &depth) -> bool;
+    [[nodiscard]] auto depth() const -> Depth;
+    //! drops work pushed since depth, as a raise leaves it
+    void unwind(const Depth &depth);
     [[nodiscard]] auto self() -> object::Object &;
     void enter_scope(const object::Object &main);
     void enter();
@@ -75,18 +96,36 @@ namespace chimera::library::virtual_machine {
     auto operator=(const Evaluator &) -> Evaluator & = delete;
     auto operator=(Evaluator &&) noexcept -> Evaluator & = delete;
     [[nodiscard]] auto builtins() const -> const object::Object &;
+    //! the __class__ attribute, or for values without one the builtins
+    //! class their type implies
+    [[nodiscard]] auto class_of(const object::Object &object) const
+        -> object::Object;
     void enter_scope(const object::Object &object);
     void enter();
     void exit_scope();
     void exit();
     void extend(const std::vector<asdl::ExprImpl> &instructions);
     void extend(const std::vector<asdl::StmtImpl> &instructions);
-    void get_attribute(const object::Object &object, const std::string &name);
+    //! the attribute when the default __getattribute__ finds it without
+    //! running any other code
+    [[nodiscard]] auto find_attribute(const object::Object &object,
+                                      object::Symbol name) const
+        -> std::optional<object::Object>;
+    //! as above, reading the slot cache remembers from the last lookup at
+    //! the same site when it is still valid
+    [[nodiscard]] auto find_attribute(const object::Object &object,
+                                      object::Symbol name,
+                                      const object::InlineCache &cache) const
+        -> std::optional<object::Object>;
+    void get_attribute(const object::Object &object, object::Symbol name);
     template <typename Instruction>
     void push(Instruction &&instruction) {
       scope.push(std::forward<Instruction>(instruction));
     }
     [[nodiscard]] auto return_value() const -> object::Object;
+    //! handles requests from signals and other threads, only called at loop
+    //! back edges and calls
+    void safepoint();
     [[nodiscard]] auto self() -> object::Object &;
     void stack_pop();
     void stack_push(const object::Object &object);
@@ -94,11 +133,17 @@ namespace chimera::library::virtual_machine {
     [[nodiscard]] auto stack_size() const -> std::size_t;
     [[nodiscard]] auto stack_top() const -> const object::Object &;
     void stack_top_update(const object::Object &object);
+    //! drops the values from first up
+    void stack_truncate(std::size_t first);
+    //! the values from first up, bottom first, valid until the next push
+    [[nodiscard]] auto stack_window(std::size_t first) const
+        -> gsl::span<const object::Object>;
     // Evaluators
     void evaluate_del(const asdl::ExprImpl &expr);
     void evaluate_get(const asdl::ExprImpl &expr);
     void evaluate_set(const asdl::ExprImpl &expr);
     void evaluate();
+    void evaluate(const Code &code);
     void evaluate(const asdl::AnnAssign &annAssign);
     void evaluate(const asdl::Assert &assert);
     void evaluate(const asdl::Assign &assign);
@@ -129,16 +174,29 @@ namespace chimera::library::virtual_machine {
     void evaluate(const asdl::With &with);
 
   private:
+    friend CodeEvaluator;
     [[nodiscard]] auto
     do_try(const std::vector<asdl::StmtImpl> &body,
            const std::optional<object::BaseException> &context)
         -> std::optional<object::BaseException>;
-    void get_attr(const object::Object &object, const std::string &name);
+    [[nodiscard]] auto find_default(const object::Object &object,
+                                    object::Symbol name) const
+        -> std::optional<object::Object>;
+    void get_attr(const object::Object &object, object::Symbol name);
+    //! whether getAttribute is object.__getattribute__ itself
+    [[nodiscard]] auto is_default(const object::Object &getAttribute) const
+        -> bool;
     void get_attribute(const object::Object &object,
                        const object::Object &getAttribute,
-                       const std::string &name);
+                       object::Symbol name);
+    //! runs work pushed since depth on this scope, leaving its values on the
+    //! stack, without flushing numbers as a full evaluate() does
+    void run(const Scopes::Depth &depth);
+    //! room for the operands of most frames without growing
+    static constexpr std::size_t STACK_RESERVE = 32;
     ThreadContext thread_context;
+    Safepoint &thread_safepoint;
     Scopes scope{};
-    std::stack<object::Object> stack{};
+    std::vector<object::Object> stack{};
   };
 } // namespace chimera::library::virtual_machine
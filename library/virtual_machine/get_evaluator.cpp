@@ -84,7 +84,7 @@ namespace chimera::library::virtual_machine {
     evaluator->evaluate_get(unary.operand);
   }
   void GetEvaluator::evaluate(const asdl::Lambda & /*lambda*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::IfExp &ifExp) const {
     evaluator->push([&ifExp](Evaluator *evaluatorA) {
@@ -99,45 +99,58 @@ namespace chimera::library::virtual_machine {
     evaluator->evaluate_get(ifExp.test);
   }
   void GetEvaluator::evaluate(const asdl::ListComp & /*list_comp*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::SetComp & /*set_comp*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::UnpackDict & /*unpackDict*/) const {}
   void GetEvaluator::evaluate(const asdl::DictComp & /*dict_comp*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void
   GetEvaluator::evaluate(const asdl::GeneratorExp & /*generator_exp*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::Await & /*await*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::Yield & /*yield*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::YieldFrom & /*yield_from*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::Compare & /*compare*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::Call &call) const {
-    evaluator->push([](Evaluator *evaluatorA) {
-      evaluatorA->push(PushStack{evaluatorA->return_value()});
-    });
-    evaluator->extend(call.args);
-    evaluator->push([](Evaluator *evaluatorA) {
+    evaluator->push([&call](Evaluator *evaluatorA) {
+      evaluatorA->safepoint();
       auto top = evaluatorA->stack_remove();
+      if (is_native(top)) {
+        evaluatorA->push(
+            [top = std::move(top),
+             first = evaluatorA->stack_size()](Evaluator *evaluatorB) {
+              const auto values = evaluatorB->stack_window(first);
+              object::Tuple args(
+                  object::Tuple::Items(values.begin(), values.end()));
+              evaluatorB->stack_truncate(first);
+              evaluatorB->push(CallEvaluator{top, std::move(args)});
+            });
+        return evaluatorA->extend(call.args);
+      }
+      evaluatorA->push([](Evaluator *evaluatorB) {
+        evaluatorB->push(PushStack{evaluatorB->return_value()});
+      });
+      evaluatorA->extend(call.args);
       evaluatorA->enter_scope(top);
     });
     evaluator->evaluate_get(call.func);
   }
   void GetEvaluator::evaluate(const asdl::Attribute &attribute) const {
     evaluator->push([&attribute](Evaluator *evaluatorA) {
-      evaluatorA->get_attribute(evaluatorA->stack_top(), attribute.attr.value);
+      evaluatorA->get_attribute(evaluatorA->stack_top(), attribute.attr.symbol);
       evaluatorA->stack_pop();
     });
     evaluator->evaluate_get(attribute.value);
@@ -151,38 +164,45 @@ namespace chimera::library::virtual_machine {
   void GetEvaluator::evaluate(const asdl::NameConstant &nameConstant) const {
     switch (nameConstant.value) {
       case asdl::NameConstant::FALSE:
-        evaluator->push(
-            PushStack{evaluator->builtins().get_attribute("False")});
+        evaluator->push(PushStack{object::singleton<object::False>()});
         break;
       case asdl::NameConstant::NONE:
-        evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+        evaluator->push(PushStack{object::singleton<object::None>()});
         break;
       case asdl::NameConstant::TRUE:
-        evaluator->push(PushStack{evaluator->builtins().get_attribute("True")});
+        evaluator->push(PushStack{object::singleton<object::True>()});
         break;
     }
   }
   void GetEvaluator::evaluate(const asdl::Ellipsis & /*ellipsis*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("Ellipsis")});
+    evaluator->push(PushStack{
+        evaluator->builtins().get_attribute(object::symbols::ELLIPSIS)});
   }
   void
   GetEvaluator::evaluate(const asdl::FormattedValue &formattedValue) const {
     evaluator->evaluate_get(formattedValue.value);
   }
   void GetEvaluator::evaluate(const asdl::JoinedStr & /*joined_str*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void GetEvaluator::evaluate(const asdl::Name &name) const {
-    evaluator->get_attribute(evaluator->self(), name.value);
+    const auto &self = evaluator->self();
+    if (auto found = evaluator->find_attribute(self, name.symbol, name.cache)) {
+      return evaluator->push(PushStack{*std::move(found)});
+    }
+    evaluator->get_attribute(self, name.symbol);
   }
   void GetEvaluator::evaluate(const asdl::Dict & /*dict*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("dict")});
+    evaluator->push(
+        PushStack{evaluator->builtins().get_attribute(object::symbols::DICT)});
   }
   void GetEvaluator::evaluate(const asdl::Set & /*set*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("set")});
+    evaluator->push(
+        PushStack{evaluator->builtins().get_attribute(object::symbols::SET)});
   }
   void GetEvaluator::evaluate(const asdl::List & /*list*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("list")});
+    evaluator->push(
+        PushStack{evaluator->builtins().get_attribute(object::symbols::LIST)});
   }
   void GetEvaluator::evaluate(const asdl::Tuple &tuple) const {
     evaluator->push(TupleEvaluator{evaluator->stack_size()});
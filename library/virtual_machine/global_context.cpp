@@ -6,6 +6,7 @@
 #include "version.hpp"
 #include "virtual_machine/evaluator.hpp"
 #include "virtual_machine/process_context.hpp"
+#include "virtual_machine/safepoint.hpp"
 #include "virtual_machine/thread_context.hpp"
 
 #include <csignal>
@@ -16,15 +17,15 @@
 
 using namespace std::literals;
 
-// NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables,misc-use-anonymous-namespace)
-static std::atomic_flag SIG_INT{};
-
-extern "C" void interupt_handler(int /*signal*/) { SIG_INT.clear(); }
+extern "C" void interupt_handler(int /*signal*/) {
+  chimera::library::virtual_machine::Safepoint::signal(
+      chimera::library::virtual_machine::Request::INTERRUPT);
+}
 
 namespace chimera::library::virtual_machine {
   GlobalContextImpl::GlobalContextImpl(Options options)
-      : options(std::move(options)), sig_int(&SIG_INT) {
-    SIG_INT.test_and_set();
+      : options(std::move(options)) {
+    Safepoint::current().receive_signals();
     std::ignore = std::signal(SIGINT, interupt_handler);
   }
   [[nodiscard]] auto GlobalContextImpl::debug() const -> bool {
@@ -57,7 +58,12 @@ namespace chimera::library::virtual_machine {
     auto module = processContext->parse_file(istream, source);
     auto main = processContext->make_module("__main__");
     auto thread = make_thread(processContext, main);
-    Evaluator(thread).evaluate(module);
+    if (options.bytecode) {
+      const auto code = compile(module);
+      Evaluator(thread).evaluate(code);
+    } else {
+      Evaluator(thread).evaluate(module);
+    }
     return 0;
   }
   [[nodiscard]] auto GlobalContextImpl::execute_script() -> int {
@@ -89,23 +95,16 @@ namespace chimera::library::virtual_machine {
       -> const options::Optimize & {
     return options.optimize;
   }
-  void GlobalContextImpl::process_interrupts() const {
-    if (!std::atomic_flag_test_and_set(sig_int)) {
-      throw object::KeyboardInterrupt();
-    }
-  }
   void GlobalContextImpl::sys_argv(const object::Object &module) const {
     auto sys = module;
-    object::Tuple argv;
-    argv.reserve(gsl::narrow<object::Tuple::size_type>(
+    object::Tuple::Items argv;
+    argv.reserve(gsl::narrow<object::Tuple::Items::size_type>(
         std::distance(options.argv.begin(), options.argv.end())));
     for (const auto &arg : options.argv) {
-      argv.emplace_back(object::Object(
-          object::String(arg), {{"__class__", module.get_attribute("str")}}));
+      argv.emplace_back(object::String(arg), object::Object::BasicAttributes{});
     }
-    sys.set_attribute(
-        "argv"s,
-        object::Object(argv, {{"__class__", sys.get_attribute("tuple")}}));
+    sys.set_attribute(object::Symbol("argv"),
+                      object::Object(object::Tuple(std::move(argv)), {}));
   }
   [[nodiscard]] auto GlobalContextImpl::verbose_init() const
       -> const options::VerboseInit & {
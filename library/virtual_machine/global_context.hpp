@@ -5,8 +5,6 @@
 #include "object/object.hpp"
 #include "options.hpp"
 
-#include <atomic>
-
 namespace chimera::library::virtual_machine {
   struct GlobalContextImpl : std::enable_shared_from_this<GlobalContextImpl> {
     explicit GlobalContextImpl(Options options);
@@ -17,7 +15,6 @@ namespace chimera::library::virtual_machine {
     [[nodiscard]] auto execute_script_input() -> int;
     [[nodiscard]] auto execute_module() -> int;
     [[nodiscard]] auto optimize() const -> const options::Optimize &;
-    void process_interrupts() const;
     void sys_argv(const object::Object &module) const;
     [[nodiscard]] auto verbose_init() const -> const options::VerboseInit &;
 
@@ -25,7 +22,6 @@ namespace chimera::library::virtual_machine {
     [[nodiscard]] auto execute(std::istream &istream, const char *source)
         -> int;
     Options options;
-    std::atomic_flag *sig_int;
   };
   using GlobalContext = std::shared_ptr<GlobalContextImpl>;
   auto make_global(Options options) -> GlobalContext;
@@ -11,8 +11,6 @@
 #include "virtual_machine/evaluator.hpp"
 #include "virtual_machine/thread_context.hpp"
 
-#include "number-rust.hpp"
-
 #include <gsl/gsl>
 
 #include <csignal>
@@ -29,51 +27,40 @@ static const std::string CHIMERA_IMPORT_PATH_VIEW(STRINGIFY(CHIMERA_PATH));
 #undef STRINGIFY
 
 namespace chimera::library::virtual_machine {
-  void destroy_module(object::Object &module) noexcept {
-    std::vector<object::Object> todo = {module};
-    while (!todo.empty()) {
-      std::vector<object::Object> attributes;
-      for (auto &work : todo) {
-        attributes.reserve(attributes.size() + work.dir_size());
-        for (const auto &key : work.dir()) {
-          if (work.has_attribute(key)) {
-            attributes.push_back(work.get_attribute(key));
-            work.delete_attribute(key);
-          }
-        }
-      }
-      todo = attributes;
-    }
-  }
   ProcessContextImpl::ProcessContextImpl(GlobalContext &global_context)
-      : builtins_(std::map<std::string, object::Object>{}),
+      : builtins_(object::Object::BasicAttributes{}),
         global_context(global_context),
         modules(
             std::map<std::string, object::Object>({{"builtins", builtins_}})) {
     modules::builtins(builtins_);
+    getattribute_ = builtins_.get_attribute(object::symbols::OBJECT)
+                        .get_attribute(object::symbols::GETATTRIBUTE);
   }
   ProcessContextImpl::~ProcessContextImpl() noexcept {
     auto builtins = builtins_;
-    destroy_module(builtins);
+    builtins.destroy();
     for (auto &module : modules.write().value) {
-      destroy_module(module.second);
+      module.second.destroy();
     }
-    r_vm_clear();
+    object::Number::flush();
   }
   [[nodiscard]] auto ProcessContextImpl::builtins() const
       -> const object::Object & {
     return builtins_;
   }
+  [[nodiscard]] auto ProcessContextImpl::getattribute() const
+      -> const object::Object & {
+    return getattribute_;
+  }
   [[nodiscard]] auto ProcessContextImpl::make_module(std::string_view &&name)
       -> object::Object {
     auto result = modules.try_emplace(std::string(name));
     if (result.second) {
+      result.first->second.publish();
       modules::builtins(result.first->second);
       result.first->second.set_attribute(
-          "__name__"s,
-          object::Object(
-              object::String(std::string(name)),
-              {{"__class__"s, result.first->second.get_attribute("str"s)}}));
+          object::symbols::NAME,
+          object::Object(object::String(std::string(name)), {}));
     }
     return result.first->second;
   }
@@ -159,7 +146,7 @@ namespace chimera::library::virtual_machine {
         auto index = module.find_last_of('.');
         if (index < module.size()) {
           object::Object(modules.at(std::string(module.substr(0, index))))
-              .set_attribute(std::string(module.substr(index + 1)), result);
+              .set_attribute(object::Symbol(module.substr(index + 1)), result);
         }
         if (module == "builtin"sv) {
           modules::builtins(result);
@@ -208,9 +195,6 @@ namespace chimera::library::virtual_machine {
       -> asdl::Interactive {
     return {global_context->optimize(), input, source};
   }
-  void ProcessContextImpl::process_interrupts() const {
-    global_context->process_interrupts();
-  }
   auto make_process(GlobalContext &global_context) -> ProcessContext {
     return std::make_shared<ProcessContextImpl>(global_context);
   }
@@ -23,6 +23,8 @@ namespace chimera::library::virtual_machine {
     auto operator=(ProcessContextImpl &&) noexcept
         -> ProcessContextImpl & = delete;
     [[nodiscard]] auto builtins() const -> const object::Object &;
+    //! object.__getattribute__, which lookups that find it may skip calling
+    [[nodiscard]] auto getattribute() const -> const object::Object &;
     [[nodiscard]] auto import_object(std::string_view &&name,
                                      std::string_view &&relativeModule)
         -> const object::Object &;
@@ -37,7 +39,6 @@ namespace chimera::library::virtual_machine {
     [[nodiscard]] auto parse_input(std::istream &input,
                                    const char *source) const
         -> asdl::Interactive;
-    void process_interrupts() const;
 
   private:
     [[nodiscard]] auto find_module(const std::string_view &path)
@@ -47,6 +48,7 @@ namespace chimera::library::virtual_machine {
     [[nodiscard]] auto import_object(std::string_view &&request_module)
         -> const object::Object &;
     object::Object builtins_;
+    object::Object getattribute_;
     GlobalContext global_context;
     // TODO(asakatida)
     // GarbageCollector garbage_collector{};
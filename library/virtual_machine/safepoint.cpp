@@ -0,0 +1,76 @@
+//! points where an evaluator thread takes requests from other threads and
+//! signal handlers
+
+#include "virtual_machine/safepoint.hpp"
+
+#include "object/object.hpp"
+
+#include <algorithm>
+#include <atomic>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace chimera::library::virtual_machine {
+  //! threads with a safepoint, for requests meant for all of them
+  struct Registry {
+    std::mutex mutex;
+    std::vector<Safepoint *> safepoints;
+  };
+  static auto registry() -> Registry & {
+    // NOLINTNEXTLINE(cppcoreguidelines-owning-memory)
+    static auto *const registry = new Registry();
+    return *registry;
+  }
+  // NOLINTNEXTLINE(cppcoreguidelines-avoid-non-const-global-variables)
+  static std::atomic<Safepoint *> SIGNALED = nullptr;
+  static_assert(std::atomic<Safepoint *>::is_always_lock_free);
+  Safepoint::Safepoint() {
+    auto &threads = registry();
+    const std::lock_guard<std::mutex> lock(threads.mutex);
+    threads.safepoints.push_back(this);
+  }
+  Safepoint::~Safepoint() noexcept {
+    auto *self = this;
+    SIGNALED.compare_exchange_strong(self, nullptr);
+    auto &threads = registry();
+    const std::lock_guard<std::mutex> lock(threads.mutex);
+    std::erase(threads.safepoints, this);
+  }
+  auto Safepoint::current() -> Safepoint & {
+    thread_local Safepoint safepoint;
+    return safepoint;
+  }
+  void Safepoint::request_all(Request request) {
+    auto &threads = registry();
+    const std::lock_guard<std::mutex> lock(threads.mutex);
+    for (auto *safepoint : threads.safepoints) {
+      safepoint->request(request);
+    }
+  }
+  void Safepoint::signal(Request request) noexcept {
+    if (auto *safepoint = SIGNALED.load(); safepoint != nullptr) {
+      safepoint->request(request);
+    }
+  }
+  auto Safepoint::epoch() const noexcept -> std::uint64_t {
+    return handshakes.load(std::memory_order_acquire);
+  }
+  void Safepoint::receive_signals() noexcept { SIGNALED.store(this); }
+  void Safepoint::request(Request request) noexcept {
+    requests.fetch_or(static_cast<std::uint32_t>(request),
+                      std::memory_order_release);
+  }
+  void Safepoint::handle() {
+    const auto pending = requests.exchange(0, std::memory_order_acquire);
+    if ((pending & static_cast<std::uint32_t>(Request::COLLECT)) != 0) {
+      handshakes.fetch_add(1, std::memory_order_release);
+    }
+    if ((pending & static_cast<std::uint32_t>(Request::PREEMPT)) != 0) {
+      std::this_thread::yield();
+    }
+    if ((pending & static_cast<std::uint32_t>(Request::INTERRUPT)) != 0) {
+      throw object::KeyboardInterrupt();
+    }
+  }
+} // namespace chimera::library::virtual_machine
@@ -0,0 +1,55 @@
+//! points where an evaluator thread takes requests from other threads and
+//! signal handlers
+
+#pragma once
+
+#include <atomic>
+#include <cstdint>
+
+namespace chimera::library::virtual_machine {
+  //! what an evaluator thread is asked to do at its next safepoint
+  enum class Request : std::uint32_t {
+    //! raise KeyboardInterrupt
+    INTERRUPT = 1U << 0U,
+    //! acknowledge a collector handshake
+    COLLECT = 1U << 1U,
+    //! give up the processor to other threads
+    PREEMPT = 1U << 2U,
+  };
+  //! one per thread, polled only at loop back edges and calls so the hot
+  //! path is a relaxed load of a word no other thread writes until it has
+  //! something to ask
+  class Safepoint {
+  public:
+    Safepoint();
+    Safepoint(const Safepoint &other) = delete;
+    Safepoint(Safepoint &&other) = delete;
+    ~Safepoint() noexcept;
+    auto operator=(const Safepoint &other) -> Safepoint & = delete;
+    auto operator=(Safepoint &&other) -> Safepoint & = delete;
+    //! the safepoint of the calling thread
+    [[nodiscard]] static auto current() -> Safepoint &;
+    //! asks every thread with a safepoint
+    static void request_all(Request request);
+    //! asks the thread that last called receive_signals, safe to call from a
+    //! signal handler
+    static void signal(Request request) noexcept;
+    //! handshakes this thread has acknowledged
+    [[nodiscard]] auto epoch() const noexcept -> std::uint64_t;
+    //! handles pending requests, cheap when there are none
+    void poll() {
+      if (requests.load(std::memory_order_relaxed) != 0) [[unlikely]] {
+        handle();
+      }
+    }
+    //! makes this thread the one signals are delivered to
+    void receive_signals() noexcept;
+    void request(Request request) noexcept;
+
+  private:
+    void handle();
+    std::atomic<std::uint32_t> requests{0};
+    std::atomic<std::uint64_t> handshakes{0};
+    static_assert(std::atomic<std::uint32_t>::is_always_lock_free);
+  };
+} // namespace chimera::library::virtual_machine
@@ -11,11 +11,10 @@ namespace chimera::library::virtual_machine {
   SetEvaluator::SetEvaluator(Evaluator *evaluator) noexcept
       : evaluator(evaluator) {}
   void SetEvaluator::evaluate(const asdl::Attribute &attribute) const {
+    // the value stays on the stack for any other targets, as for names
     evaluator->push([&attribute](Evaluator *evaluatorA) {
       auto object = evaluatorA->stack_remove();
-      auto top = evaluatorA->stack_top();
-      top.set_attribute(attribute.attr.value, std::move(object));
-      evaluatorA->stack_pop();
+      object.set_attribute(attribute.attr.symbol, evaluatorA->stack_top());
     });
     evaluator->evaluate_get(attribute.value);
   }
@@ -24,13 +23,13 @@ namespace chimera::library::virtual_machine {
   }
   void SetEvaluator::evaluate(const asdl::Name &name) const {
     evaluator->push([&name](Evaluator *evaluatorA) {
-      evaluatorA->self().set_attribute(name.value, evaluatorA->stack_top());
+      evaluatorA->self().set_attribute(name.symbol, evaluatorA->stack_top());
     });
   }
   void SetEvaluator::evaluate(const asdl::List & /*list*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void SetEvaluator::evaluate(const asdl::Tuple & /*tuple*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
 } // namespace chimera::library::virtual_machine
@@ -8,12 +8,12 @@ namespace chimera::library::virtual_machine {
   SliceEvaluator::SliceEvaluator(Evaluator *evaluator) noexcept
       : evaluator(evaluator) {}
   void SliceEvaluator::operator()(const asdl::Slice & /*slice*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void SliceEvaluator::operator()(const asdl::ExtSlice & /*ext_slice*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
   void SliceEvaluator::operator()(const asdl::Index & /*index*/) const {
-    evaluator->push(PushStack{evaluator->builtins().get_attribute("None")});
+    evaluator->push(PushStack{object::singleton<object::None>()});
   }
 } // namespace chimera::library::virtual_machine
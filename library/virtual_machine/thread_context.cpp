@@ -15,11 +15,12 @@ namespace chimera::library::virtual_machine {
       -> const object::Object & {
     return process_context->builtins();
   }
-  void ThreadContextImpl::process_interrupts() const {
-    process_context->process_interrupts();
+  [[nodiscard]] auto ThreadContextImpl::getattribute() const
+      -> const object::Object & {
+    return process_context->getattribute();
   }
   [[nodiscard]] auto ThreadContextImpl::return_value() const -> object::Object {
-    return ret.value_or(builtins().get_attribute("None"));
+    return ret.value_or(object::singleton<object::None>());
   }
   void ThreadContextImpl::return_value(object::Object &&value) {
     ret = std::move(value);
@@ -13,11 +13,11 @@ namespace chimera::library::virtual_machine {
     ThreadContextImpl(ProcessContext &process_context, object::Object main);
     [[nodiscard]] auto body() const -> object::Object;
     [[nodiscard]] auto builtins() const -> const object::Object &;
+    [[nodiscard]] auto getattribute() const -> const object::Object &;
     template <typename... Args>
     [[nodiscard]] auto import_object(Args &&...args) -> const object::Object & {
       return process_context->import_object(std::forward<Args>(args)...);
     }
-    void process_interrupts() const;
     [[nodiscard]] auto return_value() const -> object::Object;
     void return_value(object::Object &&value);
 
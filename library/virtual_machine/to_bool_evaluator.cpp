@@ -9,9 +9,13 @@ namespace chimera::library::virtual_machine {
       : object(std::move(object)) {}
   void ToBoolEvaluator::operator()(Evaluator *evaluator) const {
     if (object.get<object::False>() || object.get<object::None>()) {
-      evaluator->push(PushStack{evaluator->builtins().get_attribute("False")});
+      evaluator->push(PushStack{object::singleton<object::False>()});
     } else if (object.get<object::True>()) {
-      evaluator->push(PushStack{evaluator->builtins().get_attribute("True")});
+      evaluator->push(PushStack{object::singleton<object::True>()});
+    } else if (auto number = object.get<object::Number>()) {
+      evaluator->push(PushStack{*number == object::Number(0)
+                                    ? object::singleton<object::False>()
+                                    : object::singleton<object::True>()});
     } else {
       evaluator->push([](Evaluator *evaluatorB) {
         evaluatorB->push(ToBoolEvaluator{evaluatorB->stack_remove()});
@@ -19,7 +23,7 @@ namespace chimera::library::virtual_machine {
       evaluator->push([](Evaluator *evaluatorB) {
         evaluatorB->push(CallEvaluator{evaluatorB->stack_remove()});
       });
-      evaluator->get_attribute(object, "__bool__");
+      evaluator->get_attribute(object, object::symbols::BOOL);
     }
   }
 } // namespace chimera::library::virtual_machine
@@ -8,12 +8,12 @@
 namespace chimera::library::virtual_machine {
   TupleEvaluator::TupleEvaluator(std::size_t size) noexcept : size(size) {}
   void TupleEvaluator::operator()(Evaluator *evaluator) const {
-    object::Tuple tuple(evaluator->stack_size() - size);
-    for (std::size_t idx = 0; evaluator->stack_size() > size; ++idx) {
-      tuple[tuple.size() - 1 - idx] = evaluator->stack_top();
-      evaluator->stack_pop();
+    const auto items = evaluator->stack_window(size);
+    if (items.empty()) {
+      return evaluator->push(PushStack{object::singleton<object::Tuple>()});
     }
-    evaluator->push(PushStack{object::Object(
-        tuple, {{"__class__", evaluator->builtins().get_attribute("tuple")}})});
+    object::Tuple tuple(object::Tuple::Items(items.begin(), items.end()));
+    evaluator->stack_truncate(size);
+    evaluator->push(PushStack{object::Object(std::move(tuple), {})});
   }
 } // namespace chimera::library::virtual_machine
@@ -7,37 +7,50 @@
 
 namespace chimera::library::virtual_machine {
   void UnaryBitNotEvaluator::operator()(Evaluator *evaluator) const {
+    if (auto number = evaluator->stack_top().get<object::Number>();
+        number && number->is_int()) {
+      return evaluator->stack_top_update(object::Object(~*number, {}));
+    }
     evaluator->push([](Evaluator *evaluatorA) {
       evaluatorA->push(CallEvaluator{evaluatorA->stack_remove()});
     });
-    evaluator->get_attribute(evaluator->stack_top(), "__invert__");
+    evaluator->get_attribute(evaluator->stack_top(), object::symbols::INVERT);
     evaluator->stack_pop();
   }
   void UnaryNotEvaluator::operator()(Evaluator *evaluator) const {
+    if (auto number = evaluator->stack_top().get<object::Number>()) {
+      return evaluator->stack_top_update(
+          *number == object::Number(0) ? object::singleton<object::True>()
+                                       : object::singleton<object::False>());
+    }
     evaluator->push([](Evaluator *evaluatorA) {
       if (evaluatorA->stack_top().get_bool()) {
-        evaluatorA->stack_top_update(
-            evaluatorA->builtins().get_attribute("False"));
+        evaluatorA->stack_top_update(object::singleton<object::False>());
       } else {
-        evaluatorA->stack_top_update(
-            evaluatorA->builtins().get_attribute("True"));
+        evaluatorA->stack_top_update(object::singleton<object::True>());
       }
     });
     evaluator->push(ToBoolEvaluator{evaluator->stack_top()});
     evaluator->stack_pop();
   }
   void UnaryAddEvaluator::operator()(Evaluator *evaluator) const {
+    if (auto number = evaluator->stack_top().get<object::Number>()) {
+      return evaluator->stack_top_update(object::Object(+*number, {}));
+    }
     evaluator->push([](Evaluator *evaluatorA) {
       evaluatorA->push(CallEvaluator{evaluatorA->stack_remove()});
     });
-    evaluator->get_attribute(evaluator->stack_top(), "__pos__");
+    evaluator->get_attribute(evaluator->stack_top(), object::symbols::POS);
     evaluator->stack_pop();
   }
   void UnarySubEvaluator::operator()(Evaluator *evaluator) const {
+    if (auto number = evaluator->stack_top().get<object::Number>()) {
+      return evaluator->stack_top_update(object::Object(-*number, {}));
+    }
     evaluator->push([](Evaluator *evaluatorA) {
       evaluatorA->push(CallEvaluator{evaluatorA->stack_remove()});
     });
-    evaluator->get_attribute(evaluator->stack_top(), "__neg__");
+    evaluator->get_attribute(evaluator->stack_top(), object::symbols::NEG);
     evaluator->stack_pop();
   }
 } // namespace chimera::library::virtual_machine
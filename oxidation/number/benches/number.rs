@@ -0,0 +1,57 @@
+//! Per-operation cost of `Number` arithmetic for every pair of variants.
+//!
+//! Operands are borrowed, so the `base + base` rows show the cost of the
+//! machine word path on its own and every other row adds whatever the wider
+//! variant needs.
+//!
+//! Run with `cargo bench --bench number`.
+
+use core::hint::black_box;
+use std::time::Instant;
+
+use number::number::Number;
+
+const OPERATIONS: u32 = 100_000;
+
+fn variants() -> [(&'static str, Number); 7] {
+    let huge = Number::from(u64::MAX);
+    [
+        ("base", Number::from(7)),
+        ("natural", huge.clone() * huge),
+        ("rational", Number::from(1) / Number::from(3)),
+        ("negative", Number::from(0) - Number::from(5)),
+        ("imag", Number::from(3).imag()),
+        ("complex", Number::from(7) + Number::from(3).imag()),
+        ("nan", Number::NaN),
+    ]
+}
+
+fn time<F: FnMut()>(mut op: F) -> f64 {
+    let start = Instant::now();
+    for _ in 0..OPERATIONS {
+        op();
+    }
+    #[allow(clippy::cast_precision_loss)]
+    let per_op = start.elapsed().as_nanos() as f64 / f64::from(OPERATIONS);
+    per_op
+}
+
+fn main() {
+    let values = variants();
+    println!(
+        "{:>8} {:>8} {:>9} {:>9} {:>9} {:>9} {:>9}",
+        "left", "right", "add", "sub", "mul", "cmp", "eq"
+    );
+    for (left_name, left) in &values {
+        for (right_name, right) in &values {
+            let add = time(|| drop(black_box(black_box(left) + black_box(right))));
+            let sub = time(|| drop(black_box(black_box(left) - black_box(right))));
+            let mul = time(|| drop(black_box(black_box(left) * black_box(right))));
+            let cmp = time(|| drop(black_box(black_box(left).partial_cmp(black_box(right)))));
+            let eq = time(|| drop(black_box(black_box(left) == black_box(right))));
+            println!(
+                "{left_name:>8} {right_name:>8} {add:7.1}ns {sub:7.1}ns {mul:7.1}ns {cmp:7.1}ns {eq:7.1}ns"
+            );
+        }
+    }
+}
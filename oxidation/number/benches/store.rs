@@ -0,0 +1,38 @@
+//! Per-operation cost of the handle tables as the number of live handles grows.
+//!
+//! Values are kept above the inline small integer range so every operation
+//! goes through a table.
+//!
+//! Run with `cargo bench --bench store`; the nanoseconds per operation should
+//! stay flat from a thousand to ten million live numbers.
+
+use core::hint::black_box;
+use std::time::Instant;
+
+use number::{r_add, r_copy_number, r_create_number, r_delete_number};
+
+const OPERATIONS: u64 = 1_000_000;
+
+fn main() {
+    for live in [1_000_u64, 10_000, 100_000, 1_000_000, 10_000_000] {
+        let handles: Vec<u64> = (0..live)
+            .map(|value| r_create_number(u64::MAX - value))
+            .collect();
+        let len = handles.len();
+        let start = Instant::now();
+        for i in 0..OPERATIONS {
+            let key = handles[usize::try_from(i.wrapping_mul(7_919)).unwrap() % len];
+            let copy = black_box(r_copy_number(key));
+            let sum = black_box(r_add(copy, key));
+            r_delete_number(sum);
+            r_delete_number(copy);
+        }
+        let elapsed = start.elapsed();
+        #[allow(clippy::cast_precision_loss)]
+        let per_op = elapsed.as_nanos() as f64 / OPERATIONS as f64;
+        println!("{live:>10} live: {per_op:8.1} ns/op");
+        for handle in handles {
+            r_delete_number(handle);
+        }
+    }
+}
@@ -0,0 +1,311 @@
+#![deny(clippy::pedantic)]
+#![deny(clippy::restriction)]
+#![allow(clippy::arithmetic_side_effects)]
+#![allow(clippy::blanket_clippy_restriction_lints)]
+#![allow(clippy::implicit_return)]
+#![allow(clippy::missing_docs_in_private_items)]
+#![allow(clippy::single_call_fn)]
+#![allow(clippy::std_instead_of_alloc)]
+
+//! Per thread arenas for short lived numbers.
+//!
+//! Results of arithmetic land in the arena of the thread that computed them,
+//! which only that thread normally locks, so temporaries created and dropped
+//! by one evaluator never touch the shared store.  A handle names its arena,
+//! so a number that reaches another thread anyway still resolves through the
+//! registry.  Numbers escape into the store with `share` once they are
+//! wrapped in an object that other threads can see.
+//!
+//! An arena left with live numbers by its thread is orphaned, and its id is
+//! reclaimed once another thread frees the last of them.  Threads started
+//! while every id is taken keep their numbers in the store instead.
+
+use std::collections::{HashMap, HashSet};
+use std::sync::{Arc, Mutex, OnceLock, RwLock};
+
+use crate::handle::{ARENA_TAG, TAG_BITS, TAG_MASK};
+use crate::number::Number;
+use crate::slab::{Entry, Slab};
+use crate::stats;
+use crate::store::store;
+
+const ARENA_BITS: u32 = 20;
+const ARENA_MASK: u64 = (1 << ARENA_BITS) - 1;
+const SLOT_SHIFT: u32 = ARENA_BITS + TAG_BITS;
+
+type Arena = Arc<Mutex<Slab>>;
+
+#[derive(Debug, Default)]
+struct Registry {
+    next: u64,
+    arenas: HashMap<u64, Arena>,
+    orphans: HashSet<u64>,
+}
+
+static REGISTRY: OnceLock<RwLock<Registry>> = OnceLock::new();
+
+#[inline]
+fn registry() -> &'static RwLock<Registry> {
+    REGISTRY.get_or_init(RwLock::default)
+}
+
+#[derive(Debug)]
+struct Local {
+    id: u64,
+    arena: Arena,
+}
+
+impl Local {
+    /// Empty once every id is taken.
+    ///
+    /// # Panics
+    #[allow(clippy::unwrap_used)]
+    #[inline]
+    fn new() -> Option<Self> {
+        let mut registry = registry().write().unwrap();
+        let mut id = registry.next;
+        for _ in 0..=ARENA_MASK {
+            if !registry.arenas.contains_key(&id) {
+                let arena = Arena::default();
+                registry.next = (id + 1) & ARENA_MASK;
+                registry.arenas.insert(id, Arc::clone(&arena));
+                return Some(Self { id, arena });
+            }
+            id = (id + 1) & ARENA_MASK;
+        }
+        None
+    }
+}
+
+impl Drop for Local {
+    /// Numbers that outlive their thread stay reachable until they are freed
+    /// or the store is cleared.  Emptiness is checked under the registry lock
+    /// so a concurrent `reclaim` cannot miss the orphan.
+    #[inline]
+    fn drop(&mut self) {
+        if let Ok(mut registry) = registry().write() {
+            if self.arena.lock().is_ok_and(|arena| arena.is_empty()) {
+                registry.arenas.remove(&self.id);
+            } else {
+                registry.orphans.insert(self.id);
+            }
+        }
+    }
+}
+
+thread_local! {
+    static LOCAL: Option<Local> = Local::new();
+}
+
+/// Frees the id of an orphaned arena once its last number is gone.
+#[inline]
+fn reclaim(id: u64) {
+    if let Ok(mut registry) = registry().write() {
+        let empty = registry
+            .arenas
+            .get(&id)
+            .is_some_and(|arena| arena.lock().is_ok_and(|slab| slab.is_empty()));
+        if empty && registry.orphans.remove(&id) {
+            registry.arenas.remove(&id);
+        }
+    }
+}
+
+#[allow(clippy::as_conversions)]
+#[allow(clippy::cast_possible_truncation)]
+#[inline]
+fn split(key: u64) -> Option<(u64, usize)> {
+    if key & TAG_MASK != ARENA_TAG {
+        return None;
+    }
+    ((key >> SLOT_SHIFT) as usize)
+        .checked_sub(1)
+        .map(|slot| ((key >> TAG_BITS) & ARENA_MASK, slot))
+}
+
+/// # Panics
+#[allow(clippy::question_mark_used)]
+#[allow(clippy::unwrap_used)]
+#[inline]
+fn with<R, F: FnOnce(&mut Slab, usize) -> Option<R>>(key: u64, op: F) -> Option<R> {
+    let (id, slot) = split(key)?;
+    let mut pending = Some(op);
+    let owned = LOCAL.try_with(|local| {
+        let local = local.as_ref().filter(|local| local.id == id)?;
+        pending
+            .take()
+            .map(|apply| apply(&mut stats::lock(&local.arena), slot))
+    });
+    if let Ok(Some(result)) = owned {
+        return result;
+    }
+    let arena = registry().read().unwrap().arenas.get(&id).cloned()?;
+    let apply = pending?;
+    let mut slab = stats::lock(&arena);
+    let result = apply(&mut slab, slot);
+    let empty = slab.is_empty();
+    drop(slab);
+    if empty {
+        reclaim(id);
+    }
+    result
+}
+
+/// # Panics
+#[allow(clippy::iter_over_hash_type)]
+#[allow(clippy::unwrap_used)]
+#[inline]
+pub fn abandon() {
+    for arena in registry().read().unwrap().arenas.values() {
+        arena.lock().unwrap().abandon();
+    }
+}
+
+/// # Panics
+#[allow(clippy::expect_used)]
+#[inline]
+#[must_use]
+pub fn get(key: u64) -> Number {
+    with(key, |slab, slot| {
+        slab.get(slot).map(|entry| entry.value.clone())
+    })
+    .expect("arena::get(key)")
+}
+
+/// Lends the number behind `key` to `op` under its arena's lock.
+///
+/// # Panics
+#[allow(clippy::expect_used)]
+#[inline]
+pub fn borrow<R, F: FnOnce(&Number) -> R>(key: u64, op: F) -> R {
+    with(key, |slab, slot| {
+        slab.get(slot).map(|entry| op(&entry.value))
+    })
+    .expect("arena::borrow(key)")
+}
+
+/// Arena and slot behind `key`, found without holding any arena lock.
+///
+/// # Panics
+#[allow(clippy::question_mark_used)]
+#[allow(clippy::unwrap_used)]
+#[inline]
+fn resolve(key: u64) -> Option<(Arena, usize)> {
+    let (id, slot) = split(key)?;
+    let owned = LOCAL
+        .try_with(|local| {
+            local
+                .as_ref()
+                .filter(|local| local.id == id)
+                .map(|local| Arc::clone(&local.arena))
+        })
+        .ok()
+        .flatten();
+    let arena = owned.or_else(|| registry().read().unwrap().arenas.get(&id).cloned())?;
+    Some((arena, slot))
+}
+
+/// Lends the numbers behind two handles to `op`.  Both arenas are found
+/// before either is locked, and two arenas are locked in address order, so
+/// this never waits on the registry or on another caller in a cycle.
+///
+/// # Panics
+#[allow(clippy::expect_used)]
+#[inline]
+pub fn borrow_pair<R, F: FnOnce(&Number, &Number) -> R>(left: u64, right: u64, op: F) -> R {
+    let (left_arena, left_slot) = resolve(left).expect("arena::borrow_pair(left)");
+    let (right_arena, right_slot) = resolve(right).expect("arena::borrow_pair(right)");
+    if Arc::ptr_eq(&left_arena, &right_arena) {
+        let slab = stats::lock(&left_arena);
+        let lhs = slab.get(left_slot).expect("arena::borrow_pair(left)");
+        let rhs = slab.get(right_slot).expect("arena::borrow_pair(right)");
+        return op(&lhs.value, &rhs.value);
+    }
+    let (left_slab, right_slab) = if Arc::as_ptr(&right_arena) < Arc::as_ptr(&left_arena) {
+        let right_slab = stats::lock(&right_arena);
+        (stats::lock(&left_arena), right_slab)
+    } else {
+        let left_slab = stats::lock(&left_arena);
+        (left_slab, stats::lock(&right_arena))
+    };
+    let lhs = left_slab.get(left_slot).expect("arena::borrow_pair(left)");
+    let rhs = right_slab
+        .get(right_slot)
+        .expect("arena::borrow_pair(right)");
+    op(&lhs.value, &rhs.value)
+}
+
+/// Places `value` in the calling thread's arena, or in the store once the
+/// thread is being torn down or has no arena.
+///
+/// # Panics
+#[allow(clippy::as_conversions)]
+#[inline]
+#[must_use]
+pub fn insert(value: Number) -> u64 {
+    if LOCAL.try_with(|_| ()).is_err() {
+        return store().insert(value);
+    }
+    LOCAL.with(|local| match local.as_ref() {
+        Some(local) => {
+            let slot = stats::lock(&local.arena).insert(Entry::new(value));
+            ((slot as u64 + 1) << SLOT_SHIFT) | (local.id << TAG_BITS) | ARENA_TAG
+        }
+        None => store().insert(value),
+    })
+}
+
+#[inline]
+pub fn remove(key: u64) {
+    with(key, |slab, slot| {
+        slab.remove(slot);
+        Some(())
+    });
+}
+
+/// Removes a batch of handles under a single lock of the calling thread's
+/// arena, falling back to `remove` for handles from other arenas.
+///
+/// # Panics
+#[inline]
+pub fn remove_many(keys: &[u64]) {
+    let mut foreign = Vec::new();
+    let owned = LOCAL.try_with(|local| {
+        let local = local.as_ref()?;
+        let mut slab = stats::lock(&local.arena);
+        for &key in keys {
+            match split(key) {
+                Some((id, slot)) if id == local.id => slab.remove(slot),
+                Some(_) => foreign.push(key),
+                None => {}
+            }
+        }
+        Some(())
+    });
+    if !matches!(owned, Ok(Some(()))) {
+        return keys.iter().copied().for_each(remove);
+    }
+    foreign.into_iter().for_each(remove);
+}
+
+/// # Panics
+#[allow(clippy::expect_used)]
+#[inline]
+#[must_use]
+pub fn retain(key: u64) -> u64 {
+    assert!(
+        with(key, |slab, slot| slab.retain(slot).then_some(())).is_some(),
+        "arena::retain(key)"
+    );
+    key
+}
+
+/// Moves one reference to `key` into the store and returns its store handle.
+///
+/// # Panics
+#[allow(clippy::expect_used)]
+#[inline]
+#[must_use]
+pub fn share(key: u64) -> u64 {
+    store().insert(with(key, Slab::take).expect("arena::share(key)"))
+}
@@ -0,0 +1,88 @@
+#![deny(clippy::pedantic)]
+#![deny(clippy::restriction)]
+#![allow(clippy::arithmetic_side_effects)]
+#![allow(clippy::blanket_clippy_restriction_lints)]
+#![allow(clippy::implicit_return)]
+#![allow(clippy::missing_docs_in_private_items)]
+
+//! Handles are tagged in their low bits.
+//!
+//! `0b01` marks a small integer stored inline in the upper 62 bits and never
+//! touches the store.  `0b10` marks a handle into the arena of the thread
+//! that created it.  `0b00` marks a store handle, with `0` itself left as the
+//! null handle of a moved-from number.  The C++ `Number` mirrors this
+//! layout so it can do small integer arithmetic without crossing the FFI.
+
+use num_traits::ToPrimitive;
+
+use crate::negative::Negative;
+use crate::number::Number;
+
+pub const TAG_BITS: u32 = 2;
+pub const TAG_MASK: u64 = (1 << TAG_BITS) - 1;
+const SMALL_TAG: u64 = 0b01;
+pub const ARENA_TAG: u64 = 0b10;
+const SMALL_MAX: i64 = (1 << (i64::BITS - TAG_BITS - 1)) - 1;
+const SMALL_MIN: i64 = -SMALL_MAX - 1;
+
+#[inline]
+#[must_use]
+pub const fn is_small(key: u64) -> bool {
+    key & TAG_MASK == SMALL_TAG
+}
+
+#[inline]
+#[must_use]
+pub const fn is_arena(key: u64) -> bool {
+    key & TAG_MASK == ARENA_TAG
+}
+
+#[allow(clippy::as_conversions)]
+#[allow(clippy::cast_possible_wrap)]
+#[inline]
+#[must_use]
+pub const fn small(key: u64) -> Option<i64> {
+    if is_small(key) {
+        Some((key as i64) >> TAG_BITS)
+    } else {
+        None
+    }
+}
+
+#[allow(clippy::as_conversions)]
+#[allow(clippy::cast_sign_loss)]
+#[inline]
+#[must_use]
+pub const fn from_small(value: i64) -> Option<u64> {
+    if SMALL_MIN <= value && value <= SMALL_MAX {
+        Some(((value << TAG_BITS) as u64) | SMALL_TAG)
+    } else {
+        None
+    }
+}
+
+#[inline]
+#[must_use]
+pub fn to_small(value: &Number) -> Option<u64> {
+    match value {
+        &Number::Base(base) => base.to_i64(),
+        &Number::Negative(Negative::Base(base)) => base.to_i64().map(i64::wrapping_neg),
+        &(Number::Natural(_)
+        | Number::Rational(_)
+        | Number::Negative(_)
+        | Number::Imag(_)
+        | Number::Complex(_)
+        | Number::NaN) => None,
+    }
+    .and_then(from_small)
+}
+
+#[inline]
+#[must_use]
+pub fn to_number(value: i64) -> Number {
+    if value < 0 {
+        -Number::from(value.unsigned_abs())
+    } else {
+        Number::from(value.unsigned_abs())
+    }
+}
@@ -56,19 +56,20 @@ impl PartialOrd<Imag> for Imag {
 
 #[allow(clippy::missing_trait_methods)]
 impl Ord for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn cmp(&self, other: &Self) -> cmp::Ordering {
-        match (self.clone(), other.clone()) {
-            (Self::Base(a), Self::Base(b)) => a.cmp(&b),
-            (Self::Base(a), Self::Natural(b)) => Natural::from(a).cmp(&b),
-            (Self::Base(a), Self::Rational(b)) => Rational::from(a).cmp(&b),
-            (Self::Natural(a), Self::Base(b)) => a.cmp(&b.into()),
-            (Self::Natural(a), Self::Natural(b)) => a.cmp(&b),
-            (Self::Natural(a), Self::Rational(b)) => Rational::from(a).cmp(&b),
-            (Self::Rational(a), Self::Base(b)) => a.cmp(&b.into()),
-            (Self::Rational(a), Self::Natural(b)) => a.cmp(&b.into()),
-            (Self::Rational(a), Self::Rational(b)) => a.cmp(&b),
-            (Self::Negative(a), Self::Negative(b)) => a.cmp(&b),
+        match (self, other) {
+            (Self::Base(a), Self::Base(b)) => a.cmp(b),
+            (Self::Base(a), Self::Natural(b)) => Natural::from(*a).cmp(b),
+            (Self::Base(a), Self::Rational(b)) => Rational::from(*a).cmp(b),
+            (Self::Natural(a), Self::Base(b)) => a.cmp(&(*b).into()),
+            (Self::Natural(a), Self::Natural(b)) => a.cmp(b),
+            (Self::Natural(a), Self::Rational(b)) => Rational::from(a.clone()).cmp(b),
+            (Self::Rational(a), Self::Base(b)) => a.cmp(&(*b).into()),
+            (Self::Rational(a), Self::Natural(b)) => a.cmp(&b.clone().into()),
+            (Self::Rational(a), Self::Rational(b)) => a.cmp(b),
+            (Self::Negative(a), Self::Negative(b)) => a.cmp(b),
             (_, Self::Negative(_)) => cmp::Ordering::Greater,
             (Self::Negative(_), _) => cmp::Ordering::Less,
         }
@@ -89,27 +90,30 @@ impl Imag {
 
 #[allow(clippy::missing_trait_methods)]
 impl num_traits::ToPrimitive for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_i64(&self) -> Option<i64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_i64(),
             Self::Natural(a) => a.to_i64(),
             Self::Rational(a) => a.to_i64(),
             Self::Negative(a) => a.to_i64(),
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_u64(&self) -> Option<u64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_u64(),
             Self::Natural(a) => a.to_u64(),
             Self::Rational(a) => a.to_u64(),
             Self::Negative(a) => a.to_u64(),
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_f64(&self) -> Option<f64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_f64(),
             Self::Natural(a) => a.to_f64(),
             Self::Rational(a) => a.to_f64(),
@@ -119,9 +123,10 @@ impl num_traits::ToPrimitive for Imag {
 }
 
 impl Binary for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "{a}"),
             Self::Natural(a) => write!(formatter, "{a}"),
             Self::Rational(a) => write!(formatter, "{a}"),
@@ -131,9 +136,10 @@ impl Binary for Imag {
 }
 
 impl Display for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "{a}"),
             Self::Natural(a) => write!(formatter, "{a}"),
             Self::Rational(a) => write!(formatter, "{a}"),
@@ -143,9 +149,10 @@ impl Display for Imag {
 }
 
 impl LowerExp for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "{a}"),
             Self::Natural(a) => write!(formatter, "{a}"),
             Self::Rational(a) => write!(formatter, "{a}"),
@@ -155,9 +162,10 @@ impl LowerExp for Imag {
 }
 
 impl LowerHex for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "{a}"),
             Self::Natural(a) => write!(formatter, "{a}"),
             Self::Rational(a) => write!(formatter, "{a}"),
@@ -167,9 +175,10 @@ impl LowerHex for Imag {
 }
 
 impl Octal for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "{a}"),
             Self::Natural(a) => write!(formatter, "{a}"),
             Self::Rational(a) => write!(formatter, "{a}"),
@@ -186,9 +195,10 @@ impl Pointer for Imag {
 }
 
 impl UpperExp for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "{a}"),
             Self::Natural(a) => write!(formatter, "{a}"),
             Self::Rational(a) => write!(formatter, "{a}"),
@@ -198,9 +208,10 @@ impl UpperExp for Imag {
 }
 
 impl UpperHex for Imag {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "{a}"),
             Self::Natural(a) => write!(formatter, "{a}"),
             Self::Rational(a) => write!(formatter, "{a}"),
@@ -0,0 +1,146 @@
+#![deny(clippy::pedantic)]
+#![deny(clippy::restriction)]
+#![allow(clippy::arithmetic_side_effects)]
+#![allow(clippy::blanket_clippy_restriction_lints)]
+#![allow(clippy::implicit_return)]
+#![allow(clippy::missing_docs_in_private_items)]
+
+//! Python semantics for the integer operators the number types only define
+//! on magnitudes.
+//!
+//! Bitwise operators and shifts act on an infinite two's complement form, so
+//! `-4 << 2 | 1` is `-15`, and floor division and modulo round toward
+//! negative infinity.  Anything that is not an integer, and anything Python
+//! would raise for, gives `NaN` so callers can decide what to raise.
+
+use num_bigint::{BigInt, Sign};
+use num_integer::Integer;
+use num_traits::{Pow, Signed, ToPrimitive, Zero};
+
+use crate::natural::Natural;
+use crate::negative::Negative;
+use crate::number::Number;
+
+#[allow(clippy::pattern_type_mismatch)]
+#[inline]
+#[must_use]
+fn to_big(value: &Number) -> Option<BigInt> {
+    match value {
+        Number::Base(base) => base.to_u64().map(BigInt::from),
+        Number::Natural(natural) => Some(BigInt::from(natural.magnitude().clone())),
+        Number::Negative(Negative::Base(base)) => {
+            base.to_u64().map(|magnitude| -BigInt::from(magnitude))
+        }
+        Number::Negative(Negative::Natural(natural)) => {
+            Some(-BigInt::from(natural.magnitude().clone()))
+        }
+        Number::Rational(_)
+        | Number::Negative(Negative::Rational(_))
+        | Number::Imag(_)
+        | Number::Complex(_)
+        | Number::NaN => None,
+    }
+}
+
+#[inline]
+#[must_use]
+fn from_big(value: &BigInt) -> Number {
+    let magnitude: Number = Natural::new(value.magnitude().clone()).into();
+    if value.sign() == Sign::Minus {
+        -magnitude
+    } else {
+        magnitude
+    }
+}
+
+/// Applies `op` when both operands are integers.
+#[inline]
+#[must_use]
+fn binary(left: &Number, right: &Number, op: fn(BigInt, BigInt) -> Option<BigInt>) -> Number {
+    to_big(left)
+        .zip(to_big(right))
+        .and_then(|(lhs, rhs)| op(lhs, rhs))
+        .map_or(Number::NaN, |result| from_big(&result))
+}
+
+#[inline]
+#[must_use]
+pub fn bit_and(left: &Number, right: &Number) -> Number {
+    binary(left, right, |lhs, rhs| Some(lhs & rhs))
+}
+
+#[inline]
+#[must_use]
+pub fn bit_or(left: &Number, right: &Number) -> Number {
+    binary(left, right, |lhs, rhs| Some(lhs | rhs))
+}
+
+#[inline]
+#[must_use]
+pub fn bit_xor(left: &Number, right: &Number) -> Number {
+    binary(left, right, |lhs, rhs| Some(lhs ^ rhs))
+}
+
+/// `~value`, which is `-(value + 1)`.
+#[inline]
+#[must_use]
+pub fn invert(value: &Number) -> Number {
+    to_big(value).map_or(Number::NaN, |big| from_big(&!big))
+}
+
+/// Negative counts, and counts too large to address, give `NaN`.
+#[inline]
+#[must_use]
+pub fn shift_left(left: &Number, right: &Number) -> Number {
+    binary(left, right, |lhs, rhs| {
+        rhs.to_usize().map(|count| lhs << count)
+    })
+}
+
+/// Rounds toward negative infinity, so negative values end at `-1`.
+#[inline]
+#[must_use]
+pub fn shift_right(left: &Number, right: &Number) -> Number {
+    binary(left, right, |lhs, rhs| {
+        if rhs.is_negative() {
+            return None;
+        }
+        Some(lhs >> rhs.to_usize().unwrap_or(usize::MAX))
+    })
+}
+
+#[inline]
+#[must_use]
+pub fn floor_div(left: &Number, right: &Number) -> Number {
+    binary(left, right, |lhs, rhs| {
+        (!rhs.is_zero()).then(|| lhs.div_floor(&rhs))
+    })
+}
+
+/// The remainder takes the sign of the divisor.
+#[inline]
+#[must_use]
+pub fn modulo(left: &Number, right: &Number) -> Number {
+    binary(left, right, |lhs, rhs| {
+        (!rhs.is_zero()).then(|| lhs.mod_floor(&rhs))
+    })
+}
+
+/// Integer powers, with negative exponents giving the rational reciprocal.
+/// `None` when either operand is not an integer.
+#[inline]
+#[must_use]
+pub fn power(base: &Number, exponent: &Number) -> Option<Number> {
+    let (lhs, rhs) = to_big(base).zip(to_big(exponent))?;
+    if rhs.is_negative() && lhs.is_zero() {
+        return Some(Number::NaN);
+    }
+    let Some(count) = rhs.magnitude().to_u32() else {
+        return Some(Number::NaN);
+    };
+    let result = from_big(&Pow::pow(lhs, count));
+    if rhs.is_negative() {
+        return Some(Number::from(1) / result);
+    }
+    Some(result)
+}
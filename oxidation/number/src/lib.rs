@@ -6,177 +6,150 @@
 #![allow(clippy::float_arithmetic)]
 #![allow(clippy::implicit_return)]
 #![allow(clippy::missing_docs_in_private_items)]
-#![allow(clippy::mutex_atomic)]
 #![allow(clippy::separated_literal_suffix)]
 #![allow(clippy::single_call_fn)]
 #![allow(clippy::std_instead_of_alloc)]
 
+pub mod arena;
 pub mod base;
 pub mod complex;
+pub mod handle;
 pub mod imag;
+pub mod integer;
 pub mod natural;
 pub mod negative;
 pub mod number;
 pub mod rational;
+pub mod slab;
+pub mod stats;
+pub mod store;
 pub mod traits;
 pub mod utils;
 
-use core::fmt::{Error, Result, Write};
-use core::hash::BuildHasher;
+use core::ptr::null_mut;
+use core::slice::{from_raw_parts, from_raw_parts_mut};
 use num_traits::{Pow, ToPrimitive};
-use std::collections::{BTreeMap, HashSet};
-use std::sync::mpsc::{sync_channel, Receiver, SyncSender};
-use std::sync::{Arc, Condvar, Mutex, OnceLock};
-use std::thread::spawn;
+use std::collections::HashMap;
+use std::sync::{OnceLock, RwLock};
 
+use crate::handle::{from_small, is_arena, is_small, small, to_number, to_small};
 use crate::number::Number;
+use crate::stats::NumberStats;
+use crate::store::store;
 use crate::traits::NumberBase;
 
-#[derive(Debug)]
-enum Event {
-    End,
-    Del(u64),
-    Get(u64, Arc<(Condvar, Mutex<(bool, Number)>)>),
-    New(Number, Arc<(Condvar, Mutex<(bool, u64)>)>),
-    Syn(Arc<(Condvar, Mutex<bool>)>),
-}
-
-#[allow(clippy::expect_used)]
-fn gc_loop(receiver: &Receiver<Event>) {
-    let mut heap = HashSet::<Number>::new();
-    let mut refs = BTreeMap::<u64, usize>::new();
-    while let Ok(event) = receiver.recv() {
-        match event {
-            Event::Del(key) => {
-                refs.entry(key).and_modify(|reference| *reference -= 1);
-                if Some(0) == refs.get(&key).copied() {
-                    heap.remove(
-                        &heap
-                            .iter()
-                            .find(|num| heap.hasher().hash_one(num) == key)
-                            .cloned()
-                            .expect("Event::Del(key)"),
-                    );
-                    refs.remove(&key);
-                }
-            }
-            Event::Get(key, wait) => {
-                if let Ok(mut started) = wait.1.lock() {
-                    *started = (
-                        true,
-                        heap.iter()
-                            .find(|num| heap.hasher().hash_one(num) == key)
-                            .cloned()
-                            .expect("Event::Get(key, wait)"),
-                    );
-                    wait.0.notify_one();
-                } else {
-                    return;
-                }
-            }
-            Event::New(value, wait) => {
-                if let Ok(mut started) = wait.1.lock() {
-                    let key = heap.hasher().hash_one(value.clone());
-                    if heap.insert(value) {
-                        refs.insert(key, 1);
-                    } else {
-                        refs.entry(key).and_modify(|reference| *reference += 1);
-                    };
-                    *started = (true, key);
-                    wait.0.notify_one();
-                } else {
-                    return;
-                }
-            }
-            Event::Syn(wait) => {
-                if let Ok(mut started) = wait.1.lock() {
-                    *started = true;
-                    wait.0.notify_one();
-                } else {
-                    return;
-                }
-            }
-            Event::End => {
-                return;
-            }
-        }
+#[inline]
+#[must_use]
+fn export_number(value: Number) -> u64 {
+    to_small(&value).unwrap_or_else(|| {
+        stats::news();
+        arena::insert(value)
+    })
+}
+
+#[inline]
+#[must_use]
+fn get(key: u64) -> Number {
+    if is_arena(key) {
+        stats::gets();
+        return arena::get(key);
     }
+    small(key).map_or_else(
+        || {
+            stats::gets();
+            store().get(key)
+        },
+        to_number,
+    )
 }
 
-static EVENTS: OnceLock<SyncSender<Event>> = OnceLock::new();
+/// Lends the number behind `key` to `op` without copying it out of its table.
+#[inline]
+fn borrow<R, F: FnOnce(&Number) -> R>(key: u64, op: F) -> R {
+    if is_arena(key) {
+        stats::gets();
+        return arena::borrow(key, op);
+    }
+    match small(key) {
+        Some(value) => op(&to_number(value)),
+        None => {
+            stats::gets();
+            store().borrow(key, op)
+        }
+    }
+}
 
-fn events() -> &'static SyncSender<Event> {
-    EVENTS.get_or_init(|| {
-        let (sender, receiver) = sync_channel(12);
-        spawn(move || gc_loop(&receiver));
-        sender
-    })
+/// Applies `op` to both operands in place and exports the result.  Arena
+/// locks are always taken before store locks, and the table lock is released
+/// before the result is placed.
+#[inline]
+#[must_use]
+fn borrow_op(left: u64, right: u64, op: fn(&Number, &Number) -> Number) -> u64 {
+    let heap = |key| !is_arena(key) && small(key).is_none();
+    let value = if is_arena(left) && is_arena(right) {
+        stats::gets();
+        stats::gets();
+        arena::borrow_pair(left, right, op)
+    } else if heap(left) && heap(right) {
+        stats::gets();
+        stats::gets();
+        store().borrow_pair(left, right, op)
+    } else if is_arena(right) {
+        borrow(right, |rhs| borrow(left, |lhs| op(lhs, rhs)))
+    } else {
+        borrow(left, |lhs| borrow(right, |rhs| op(lhs, rhs)))
+    };
+    export_number(value)
 }
 
-/// # Panics
-#[allow(clippy::unwrap_used)]
+/// Applies `op` directly when both operands are inline small integers and
+/// the result still fits inline.
 #[inline]
 #[must_use]
-fn export_number(value: Number) -> u64 {
-    let wait = Arc::new((Condvar::new(), Mutex::new((false, 0_u64))));
-    events().send(Event::New(value, Arc::clone(&wait))).unwrap();
-    let mut started = wait.1.lock().unwrap();
-    while !started.0 {
-        started = wait.0.wait(started).unwrap();
-    }
-    started.1
+fn small_op(left: u64, right: u64, op: fn(i64, i64) -> Option<i64>) -> Option<u64> {
+    small(left)
+        .zip(small(right))
+        .and_then(|(lhs, rhs)| op(lhs, rhs))
+        .and_then(from_small)
 }
 
+/// Python floor division of machine integers, `None` for a zero divisor.
 #[inline]
 #[must_use]
-fn fmt_code(_err: Error) -> i32 {
-    1_i32
+fn floor_div_small(lhs: i64, rhs: i64) -> Option<i64> {
+    let quotient = lhs.checked_div(rhs)?;
+    if lhs % rhs != 0 && (lhs < 0) != (rhs < 0) {
+        return quotient.checked_sub(1);
+    }
+    Some(quotient)
 }
 
-/// # Panics
-#[allow(clippy::unwrap_used)]
+/// Python modulo of machine integers, taking the sign of the divisor.
 #[inline]
 #[must_use]
-fn get(key: u64) -> Number {
-    let wait = Arc::new((Condvar::new(), Mutex::new((false, Number::new(0)))));
-    events().send(Event::Get(key, Arc::clone(&wait))).unwrap();
-    let mut started = wait.1.lock().unwrap();
-    while !started.0 {
-        started = wait.0.wait(started).unwrap();
+fn mod_small(lhs: i64, rhs: i64) -> Option<i64> {
+    let remainder = lhs.checked_rem(rhs)?;
+    if remainder != 0 && (remainder < 0) != (rhs < 0) {
+        return remainder.checked_add(rhs);
     }
-    started.1.clone()
+    Some(remainder)
 }
 
-struct Writer {
-    buffer: *mut u8,
-    len: usize,
-    capacity: usize,
+/// Left shift of machine integers while no bits are lost.
+#[inline]
+#[must_use]
+fn shift_left_small(lhs: i64, rhs: i64) -> Option<i64> {
+    let count = u32::try_from(rhs).ok().filter(|&count| count < i64::BITS)?;
+    let shifted = lhs << count;
+    (shifted >> count == lhs).then_some(shifted)
 }
 
-#[allow(clippy::missing_trait_methods)]
-impl Write for Writer {
-    #[allow(clippy::question_mark_used)]
-    #[inline]
-    fn write_str(&mut self, string: &str) -> Result {
-        if string.is_empty() {
-            return Ok(());
-        }
-        let bytes = string.as_bytes();
-        let length = bytes.len();
-        if self.capacity.checked_sub(self.len).ok_or(Error)? < length {
-            return Err(Error);
-        }
-        let buffer = self.len.try_into().ok().ok_or(Error).map(|len| {
-            // SAFETY: depends on capacity being honest
-            unsafe { self.buffer.offset(len) }
-        })?;
-        // SAFETY: depends on capacity being honest
-        unsafe {
-            buffer.copy_from_nonoverlapping(bytes.as_ptr(), length);
-        };
-        self.len = self.len.checked_add(length).ok_or(Error)?;
-        Ok(())
-    }
+/// Zero is always inline, so this is the whole test.  Callers raise
+/// `ZeroDivisionError` first, this only keeps the FFI from panicking.
+#[inline]
+#[must_use]
+fn is_zero(key: u64) -> bool {
+    small(key) == Some(0)
 }
 
 #[inline]
@@ -187,57 +160,85 @@ pub extern "C" fn r_abs(left: u64) -> u64 {
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_add(left: u64, right: u64) -> u64 {
-    export_number(get(left) + get(right))
+    small_op(left, right, i64::checked_add)
+        .unwrap_or_else(|| borrow_op(left, right, |lhs, rhs| lhs + rhs))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_bit_not(left: u64) -> u64 {
-    export_number(!get(left))
+    small(left)
+        .map(|value| !value)
+        .and_then(from_small)
+        .unwrap_or_else(|| export_number(integer::invert(&get(left))))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_bit_and(left: u64, right: u64) -> u64 {
-    export_number(get(left) & get(right))
+    small_op(left, right, |lhs, rhs| Some(lhs & rhs))
+        .unwrap_or_else(|| export_number(integer::bit_and(&get(left), &get(right))))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_bit_lshift(left: u64, right: u64) -> u64 {
-    export_number(get(left) & get(right))
+    small_op(left, right, shift_left_small)
+        .unwrap_or_else(|| export_number(integer::shift_left(&get(left), &get(right))))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_bit_or(left: u64, right: u64) -> u64 {
-    export_number(get(left) | get(right))
+    small_op(left, right, |lhs, rhs| Some(lhs | rhs))
+        .unwrap_or_else(|| export_number(integer::bit_or(&get(left), &get(right))))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_bit_rshift(left: u64, right: u64) -> u64 {
-    export_number(get(left) & get(right))
+    small_op(left, right, |lhs, rhs| {
+        u32::try_from(rhs)
+            .ok()
+            .map(|count| lhs >> count.min(i64::BITS - 1))
+    })
+    .unwrap_or_else(|| export_number(integer::shift_right(&get(left), &get(right))))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_bit_xor(left: u64, right: u64) -> u64 {
-    export_number(get(left) ^ get(right))
+    small_op(left, right, |lhs, rhs| Some(lhs ^ rhs))
+        .unwrap_or_else(|| export_number(integer::bit_xor(&get(left), &get(right))))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_div(left: u64, right: u64) -> u64 {
+    if is_zero(right) {
+        return export_number(Number::NaN);
+    }
     export_number(get(left) / get(right))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_eq(left: u64, right: u64) -> bool {
+    if let Some((lhs, rhs)) = small(left).zip(small(right)) {
+        return lhs == rhs;
+    }
     get(left) == get(right)
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_div_floor(left: u64, right: u64) -> u64 {
-    export_number(get(left).div_floor(get(right)))
+    r_floor_div(left, right)
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_floor_div(left: u64, right: u64) -> u64 {
-    export_number(get(left).div_floor(get(right)))
+    if is_zero(right) {
+        return export_number(Number::NaN);
+    }
+    small_op(left, right, floor_div_small).unwrap_or_else(|| {
+        let (lhs, rhs) = (get(left), get(right));
+        if lhs.is_int() && rhs.is_int() {
+            return export_number(integer::floor_div(&lhs, &rhs));
+        }
+        export_number(lhs.div_floor(rhs))
+    })
 }
 #[inline]
 #[no_mangle]
@@ -267,27 +268,51 @@ pub extern "C" fn r_is_nan(left: u64) -> bool {
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_lt(left: u64, right: u64) -> bool {
+    if let Some((lhs, rhs)) = small(left).zip(small(right)) {
+        return lhs < rhs;
+    }
     get(left) < get(right)
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_modu(left: u64, right: u64) -> u64 {
-    export_number(get(left) % get(right))
+    if is_zero(right) {
+        return export_number(Number::NaN);
+    }
+    small_op(left, right, mod_small).unwrap_or_else(|| {
+        let (lhs, rhs) = (get(left), get(right));
+        if lhs.is_int() && rhs.is_int() {
+            return export_number(integer::modulo(&lhs, &rhs));
+        }
+        export_number(lhs % rhs)
+    })
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_mul(left: u64, right: u64) -> u64 {
-    export_number(get(left) * get(right))
+    small_op(left, right, i64::checked_mul)
+        .unwrap_or_else(|| borrow_op(left, right, |lhs, rhs| lhs * rhs))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_neg(left: u64) -> u64 {
-    export_number(-get(left))
+    small(left)
+        .and_then(i64::checked_neg)
+        .and_then(from_small)
+        .unwrap_or_else(|| export_number(-get(left)))
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_pow(left: u64, right: u64) -> u64 {
-    export_number(get(left).pow(get(right)))
+    small_op(left, right, |lhs, rhs| {
+        u32::try_from(rhs)
+            .ok()
+            .and_then(|count| lhs.checked_pow(count))
+    })
+    .unwrap_or_else(|| {
+        let (lhs, rhs) = (get(left), get(right));
+        export_number(integer::power(&lhs, &rhs).unwrap_or_else(|| lhs.pow(rhs)))
+    })
 }
 #[inline]
 #[no_mangle]
@@ -297,40 +322,145 @@ pub extern "C" fn r_mod_pow(base: u64, exp: u64, modu: u64) -> u64 {
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_repr(buffer: *mut u8, capacity: usize, value: u64) -> i32 {
-    write!(
-        Writer {
-            buffer,
-            len: 0,
-            capacity,
-        },
-        "{}",
-        get(value)
-    )
-    .err()
-    .map(fmt_code)
-    .unwrap_or_default()
+    i32::from(r_repr_into(buffer, capacity, value) > capacity)
+}
+/// Writes as much of the decimal form of `value` as fits in `capacity` bytes
+/// and returns its full length, so a caller whose buffer was too small can
+/// grow it and call again.  Stored numbers keep their decimal form cached so
+/// the retry, and any later repr of the same value, does not format again.
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_repr_into(buffer: *mut u8, capacity: usize, value: u64) -> usize {
+    let copy = |repr: &str| {
+        handles_mut(buffer, capacity)
+            .iter_mut()
+            .zip(repr.as_bytes())
+            .for_each(|(out, byte)| *out = *byte);
+        repr.len()
+    };
+    if let Some(inline) = small(value) {
+        return copy(&inline.to_string());
+    }
+    if is_arena(value) {
+        return copy(&arena::get(value).to_string());
+    }
+    store().repr(value, copy)
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_repr_len(value: u64) -> usize {
-    get(value).to_string().len()
+    r_repr_into(null_mut(), 0, value)
 }
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_sub(left: u64, right: u64) -> u64 {
-    export_number(get(left) - get(right))
+    small_op(left, right, i64::checked_sub)
+        .unwrap_or_else(|| borrow_op(left, right, |lhs, rhs| lhs - rhs))
+}
+
+#[inline]
+#[must_use]
+fn handles<'handles>(values: *const u64, len: usize) -> &'handles [u64] {
+    if values.is_null() || len == 0 {
+        return &[];
+    }
+    // SAFETY: depends on len being honest
+    unsafe { from_raw_parts(values, len) }
+}
+
+#[inline]
+#[must_use]
+fn handles_mut<'handles, T>(values: *mut T, len: usize) -> &'handles mut [T] {
+    if values.is_null() || len == 0 {
+        return &mut [];
+    }
+    // SAFETY: depends on len being honest
+    unsafe { from_raw_parts_mut(values, len) }
+}
+
+/// Applies `op` pairwise over `len` handles from `left` and `right` into `out`.
+#[inline]
+fn each<T>(out: *mut T, left: *const u64, right: *const u64, len: usize, op: fn(u64, u64) -> T) {
+    handles_mut(out, len)
+        .iter_mut()
+        .zip(handles(left, len).iter().zip(handles(right, len)))
+        .for_each(|(result, (&lhs, &rhs))| *result = op(lhs, rhs));
+}
+
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_add_many(out: *mut u64, left: *const u64, right: *const u64, len: usize) {
+    each(out, left, right, len, |lhs, rhs| r_add(lhs, rhs));
+}
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_eq_many(out: *mut bool, left: *const u64, right: *const u64, len: usize) {
+    each(out, left, right, len, |lhs, rhs| r_eq(lhs, rhs));
+}
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_lt_many(out: *mut bool, left: *const u64, right: *const u64, len: usize) {
+    each(out, left, right, len, |lhs, rhs| r_lt(lhs, rhs));
+}
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_mul_many(out: *mut u64, left: *const u64, right: *const u64, len: usize) {
+    each(out, left, right, len, |lhs, rhs| r_mul(lhs, rhs));
+}
+
+/// Left to right total of `len` handles, staying in machine integers until
+/// the running total leaves the inline range.
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_sum(values: *const u64, len: usize) -> u64 {
+    let mut total = 0_i64;
+    let mut rest = handles(values, len).iter();
+    while let Some(&key) = rest.next() {
+        if let Some(next) = small(key).and_then(|value| total.checked_add(value)) {
+            total = next;
+        } else {
+            return export_number(
+                rest.fold(to_number(total) + get(key), |acc, &other| acc + get(other)),
+            );
+        }
+    }
+    from_small(total).unwrap_or_else(|| export_number(to_number(total)))
+}
+
+/// Left to right product of `len` handles, see `r_sum`.
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_product(values: *const u64, len: usize) -> u64 {
+    let mut total = 1_i64;
+    let mut rest = handles(values, len).iter();
+    while let Some(&key) = rest.next() {
+        if let Some(next) = small(key).and_then(|value| total.checked_mul(value)) {
+            total = next;
+        } else {
+            return export_number(
+                rest.fold(to_number(total) * get(key), |acc, &other| acc * get(other)),
+            );
+        }
+    }
+    from_small(total).unwrap_or_else(|| export_number(to_number(total)))
 }
 
 #[inline]
 #[no_mangle]
 #[allow(clippy::cast_possible_wrap)]
 pub extern "C" fn r_cast_int(value: u64) -> i64 {
+    if let Some(inline) = small(value) {
+        return inline;
+    }
     get(value).to_i64().unwrap_or(0)
 }
 
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_cast_unsigned(value: u64) -> u64 {
+    if let Some(inline) = small(value) {
+        return inline.try_into().unwrap_or(0);
+    }
     get(value).to_u64().unwrap_or(0)
 }
 
@@ -343,40 +473,114 @@ pub extern "C" fn r_cast_float(value: u64) -> f64 {
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_create_number(value: u64) -> u64 {
-    export_number(value.into())
+    value
+        .try_into()
+        .ok()
+        .and_then(from_small)
+        .unwrap_or_else(|| {
+            stats::news();
+            arena::insert(value.into())
+        })
 }
 
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_copy_number(number: u64) -> u64 {
-    export_number(get(number))
+    if is_small(number) {
+        return number;
+    }
+    if is_arena(number) {
+        return arena::retain(number);
+    }
+    store().retain(number)
 }
 
-/// # Panics
-#[allow(clippy::unwrap_used)]
 #[inline]
 #[no_mangle]
 pub extern "C" fn r_delete_number(number: u64) {
-    events().send(Event::Del(number)).unwrap();
+    if !is_small(number) {
+        stats::deletes(1);
+    }
+    if is_arena(number) {
+        return arena::remove(number);
+    }
+    if !is_small(number) {
+        store().remove(number);
+    }
 }
 
-/// # Panics
-#[allow(clippy::unwrap_used)]
+/// Moves a number out of the calling thread's arena into the shared store,
+/// consuming `number` and returning the handle to use from then on.
 #[inline]
 #[no_mangle]
-pub extern "C" fn r_vm_clear() {
-    let wait = Arc::new((Condvar::new(), Mutex::new(false)));
-    events().send(Event::Syn(Arc::clone(&wait))).unwrap();
-    let mut started = wait.1.lock().unwrap();
-    while !*started {
-        started = wait.0.wait(started).unwrap();
+pub extern "C" fn r_share_number(number: u64) -> u64 {
+    if is_arena(number) {
+        return arena::share(number);
     }
+    number
 }
 
+/// Distinct values `r_intern_number` keeps before it only shares, so source
+/// full of one-off constants cannot grow the table without bound.
+const MAX_LITERALS: usize = 1 << 16;
+
+/// Store handle of each interned value, holding one reference to it.
+static LITERALS: OnceLock<RwLock<HashMap<Number, u64>>> = OnceLock::new();
+
+/// Shares one store handle between every literal equal to `number`,
+/// consuming `number`.  Inline values never reach the table.
+///
 /// # Panics
 #[allow(clippy::unwrap_used)]
 #[inline]
 #[no_mangle]
+pub extern "C" fn r_intern_number(number: u64) -> u64 {
+    if is_small(number) {
+        return number;
+    }
+    let value = get(number);
+    let literals = LITERALS.get_or_init(RwLock::default);
+    if let Some(&interned) = literals.read().unwrap().get(&value) {
+        r_delete_number(number);
+        return store().retain(interned);
+    }
+    let mut write = literals.write().unwrap();
+    if let Some(&interned) = write.get(&value) {
+        r_delete_number(number);
+        return store().retain(interned);
+    }
+    let shared = r_share_number(number);
+    if write.len() < MAX_LITERALS {
+        write.insert(value, store().retain(shared));
+    }
+    shared
+}
+
+/// Drops one reference to each of `len` handles, taking each table lock once
+/// per run of handles rather than once per handle.
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_delete_numbers(values: *const u64, len: usize) {
+    let keys = handles(values, len);
+    stats::deletes(keys.len().try_into().unwrap_or(u64::MAX));
+    arena::remove_many(keys);
+    store().remove_many(keys);
+}
+
+/// Releases every number at once on process exit, without dropping them one
+/// at a time.
+#[inline]
+#[no_mangle]
 pub extern "C" fn r_vm_end() {
-    events().send(Event::End).unwrap();
+    arena::abandon();
+    store().abandon();
+}
+
+/// Writes a snapshot of the handle table counters to `out`.
+#[inline]
+#[no_mangle]
+pub extern "C" fn r_number_stats(out: *mut NumberStats) {
+    if let Some(snapshot) = handles_mut(out, 1).first_mut() {
+        *snapshot = stats::snapshot();
+    }
 }
@@ -73,6 +73,11 @@ impl Natural {
     }
     #[inline]
     #[must_use]
+    pub const fn magnitude(&self) -> &num_bigint::BigUint {
+        &self.value
+    }
+    #[inline]
+    #[must_use]
     pub fn reduce(&self) -> Maybe {
         let mut value = self.value.to_u64_digits();
         if value.len() < 2 {
@@ -54,43 +54,47 @@ impl PartialOrd<Negative> for Negative {
 
 #[allow(clippy::missing_trait_methods)]
 impl Ord for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn cmp(&self, other: &Self) -> cmp::Ordering {
-        match (self.clone(), other.clone()) {
-            (Self::Base(a), Self::Base(b)) => b.cmp(&a),
-            (Self::Base(a), Self::Natural(b)) => b.cmp(&a.into()),
-            (Self::Base(a), Self::Rational(b)) => b.cmp(&a.into()),
-            (Self::Natural(a), Self::Base(b)) => a.cmp(&b.into()).reverse(),
-            (Self::Natural(a), Self::Natural(b)) => b.cmp(&a),
-            (Self::Natural(a), Self::Rational(b)) => b.cmp(&a.into()),
-            (Self::Rational(a), Self::Base(b)) => a.cmp(&b.into()).reverse(),
-            (Self::Rational(a), Self::Natural(b)) => a.cmp(&b.into()).reverse(),
-            (Self::Rational(a), Self::Rational(b)) => b.cmp(&a),
+        match (self, other) {
+            (Self::Base(a), Self::Base(b)) => b.cmp(a),
+            (Self::Base(a), Self::Natural(b)) => b.cmp(&(*a).into()),
+            (Self::Base(a), Self::Rational(b)) => b.cmp(&(*a).into()),
+            (Self::Natural(a), Self::Base(b)) => a.cmp(&(*b).into()).reverse(),
+            (Self::Natural(a), Self::Natural(b)) => b.cmp(a),
+            (Self::Natural(a), Self::Rational(b)) => b.cmp(&a.clone().into()),
+            (Self::Rational(a), Self::Base(b)) => a.cmp(&(*b).into()).reverse(),
+            (Self::Rational(a), Self::Natural(b)) => a.cmp(&b.clone().into()).reverse(),
+            (Self::Rational(a), Self::Rational(b)) => b.cmp(a),
         }
     }
 }
 
 #[allow(clippy::missing_trait_methods)]
 impl num_traits::ToPrimitive for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_i64(&self) -> Option<i64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_i64(),
             Self::Natural(a) => a.to_i64(),
             Self::Rational(a) => a.to_i64(),
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_u64(&self) -> Option<u64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_u64(),
             Self::Natural(a) => a.to_u64(),
             Self::Rational(a) => a.to_u64(),
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_f64(&self) -> Option<f64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_f64(),
             Self::Natural(a) => a.to_f64(),
             Self::Rational(a) => a.to_f64(),
@@ -99,9 +103,10 @@ impl num_traits::ToPrimitive for Negative {
 }
 
 impl Binary for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "-{a}"),
             Self::Natural(a) => write!(formatter, "-{a}"),
             Self::Rational(a) => write!(formatter, "-{a}"),
@@ -110,9 +115,10 @@ impl Binary for Negative {
 }
 
 impl Display for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "-{a}"),
             Self::Natural(a) => write!(formatter, "-{a}"),
             Self::Rational(a) => write!(formatter, "-{a}"),
@@ -121,9 +127,10 @@ impl Display for Negative {
 }
 
 impl LowerExp for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "-{a}"),
             Self::Natural(a) => write!(formatter, "-{a}"),
             Self::Rational(a) => write!(formatter, "-{a}"),
@@ -132,9 +139,10 @@ impl LowerExp for Negative {
 }
 
 impl LowerHex for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "-{a}"),
             Self::Natural(a) => write!(formatter, "-{a}"),
             Self::Rational(a) => write!(formatter, "-{a}"),
@@ -143,9 +151,10 @@ impl LowerHex for Negative {
 }
 
 impl Octal for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "-{a}"),
             Self::Natural(a) => write!(formatter, "-{a}"),
             Self::Rational(a) => write!(formatter, "-{a}"),
@@ -161,9 +170,10 @@ impl Pointer for Negative {
 }
 
 impl UpperExp for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "-{a}"),
             Self::Natural(a) => write!(formatter, "-{a}"),
             Self::Rational(a) => write!(formatter, "-{a}"),
@@ -172,9 +182,10 @@ impl UpperExp for Negative {
 }
 
 impl UpperHex for Negative {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter<'_>) -> Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => write!(formatter, "-{a}"),
             Self::Natural(a) => write!(formatter, "-{a}"),
             Self::Rational(a) => write!(formatter, "-{a}"),
@@ -39,10 +39,11 @@ impl Default for Number {
 
 #[allow(clippy::missing_trait_methods)]
 impl PartialEq<u64> for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn eq(&self, other: &u64) -> bool {
-        match self.clone() {
-            Self::Base(a) => a == *other,
+        match self {
+            Self::Base(a) => a == other,
             Self::Natural(_)
             | Self::Rational(_)
             | Self::Negative(_)
@@ -55,9 +56,10 @@ impl PartialEq<u64> for Number {
 
 #[allow(clippy::missing_trait_methods)]
 impl PartialOrd<u64> for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn partial_cmp(&self, other: &u64) -> Option<cmp::Ordering> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.partial_cmp(other),
             Self::Natural(a) => a.partial_cmp(other),
             Self::Rational(a) => a.partial_cmp(other),
@@ -71,40 +73,53 @@ impl PartialOrd<u64> for Number {
 #[allow(clippy::missing_trait_methods)]
 #[allow(clippy::non_canonical_partial_ord_impl)]
 impl PartialOrd<Number> for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn partial_cmp(&self, other: &Self) -> Option<cmp::Ordering> {
-        match (self.clone(), other.clone()) {
+        match (self, other) {
             (Self::NaN, _) | (_, Self::NaN) => None,
-            (Self::Base(a), Self::Base(b)) => Some(a.cmp(&b)),
-            (Self::Base(a), Self::Natural(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Base(a), Self::Rational(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Base(a), Self::Imag(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Base(a), Self::Complex(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Natural(a), Self::Base(b)) => Some(a.cmp(&b.into())),
-            (Self::Natural(a), Self::Natural(b)) => Some(a.cmp(&b)),
-            (Self::Natural(a), Self::Rational(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Natural(a), Self::Imag(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Natural(a), Self::Complex(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Rational(a), Self::Base(b)) => Some(a.cmp(&b.into())),
-            (Self::Rational(a), Self::Natural(b)) => Some(a.cmp(&b.into())),
-            (Self::Rational(a), Self::Rational(b)) => Some(a.cmp(&b)),
-            (Self::Rational(a), Self::Imag(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Rational(a), Self::Complex(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Negative(a), Self::Negative(b)) => Some(a.cmp(&b)),
-            (Self::Negative(a), Self::Imag(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Negative(a), Self::Complex(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Imag(a), Self::Base(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Imag(a), Self::Natural(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Imag(a), Self::Rational(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Imag(a), Self::Negative(b)) => Some(Complex::cmp(&a.into(), &b.into())),
-            (Self::Imag(a), Self::Imag(b)) => Some(a.cmp(&b)),
-            (Self::Imag(a), Self::Complex(b)) => Some(b.cmp(&a.into()).reverse()),
-            (Self::Complex(a), Self::Base(b)) => Some(a.cmp(&b.into())),
-            (Self::Complex(a), Self::Natural(b)) => Some(a.cmp(&b.into())),
-            (Self::Complex(a), Self::Rational(b)) => Some(a.cmp(&b.into())),
-            (Self::Complex(a), Self::Negative(b)) => Some(a.cmp(&b.into())),
-            (Self::Complex(a), Self::Imag(b)) => Some(a.cmp(&b.into())),
-            (Self::Complex(a), Self::Complex(b)) => Some(a.cmp(&b)),
+            (Self::Base(a), Self::Base(b)) => Some(a.cmp(b)),
+            (Self::Base(a), Self::Natural(b)) => Some(b.cmp(&(*a).into()).reverse()),
+            (Self::Base(a), Self::Rational(b)) => Some(b.cmp(&(*a).into()).reverse()),
+            (Self::Base(a), Self::Imag(b)) => Some(Complex::cmp(&(*a).into(), &b.clone().into())),
+            (Self::Base(a), Self::Complex(b)) => Some(b.cmp(&(*a).into()).reverse()),
+            (Self::Natural(a), Self::Base(b)) => Some(a.cmp(&(*b).into())),
+            (Self::Natural(a), Self::Natural(b)) => Some(a.cmp(b)),
+            (Self::Natural(a), Self::Rational(b)) => Some(b.cmp(&a.clone().into()).reverse()),
+            (Self::Natural(a), Self::Imag(b)) => {
+                Some(Complex::cmp(&a.clone().into(), &b.clone().into()))
+            }
+            (Self::Natural(a), Self::Complex(b)) => Some(b.cmp(&a.clone().into()).reverse()),
+            (Self::Rational(a), Self::Base(b)) => Some(a.cmp(&(*b).into())),
+            (Self::Rational(a), Self::Natural(b)) => Some(a.cmp(&b.clone().into())),
+            (Self::Rational(a), Self::Rational(b)) => Some(a.cmp(b)),
+            (Self::Rational(a), Self::Imag(b)) => {
+                Some(Complex::cmp(&a.clone().into(), &b.clone().into()))
+            }
+            (Self::Rational(a), Self::Complex(b)) => Some(b.cmp(&a.clone().into()).reverse()),
+            (Self::Negative(a), Self::Negative(b)) => Some(a.cmp(b)),
+            (Self::Negative(a), Self::Imag(b)) => {
+                Some(Complex::cmp(&a.clone().into(), &b.clone().into()))
+            }
+            (Self::Negative(a), Self::Complex(b)) => Some(b.cmp(&a.clone().into()).reverse()),
+            (Self::Imag(a), Self::Base(b)) => Some(Complex::cmp(&a.clone().into(), &(*b).into())),
+            (Self::Imag(a), Self::Natural(b)) => {
+                Some(Complex::cmp(&a.clone().into(), &b.clone().into()))
+            }
+            (Self::Imag(a), Self::Rational(b)) => {
+                Some(Complex::cmp(&a.clone().into(), &b.clone().into()))
+            }
+            (Self::Imag(a), Self::Negative(b)) => {
+                Some(Complex::cmp(&a.clone().into(), &b.clone().into()))
+            }
+            (Self::Imag(a), Self::Imag(b)) => Some(a.cmp(b)),
+            (Self::Imag(a), Self::Complex(b)) => Some(b.cmp(&a.clone().into()).reverse()),
+            (Self::Complex(a), Self::Base(b)) => Some(a.cmp(&(*b).into())),
+            (Self::Complex(a), Self::Natural(b)) => Some(a.cmp(&b.clone().into())),
+            (Self::Complex(a), Self::Rational(b)) => Some(a.cmp(&b.clone().into())),
+            (Self::Complex(a), Self::Negative(b)) => Some(a.cmp(&b.clone().into())),
+            (Self::Complex(a), Self::Imag(b)) => Some(a.cmp(&b.clone().into())),
+            (Self::Complex(a), Self::Complex(b)) => Some(a.cmp(b)),
             (_, Self::Negative(_)) | (Self::Negative(_), _) => Some(cmp::Ordering::Less),
         }
     }
@@ -216,9 +231,10 @@ impl Number {
 
 #[allow(clippy::missing_trait_methods)]
 impl num_traits::ToPrimitive for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_i64(&self) -> Option<i64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_i64(),
             Self::Natural(a) => a.to_i64(),
             Self::Rational(a) => a.to_i64(),
@@ -228,9 +244,10 @@ impl num_traits::ToPrimitive for Number {
             Self::NaN => None,
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_u64(&self) -> Option<u64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_u64(),
             Self::Natural(a) => a.to_u64(),
             Self::Rational(a) => a.to_u64(),
@@ -240,9 +257,10 @@ impl num_traits::ToPrimitive for Number {
             Self::NaN => None,
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_f64(&self) -> Option<f64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_f64(),
             Self::Natural(a) => a.to_f64(),
             Self::Rational(a) => a.to_f64(),
@@ -255,9 +273,10 @@ impl num_traits::ToPrimitive for Number {
 }
 
 impl fmt::Binary for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => fmt::Binary::fmt(&a, formatter),
             Self::Natural(a) => fmt::Binary::fmt(&a, formatter),
             Self::Rational(a) => fmt::Binary::fmt(&a, formatter),
@@ -270,9 +289,10 @@ impl fmt::Binary for Number {
 }
 
 impl fmt::Display for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.fmt(formatter),
             Self::Natural(a) => fmt::Display::fmt(&a, formatter),
             Self::Rational(a) => a.fmt(formatter),
@@ -285,9 +305,10 @@ impl fmt::Display for Number {
 }
 
 impl fmt::LowerExp for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => fmt::LowerExp::fmt(&a, formatter),
             Self::Natural(a) => fmt::Display::fmt(&a, formatter),
             Self::Rational(a) => fmt::LowerExp::fmt(&a, formatter),
@@ -300,9 +321,10 @@ impl fmt::LowerExp for Number {
 }
 
 impl fmt::LowerHex for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => fmt::LowerHex::fmt(&a, formatter),
             Self::Natural(a) => fmt::LowerHex::fmt(&a, formatter),
             Self::Rational(a) => fmt::LowerHex::fmt(&a, formatter),
@@ -315,9 +337,10 @@ impl fmt::LowerHex for Number {
 }
 
 impl fmt::Octal for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => fmt::Octal::fmt(&a, formatter),
             Self::Natural(a) => fmt::Octal::fmt(&a, formatter),
             Self::Rational(a) => fmt::Octal::fmt(&a, formatter),
@@ -337,9 +360,10 @@ impl fmt::Pointer for Number {
 }
 
 impl fmt::UpperExp for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => fmt::UpperExp::fmt(&a, formatter),
             Self::Natural(a) => fmt::Display::fmt(&a, formatter),
             Self::Rational(a) => fmt::UpperExp::fmt(&a, formatter),
@@ -352,9 +376,10 @@ impl fmt::UpperExp for Number {
 }
 
 impl fmt::UpperHex for Number {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
-        match self.clone() {
+        match self {
             Self::Base(a) => fmt::UpperHex::fmt(&a, formatter),
             Self::Natural(a) => fmt::UpperHex::fmt(&a, formatter),
             Self::Rational(a) => fmt::UpperHex::fmt(&a, formatter),
@@ -422,6 +447,17 @@ impl ops::Add for Number {
     }
 }
 
+impl ops::Add<&Number> for &Number {
+    type Output = Number;
+    #[inline]
+    fn add(self, other: &Number) -> Self::Output {
+        match (self, other) {
+            (&Number::Base(a), &Number::Base(b)) => a + b,
+            _ => self.clone() + other.clone(),
+        }
+    }
+}
+
 impl ops::BitAnd for Number {
     type Output = Self;
     #[inline]
@@ -653,6 +689,17 @@ impl ops::Mul for Number {
     }
 }
 
+impl ops::Mul<&Number> for &Number {
+    type Output = Number;
+    #[inline]
+    fn mul(self, other: &Number) -> Self::Output {
+        match (self, other) {
+            (&Number::Base(a), &Number::Base(b)) => a * b,
+            _ => self.clone() * other.clone(),
+        }
+    }
+}
+
 impl ops::Neg for Number {
     type Output = Self;
     #[inline]
@@ -987,6 +1034,17 @@ impl ops::Sub for Number {
     }
 }
 
+impl ops::Sub<&Number> for &Number {
+    type Output = Number;
+    #[inline]
+    fn sub(self, other: &Number) -> Self::Output {
+        match (self, other) {
+            (&Number::Base(a), &Number::Base(b)) => a - b,
+            _ => self.clone() - other.clone(),
+        }
+    }
+}
+
 #[allow(clippy::missing_trait_methods)]
 impl NumberBase for Number {
     #[inline]
@@ -31,11 +31,12 @@ pub enum Part {
 
 #[allow(clippy::missing_trait_methods)]
 impl PartialEq<u64> for Part {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn eq(&self, other: &u64) -> bool {
-        match self.clone() {
-            Self::Base(a) => a == *other,
-            Self::Natural(a) => a == *other,
+        match self {
+            Self::Base(a) => a == other,
+            Self::Natural(a) => a == other,
         }
     }
 }
@@ -90,23 +91,26 @@ impl From<Part> for Number {
 #[allow(clippy::integer_division)]
 #[allow(clippy::missing_trait_methods)]
 impl num_traits::ToPrimitive for Part {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_i64(&self) -> Option<i64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_i64(),
             Self::Natural(a) => a.to_i64(),
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_u64(&self) -> Option<u64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_u64(),
             Self::Natural(a) => a.to_u64(),
         }
     }
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn to_f64(&self) -> Option<f64> {
-        match self.clone() {
+        match self {
             Self::Base(a) => a.to_f64(),
             Self::Natural(a) => a.to_f64(),
         }
@@ -150,9 +154,10 @@ impl Part {
 }
 
 impl Display for Part {
+    #[allow(clippy::pattern_type_mismatch)]
     #[inline]
     fn fmt(&self, formatter: &mut Formatter) -> FmtResult {
-        match self.clone() {
+        match self {
             Self::Base(n) => write!(formatter, "{n}"),
             Self::Natural(n) => write!(formatter, "{n}"),
         }
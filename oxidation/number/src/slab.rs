@@ -0,0 +1,130 @@
+#![deny(clippy::pedantic)]
+#![deny(clippy::restriction)]
+#![allow(clippy::arithmetic_side_effects)]
+#![allow(clippy::blanket_clippy_restriction_lints)]
+#![allow(clippy::implicit_return)]
+#![allow(clippy::missing_docs_in_private_items)]
+#![allow(clippy::std_instead_of_alloc)]
+
+use core::mem::{forget, size_of, take};
+use std::sync::OnceLock;
+
+use crate::number::Number;
+use crate::stats;
+
+#[derive(Debug)]
+#[non_exhaustive]
+pub struct Entry {
+    pub value: Number,
+    pub refs: usize,
+    pub repr: OnceLock<Box<str>>,
+}
+
+impl Entry {
+    #[inline]
+    #[must_use]
+    pub const fn new(value: Number) -> Self {
+        Self {
+            value,
+            refs: 1,
+            repr: OnceLock::new(),
+        }
+    }
+}
+
+/// Slot vector with a free list so handles index straight into storage.
+#[derive(Debug, Default)]
+pub struct Slab {
+    free: Vec<usize>,
+    slots: Vec<Option<Entry>>,
+}
+
+impl Drop for Slab {
+    #[inline]
+    fn drop(&mut self) {
+        stats::heap_shrank(self.bytes());
+    }
+}
+
+impl Slab {
+    #[inline]
+    fn bytes(&self) -> usize {
+        self.slots.capacity() * size_of::<Option<Entry>>()
+    }
+
+    /// Empties the slab without dropping the numbers it held, for process
+    /// exit where freeing them one at a time is wasted work.
+    #[allow(clippy::mem_forget)]
+    #[inline]
+    pub fn abandon(&mut self) {
+        stats::heap_shrank(self.bytes());
+        forget(take(self));
+    }
+
+    #[inline]
+    pub fn get(&self, slot: usize) -> Option<&Entry> {
+        self.slots.get(slot).and_then(Option::as_ref)
+    }
+
+    #[inline]
+    #[must_use]
+    pub fn is_empty(&self) -> bool {
+        self.free.len() == self.slots.len()
+    }
+
+    #[inline]
+    pub fn insert(&mut self, entry: Entry) -> usize {
+        stats::inserted();
+        if let Some(slot) = self.free.pop() {
+            if let Some(free) = self.slots.get_mut(slot) {
+                *free = Some(entry);
+            }
+            return slot;
+        }
+        let before = self.bytes();
+        self.slots.push(Some(entry));
+        if self.bytes() != before {
+            stats::heap_grew(self.bytes() - before);
+        }
+        self.slots.len() - 1
+    }
+
+    /// Releases one reference and hands back the value, moving it out when
+    /// that was the last reference.
+    #[allow(clippy::question_mark_used)]
+    #[inline]
+    pub fn take(&mut self, slot: usize) -> Option<Number> {
+        let occupied = self.slots.get_mut(slot)?;
+        let entry = occupied.as_mut()?;
+        entry.refs -= 1;
+        if entry.refs == 0 {
+            stats::freed();
+            self.free.push(slot);
+            return occupied.take().map(|last| last.value);
+        }
+        Some(entry.value.clone())
+    }
+
+    #[inline]
+    pub fn retain(&mut self, slot: usize) -> bool {
+        self.slots
+            .get_mut(slot)
+            .and_then(Option::as_mut)
+            .map(|entry| entry.refs += 1)
+            .is_some()
+    }
+
+    #[inline]
+    pub fn remove(&mut self, slot: usize) {
+        if let Some(occupied) = self.slots.get_mut(slot) {
+            if let Some(entry) = occupied.as_mut() {
+                entry.refs -= 1;
+                if entry.refs == 0 {
+                    stats::freed();
+                    *occupied = None;
+                    self.free.push(slot);
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,281 @@
+#![deny(clippy::pedantic)]
+#![deny(clippy::restriction)]
+#![allow(clippy::arithmetic_side_effects)]
+#![allow(clippy::blanket_clippy_restriction_lints)]
+#![allow(clippy::implicit_return)]
+#![allow(clippy::missing_docs_in_private_items)]
+#![allow(clippy::single_call_fn)]
+#![allow(clippy::std_instead_of_alloc)]
+
+//! Counters for traffic through the handle tables.
+//!
+//! Each thread counts into its own block, which only it writes, so counting
+//! adds no shared cache line to the paths the arenas and shards keep apart.
+//! Blocks are summed when a snapshot is asked for and folded into a retired
+//! block when their thread exits.  Lock waits are only timed after a `try_`
+//! acquire has failed, so uncontended locking costs nothing extra.
+
+use core::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use std::sync::{
+    Arc, Mutex, MutexGuard, OnceLock, RwLock, RwLockReadGuard, RwLockWriteGuard, TryLockError,
+};
+use std::time::Instant;
+
+/// Snapshot of the counters, laid out for the C side.
+#[allow(clippy::exhaustive_structs)]
+#[allow(clippy::module_name_repetitions)]
+#[derive(Clone, Copy, Debug, Default, Eq, PartialEq)]
+#[repr(C)]
+pub struct NumberStats {
+    /// Numbers placed in an arena or the store.
+    pub news: u64,
+    /// Lookups of a number behind a handle.
+    pub gets: u64,
+    /// References dropped through `r_delete_number` or `r_delete_numbers`.
+    pub deletes: u64,
+    /// Table entries holding a number right now.
+    pub live: u64,
+    /// Largest number of bytes the tables' slot vectors have held at once.
+    pub peak_bytes: u64,
+    /// Lock acquisitions that found the lock held and had to wait.
+    pub stalls: u64,
+    /// Total nanoseconds spent in those waits.
+    pub wait_nanos: u64,
+}
+
+#[derive(Debug, Default)]
+struct Counters {
+    news: AtomicU64,
+    gets: AtomicU64,
+    deletes: AtomicU64,
+    inserted: AtomicU64,
+    freed: AtomicU64,
+    stalls: AtomicU64,
+    wait_nanos: AtomicU64,
+}
+
+impl Counters {
+    #[inline]
+    fn fold(&self, other: &Self) {
+        for (into, from) in self.fields().into_iter().zip(other.fields()) {
+            into.fetch_add(from.load(Ordering::Relaxed), Ordering::Relaxed);
+        }
+    }
+
+    #[inline]
+    const fn fields(&self) -> [&AtomicU64; 7] {
+        [
+            &self.news,
+            &self.gets,
+            &self.deletes,
+            &self.inserted,
+            &self.freed,
+            &self.stalls,
+            &self.wait_nanos,
+        ]
+    }
+}
+
+#[derive(Debug, Default)]
+struct Registry {
+    retired: Counters,
+    threads: Vec<Arc<Counters>>,
+}
+
+static REGISTRY: OnceLock<Mutex<Registry>> = OnceLock::new();
+static HEAP: AtomicUsize = AtomicUsize::new(0);
+static PEAK: AtomicUsize = AtomicUsize::new(0);
+
+#[inline]
+fn registry() -> &'static Mutex<Registry> {
+    REGISTRY.get_or_init(Mutex::default)
+}
+
+#[derive(Debug)]
+struct Local {
+    counters: Arc<Counters>,
+}
+
+impl Local {
+    /// # Panics
+    #[allow(clippy::unwrap_used)]
+    #[inline]
+    fn new() -> Self {
+        let counters = Arc::<Counters>::default();
+        registry()
+            .lock()
+            .unwrap()
+            .threads
+            .push(Arc::clone(&counters));
+        Self { counters }
+    }
+}
+
+impl Drop for Local {
+    #[inline]
+    fn drop(&mut self) {
+        if let Ok(mut registry) = registry().lock() {
+            registry
+                .threads
+                .retain(|counters| !Arc::ptr_eq(counters, &self.counters));
+            registry.retired.fold(&self.counters);
+        }
+    }
+}
+
+thread_local! {
+    static LOCAL: Local = Local::new();
+}
+
+/// Adds `amount` to the calling thread's counter picked by `field`.
+///
+/// Only the owning thread writes its block, so a plain load and store is
+/// enough and avoids a locked read-modify-write on every event.
+#[inline]
+fn count<F: Fn(&Counters) -> &AtomicU64>(field: F, amount: u64) {
+    let counted = LOCAL.try_with(|local| {
+        let counter = field(&local.counters);
+        counter.store(
+            counter.load(Ordering::Relaxed).wrapping_add(amount),
+            Ordering::Relaxed,
+        );
+    });
+    if counted.is_err() {
+        if let Ok(registry) = registry().lock() {
+            field(&registry.retired).fetch_add(amount, Ordering::Relaxed);
+        }
+    }
+}
+
+#[inline]
+pub fn news() {
+    count(|counters| &counters.news, 1);
+}
+
+#[inline]
+pub fn gets() {
+    count(|counters| &counters.gets, 1);
+}
+
+#[inline]
+pub fn deletes(amount: u64) {
+    count(|counters| &counters.deletes, amount);
+}
+
+/// A table slot was filled.
+#[inline]
+pub fn inserted() {
+    count(|counters| &counters.inserted, 1);
+}
+
+/// A table slot was emptied.
+#[inline]
+pub fn freed() {
+    count(|counters| &counters.freed, 1);
+}
+
+/// Records that the tables' slot vectors grew by `bytes`.
+#[inline]
+pub fn heap_grew(bytes: usize) {
+    let heap = HEAP.fetch_add(bytes, Ordering::Relaxed) + bytes;
+    PEAK.fetch_max(heap, Ordering::Relaxed);
+}
+
+#[inline]
+pub fn heap_shrank(bytes: usize) {
+    HEAP.fetch_sub(bytes, Ordering::Relaxed);
+}
+
+#[allow(clippy::as_conversions)]
+#[allow(clippy::cast_possible_truncation)]
+#[inline]
+fn waited(start: Instant) {
+    count(|counters| &counters.stalls, 1);
+    count(
+        |counters| &counters.wait_nanos,
+        start.elapsed().as_nanos() as u64,
+    );
+}
+
+/// `lock.lock()`, timing the wait when the mutex is already held.
+///
+/// # Panics
+#[allow(clippy::unwrap_used)]
+#[inline]
+pub fn lock<T>(lock: &Mutex<T>) -> MutexGuard<'_, T> {
+    match lock.try_lock() {
+        Ok(guard) => guard,
+        Err(TryLockError::Poisoned(poisoned)) => Err(poisoned).unwrap(),
+        Err(TryLockError::WouldBlock) => {
+            let start = Instant::now();
+            let guard = lock.lock().unwrap();
+            waited(start);
+            guard
+        }
+    }
+}
+
+/// `lock.read()`, timing the wait when a writer holds the lock.
+///
+/// # Panics
+#[allow(clippy::unwrap_used)]
+#[inline]
+pub fn read<T>(lock: &RwLock<T>) -> RwLockReadGuard<'_, T> {
+    match lock.try_read() {
+        Ok(guard) => guard,
+        Err(TryLockError::Poisoned(poisoned)) => Err(poisoned).unwrap(),
+        Err(TryLockError::WouldBlock) => {
+            let start = Instant::now();
+            let guard = lock.read().unwrap();
+            waited(start);
+            guard
+        }
+    }
+}
+
+/// `lock.write()`, timing the wait when the lock is held.
+///
+/// # Panics
+#[allow(clippy::unwrap_used)]
+#[inline]
+pub fn write<T>(lock: &RwLock<T>) -> RwLockWriteGuard<'_, T> {
+    match lock.try_write() {
+        Ok(guard) => guard,
+        Err(TryLockError::Poisoned(poisoned)) => Err(poisoned).unwrap(),
+        Err(TryLockError::WouldBlock) => {
+            let start = Instant::now();
+            let guard = lock.write().unwrap();
+            waited(start);
+            guard
+        }
+    }
+}
+
+/// Sums every thread's counters.
+///
+/// # Panics
+#[allow(clippy::as_conversions)]
+#[allow(clippy::unwrap_used)]
+#[inline]
+#[must_use]
+pub fn snapshot() -> NumberStats {
+    let total = Counters::default();
+    {
+        let registry = registry().lock().unwrap();
+        total.fold(&registry.retired);
+        for counters in &registry.threads {
+            total.fold(counters);
+        }
+    }
+    let [news, gets, deletes, inserted, freed, stalls, wait_nanos] =
+        total.fields().map(|field| field.load(Ordering::Relaxed));
+    NumberStats {
+        news,
+        gets,
+        deletes,
+        live: inserted.wrapping_sub(freed),
+        peak_bytes: PEAK.load(Ordering::Relaxed) as u64,
+        stalls,
+        wait_nanos,
+    }
+}
@@ -0,0 +1,219 @@
+#![deny(clippy::pedantic)]
+#![deny(clippy::restriction)]
+#![allow(clippy::arithmetic_side_effects)]
+#![allow(clippy::blanket_clippy_restriction_lints)]
+#![allow(clippy::implicit_return)]
+#![allow(clippy::missing_docs_in_private_items)]
+#![allow(clippy::std_instead_of_alloc)]
+
+use core::array::from_fn;
+use core::cell::Cell;
+use core::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{OnceLock, RwLock, RwLockWriteGuard};
+
+use crate::handle::{TAG_BITS, TAG_MASK};
+use crate::number::Number;
+use crate::slab::{Entry, Slab};
+use crate::stats;
+
+const SHARD_BITS: u32 = 6;
+const SHARDS: usize = 1 << SHARD_BITS;
+const SHARD_MASK: u64 = (1 << SHARD_BITS) - 1;
+const SLOT_SHIFT: u32 = SHARD_BITS + TAG_BITS;
+
+/// Handle table shared by every evaluator thread.
+///
+/// Handles are spread over independent shards so that callers on different
+/// threads only contend when they touch the same shard, and lookups only take
+/// a shared lock.  Each handle encodes its shard above the tag bits and its
+/// slot plus one above that, so resolving a handle never searches and the
+/// handle `0` is never issued.
+#[derive(Debug)]
+pub struct Store {
+    next: AtomicUsize,
+    shards: [RwLock<Slab>; SHARDS],
+}
+
+impl Default for Store {
+    #[inline]
+    fn default() -> Self {
+        Self {
+            next: AtomicUsize::new(0),
+            shards: from_fn(|_| RwLock::default()),
+        }
+    }
+}
+
+thread_local! {
+    static SHARD: Cell<Option<usize>> = const { Cell::new(None) };
+}
+
+impl Store {
+    #[allow(clippy::as_conversions)]
+    #[allow(clippy::cast_possible_truncation)]
+    #[inline]
+    fn split(key: u64) -> Option<(usize, usize)> {
+        if key & TAG_MASK != 0 {
+            return None;
+        }
+        ((key >> SLOT_SHIFT) as usize)
+            .checked_sub(1)
+            .map(|slot| (((key >> TAG_BITS) & SHARD_MASK) as usize, slot))
+    }
+
+    #[allow(clippy::indexing_slicing)]
+    #[inline]
+    fn shard(&self, shard: usize) -> &RwLock<Slab> {
+        &self.shards[shard & (SHARDS - 1)]
+    }
+
+    /// Shard owned by the calling thread, handed out round robin.
+    #[inline]
+    fn home(&self) -> usize {
+        SHARD.with(|home| {
+            home.get().unwrap_or_else(|| {
+                let shard = self.next.fetch_add(1, Ordering::Relaxed) & (SHARDS - 1);
+                home.set(Some(shard));
+                shard
+            })
+        })
+    }
+
+    /// # Panics
+    #[allow(clippy::unwrap_used)]
+    #[inline]
+    pub fn abandon(&self) {
+        for shard in &self.shards {
+            shard.write().unwrap().abandon();
+        }
+    }
+
+    /// # Panics
+    #[allow(clippy::expect_used)]
+    #[inline]
+    #[must_use]
+    pub fn get(&self, key: u64) -> Number {
+        let (shard, slot) = Self::split(key).expect("Store::get(key)");
+        stats::read(self.shard(shard))
+            .get(slot)
+            .map(|entry| entry.value.clone())
+            .expect("Store::get(key)")
+    }
+
+    /// Lends the number behind `key` to `op` under the shard's shared lock.
+    ///
+    /// # Panics
+    #[allow(clippy::expect_used)]
+    #[inline]
+    pub fn borrow<R, F: FnOnce(&Number) -> R>(&self, key: u64, op: F) -> R {
+        let (shard, slot) = Self::split(key).expect("Store::borrow(key)");
+        let slab = stats::read(self.shard(shard));
+        op(&slab.get(slot).expect("Store::borrow(key)").value)
+    }
+
+    /// Lends the numbers behind two handles to `op`, taking a shard lock only
+    /// once and otherwise in shard order, so concurrent callers cannot wait on
+    /// each other in a cycle.
+    ///
+    /// # Panics
+    #[allow(clippy::expect_used)]
+    #[inline]
+    pub fn borrow_pair<R, F: FnOnce(&Number, &Number) -> R>(
+        &self,
+        left: u64,
+        right: u64,
+        op: F,
+    ) -> R {
+        let (left_shard, left_slot) = Self::split(left).expect("Store::borrow_pair(left)");
+        let (right_shard, right_slot) = Self::split(right).expect("Store::borrow_pair(right)");
+        if left_shard == right_shard {
+            let slab = stats::read(self.shard(left_shard));
+            let lhs = slab.get(left_slot).expect("Store::borrow_pair(left)");
+            let rhs = slab.get(right_slot).expect("Store::borrow_pair(right)");
+            return op(&lhs.value, &rhs.value);
+        }
+        if right_shard < left_shard {
+            return self.borrow(right, |rhs| self.borrow(left, |lhs| op(lhs, rhs)));
+        }
+        self.borrow(left, |lhs| self.borrow(right, |rhs| op(lhs, rhs)))
+    }
+
+    /// # Panics
+    #[allow(clippy::as_conversions)]
+    #[inline]
+    #[must_use]
+    pub fn insert(&self, value: Number) -> u64 {
+        let shard = self.home();
+        let slot = stats::write(self.shard(shard)).insert(Entry {
+            value,
+            refs: 1,
+            repr: OnceLock::new(),
+        });
+        ((slot as u64 + 1) << SLOT_SHIFT) | ((shard as u64) << TAG_BITS)
+    }
+
+    /// Hands the decimal form of `key` to `with`, formatting it only the first
+    /// time it is asked for.
+    ///
+    /// # Panics
+    #[allow(clippy::expect_used)]
+    #[inline]
+    pub fn repr<R, F: FnOnce(&str) -> R>(&self, key: u64, with: F) -> R {
+        let (shard, slot) = Self::split(key).expect("Store::repr(key)");
+        let slab = stats::read(self.shard(shard));
+        let entry = slab.get(slot).expect("Store::repr(key)");
+        with(
+            entry
+                .repr
+                .get_or_init(|| entry.value.to_string().into_boxed_str()),
+        )
+    }
+
+    /// Shares an existing handle rather than cloning the value behind it.
+    ///
+    /// # Panics
+    #[allow(clippy::expect_used)]
+    #[inline]
+    #[must_use]
+    pub fn retain(&self, key: u64) -> u64 {
+        let (shard, slot) = Self::split(key).expect("Store::retain(key)");
+        assert!(
+            stats::write(self.shard(shard)).retain(slot),
+            "Store::retain(key)"
+        );
+        key
+    }
+
+    /// # Panics
+    #[inline]
+    pub fn remove(&self, key: u64) {
+        if let Some((shard, slot)) = Self::split(key) {
+            stats::write(self.shard(shard)).remove(slot);
+        }
+    }
+
+    /// Removes a batch of handles, holding each shard lock across runs of
+    /// handles from the same shard.
+    ///
+    /// # Panics
+    #[inline]
+    pub fn remove_many(&self, keys: &[u64]) {
+        let mut held: Option<(usize, RwLockWriteGuard<'_, Slab>)> = None;
+        for (shard, slot) in keys.iter().copied().filter_map(Self::split) {
+            if held.as_ref().map(|current| current.0) != Some(shard) {
+                held = None;
+                held = Some((shard, stats::write(self.shard(shard))));
+            }
+            if let Some(current) = held.as_mut() {
+                current.1.remove(slot);
+            }
+        }
+    }
+}
+
+static STORE: OnceLock<Store> = OnceLock::new();
+
+#[inline]
+pub fn store() -> &'static Store {
+    STORE.get_or_init(Store::default)
+}
@@ -11,10 +11,10 @@
 #include <gsl/span>     // for span_iterator, span
 #include <gsl/span_ext> // for make_span
 
-#include <cstring>   // for size_t, strncmp, strlen
+#include <cstring>   // for size_t, strcmp, strncmp, strlen
 #include <exception> // for exception
 #include <iostream>  // for operator<<, char_traits
-#include <iterator>  // for distance, literals, next
+#include <iterator>  // for distance, literals, next, prev
 #include <stdexcept> // for runtime_error
 #include <string>    // for basic_string, to_string
 #include <vector>    // for vector
@@ -47,6 +47,13 @@ namespace chimera::library {
               << std::endl;
     return 0;
   }
+  //! -X bytecode runs scripts from compiled code
+  static void extension(Options &options, const char *name) {
+    options.extensions.emplace_back(name);
+    if (std::strcmp(name, "bytecode") == 0) {
+      options.bytecode = true;
+    }
+  }
   using Argv = gsl::span<const char>;
   // NOLINTNEXTLINE(readability-function-cognitive-complexity)
   static auto main(Span &&args) noexcept -> int {
@@ -183,14 +190,16 @@ namespace chimera::library {
               case 'X':
                 ++argChar;
                 if (argChar != argCStr.end()) {
-                  options.extensions.emplace_back(&*argChar);
+                  extension(options, &*argChar);
+                  // the rest of this argument is the extension name
+                  argChar = std::prev(argCStr.end());
                   break;
                 }
                 ++arg;
                 if (arg == args.end()) {
                   throw std::runtime_error("missing extension argument");
                 }
-                options.extensions.emplace_back(*arg);
+                extension(options, *arg);
                 break;
               default:
                 throw std::runtime_error(
@@ -10,527 +10,619 @@ namespace chimera::library::virtual_machine::modules {
   // NOLINTBEGIN(misc-const-correctness)
   void builtins(const object::Object &builtins) {
     auto module = builtins;
-    module.set_attribute("__builtins__"s, builtins);
-    object::Object builtinsFalse(object::False{},
-                                 {{"__class__", {/*set below*/}}});
-    module.set_attribute("False"s, builtinsFalse);
-    module.set_attribute("__debug__"s, builtinsFalse);
-    object::Object builtinsNone(object::None{}, {});
-    module.set_attribute("None"s, builtinsNone);
-    object::Object builtinsTrue(object::True{},
-                                {{"__class__", {/*set below*/}}});
-    module.set_attribute("True"s, builtinsTrue);
+    module.set_attribute(object::Symbol("__builtins__"), builtins);
+    object::Object builtinsFalse = object::singleton<object::False>();
+    module.set_attribute(object::Symbol("False"), builtinsFalse);
+    module.set_attribute(object::Symbol("__debug__"), builtinsFalse);
+    object::Object builtinsNone = object::singleton<object::None>();
+    module.set_attribute(object::Symbol("None"), builtinsNone);
+    object::Object builtinsTrue = object::singleton<object::True>();
+    module.set_attribute(object::Symbol("True"), builtinsTrue);
     object::Object builtinsClass(
-        {{"__class__", {/*set below*/}}, {"__module__", builtins}});
-    module.set_attribute("__class__"s, builtinsClass);
-    object::Object builtinsName(object::String("builtins"s),
-                                {{"__class__", {/*set below*/}}});
-    module.set_attribute("__name__"s, builtinsName);
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__module__"), builtins}});
+    module.set_attribute(object::Symbol("__class__"), builtinsClass);
+    object::Object builtinsName(
+        object::String("builtins"s),
+        {{object::Symbol("__class__"), {/*set below*/}}});
+    module.set_attribute(object::Symbol("__name__"), builtinsName);
     object::Object builtinsBool(
-        {{"__abs__", builtinsNone},        {"__add__", builtinsNone},
-         {"__and__", builtinsNone},        {"__bool__", builtinsNone},
-         {"__ceil__", builtinsNone},       {"__class__", {/*set below*/}},
-         {"__divmod__", builtinsNone},     {"__doc__", builtinsNone},
-         {"__eq__", builtinsNone},         {"__float__", builtinsNone},
-         {"__floor__", builtinsNone},      {"__floordiv__", builtinsNone},
-         {"__format__", builtinsNone},     {"__ge__", builtinsNone},
-         {"__getnewargs__", builtinsNone}, {"__gt__", builtinsNone},
-         {"__hash__", builtinsNone},       {"__index__", builtinsNone},
-         {"__init__", builtinsNone},       {"__init_subclass__", builtinsNone},
-         {"__int__", builtinsNone},        {"__invert__", builtinsNone},
-         {"__le__", builtinsNone},         {"__lshift__", builtinsNone},
-         {"__lt__", builtinsNone},         {"__mod__", builtinsNone},
-         {"__mul__", builtinsNone},        {"__ne__", builtinsNone},
-         {"__neg__", builtinsNone},        {"__new__", builtinsNone},
-         {"__or__", builtinsNone},         {"__pos__", builtinsNone},
-         {"__pow__", builtinsNone},        {"__radd__", builtinsNone},
-         {"__rand__", builtinsNone},       {"__rdivmod__", builtinsNone},
-         {"__reduce__", builtinsNone},     {"__reduce_ex__", builtinsNone},
-         {"__rfloordiv__", builtinsNone},  {"__rlshift__", builtinsNone},
-         {"__rmod__", builtinsNone},       {"__rmul__", builtinsNone},
-         {"__ror__", builtinsNone},        {"__round__", builtinsNone},
-         {"__rpow__", builtinsNone},       {"__rrshift__", builtinsNone},
-         {"__rshift__", builtinsNone},     {"__rsub__", builtinsNone},
-         {"__rtruediv__", builtinsNone},   {"__rxor__", builtinsNone},
-         {"__sub__", builtinsNone},        {"__truediv__", builtinsNone},
-         {"__trunc__", builtinsNone},      {"__xor__", builtinsNone},
-         {"bit_length", builtinsNone},     {"conjugate", builtinsNone},
-         {"denominator", builtinsNone},    {"from_bytes", builtinsNone},
-         {"imag", builtinsNone},           {"numerator", builtinsNone},
-         {"real", builtinsNone},           {"to_bytes", builtinsNone}});
-    module.set_attribute("bool"s, builtinsBool);
-    builtinsFalse.set_attribute("__class__"s, builtinsBool);
-    builtinsTrue.set_attribute("__class__"s, builtinsBool);
-    object::Object builtinsBytes({{"__add__", builtinsNone},
-                                  {"__class__", {/*set below*/}},
-                                  {"__contains__", builtinsNone},
-                                  {"__doc__", builtinsNone},
-                                  {"__eq__", builtinsNone},
-                                  {"__format__", builtinsNone},
-                                  {"__ge__", builtinsNone},
-                                  {"__getitem__", builtinsNone},
-                                  {"__getnewargs__", builtinsNone},
-                                  {"__gt__", builtinsNone},
-                                  {"__hash__", builtinsNone},
-                                  {"__init__", builtinsNone},
-                                  {"__init_subclass__", builtinsNone},
-                                  {"__iter__", builtinsNone},
-                                  {"__le__", builtinsNone},
-                                  {"__len__", builtinsNone},
-                                  {"__lt__", builtinsNone},
-                                  {"__mod__", builtinsNone},
-                                  {"__mul__", builtinsNone},
-                                  {"__ne__", builtinsNone},
-                                  {"__new__", builtinsNone},
-                                  {"__reduce__", builtinsNone},
-                                  {"__reduce_ex__", builtinsNone},
-                                  {"__rmod__", builtinsNone},
-                                  {"__rmul__", builtinsNone},
-                                  {"capitalize", builtinsNone},
-                                  {"center", builtinsNone},
-                                  {"count", builtinsNone},
-                                  {"decode", builtinsNone},
-                                  {"endswith", builtinsNone},
-                                  {"expandtabs", builtinsNone},
-                                  {"find", builtinsNone},
-                                  {"fromhex", builtinsNone},
-                                  {"hex", builtinsNone},
-                                  {"index", builtinsNone},
-                                  {"isalnum", builtinsNone},
-                                  {"isalpha", builtinsNone},
-                                  {"isdigit", builtinsNone},
-                                  {"islower", builtinsNone},
-                                  {"isspace", builtinsNone},
-                                  {"istitle", builtinsNone},
-                                  {"isupper", builtinsNone},
-                                  {"join", builtinsNone},
-                                  {"ljust", builtinsNone},
-                                  {"lower", builtinsNone},
-                                  {"lstrip", builtinsNone},
-                                  {"maketrans", builtinsNone},
-                                  {"partition", builtinsNone},
-                                  {"replace", builtinsNone},
-                                  {"rfind", builtinsNone},
-                                  {"rindex", builtinsNone},
-                                  {"rjust", builtinsNone},
-                                  {"rpartition", builtinsNone},
-                                  {"rsplit", builtinsNone},
-                                  {"rstrip", builtinsNone},
-                                  {"split", builtinsNone},
-                                  {"splitlines", builtinsNone},
-                                  {"startswith", builtinsNone},
-                                  {"strip", builtinsNone},
-                                  {"swapcase", builtinsNone},
-                                  {"title", builtinsNone},
-                                  {"translate", builtinsNone},
-                                  {"upper", builtinsNone},
-                                  {"zfill", builtinsNone}});
-    module.set_attribute("bytes"s, builtinsBytes);
-    object::Object builtinsCompile(object::SysCall::COMPILE,
-                                   {{"__class__", {/*set below*/}},
-                                    {"__doc__", builtinsNone},
-                                    {"__name__", builtinsNone},
-                                    {"__qualname__", builtinsNone}});
-    module.set_attribute("compile"s, builtinsCompile);
-    object::Object builtinsEval(object::SysCall::EVAL,
-                                {{"__class__", {/*set below*/}},
-                                 {"__doc__", builtinsNone},
-                                 {"__name__", builtinsNone},
-                                 {"__qualname__", builtinsNone}});
-    module.set_attribute("eval"s, builtinsEval);
-    object::Object builtinsExec(object::SysCall::EXEC,
-                                {{"__class__", {/*set below*/}},
-                                 {"__doc__", builtinsNone},
-                                 {"__name__", builtinsNone},
-                                 {"__qualname__", builtinsNone}});
-    module.set_attribute("exec"s, builtinsExec);
-    object::Object builtinsFloat({{"__abs__", builtinsNone},
-                                  {"__add__", builtinsNone},
-                                  {"__bool__", builtinsNone},
-                                  {"__class__", {/*set below*/}},
-                                  {"__divmod__", builtinsNone},
-                                  {"__doc__", builtinsNone},
-                                  {"__eq__", builtinsNone},
-                                  {"__float__", builtinsNone},
-                                  {"__floordiv__", builtinsNone},
-                                  {"__format__", builtinsNone},
-                                  {"__ge__", builtinsNone},
-                                  {"__getformat__", builtinsNone},
-                                  {"__getnewargs__", builtinsNone},
-                                  {"__gt__", builtinsNone},
-                                  {"__hash__", builtinsNone},
-                                  {"__init__", builtinsNone},
-                                  {"__init_subclass__", builtinsNone},
-                                  {"__int__", builtinsNone},
-                                  {"__le__", builtinsNone},
-                                  {"__lt__", builtinsNone},
-                                  {"__mod__", builtinsNone},
-                                  {"__mul__", builtinsNone},
-                                  {"__ne__", builtinsNone},
-                                  {"__neg__", builtinsNone},
-                                  {"__new__", builtinsNone},
-                                  {"__pos__", builtinsNone},
-                                  {"__pow__", builtinsNone},
-                                  {"__radd__", builtinsNone},
-                                  {"__rdivmod__", builtinsNone},
-                                  {"__reduce__", builtinsNone},
-                                  {"__reduce_ex__", builtinsNone},
-                                  {"__rfloordiv__", builtinsNone},
-                                  {"__rmod__", builtinsNone},
-                                  {"__rmul__", builtinsNone},
-                                  {"__round__", builtinsNone},
-                                  {"__rpow__", builtinsNone},
-                                  {"__rsub__", builtinsNone},
-                                  {"__rtruediv__", builtinsNone},
-                                  {"__setformat__", builtinsNone},
-                                  {"__sub__", builtinsNone},
-                                  {"__truediv__", builtinsNone},
-                                  {"__trunc__", builtinsNone},
-                                  {"as_integer_ratio", builtinsNone},
-                                  {"conjugate", builtinsNone},
-                                  {"fromhex", builtinsNone},
-                                  {"hex", builtinsNone},
-                                  {"imag", builtinsNone},
-                                  {"is_integer", builtinsNone},
-                                  {"real", builtinsNone}});
-    module.set_attribute("float"s, builtinsFloat);
-    object::Object builtinsGlobals(object::SysCall::GLOBALS,
-                                   {{"__class__", {/*set below*/}},
-                                    {"__doc__", builtinsNone},
-                                    {"__name__", builtinsNone},
-                                    {"__qualname__", builtinsNone}});
-    module.set_attribute("globals"s, builtinsGlobals);
+        {{object::Symbol("__abs__"), builtinsNone},
+         {object::Symbol("__add__"), builtinsNone},
+         {object::Symbol("__and__"), builtinsNone},
+         {object::Symbol("__bool__"), builtinsNone},
+         {object::Symbol("__ceil__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__divmod__"), builtinsNone},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__float__"), builtinsNone},
+         {object::Symbol("__floor__"), builtinsNone},
+         {object::Symbol("__floordiv__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getnewargs__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__index__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__int__"), builtinsNone},
+         {object::Symbol("__invert__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__lshift__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__mod__"), builtinsNone},
+         {object::Symbol("__mul__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__neg__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__or__"), builtinsNone},
+         {object::Symbol("__pos__"), builtinsNone},
+         {object::Symbol("__pow__"), builtinsNone},
+         {object::Symbol("__radd__"), builtinsNone},
+         {object::Symbol("__rand__"), builtinsNone},
+         {object::Symbol("__rdivmod__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__rfloordiv__"), builtinsNone},
+         {object::Symbol("__rlshift__"), builtinsNone},
+         {object::Symbol("__rmod__"), builtinsNone},
+         {object::Symbol("__rmul__"), builtinsNone},
+         {object::Symbol("__ror__"), builtinsNone},
+         {object::Symbol("__round__"), builtinsNone},
+         {object::Symbol("__rpow__"), builtinsNone},
+         {object::Symbol("__rrshift__"), builtinsNone},
+         {object::Symbol("__rshift__"), builtinsNone},
+         {object::Symbol("__rsub__"), builtinsNone},
+         {object::Symbol("__rtruediv__"), builtinsNone},
+         {object::Symbol("__rxor__"), builtinsNone},
+         {object::Symbol("__sub__"), builtinsNone},
+         {object::Symbol("__truediv__"), builtinsNone},
+         {object::Symbol("__trunc__"), builtinsNone},
+         {object::Symbol("__xor__"), builtinsNone},
+         {object::Symbol("bit_length"), builtinsNone},
+         {object::Symbol("conjugate"), builtinsNone},
+         {object::Symbol("denominator"), builtinsNone},
+         {object::Symbol("from_bytes"), builtinsNone},
+         {object::Symbol("imag"), builtinsNone},
+         {object::Symbol("numerator"), builtinsNone},
+         {object::Symbol("real"), builtinsNone},
+         {object::Symbol("to_bytes"), builtinsNone}});
+    module.set_attribute(object::Symbol("bool"), builtinsBool);
+    object::Object builtinsBytes(
+        {{object::Symbol("__add__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__contains__"), builtinsNone},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getitem__"), builtinsNone},
+         {object::Symbol("__getnewargs__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__iter__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__len__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__mod__"), builtinsNone},
+         {object::Symbol("__mul__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__rmod__"), builtinsNone},
+         {object::Symbol("__rmul__"), builtinsNone},
+         {object::Symbol("capitalize"), builtinsNone},
+         {object::Symbol("center"), builtinsNone},
+         {object::Symbol("count"), builtinsNone},
+         {object::Symbol("decode"), builtinsNone},
+         {object::Symbol("endswith"), builtinsNone},
+         {object::Symbol("expandtabs"), builtinsNone},
+         {object::Symbol("find"), builtinsNone},
+         {object::Symbol("fromhex"), builtinsNone},
+         {object::Symbol("hex"), builtinsNone},
+         {object::Symbol("index"), builtinsNone},
+         {object::Symbol("isalnum"), builtinsNone},
+         {object::Symbol("isalpha"), builtinsNone},
+         {object::Symbol("isdigit"), builtinsNone},
+         {object::Symbol("islower"), builtinsNone},
+         {object::Symbol("isspace"), builtinsNone},
+         {object::Symbol("istitle"), builtinsNone},
+         {object::Symbol("isupper"), builtinsNone},
+         {object::Symbol("join"), builtinsNone},
+         {object::Symbol("ljust"), builtinsNone},
+         {object::Symbol("lower"), builtinsNone},
+         {object::Symbol("lstrip"), builtinsNone},
+         {object::Symbol("maketrans"), builtinsNone},
+         {object::Symbol("partition"), builtinsNone},
+         {object::Symbol("replace"), builtinsNone},
+         {object::Symbol("rfind"), builtinsNone},
+         {object::Symbol("rindex"), builtinsNone},
+         {object::Symbol("rjust"), builtinsNone},
+         {object::Symbol("rpartition"), builtinsNone},
+         {object::Symbol("rsplit"), builtinsNone},
+         {object::Symbol("rstrip"), builtinsNone},
+         {object::Symbol("split"), builtinsNone},
+         {object::Symbol("splitlines"), builtinsNone},
+         {object::Symbol("startswith"), builtinsNone},
+         {object::Symbol("strip"), builtinsNone},
+         {object::Symbol("swapcase"), builtinsNone},
+         {object::Symbol("title"), builtinsNone},
+         {object::Symbol("translate"), builtinsNone},
+         {object::Symbol("upper"), builtinsNone},
+         {object::Symbol("zfill"), builtinsNone}});
+    module.set_attribute(object::Symbol("bytes"), builtinsBytes);
+    object::Object builtinsCompile(
+        object::SysCall::COMPILE,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("compile"), builtinsCompile);
+    object::Object builtinsEval(
+        object::SysCall::EVAL,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("eval"), builtinsEval);
+    object::Object builtinsExec(
+        object::SysCall::EXEC,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("exec"), builtinsExec);
+    object::Object builtinsFloat(
+        {{object::Symbol("__abs__"), builtinsNone},
+         {object::Symbol("__add__"), builtinsNone},
+         {object::Symbol("__bool__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__divmod__"), builtinsNone},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__float__"), builtinsNone},
+         {object::Symbol("__floordiv__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getformat__"), builtinsNone},
+         {object::Symbol("__getnewargs__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__int__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__mod__"), builtinsNone},
+         {object::Symbol("__mul__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__neg__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__pos__"), builtinsNone},
+         {object::Symbol("__pow__"), builtinsNone},
+         {object::Symbol("__radd__"), builtinsNone},
+         {object::Symbol("__rdivmod__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__rfloordiv__"), builtinsNone},
+         {object::Symbol("__rmod__"), builtinsNone},
+         {object::Symbol("__rmul__"), builtinsNone},
+         {object::Symbol("__round__"), builtinsNone},
+         {object::Symbol("__rpow__"), builtinsNone},
+         {object::Symbol("__rsub__"), builtinsNone},
+         {object::Symbol("__rtruediv__"), builtinsNone},
+         {object::Symbol("__setformat__"), builtinsNone},
+         {object::Symbol("__sub__"), builtinsNone},
+         {object::Symbol("__truediv__"), builtinsNone},
+         {object::Symbol("__trunc__"), builtinsNone},
+         {object::Symbol("as_integer_ratio"), builtinsNone},
+         {object::Symbol("conjugate"), builtinsNone},
+         {object::Symbol("fromhex"), builtinsNone},
+         {object::Symbol("hex"), builtinsNone},
+         {object::Symbol("imag"), builtinsNone},
+         {object::Symbol("is_integer"), builtinsNone},
+         {object::Symbol("real"), builtinsNone}});
+    module.set_attribute(object::Symbol("float"), builtinsFloat);
+    object::Object builtinsGlobals(
+        object::SysCall::GLOBALS,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("globals"), builtinsGlobals);
     object::Object builtinsId(object::SysCall::ID,
-                              {{"__class__", {/*set below*/}},
-                               {"__doc__", builtinsNone},
-                               {"__name__", builtinsNone},
-                               {"__qualname__", builtinsNone}});
-    module.set_attribute("id"s, builtinsId);
-    object::Object builtinsInput(object::SysCall::INPUT,
-                                 {{"__class__", {/*set below*/}},
-                                  {"__doc__", builtinsNone},
-                                  {"__name__", builtinsNone},
-                                  {"__qualname__", builtinsNone}});
-    module.set_attribute("input"s, builtinsInput);
+                              {{object::Symbol("__class__"), {/*set below*/}},
+                               {object::Symbol("__doc__"), builtinsNone},
+                               {object::Symbol("__name__"), builtinsNone},
+                               {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("id"), builtinsId);
+    object::Object builtinsInput(
+        object::SysCall::INPUT,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("input"), builtinsInput);
     object::Object builtinsInt(
-        {{"__abs__", builtinsNone},        {"__add__", builtinsNone},
-         {"__and__", builtinsNone},        {"__bool__", builtinsNone},
-         {"__ceil__", builtinsNone},       {"__class__", {/*set below*/}},
-         {"__divmod__", builtinsNone},     {"__doc__", builtinsNone},
-         {"__eq__", builtinsNone},         {"__float__", builtinsNone},
-         {"__floor__", builtinsNone},      {"__floordiv__", builtinsNone},
-         {"__format__", builtinsNone},     {"__ge__", builtinsNone},
-         {"__getnewargs__", builtinsNone}, {"__gt__", builtinsNone},
-         {"__hash__", builtinsNone},       {"__index__", builtinsNone},
-         {"__init__", builtinsNone},       {"__init_subclass__", builtinsNone},
-         {"__int__", builtinsNone},        {"__invert__", builtinsNone},
-         {"__le__", builtinsNone},         {"__lshift__", builtinsNone},
-         {"__lt__", builtinsNone},         {"__mod__", builtinsNone},
-         {"__mul__", builtinsNone},        {"__ne__", builtinsNone},
-         {"__neg__", builtinsNone},        {"__new__", builtinsNone},
-         {"__or__", builtinsNone},         {"__pos__", builtinsNone},
-         {"__pow__", builtinsNone},        {"__radd__", builtinsNone},
-         {"__rand__", builtinsNone},       {"__rdivmod__", builtinsNone},
-         {"__reduce__", builtinsNone},     {"__reduce_ex__", builtinsNone},
-         {"__rfloordiv__", builtinsNone},  {"__rlshift__", builtinsNone},
-         {"__rmod__", builtinsNone},       {"__rmul__", builtinsNone},
-         {"__ror__", builtinsNone},        {"__round__", builtinsNone},
-         {"__rpow__", builtinsNone},       {"__rrshift__", builtinsNone},
-         {"__rshift__", builtinsNone},     {"__rsub__", builtinsNone},
-         {"__rtruediv__", builtinsNone},   {"__rxor__", builtinsNone},
-         {"__sub__", builtinsNone},        {"__truediv__", builtinsNone},
-         {"__trunc__", builtinsNone},      {"__xor__", builtinsNone},
-         {"bit_length", builtinsNone},     {"conjugate", builtinsNone},
-         {"denominator", builtinsNone},    {"from_bytes", builtinsNone},
-         {"imag", builtinsNone},           {"numerator", builtinsNone},
-         {"real", builtinsNone},           {"to_bytes", builtinsNone}});
-    module.set_attribute("int"s, builtinsInt);
-    object::Object builtinsLocals(object::SysCall::LOCALS,
-                                  {{"__class__", {/*set below*/}},
-                                   {"__doc__", builtinsNone},
-                                   {"__name__", builtinsNone},
-                                   {"__qualname__", builtinsNone}});
-    module.set_attribute("locals"s, builtinsLocals);
-    object::Object builtinsObject({{"__abstractmethods__", builtinsNone},
-                                   {"__base__", {/*set below*/}},
-                                   {"__basicsize__", builtinsNone},
-                                   {"__call__", builtinsNone},
-                                   {"__class__", {/*set below*/}},
-                                   {"__delattr__", {/*set below*/}},
-                                   {"__dict__", builtinsNone},
-                                   {"__dictoffset__", builtinsNone},
-                                   {"__dir__", {/*set below*/}},
-                                   {"__doc__", builtinsNone},
-                                   {"__eq__", builtinsNone},
-                                   {"__flags__", builtinsNone},
-                                   {"__format__", builtinsNone},
-                                   {"__ge__", builtinsNone},
-                                   {"__getattribute__", {/*set below*/}},
-                                   {"__gt__", builtinsNone},
-                                   {"__hash__", builtinsNone},
-                                   {"__init__", builtinsNone},
-                                   {"__init_subclass__", builtinsNone},
-                                   {"__instancecheck__", builtinsNone},
-                                   {"__itemsize__", builtinsNone},
-                                   {"__le__", builtinsNone},
-                                   {"__lt__", builtinsNone},
-                                   {"__module__", builtins},
-                                   {"__mro__", builtinsNone},
-                                   {"__name__", builtinsNone},
-                                   {"__ne__", builtinsNone},
-                                   {"__new__", builtinsNone},
-                                   {"__prepare__", builtinsNone},
-                                   {"__qualname__", builtinsNone},
-                                   {"__reduce__", builtinsNone},
-                                   {"__reduce_ex__", builtinsNone},
-                                   {"__setattr__", {/*set below*/}},
-                                   {"__sizeof__", builtinsNone},
-                                   {"__str__", builtinsNone},
-                                   {"__subclasscheck__", builtinsNone},
-                                   {"__subclasses__", builtinsNone},
-                                   {"__subclasshook__", builtinsNone},
-                                   {"__text_signature__", builtinsNone},
-                                   {"__weakrefoffset__", builtinsNone},
-                                   {"mro", builtinsNone}});
-    module.set_attribute("object"s, builtinsObject);
-    builtinsObject.set_attribute("__base__"s, builtinsObject);
-    object::Object builtinsOpen(object::SysCall::OPEN,
-                                {{"__class__", {/*set below*/}},
-                                 {"__doc__", builtinsNone},
-                                 {"__name__", builtinsNone},
-                                 {"__qualname__", builtinsNone}});
-    module.set_attribute("open"s, builtinsOpen);
-    object::Object builtinsPrint(object::SysCall::PRINT,
-                                 {{"__class__", {/*set below*/}},
-                                  {"__doc__", builtinsNone},
-                                  {"__name__", builtinsNone},
-                                  {"__qualname__", builtinsNone}});
-    module.set_attribute("print"s, builtinsPrint);
-    object::Object builtinsStr({{"__add__", builtinsNone},
-                                {"__class__", {/*set below*/}},
-                                {"__contains__", builtinsNone},
-                                {"__doc__", builtinsNone},
-                                {"__eq__", builtinsNone},
-                                {"__format__", builtinsNone},
-                                {"__ge__", builtinsNone},
-                                {"__getitem__", builtinsNone},
-                                {"__getnewargs__", builtinsNone},
-                                {"__gt__", builtinsNone},
-                                {"__hash__", builtinsNone},
-                                {"__init__", builtinsNone},
-                                {"__init_subclass__", builtinsNone},
-                                {"__iter__", builtinsNone},
-                                {"__le__", builtinsNone},
-                                {"__len__", builtinsNone},
-                                {"__lt__", builtinsNone},
-                                {"__mod__", builtinsNone},
-                                {"__mul__", builtinsNone},
-                                {"__ne__", builtinsNone},
-                                {"__new__", builtinsNone},
-                                {"__reduce__", builtinsNone},
-                                {"__reduce_ex__", builtinsNone},
-                                {"__rmod__", builtinsNone},
-                                {"__rmul__", builtinsNone},
-                                {"capitalize", builtinsNone},
-                                {"casefold", builtinsNone},
-                                {"center", builtinsNone},
-                                {"count", builtinsNone},
-                                {"encode", builtinsNone},
-                                {"endswith", builtinsNone},
-                                {"expandtabs", builtinsNone},
-                                {"find", builtinsNone},
-                                {"format", builtinsNone},
-                                {"format_map", builtinsNone},
-                                {"index", builtinsNone},
-                                {"isalnum", builtinsNone},
-                                {"isalpha", builtinsNone},
-                                {"isdecimal", builtinsNone},
-                                {"isdigit", builtinsNone},
-                                {"isidentifier", builtinsNone},
-                                {"islower", builtinsNone},
-                                {"isnumeric", builtinsNone},
-                                {"isprintable", builtinsNone},
-                                {"isspace", builtinsNone},
-                                {"istitle", builtinsNone},
-                                {"isupper", builtinsNone},
-                                {"join", builtinsNone},
-                                {"ljust", builtinsNone},
-                                {"lower", builtinsNone},
-                                {"lstrip", builtinsNone},
-                                {"maketrans", builtinsNone},
-                                {"partition", builtinsNone},
-                                {"replace", builtinsNone},
-                                {"rfind", builtinsNone},
-                                {"rindex", builtinsNone},
-                                {"rjust", builtinsNone},
-                                {"rpartition", builtinsNone},
-                                {"rsplit", builtinsNone},
-                                {"rstrip", builtinsNone},
-                                {"split", builtinsNone},
-                                {"splitlines", builtinsNone},
-                                {"startswith", builtinsNone},
-                                {"strip", builtinsNone},
-                                {"swapcase", builtinsNone},
-                                {"title", builtinsNone},
-                                {"translate", builtinsNone},
-                                {"upper", builtinsNone},
-                                {"zfill", builtinsNone}});
-    module.set_attribute("str"s, builtinsStr);
-    builtinsName.set_attribute("__class__"s, builtinsStr);
-    object::Object builtinsTuple({{"__add__", builtinsNone},
-                                  {"__class__", {/*set below*/}},
-                                  {"__contains__", builtinsNone},
-                                  {"__doc__", builtinsNone},
-                                  {"__eq__", builtinsNone},
-                                  {"__format__", builtinsNone},
-                                  {"__ge__", builtinsNone},
-                                  {"__getitem__", builtinsNone},
-                                  {"__getnewargs__", builtinsNone},
-                                  {"__gt__", builtinsNone},
-                                  {"__hash__", builtinsNone},
-                                  {"__init__", builtinsNone},
-                                  {"__init_subclass__", builtinsNone},
-                                  {"__iter__", builtinsNone},
-                                  {"__le__", builtinsNone},
-                                  {"__len__", builtinsNone},
-                                  {"__lt__", builtinsNone},
-                                  {"__mul__", builtinsNone},
-                                  {"__ne__", builtinsNone},
-                                  {"__new__", builtinsNone},
-                                  {"__reduce__", builtinsNone},
-                                  {"__reduce_ex__", builtinsNone},
-                                  {"__repr__", builtinsNone},
-                                  {"__rmul__", builtinsNone},
-                                  {"count", builtinsNone},
-                                  {"index", builtinsNone}});
-    module.set_attribute("tuple"s, builtinsTuple);
-    object::Object builtinsType({{"__base__", builtinsObject},
-                                 {"__bases__", builtinsNone},
-                                 {"__class__", {/*set below*/}},
-                                 {"__doc__", builtinsNone},
-                                 {"__module__", builtins},
-                                 {"__mro__", {/*set below*/}},
-                                 {"__name__", builtinsNone},
-                                 {"__qualname__", builtinsNone}});
-    module.set_attribute("type"s, builtinsType);
-    builtinsClass.set_attribute("__class__"s, builtinsType);
-    builtinsBool.set_attribute("__class__"s, builtinsType);
-    builtinsBytes.set_attribute("__class__"s, builtinsType);
-    builtinsFloat.set_attribute("__class__"s, builtinsType);
-    builtinsInt.set_attribute("__class__"s, builtinsType);
-    builtinsStr.set_attribute("__class__"s, builtinsType);
-    builtinsTuple.set_attribute("__class__"s, builtinsType);
-    builtinsType.set_attribute("__class__"s, builtinsType);
-    object::Object builtinsCompileClass({{"__call__", builtinsNone},
-                                         {"__class__", builtinsType},
-                                         {"__doc__", builtinsNone},
-                                         {"__eq__", builtinsNone},
-                                         {"__format__", builtinsNone},
-                                         {"__ge__", builtinsNone},
-                                         {"__gt__", builtinsNone},
-                                         {"__hash__", builtinsNone},
-                                         {"__init__", builtinsNone},
-                                         {"__init_subclass__", builtinsNone},
-                                         {"__le__", builtinsNone},
-                                         {"__lt__", builtinsNone},
-                                         {"__module__", builtins},
-                                         {"__name__", builtinsNone},
-                                         {"__ne__", builtinsNone},
-                                         {"__new__", builtinsNone},
-                                         {"__qualname__", builtinsNone},
-                                         {"__reduce__", builtinsNone},
-                                         {"__reduce_ex__", builtinsNone},
-                                         {"__repr__", builtinsNone},
-                                         {"__text_signature__", builtinsNone}});
-    builtinsCompile.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsEval.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsExec.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsGlobals.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsId.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsInput.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsLocals.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsOpen.set_attribute("__class__"s, builtinsCompileClass);
-    builtinsPrint.set_attribute("__class__"s, builtinsCompileClass);
-    object::Object builtinsObjectClass({{"__bool__", builtinsNone},
-                                        {"__class__", builtinsType},
-                                        {"__doc__", builtinsNone},
-                                        {"__eq__", builtinsNone},
-                                        {"__format__", builtinsNone},
-                                        {"__ge__", builtinsNone},
-                                        {"__gt__", builtinsNone},
-                                        {"__hash__", builtinsNone},
-                                        {"__init__", builtinsNone},
-                                        {"__init_subclass__", builtinsNone},
-                                        {"__le__", builtinsNone},
-                                        {"__lt__", builtinsNone},
-                                        {"__ne__", builtinsNone},
-                                        {"__new__", builtinsNone},
-                                        {"__reduce__", builtinsNone},
-                                        {"__reduce_ex__", builtinsNone}});
-    builtinsObject.set_attribute("__class__"s, builtinsObjectClass);
-    object::Object builtinsObjectDelattr(object::ObjectMethod::DELATTR,
-                                         {{"__class__", builtinsCompileClass},
-                                          {"__doc__", builtinsNone},
-                                          {"__name__", builtinsNone},
-                                          {"__qualname__", builtinsNone}});
-    builtinsObject.set_attribute("__delattr__"s, builtinsObjectDelattr);
-    object::Object builtinsObjectDir(object::ObjectMethod::DIR,
-                                     {{"__class__", builtinsCompileClass},
-                                      {"__doc__", builtinsNone},
-                                      {"__name__", builtinsNone},
-                                      {"__qualname__", builtinsNone}});
-    builtinsObject.set_attribute("__dir__"s, builtinsObjectDir);
+        {{object::Symbol("__abs__"), builtinsNone},
+         {object::Symbol("__add__"), builtinsNone},
+         {object::Symbol("__and__"), builtinsNone},
+         {object::Symbol("__bool__"), builtinsNone},
+         {object::Symbol("__ceil__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__divmod__"), builtinsNone},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__float__"), builtinsNone},
+         {object::Symbol("__floor__"), builtinsNone},
+         {object::Symbol("__floordiv__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getnewargs__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__index__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__int__"), builtinsNone},
+         {object::Symbol("__invert__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__lshift__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__mod__"), builtinsNone},
+         {object::Symbol("__mul__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__neg__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__or__"), builtinsNone},
+         {object::Symbol("__pos__"), builtinsNone},
+         {object::Symbol("__pow__"), builtinsNone},
+         {object::Symbol("__radd__"), builtinsNone},
+         {object::Symbol("__rand__"), builtinsNone},
+         {object::Symbol("__rdivmod__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__rfloordiv__"), builtinsNone},
+         {object::Symbol("__rlshift__"), builtinsNone},
+         {object::Symbol("__rmod__"), builtinsNone},
+         {object::Symbol("__rmul__"), builtinsNone},
+         {object::Symbol("__ror__"), builtinsNone},
+         {object::Symbol("__round__"), builtinsNone},
+         {object::Symbol("__rpow__"), builtinsNone},
+         {object::Symbol("__rrshift__"), builtinsNone},
+         {object::Symbol("__rshift__"), builtinsNone},
+         {object::Symbol("__rsub__"), builtinsNone},
+         {object::Symbol("__rtruediv__"), builtinsNone},
+         {object::Symbol("__rxor__"), builtinsNone},
+         {object::Symbol("__sub__"), builtinsNone},
+         {object::Symbol("__truediv__"), builtinsNone},
+         {object::Symbol("__trunc__"), builtinsNone},
+         {object::Symbol("__xor__"), builtinsNone},
+         {object::Symbol("bit_length"), builtinsNone},
+         {object::Symbol("conjugate"), builtinsNone},
+         {object::Symbol("denominator"), builtinsNone},
+         {object::Symbol("from_bytes"), builtinsNone},
+         {object::Symbol("imag"), builtinsNone},
+         {object::Symbol("numerator"), builtinsNone},
+         {object::Symbol("real"), builtinsNone},
+         {object::Symbol("to_bytes"), builtinsNone}});
+    module.set_attribute(object::Symbol("int"), builtinsInt);
+    object::Object builtinsLocals(
+        object::SysCall::LOCALS,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("locals"), builtinsLocals);
+    object::Object builtinsObject(
+        {{object::Symbol("__abstractmethods__"), builtinsNone},
+         {object::Symbol("__base__"), {/*set below*/}},
+         {object::Symbol("__basicsize__"), builtinsNone},
+         {object::Symbol("__call__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__delattr__"), {/*set below*/}},
+         {object::Symbol("__dict__"), builtinsNone},
+         {object::Symbol("__dictoffset__"), builtinsNone},
+         {object::Symbol("__dir__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__flags__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getattribute__"), {/*set below*/}},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__instancecheck__"), builtinsNone},
+         {object::Symbol("__itemsize__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__module__"), builtins},
+         {object::Symbol("__mro__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__prepare__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__setattr__"), {/*set below*/}},
+         {object::Symbol("__sizeof__"), builtinsNone},
+         {object::Symbol("__str__"), builtinsNone},
+         {object::Symbol("__subclasscheck__"), builtinsNone},
+         {object::Symbol("__subclasses__"), builtinsNone},
+         {object::Symbol("__subclasshook__"), builtinsNone},
+         {object::Symbol("__text_signature__"), builtinsNone},
+         {object::Symbol("__weakrefoffset__"), builtinsNone},
+         {object::Symbol("mro"), builtinsNone}});
+    module.set_attribute(object::Symbol("object"), builtinsObject);
+    builtinsObject.set_attribute(object::Symbol("__base__"), builtinsObject);
+    object::Object builtinsOpen(
+        object::SysCall::OPEN,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("open"), builtinsOpen);
+    object::Object builtinsPrint(
+        object::SysCall::PRINT,
+        {{object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("print"), builtinsPrint);
+    object::Object builtinsStr(
+        {{object::Symbol("__add__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__contains__"), builtinsNone},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getitem__"), builtinsNone},
+         {object::Symbol("__getnewargs__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__iter__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__len__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__mod__"), builtinsNone},
+         {object::Symbol("__mul__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__rmod__"), builtinsNone},
+         {object::Symbol("__rmul__"), builtinsNone},
+         {object::Symbol("capitalize"), builtinsNone},
+         {object::Symbol("casefold"), builtinsNone},
+         {object::Symbol("center"), builtinsNone},
+         {object::Symbol("count"), builtinsNone},
+         {object::Symbol("encode"), builtinsNone},
+         {object::Symbol("endswith"), builtinsNone},
+         {object::Symbol("expandtabs"), builtinsNone},
+         {object::Symbol("find"), builtinsNone},
+         {object::Symbol("format"), builtinsNone},
+         {object::Symbol("format_map"), builtinsNone},
+         {object::Symbol("index"), builtinsNone},
+         {object::Symbol("isalnum"), builtinsNone},
+         {object::Symbol("isalpha"), builtinsNone},
+         {object::Symbol("isdecimal"), builtinsNone},
+         {object::Symbol("isdigit"), builtinsNone},
+         {object::Symbol("isidentifier"), builtinsNone},
+         {object::Symbol("islower"), builtinsNone},
+         {object::Symbol("isnumeric"), builtinsNone},
+         {object::Symbol("isprintable"), builtinsNone},
+         {object::Symbol("isspace"), builtinsNone},
+         {object::Symbol("istitle"), builtinsNone},
+         {object::Symbol("isupper"), builtinsNone},
+         {object::Symbol("join"), builtinsNone},
+         {object::Symbol("ljust"), builtinsNone},
+         {object::Symbol("lower"), builtinsNone},
+         {object::Symbol("lstrip"), builtinsNone},
+         {object::Symbol("maketrans"), builtinsNone},
+         {object::Symbol("partition"), builtinsNone},
+         {object::Symbol("replace"), builtinsNone},
+         {object::Symbol("rfind"), builtinsNone},
+         {object::Symbol("rindex"), builtinsNone},
+         {object::Symbol("rjust"), builtinsNone},
+         {object::Symbol("rpartition"), builtinsNone},
+         {object::Symbol("rsplit"), builtinsNone},
+         {object::Symbol("rstrip"), builtinsNone},
+         {object::Symbol("split"), builtinsNone},
+         {object::Symbol("splitlines"), builtinsNone},
+         {object::Symbol("startswith"), builtinsNone},
+         {object::Symbol("strip"), builtinsNone},
+         {object::Symbol("swapcase"), builtinsNone},
+         {object::Symbol("title"), builtinsNone},
+         {object::Symbol("translate"), builtinsNone},
+         {object::Symbol("upper"), builtinsNone},
+         {object::Symbol("zfill"), builtinsNone}});
+    module.set_attribute(object::Symbol("str"), builtinsStr);
+    builtinsName.set_attribute(object::Symbol("__class__"), builtinsStr);
+    object::Object builtinsTuple(
+        {{object::Symbol("__add__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__contains__"), builtinsNone},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getitem__"), builtinsNone},
+         {object::Symbol("__getnewargs__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__iter__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__len__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__mul__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__repr__"), builtinsNone},
+         {object::Symbol("__rmul__"), builtinsNone},
+         {object::Symbol("count"), builtinsNone},
+         {object::Symbol("index"), builtinsNone}});
+    module.set_attribute(object::Symbol("tuple"), builtinsTuple);
+    object::Object builtinsType(
+        {{object::Symbol("__base__"), builtinsObject},
+         {object::Symbol("__bases__"), builtinsNone},
+         {object::Symbol("__class__"), {/*set below*/}},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__module__"), builtins},
+         {object::Symbol("__mro__"), {/*set below*/}},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    module.set_attribute(object::Symbol("type"), builtinsType);
+    builtinsClass.set_attribute(object::Symbol("__class__"), builtinsType);
+    builtinsBool.set_attribute(object::Symbol("__class__"), builtinsType);
+    builtinsBytes.set_attribute(object::Symbol("__class__"), builtinsType);
+    builtinsFloat.set_attribute(object::Symbol("__class__"), builtinsType);
+    builtinsInt.set_attribute(object::Symbol("__class__"), builtinsType);
+    builtinsStr.set_attribute(object::Symbol("__class__"), builtinsType);
+    builtinsTuple.set_attribute(object::Symbol("__class__"), builtinsType);
+    builtinsType.set_attribute(object::Symbol("__class__"), builtinsType);
+    object::Object builtinsCompileClass(
+        {{object::Symbol("__call__"), builtinsNone},
+         {object::Symbol("__class__"), builtinsType},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__module__"), builtins},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__repr__"), builtinsNone},
+         {object::Symbol("__text_signature__"), builtinsNone}});
+    builtinsCompile.set_attribute(object::Symbol("__class__"),
+                                  builtinsCompileClass);
+    builtinsEval.set_attribute(object::Symbol("__class__"),
+                               builtinsCompileClass);
+    builtinsExec.set_attribute(object::Symbol("__class__"),
+                               builtinsCompileClass);
+    builtinsGlobals.set_attribute(object::Symbol("__class__"),
+                                  builtinsCompileClass);
+    builtinsId.set_attribute(object::Symbol("__class__"), builtinsCompileClass);
+    builtinsInput.set_attribute(object::Symbol("__class__"),
+                                builtinsCompileClass);
+    builtinsLocals.set_attribute(object::Symbol("__class__"),
+                                 builtinsCompileClass);
+    builtinsOpen.set_attribute(object::Symbol("__class__"),
+                               builtinsCompileClass);
+    builtinsPrint.set_attribute(object::Symbol("__class__"),
+                                builtinsCompileClass);
+    object::Object builtinsObjectClass(
+        {{object::Symbol("__bool__"), builtinsNone},
+         {object::Symbol("__class__"), builtinsType},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone}});
+    builtinsObject.set_attribute(object::Symbol("__class__"),
+                                 builtinsObjectClass);
+    object::Object builtinsObjectDelattr(
+        object::ObjectMethod::DELATTR,
+        {{object::Symbol("__class__"), builtinsCompileClass},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    builtinsObject.set_attribute(object::Symbol("__delattr__"),
+                                 builtinsObjectDelattr);
+    object::Object builtinsObjectDir(
+        object::ObjectMethod::DIR,
+        {{object::Symbol("__class__"), builtinsCompileClass},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    builtinsObject.set_attribute(object::Symbol("__dir__"), builtinsObjectDir);
     object::Object builtinsObjectGetattribute(
         object::ObjectMethod::GETATTRIBUTE,
-        {{"__class__", builtinsCompileClass},
-         {"__doc__", builtinsNone},
-         {"__name__", builtinsNone},
-         {"__qualname__", builtinsNone}});
-    builtinsObject.set_attribute("__getattribute__"s,
+        {{object::Symbol("__class__"), builtinsCompileClass},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    builtinsObject.set_attribute(object::Symbol("__getattribute__"),
                                  builtinsObjectGetattribute);
-    object::Object builtinsObjectSetattr(object::ObjectMethod::SETATTR,
-                                         {{"__class__", builtinsCompileClass},
-                                          {"__doc__", builtinsNone},
-                                          {"__name__", builtinsNone},
-                                          {"__qualname__", builtinsNone}});
-    builtinsObject.set_attribute("__setattr__"s, builtinsObjectSetattr);
-    object::Object builtinsTypeMro(object::Tuple{builtinsType, builtinsObject},
-                                   {{"__class__", builtinsTuple}});
-    builtinsType.set_attribute("__mro__"s, builtinsTypeMro);
-    object::Object builtinsRuntimeError({{"__cause__", builtinsNone},
-                                         {"__class__", builtinsNone},
-                                         {"__context__", builtinsNone},
-                                         {"__delattr__", builtinsNone},
-                                         {"__dict__", builtinsNone},
-                                         {"__dir__", builtinsNone},
-                                         {"__doc__", builtinsNone},
-                                         {"__eq__", builtinsNone},
-                                         {"__format__", builtinsNone},
-                                         {"__ge__", builtinsNone},
-                                         {"__getattribute__", builtinsNone},
-                                         {"__getstate__", builtinsNone},
-                                         {"__gt__", builtinsNone},
-                                         {"__hash__", builtinsNone},
-                                         {"__init__", builtinsNone},
-                                         {"__init_subclass__", builtinsNone},
-                                         {"__le__", builtinsNone},
-                                         {"__lt__", builtinsNone},
-                                         {"__ne__", builtinsNone},
-                                         {"__new__", builtinsNone},
-                                         {"__reduce__", builtinsNone},
-                                         {"__reduce_ex__", builtinsNone},
-                                         {"__repr__", builtinsNone},
-                                         {"__setattr__", builtinsNone},
-                                         {"__setstate__", builtinsNone},
-                                         {"__sizeof__", builtinsNone},
-                                         {"__str__", builtinsNone},
-                                         {"__subclasshook__", builtinsNone},
-                                         {"__suppress_context__", builtinsNone},
-                                         {"__traceback__", builtinsNone},
-                                         {"add_note", builtinsNone},
-                                         {"args", builtinsNone},
-                                         {"with_traceback", builtinsType}});
-    module.set_attribute("RuntimeError"s, builtinsRuntimeError);
+    object::Object builtinsObjectSetattr(
+        object::ObjectMethod::SETATTR,
+        {{object::Symbol("__class__"), builtinsCompileClass},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__name__"), builtinsNone},
+         {object::Symbol("__qualname__"), builtinsNone}});
+    builtinsObject.set_attribute(object::Symbol("__setattr__"),
+                                 builtinsObjectSetattr);
+    object::Object builtinsTypeMro(
+        object::Tuple{builtinsType, builtinsObject},
+        {{object::Symbol("__class__"), builtinsTuple}});
+    builtinsType.set_attribute(object::Symbol("__mro__"), builtinsTypeMro);
+    object::Object builtinsRuntimeError(
+        {{object::Symbol("__cause__"), builtinsNone},
+         {object::Symbol("__class__"), builtinsNone},
+         {object::Symbol("__context__"), builtinsNone},
+         {object::Symbol("__delattr__"), builtinsNone},
+         {object::Symbol("__dict__"), builtinsNone},
+         {object::Symbol("__dir__"), builtinsNone},
+         {object::Symbol("__doc__"), builtinsNone},
+         {object::Symbol("__eq__"), builtinsNone},
+         {object::Symbol("__format__"), builtinsNone},
+         {object::Symbol("__ge__"), builtinsNone},
+         {object::Symbol("__getattribute__"), builtinsNone},
+         {object::Symbol("__getstate__"), builtinsNone},
+         {object::Symbol("__gt__"), builtinsNone},
+         {object::Symbol("__hash__"), builtinsNone},
+         {object::Symbol("__init__"), builtinsNone},
+         {object::Symbol("__init_subclass__"), builtinsNone},
+         {object::Symbol("__le__"), builtinsNone},
+         {object::Symbol("__lt__"), builtinsNone},
+         {object::Symbol("__ne__"), builtinsNone},
+         {object::Symbol("__new__"), builtinsNone},
+         {object::Symbol("__reduce__"), builtinsNone},
+         {object::Symbol("__reduce_ex__"), builtinsNone},
+         {object::Symbol("__repr__"), builtinsNone},
+         {object::Symbol("__setattr__"), builtinsNone},
+         {object::Symbol("__setstate__"), builtinsNone},
+         {object::Symbol("__sizeof__"), builtinsNone},
+         {object::Symbol("__str__"), builtinsNone},
+         {object::Symbol("__subclasshook__"), builtinsNone},
+         {object::Symbol("__suppress_context__"), builtinsNone},
+         {object::Symbol("__traceback__"), builtinsNone},
+         {object::Symbol("add_note"), builtinsNone},
+         {object::Symbol("args"), builtinsNone},
+         {object::Symbol("with_traceback"), builtinsType}});
+    module.set_attribute(object::Symbol("RuntimeError"), builtinsRuntimeError);
   }
   // NOLINTEND(misc-const-correctness)
 } // namespace chimera::library::virtual_machine::modules
@@ -9,95 +9,95 @@
 #include <algorithm>
 #include <vector>
 
-using namespace std::literals;
-
 namespace chimera::library::virtual_machine::modules {
   using Argv = std::vector<object::Object>;
   void sys(const object::Object &module) {
     auto sys = module;
-    sys.set_attribute("__displayhook__"s, module);
-    sys.set_attribute("__doc__"s, module);
-    sys.set_attribute("__excepthook__"s, module);
-    sys.set_attribute("__interactivehook__"s, module);
-    sys.set_attribute("__loader__"s, module);
-    sys.set_attribute("__name__"s, module);
-    sys.set_attribute("__package__"s, module);
-    sys.set_attribute("__spec__"s, module);
-    sys.set_attribute("__stderr__"s, module);
-    sys.set_attribute("__stdin__"s, module);
-    sys.set_attribute("__stdout__"s, module);
-    sys.set_attribute("_clear_type_cache"s, module);
-    sys.set_attribute("_current_frames"s, module);
-    sys.set_attribute("_debugmallocstats"s, module);
-    sys.set_attribute("_getframe"s, module);
-    sys.set_attribute("_git"s, module);
-    sys.set_attribute("_home"s, module);
-    sys.set_attribute("_xoptions"s, module);
-    sys.set_attribute("abiflags"s, module);
-    sys.set_attribute("api_version"s, module);
-    sys.set_attribute("argv"s, module);
-    sys.set_attribute("base_exec_prefix"s, module);
-    sys.set_attribute("base_prefix"s, module);
-    sys.set_attribute("builtin_module_names"s, module);
-    sys.set_attribute("byteorder"s, module);
-    sys.set_attribute("call_tracing"s, module);
-    sys.set_attribute("callstats"s, module);
-    sys.set_attribute("copyright"s, module);
-    sys.set_attribute("displayhook"s, module);
-    sys.set_attribute("dont_write_bytecode"s, module);
-    sys.set_attribute("exc_info"s, module);
-    sys.set_attribute("excepthook"s, module);
-    sys.set_attribute("exec_prefix"s, module);
-    sys.set_attribute("executable"s, module);
-    sys.set_attribute("exit"s, module);
-    sys.set_attribute("flags"s, module);
-    sys.set_attribute("float_info"s, module);
-    sys.set_attribute("float_repr_style"s, module);
-    sys.set_attribute("get_asyncgen_hooks"s, module);
-    sys.set_attribute("get_coroutine_wrapper"s, module);
-    sys.set_attribute("getallocatedblocks"s, module);
-    sys.set_attribute("getcheckinterval"s, module);
-    sys.set_attribute("getdefaultencoding"s, module);
-    sys.set_attribute("getdlopenflags"s, module);
-    sys.set_attribute("getfilesystemencodeerrors"s, module);
-    sys.set_attribute("getfilesystemencoding"s, module);
-    sys.set_attribute("getprofile"s, module);
-    sys.set_attribute("getrecursionlimit"s, module);
-    sys.set_attribute("getrefcount"s, module);
-    sys.set_attribute("getsizeof"s, module);
-    sys.set_attribute("getswitchinterval"s, module);
-    sys.set_attribute("gettrace"s, module);
-    sys.set_attribute("hash_info"s, module);
-    sys.set_attribute("hexversion"s, module);
-    sys.set_attribute("implementation"s, module);
-    sys.set_attribute("int_info"s, module);
-    sys.set_attribute("intern"s, module);
-    sys.set_attribute("is_finalizing"s, module);
-    sys.set_attribute("maxsize"s, module);
-    sys.set_attribute("maxunicode"s, module);
-    sys.set_attribute("meta_path"s, module);
-    sys.set_attribute("modules"s, module);
-    sys.set_attribute("path"s, module);
-    sys.set_attribute("path_hooks"s, module);
-    sys.set_attribute("path_importer_cache"s, module);
-    sys.set_attribute("platform"s, module);
-    sys.set_attribute("prefix"s, module);
-    sys.set_attribute("ps1"s, module);
-    sys.set_attribute("ps2"s, module);
-    sys.set_attribute("set_asyncgen_hooks"s, module);
-    sys.set_attribute("set_coroutine_wrapper"s, module);
-    sys.set_attribute("setcheckinterval"s, module);
-    sys.set_attribute("setdlopenflags"s, module);
-    sys.set_attribute("setprofile"s, module);
-    sys.set_attribute("setrecursionlimit"s, module);
-    sys.set_attribute("setswitchinterval"s, module);
-    sys.set_attribute("settrace"s, module);
-    sys.set_attribute("stderr"s, module);
-    sys.set_attribute("stdin"s, module);
-    sys.set_attribute("stdout"s, module);
-    sys.set_attribute("thread_info"s, module);
-    sys.set_attribute("version"s, module);
-    sys.set_attribute("version_info"s, module);
-    sys.set_attribute("warnoptions"s, module);
+    sys.set_attribute(object::Symbol("__displayhook__"), module);
+    sys.set_attribute(object::Symbol("__doc__"), module);
+    sys.set_attribute(object::Symbol("__excepthook__"), module);
+    sys.set_attribute(object::Symbol("__interactivehook__"), module);
+    sys.set_attribute(object::Symbol("__loader__"), module);
+    sys.set_attribute(object::Symbol("__name__"), module);
+    sys.set_attribute(object::Symbol("__package__"), module);
+    sys.set_attribute(object::Symbol("__spec__"), module);
+    sys.set_attribute(object::Symbol("__stderr__"), module);
+    sys.set_attribute(object::Symbol("__stdin__"), module);
+    sys.set_attribute(object::Symbol("__stdout__"), module);
+    sys.set_attribute(object::Symbol("_clear_type_cache"), module);
+    sys.set_attribute(object::Symbol("_current_frames"), module);
+    sys.set_attribute(object::Symbol("_debugmallocstats"), module);
+    sys.set_attribute(object::Symbol("_getframe"), module);
+    sys.set_attribute(object::Symbol("_git"), module);
+    sys.set_attribute(object::Symbol("_home"), module);
+    sys.set_attribute(object::Symbol("_number_stats"),
+                      object::Object(object::SysCall::NUMBER_STATS, {}));
+    sys.set_attribute(object::Symbol("_xoptions"), module);
+    sys.set_attribute(object::Symbol("abiflags"), module);
+    sys.set_attribute(object::Symbol("api_version"), module);
+    sys.set_attribute(object::Symbol("argv"), module);
+    sys.set_attribute(object::Symbol("base_exec_prefix"), module);
+    sys.set_attribute(object::Symbol("base_prefix"), module);
+    sys.set_attribute(object::Symbol("builtin_module_names"), module);
+    sys.set_attribute(object::Symbol("byteorder"), module);
+    sys.set_attribute(object::Symbol("call_tracing"), module);
+    sys.set_attribute(object::Symbol("callstats"), module);
+    sys.set_attribute(object::Symbol("copyright"), module);
+    sys.set_attribute(object::Symbol("displayhook"), module);
+    sys.set_attribute(object::Symbol("dont_write_bytecode"), module);
+    sys.set_attribute(object::Symbol("exc_info"), module);
+    sys.set_attribute(object::Symbol("excepthook"), module);
+    sys.set_attribute(object::Symbol("exec_prefix"), module);
+    sys.set_attribute(object::Symbol("executable"), module);
+    sys.set_attribute(object::Symbol("exit"), module);
+    sys.set_attribute(object::Symbol("flags"), module);
+    sys.set_attribute(object::Symbol("float_info"), module);
+    sys.set_attribute(object::Symbol("float_repr_style"), module);
+    sys.set_attribute(object::Symbol("get_asyncgen_hooks"), module);
+    sys.set_attribute(object::Symbol("get_coroutine_wrapper"), module);
+    sys.set_attribute(object::Symbol("getallocatedblocks"), module);
+    sys.set_attribute(object::Symbol("getcheckinterval"), module);
+    sys.set_attribute(object::Symbol("getdefaultencoding"), module);
+    sys.set_attribute(object::Symbol("getdlopenflags"), module);
+    sys.set_attribute(object::Symbol("getfilesystemencodeerrors"), module);
+    sys.set_attribute(object::Symbol("getfilesystemencoding"), module);
+    sys.set_attribute(object::Symbol("getprofile"), module);
+    sys.set_attribute(object::Symbol("getrecursionlimit"), module);
+    sys.set_attribute(object::Symbol("getrefcount"), module);
+    sys.set_attribute(object::Symbol("getsizeof"), module);
+    sys.set_attribute(object::Symbol("getswitchinterval"), module);
+    sys.set_attribute(object::Symbol("gettrace"), module);
+    sys.set_attribute(object::Symbol("hash_info"), module);
+    sys.set_attribute(object::Symbol("hexversion"), module);
+    sys.set_attribute(object::Symbol("implementation"), module);
+    sys.set_attribute(object::Symbol("int_info"), module);
+    sys.set_attribute(object::Symbol("intern"), module);
+    sys.set_attribute(object::Symbol("is_finalizing"), module);
+    sys.set_attribute(object::Symbol("maxsize"), module);
+    sys.set_attribute(object::Symbol("maxunicode"), module);
+    sys.set_attribute(object::Symbol("meta_path"), module);
+    sys.set_attribute(object::Symbol("modules"), module);
+    sys.set_attribute(object::Symbol("path"), module);
+    sys.set_attribute(object::Symbol("path_hooks"), module);
+    sys.set_attribute(object::Symbol("path_importer_cache"), module);
+    sys.set_attribute(object::Symbol("platform"), module);
+    sys.set_attribute(object::Symbol("prefix"), module);
+    sys.set_attribute(object::Symbol("ps1"), module);
+    sys.set_attribute(object::Symbol("ps2"), module);
+    sys.set_attribute(object::Symbol("set_asyncgen_hooks"), module);
+    sys.set_attribute(object::Symbol("set_coroutine_wrapper"), module);
+    sys.set_attribute(object::Symbol("setcheckinterval"), module);
+    sys.set_attribute(object::Symbol("setdlopenflags"), module);
+    sys.set_attribute(object::Symbol("setprofile"), module);
+    sys.set_attribute(object::Symbol("setrecursionlimit"), module);
+    sys.set_attribute(object::Symbol("setswitchinterval"), module);
+    sys.set_attribute(object::Symbol("settrace"), module);
+    sys.set_attribute(object::Symbol("stderr"), module);
+    sys.set_attribute(object::Symbol("stdin"), module);
+    sys.set_attribute(object::Symbol("stdout"), module);
+    sys.set_attribute(object::Symbol("thread_info"), module);
+    sys.set_attribute(object::Symbol("version"), module);
+    sys.set_attribute(object::Symbol("version_info"), module);
+    sys.set_attribute(object::Symbol("warnoptions"), module);
   }
 } // namespace chimera::library::virtual_machine::modules
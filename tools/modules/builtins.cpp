@@ -30,8 +30,9 @@ namespace chimera::library {
     auto main = processContext->make_module("builtins");
     auto threadContext = virtual_machine::make_thread(processContext, main);
     virtual_machine::Evaluator(threadContext).evaluate(module);
-    const Printer printer{threadContext->body(), "builtins",
-                          threadContext->body().get_attribute("__builtins__")};
+    const Printer printer{
+        threadContext->body(), "builtins",
+        threadContext->body().get_attribute(object::Symbol("__builtins__"))};
     std::cout << printer;
   }
 } // namespace chimera::library
@@ -41,15 +41,19 @@ namespace chimera::library {
         if (m_remap.try_emplace(std::get<1>(work).id(), std::get<0>(work).id())
                 .second) {
           for (const auto &name : std::get<0>(work).dir()) {
-            if (std::get<1>(work).has_attribute(name)) {
-              next_modules.emplace_back(std::get<0>(work).get_attribute(name),
-                                        std::get<1>(work).get_attribute(name));
+            const object::Symbol symbol(name);
+            if (std::get<1>(work).has_attribute(symbol)) {
+              next_modules.emplace_back(
+                  std::get<0>(work).get_attribute(symbol),
+                  std::get<1>(work).get_attribute(symbol));
             }
           }
           for (const auto &name : std::get<1>(work).dir()) {
-            if (std::get<0>(work).has_attribute(name)) {
-              next_modules.emplace_back(std::get<0>(work).get_attribute(name),
-                                        std::get<1>(work).get_attribute(name));
+            const object::Symbol symbol(name);
+            if (std::get<0>(work).has_attribute(symbol)) {
+              next_modules.emplace_back(
+                  std::get<0>(work).get_attribute(symbol),
+                  std::get<1>(work).get_attribute(symbol));
             }
           }
         }
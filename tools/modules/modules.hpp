@@ -5,14 +5,15 @@
 
 #include <gsl/assert> // for Expects
 
-#include <algorithm> // for sort
-#include <iomanip>   // for quoted
-#include <map>       // for map
-#include <optional>  // for optional
-#include <ostream>   // for endl
-#include <queue>     // for priority_queue
-#include <string>    // for basic_string, to_string
-#include <vector>    // for vector
+#include <algorithm>     // for sort
+#include <iomanip>       // for quoted
+#include <optional>      // for optional
+#include <ostream>       // for endl
+#include <queue>         // for priority_queue
+#include <string>        // for basic_string, to_string
+#include <string_view>   // for string_view
+#include <unordered_map> // for unordered_map
+#include <vector>        // for vector
 
 namespace chimera::library {
   namespace object::number {
@@ -47,6 +48,30 @@ namespace chimera::library {
   private:
     PrintState *printer;
   };
+  //! values every process shares one object for
+  struct Singleton {
+    [[nodiscard]] auto operator()(const object::False & /*false*/) const
+        -> std::string_view {
+      return "object::singleton<object::False>()";
+    }
+    [[nodiscard]] auto operator()(const object::None & /*none*/) const
+        -> std::string_view {
+      return "object::singleton<object::None>()";
+    }
+    [[nodiscard]] auto operator()(const object::True & /*true*/) const
+        -> std::string_view {
+      return "object::singleton<object::True>()";
+    }
+    [[nodiscard]] auto operator()(const object::Tuple &tuple) const
+        -> std::string_view {
+      return tuple.empty() ? "object::singleton<object::Tuple>()" : "";
+    }
+    template <typename Type>
+    [[nodiscard]] auto operator()(const Type & /*type*/) const
+        -> std::string_view {
+      return {};
+    }
+  };
   struct PrintState {
     PrintState(const object::Object &main, const std::string &module)
         : main(main) {
@@ -194,6 +219,8 @@ namespace chimera::library {
           return ostream << "INPUT";
         case object::SysCall::LOCALS:
           return ostream << "LOCALS";
+        case object::SysCall::NUMBER_STATS:
+          return ostream << "NUMBER_STATS";
         case object::SysCall::PRINT:
           return ostream << "PRINT";
         case object::SysCall::OPEN:
@@ -213,6 +240,11 @@ namespace chimera::library {
       if (is_printed(work.object)) {
         return ostream;
       }
+      if (auto singleton = work.object.visit(Singleton{});
+          !singleton.empty() && work.object.dir_size() == 0) {
+        ostream << "object::Object " << baseName << " = " << singleton << ";";
+        return printed_as(ostream, work.object, baseName);
+      }
       ostream << "object::Object " << baseName << "(";
       work.object.visit(
           [this, &ostream](auto &&value) { this->print(ostream, value); });
@@ -224,43 +256,47 @@ namespace chimera::library {
         } else {
           first = false;
         }
-        ostream << "{" << std::quoted(name) << "s,";
-        if (is_printed(work.object.get_attribute(name))) {
-          ostream << printed(work.object.get_attribute(name));
+        const auto attribute = work.object.get_attribute(object::Symbol(name));
+        ostream << "{object::Symbol(" << std::quoted(name) << "),";
+        if (is_printed(attribute)) {
+          ostream << printed(attribute);
         } else {
           ostream << "{/*set below*/}";
-          wanted[id(work.object.get_attribute(name))].emplace_back(
-              SetAttribute{baseName, name});
-          queue.push(
-              Work{this, work.object.get_attribute(name), baseName, name});
+          wanted[id(attribute)].emplace_back(SetAttribute{baseName, name});
+          queue.push(Work{this, attribute, baseName, name});
         }
         ostream << "}";
       }
-      m_printed.try_emplace(id(work.object), baseName);
       ostream << "});";
-      if (wanted.contains(id(work.object))) {
-        auto setAttributes = std::move(wanted.at(id(work.object)));
-        wanted.erase(id(work.object));
+      return printed_as(ostream, work.object, baseName);
+    }
+    [[nodiscard]] auto main_printed() -> std::string { return printed(main); }
+    //! records object as printed and sets it on everything waiting for it
+    template <typename OStream>
+    auto printed_as(OStream &ostream, const object::Object &object,
+                    const std::string &baseName) -> OStream & {
+      m_printed.try_emplace(id(object), baseName);
+      if (wanted.contains(id(object))) {
+        auto setAttributes = std::move(wanted.at(id(object)));
+        wanted.erase(id(object));
         std::sort(setAttributes.begin(), setAttributes.end(), Compare{});
         for (const auto &setAttribute : setAttributes) {
-          ostream << setAttribute.base_name << ".set_attribute("
-                  << std::quoted(setAttribute.name) << "s,"
-                  << printed(work.object) << ");";
+          ostream << setAttribute.base_name << ".set_attribute(object::Symbol("
+                  << std::quoted(setAttribute.name) << ")," << baseName << ");";
         }
       }
       return ostream;
     }
-    [[nodiscard]] auto main_printed() -> std::string { return printed(main); }
     template <typename OStream>
     void print_all(OStream &ostream) {
       for (const auto &name : main.dir()) {
-        if (is_printed(main.get_attribute(name))) {
-          ostream << "module.set_attribute(" << std::quoted(name) << "s,"
-                  << printed(main.get_attribute(name)) << ");";
+        const auto attribute = main.get_attribute(object::Symbol(name));
+        if (is_printed(attribute)) {
+          ostream << "module.set_attribute(object::Symbol(" << std::quoted(name)
+                  << ")," << printed(attribute) << ");";
         } else {
-          wanted[id(main.get_attribute(name))].emplace_back(
-              SetAttribute{"module", name});
-          queue.push(Work{this, main.get_attribute(name), "module", name});
+          wanted[id(attribute)].emplace_back(SetAttribute{"module", name});
+          queue.push(Work{this, attribute, "module", name});
         }
       }
       while (!queue.empty()) {
@@ -272,10 +308,10 @@ namespace chimera::library {
 
   private:
     friend IncompleteTuple;
-    std::map<object::Id, object::Id> m_remap{};
-    std::map<object::Id, std::string> m_printed{};
+    std::unordered_map<object::Id, object::Id> m_remap{};
+    std::unordered_map<object::Id, std::string> m_printed{};
     std::priority_queue<Work, std::vector<Work>, Compare> queue{};
-    std::map<object::Id, std::vector<SetAttribute>> wanted{};
+    std::unordered_map<object::Id, std::vector<SetAttribute>> wanted{};
     std::optional<object::Object> tuple_want{};
     object::Object main;
   };
@@ -0,0 +1,38 @@
+#include "container/atomic_container.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <thread>
+
+using chimera::library::container::AtomicContainer;
+using chimera::library::container::Confine;
+
+TEST_CASE("container AtomicContainer confine") {
+  AtomicContainer<int> container(1);
+  REQUIRE_FALSE(container.confined());
+  container.confine();
+  REQUIRE(container.confined());
+  container.write().value = 2;
+  REQUIRE(container.read().value == 2);
+  bool confined = true;
+  std::thread([&container, &confined] {
+    confined = container.confined();
+  }).join();
+  REQUIRE_FALSE(confined);
+  container.publish();
+  REQUIRE_FALSE(container.confined());
+  REQUIRE(container.read().value == 2);
+}
+
+TEST_CASE("container Confine") {
+  REQUIRE_FALSE(Confine::active());
+  {
+    const Confine outer;
+    {
+      const Confine inner;
+      REQUIRE(Confine::active());
+    }
+    REQUIRE(Confine::active());
+  }
+  REQUIRE_FALSE(Confine::active());
+}
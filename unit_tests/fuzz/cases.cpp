@@ -16,6 +16,7 @@
 #include <cstdint>
 #include <exception>
 #include <string>
+#include <tuple>
 
 namespace chimera::library {
   [[nodiscard]] auto fuzz_istream(const std::uint8_t *data, std::size_t size)
@@ -25,16 +26,23 @@ namespace chimera::library {
         std::string(reinterpret_cast<const char *>(data), size));
     return input;
   }
-  [[nodiscard]] auto fuzz_options() -> Options {
-    return {.chimera = "chimera", .exec = options::Script{"fuzzer.py"}};
+  [[nodiscard]] auto fuzz_options(const options::Optimize &optimize)
+      -> Options {
+    return {.chimera = "chimera",
+            .exec = options::Script{"fuzzer.py"},
+            .optimize = optimize};
   }
   [[nodiscard]] auto fuzz_expression_eval(const std::uint8_t *data,
                                           std::size_t size) -> int {
+    auto optimized = fuzz_istream(data, size);
+    std::ignore = fuzz_expression_eval(optimized, options::Optimize::BASIC);
     auto istream = fuzz_istream(data, size);
-    return fuzz_expression_eval(istream);
+    return fuzz_expression_eval(istream, options::Optimize::NONE);
   }
-  [[nodiscard]] auto fuzz_expression_eval(std::istream &input) -> int {
-    const auto options = fuzz_options();
+  [[nodiscard]] auto fuzz_expression_eval(std::istream &input,
+                                          const options::Optimize &optimize)
+      -> int {
+    const auto options = fuzz_options(optimize);
     auto globalContext = virtual_machine::make_global(options);
     auto processContext = virtual_machine::make_process(globalContext);
     std::optional<asdl::Expression> expression;
@@ -57,11 +65,14 @@ namespace chimera::library {
   }
   [[nodiscard]] auto fuzz_file_eval(const std::uint8_t *data, std::size_t size)
       -> int {
+    auto optimized = fuzz_istream(data, size);
+    std::ignore = fuzz_file_eval(optimized, options::Optimize::BASIC);
     auto istream = fuzz_istream(data, size);
-    return fuzz_file_eval(istream);
+    return fuzz_file_eval(istream, options::Optimize::NONE);
   }
-  [[nodiscard]] auto fuzz_file_eval(std::istream &input) -> int {
-    const auto options = fuzz_options();
+  [[nodiscard]] auto fuzz_file_eval(std::istream &input,
+                                    const options::Optimize &optimize) -> int {
+    const auto options = fuzz_options(optimize);
     auto globalContext = virtual_machine::make_global(options);
     auto processContext = virtual_machine::make_process(globalContext);
     std::optional<asdl::Module> module;
@@ -84,11 +95,15 @@ namespace chimera::library {
   }
   [[nodiscard]] auto fuzz_interactive_eval(const std::uint8_t *data,
                                            std::size_t size) -> int {
+    auto optimized = fuzz_istream(data, size);
+    std::ignore = fuzz_interactive_eval(optimized, options::Optimize::BASIC);
     auto istream = fuzz_istream(data, size);
-    return fuzz_interactive_eval(istream);
+    return fuzz_interactive_eval(istream, options::Optimize::NONE);
   }
-  [[nodiscard]] auto fuzz_interactive_eval(std::istream &input) -> int {
-    const auto options = fuzz_options();
+  [[nodiscard]] auto fuzz_interactive_eval(std::istream &input,
+                                           const options::Optimize &optimize)
+      -> int {
+    const auto options = fuzz_options(optimize);
     auto globalContext = virtual_machine::make_global(options);
     auto processContext = virtual_machine::make_process(globalContext);
     std::optional<asdl::Interactive> interactive;
@@ -12,7 +12,9 @@
 namespace chimera::library {
   [[nodiscard]] auto fuzz_istream(const std::uint8_t *data, std::size_t size)
       -> std::istringstream;
-  [[nodiscard]] auto fuzz_options() -> Options;
+  [[nodiscard]] auto
+  fuzz_options(const options::Optimize &optimize = options::Optimize::NONE)
+      -> Options;
   template <typename Grammar, typename... Args>
   [[nodiscard]] auto fuzz_parse(grammar::Input &&input, Args &&...args) -> int {
     const auto options = fuzz_options();
@@ -56,6 +58,10 @@ namespace chimera::library {
     try {
       grammar::parse<Grammar>(options::Optimize::NONE, std::move(input),
                               ASDL{});
+      // parses that succeed are folded too, so the optimizer sees them
+      auto optimized = fuzz_istream(data, size);
+      grammar::parse<Grammar>(options::Optimize::BASIC,
+                              grammar::Input(optimized, "<fuzz>"), ASDL{});
     } catch (const tao::pegtl::parse_error &) {
       return -1;
     } catch (const grammar::SyntaxError &) {
@@ -65,11 +71,16 @@ namespace chimera::library {
   }
   [[nodiscard]] auto fuzz_expression_eval(const std::uint8_t *data,
                                           std::size_t size) -> int;
-  [[nodiscard]] auto fuzz_expression_eval(std::istream &input) -> int;
+  [[nodiscard]] auto fuzz_expression_eval(std::istream &input,
+                                          const options::Optimize &optimize)
+      -> int;
   [[nodiscard]] auto fuzz_file_eval(const std::uint8_t *data, std::size_t size)
       -> int;
-  [[nodiscard]] auto fuzz_file_eval(std::istream &input) -> int;
+  [[nodiscard]] auto fuzz_file_eval(std::istream &input,
+                                    const options::Optimize &optimize) -> int;
   [[nodiscard]] auto fuzz_interactive_eval(const std::uint8_t *data,
                                            std::size_t size) -> int;
-  [[nodiscard]] auto fuzz_interactive_eval(std::istream &input) -> int;
+  [[nodiscard]] auto fuzz_interactive_eval(std::istream &input,
+                                           const options::Optimize &optimize)
+      -> int;
 } // namespace chimera::library
@@ -3,6 +3,8 @@
 
 #include <catch2/catch_test_macros.hpp>
 
+#include <cstdint>
+
 using namespace std::literals;
 
 TEST_CASE("grammar construct number `3.14`") {
@@ -28,3 +30,24 @@ TEST_CASE("grammar construct number `1j`") {
 TEST_CASE("grammar construct number `3e-333503335`") {
   REQUIRE_NOTHROW(chimera::library::test_parse("3e-333503335"s));
 }
+
+TEST_CASE("grammar construct number literal interned") {
+  using chimera::library::grammar::token::literal;
+  using chimera::library::object::Number;
+  using chimera::library::object::Symbol;
+  // past the inline range, so the value lives in the store
+  const Number huge(std::uint64_t{1} << 63U);
+  auto first = literal(Number(huge));
+  Number::flush();
+  const auto live = Number::stats().live;
+  const auto second = literal(Number(huge));
+  Number::flush();
+  REQUIRE(Number::stats().live == live);
+  REQUIRE(first.id() != second.id());
+  REQUIRE(*first.get<Number>() == *second.get<Number>());
+  first.set_attribute(Symbol("mutable"), literal(Number(1)));
+  REQUIRE_FALSE(second.has_attribute(Symbol("mutable")));
+  const auto imag = literal(huge.imag());
+  REQUIRE(imag.get<Number>()->is_complex());
+  REQUIRE_FALSE(first.get<Number>()->is_complex());
+}
@@ -0,0 +1,104 @@
+#include "asdl/asdl.hpp"
+#include "options.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <cstddef>
+#include <sstream>
+
+using namespace std::literals;
+using chimera::library::asdl::Module;
+using chimera::library::options::Optimize;
+
+namespace {
+  auto parse(const Optimize &optimize, const char *data) -> Module {
+    std::istringstream input{data};
+    return Module(optimize, input, "<unit>");
+  }
+} // namespace
+
+TEST_CASE("grammar optimize none") {
+  const auto module = parse(Optimize::NONE, "assert 1 + 2\nif False:\n  a\n");
+  REQUIRE(module.iter().size() == 2);
+}
+
+TEST_CASE("grammar optimize fold") {
+  const auto module =
+      parse(Optimize::BASIC, "a = 2 * 3 + 1\nb = 'x' + 'y'\nc = not 0\n");
+  REQUIRE(module.iter().size() == 3);
+  const auto a = module.iter()[0].get<chimera::library::asdl::Assign>();
+  REQUIRE(a);
+  const auto seven = a->value.get<chimera::library::object::Object>();
+  REQUIRE(seven);
+  REQUIRE(*seven->get<chimera::library::object::Number>() ==
+          chimera::library::object::Number(7));
+  const auto b = module.iter()[1].get<chimera::library::asdl::Assign>();
+  REQUIRE(b);
+  REQUIRE(*b->value.get<chimera::library::object::Object>()
+               ->get<chimera::library::object::String>() == "xy"s);
+  const auto c = module.iter()[2].get<chimera::library::asdl::Assign>();
+  REQUIRE(c);
+  REQUIRE(c->value.get<chimera::library::asdl::NameConstant>()->value ==
+          chimera::library::asdl::NameConstant::TRUE);
+}
+
+TEST_CASE("grammar optimize fold numbers") {
+  using chimera::library::asdl::Assign;
+  using chimera::library::asdl::Bin;
+  using chimera::library::object::Number;
+  using chimera::library::object::Object;
+  const auto module = parse(
+      Optimize::BASIC, "a = 1 << 3\nb = ~5\nc = +(-5)\nd = -7 // 2\n"
+                       "e = 1 // 0\nf = 1 / 0\ng = 1 % 0\nh = 1 << -1\n");
+  REQUIRE(module.iter().size() == 8);
+  const auto value = [&module](std::size_t idx) {
+    return module.iter()[idx].get<Assign>()->value;
+  };
+  REQUIRE(*value(0).get<Object>()->get<Number>() == Number(8));
+  REQUIRE(*value(1).get<Object>()->get<Number>() == -Number(6));
+  REQUIRE(*value(2).get<Object>()->get<Number>() == -Number(5));
+  REQUIRE(*value(3).get<Object>()->get<Number>() == -Number(4));
+  // these raise at run time, so they are left for it
+  for (std::size_t idx = 4; idx < 8; ++idx) {
+    REQUIRE(value(idx).get<Bin>());
+  }
+}
+
+TEST_CASE("grammar optimize dead code") {
+  const auto module = parse(Optimize::BASIC,
+                            "assert a\nif False:\n  a\nelif 1:\n  b\n  raise "
+                            "a\n  c\nelse:\n  d\nwhile 0:\n  e\ne\n");
+  REQUIRE(module.iter().size() == 2);
+  REQUIRE(module.iter()[1].get<chimera::library::asdl::Raise>());
+}
+
+TEST_CASE("grammar optimize docs") {
+  REQUIRE(parse(Optimize::BASIC, "'''doc'''\n").doc());
+  const auto module =
+      parse(Optimize::DISCARD_DOCS, "'''doc'''\ndef f():\n  '''doc'''\n");
+  REQUIRE_FALSE(module.doc());
+  const auto function =
+      module.iter().front().get<chimera::library::asdl::FunctionDef>();
+  REQUIRE(function);
+  REQUIRE_FALSE(function->doc_string);
+}
+
+TEST_CASE("grammar optimize fold strings") {
+  using chimera::library::asdl::Assign;
+  using chimera::library::asdl::Bin;
+  using chimera::library::object::Object;
+  using chimera::library::object::String;
+  const auto module =
+      parse(Optimize::BASIC, "a = 'ab' * 2\nb = 'ab' * 0\nc = 'ab' * 10**30\n"
+                             "d = '' * 10**18\ne = 'ab' * -1\n");
+  REQUIRE(module.iter().size() == 5);
+  const auto value = [&module](std::size_t idx) {
+    return module.iter()[idx].get<Assign>()->value;
+  };
+  REQUIRE(*value(0).get<Object>()->get<String>() == "abab"s);
+  REQUIRE(value(1).get<Object>()->get<String>()->empty());
+  // counts past the string limit are left for run time
+  for (std::size_t idx = 2; idx < 5; ++idx) {
+    REQUIRE(value(idx).get<Bin>());
+  }
+}
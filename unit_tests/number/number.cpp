@@ -3,8 +3,11 @@
 #include <catch2/catch_test_macros.hpp>
 #include <catch2/matchers/catch_matchers_floating_point.hpp>
 
+#include <array>
 #include <limits>
 #include <sstream>
+#include <thread>
+#include <vector>
 
 using chimera::library::object::number::Number;
 using NumericLimits = std::numeric_limits<std::uint64_t>;
@@ -213,3 +216,119 @@ TEST_CASE("number Number rational costly") {
   REQUIRE(third == (massive / extra));
   REQUIRE_THAT(double(third), Catch::Matchers::WithinRel(1.0 / 3.0));
 }
+
+TEST_CASE("number Number threads") {
+  const Number huge(NumericLimits::max());
+  // assertions are not thread safe, each thread counts its own mismatches
+  std::array<std::uint64_t, 8> mismatches{};
+  std::vector<std::thread> threads;
+  threads.reserve(mismatches.size());
+  for (std::uint64_t i = 0; i < mismatches.size(); ++i) {
+    threads.emplace_back([&huge, &mismatches, i] {
+      for (std::uint64_t j = 0; j < 1000; ++j) {
+        const auto number = huge * Number(i + j);
+        if ((number / huge) != Number(i + j)) {
+          ++mismatches.at(i);
+        }
+      }
+    });
+  }
+  for (auto &thread : threads) {
+    thread.join();
+  }
+  for (const auto mismatch : mismatches) {
+    REQUIRE(mismatch == 0);
+  }
+  REQUIRE(std::uint64_t(huge) == NumericLimits::max());
+}
+
+TEST_CASE("number Number small") {
+  const Number one(1);
+  const Number limit(static_cast<std::uint64_t>(
+      chimera::library::object::number::detail::SMALL_MAX));
+  auto number = limit;
+  number += one;
+  REQUIRE(number > limit);
+  REQUIRE((number - one) == limit);
+  number -= one;
+  number -= one;
+  REQUIRE(number < limit);
+  const auto negative = Number(0) - limit;
+  REQUIRE(std::int64_t(negative) == -std::int64_t(limit));
+  REQUIRE((negative - one - one) < negative);
+  REQUIRE(((negative - one - one) + one + one) == negative);
+  REQUIRE((limit * limit) > limit);
+  REQUIRE(((limit * limit) / limit) == limit);
+}
+
+TEST_CASE("number Number sum") {
+  const Number huge(NumericLimits::max());
+  std::vector<Number> numbers;
+  for (std::uint64_t i = 0; i < 100; ++i) {
+    numbers.emplace_back(i);
+  }
+  REQUIRE(std::uint64_t(Number::sum(numbers)) == 4950);
+  REQUIRE(Number::sum({}) == Number(0));
+  numbers.push_back(huge);
+  numbers.push_back(huge);
+  REQUIRE(Number::sum(numbers) == (huge + huge + Number(4950)));
+  const std::vector<Number> factors{Number(3), huge, Number(2)};
+  REQUIRE(Number::product(factors) == (huge * Number(6)));
+}
+
+TEST_CASE("number Number repr") {
+  const Number huge(NumericLimits::max());
+  const auto massive = huge * huge * huge * huge;
+  {
+    std::stringstream stream;
+    stream << (Number(0) - Number(42));
+    REQUIRE(stream.str() == "-42");
+  }
+  for (int i = 0; i < 2; ++i) {
+    std::stringstream stream;
+    stream << massive;
+    REQUIRE(stream.str() == "1157920892373161953984625780671411847999"
+                            "68521174335529155754622898352762650625");
+  }
+}
+
+TEST_CASE("number Number share") {
+  const Number huge(NumericLimits::max());
+  auto number = huge * huge;
+  const auto copy = number;
+  number.share();
+  REQUIRE(number == copy);
+  bool same = false;
+  std::thread([&number, &copy, &huge, &same] {
+    same = (number + copy) == (huge * huge * Number(2));
+  }).join();
+  REQUIRE(same);
+  REQUIRE(number == copy);
+}
+
+TEST_CASE("number Number flush") {
+  const Number huge(NumericLimits::max());
+  auto number = huge;
+  for (std::uint64_t i = 0; i < 1000; ++i) {
+    number = number + huge;
+  }
+  Number::flush();
+  REQUIRE(number == (huge * Number(1001)));
+  Number::flush();
+}
+
+TEST_CASE("number Number stats") {
+  const auto before = Number::stats();
+  {
+    const Number huge(NumericLimits::max());
+    const auto number = huge * huge;
+    REQUIRE(number > huge);
+    const auto during = Number::stats();
+    REQUIRE(during.news >= before.news + 2);
+    REQUIRE(during.gets > before.gets);
+    REQUIRE(during.peak_bytes > 0);
+  }
+  const auto after = Number::stats();
+  REQUIRE(after.deletes >= before.deletes + 2);
+  REQUIRE(after.live == before.live);
+}
@@ -0,0 +1,30 @@
+#include "object/object.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <string>
+#include <vector>
+
+using namespace std::literals;
+using chimera::library::object::Object;
+using chimera::library::object::Symbol;
+
+TEST_CASE("object Object destroy") {
+  Object object;
+  Object inner;
+  Object leaf;
+  inner.set_attribute(Symbol("leaf"), leaf);
+  object.set_attribute(Symbol("a"), inner);
+  object.set_attribute(Symbol("b"), inner);
+  inner.set_attribute(Symbol("cycle"), object);
+  std::vector<Object> drained;
+  inner.drain_attributes(drained);
+  REQUIRE(drained.size() == 2);
+  REQUIRE(inner.dir_size() == 0);
+  inner.set_attribute(Symbol("leaf"), leaf);
+  leaf.set_attribute(Symbol("c"), Object());
+  object.destroy();
+  REQUIRE(object.dir_size() == 0);
+  REQUIRE(inner.dir_size() == 0);
+  REQUIRE(leaf.dir_size() == 0);
+}
@@ -0,0 +1,102 @@
+#include "object/object.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <array>
+#include <string>
+#include <thread>
+#include <vector>
+
+using namespace std::literals;
+using chimera::library::object::Object;
+using chimera::library::object::Symbol;
+
+TEST_CASE("object Object inline cache") {
+  using chimera::library::object::InlineCache;
+  Object object;
+  Object first;
+  Object second;
+  object.set_attribute(Symbol("a"), first);
+  const InlineCache cache{};
+  REQUIRE_FALSE(object.find_cached(cache));
+  object.remember(Symbol("a"), 0, 0, cache);
+  REQUIRE(object.find_cached(cache)->id() == first.id());
+  object.set_attribute(Symbol("a"), second);
+  REQUIRE(object.find_cached(cache)->id() == second.id());
+  Object other;
+  other.set_attribute(Symbol("a"), first);
+  REQUIRE_FALSE(other.find_cached(cache));
+  object.set_attribute(Symbol("b"), first);
+  REQUIRE_FALSE(object.find_cached(cache));
+  object.set_attribute(Symbol("__getattribute__"), first);
+  const InlineCache skipped{};
+  object.remember(Symbol("a"), 0, 0, skipped);
+  REQUIRE_FALSE(object.find_cached(skipped));
+  Object module;
+  module.set_attribute(Symbol("__class__"), first);
+  module.set_attribute(Symbol("a"), first);
+  const InlineCache classed{};
+  module.remember(Symbol("a"), first.id(), first.version(), classed);
+  REQUIRE(module.find_cached(classed)->id() == first.id());
+  module.set_attribute(Symbol("__class__"), second);
+  REQUIRE_FALSE(module.find_cached(classed));
+}
+
+TEST_CASE("object Object inline cache follows its class") {
+  using chimera::library::object::InlineCache;
+  using chimera::library::object::Tuple;
+  Object base;
+  Object type({{Symbol("__mro__"), Object(Tuple{base}, {})}});
+  Object unrelated;
+  Object value;
+  REQUIRE_FALSE(type.lookup(Symbol("a")));
+  REQUIRE_FALSE(unrelated.lookup(Symbol("a")));
+  Object object;
+  object.set_attribute(Symbol("__class__"), type);
+  object.set_attribute(Symbol("a"), value);
+  const InlineCache cache{};
+  object.remember(Symbol("a"), type.id(), type.version(), cache);
+  REQUIRE(object.find_cached(cache)->id() == value.id());
+  unrelated.set_attribute(Symbol("b"), value);
+  REQUIRE(object.find_cached(cache)->id() == value.id());
+  base.set_attribute(Symbol("b"), value);
+  REQUIRE_FALSE(object.find_cached(cache));
+  object.remember(Symbol("a"), type.id(), type.version(), cache);
+  REQUIRE(object.find_cached(cache)->id() == value.id());
+  type.set_attribute(Symbol("b"), value);
+  REQUIRE_FALSE(object.find_cached(cache));
+}
+
+TEST_CASE("object Object inline cache shared between threads") {
+  using chimera::library::object::InlineCache;
+  Object first;
+  Object second;
+  Object value;
+  first.set_attribute(Symbol("a"), value);
+  second.set_attribute(Symbol("b"), first);
+  second.set_attribute(Symbol("a"), value);
+  first.publish();
+  second.publish();
+  const InlineCache cache{};
+  // one flag per thread, not vector<bool> whose bits share words
+  std::array<bool, 4> wrong{};
+  std::vector<std::thread> threads;
+  for (std::size_t idx = 0; idx < wrong.size(); ++idx) {
+    threads.emplace_back([&, idx] {
+      const auto &object = idx % 2 == 0 ? first : second;
+      for (int loop = 0; loop < 1000; ++loop) {
+        object.remember(Symbol("a"), 0, 0, cache);
+        if (const auto found = object.find_cached(cache);
+            found && found->id() != value.id()) {
+          wrong[idx] = true;
+        }
+      }
+    });
+  }
+  for (auto &thread : threads) {
+    thread.join();
+  }
+  for (const auto failed : wrong) {
+    REQUIRE_FALSE(failed);
+  }
+}
@@ -0,0 +1,95 @@
+#include "object/object.hpp"
+#include "object/pool.hpp"
+#include "virtual_machine/global_context.hpp"
+
+#include <catch2/benchmark/catch_benchmark.hpp>
+#include <catch2/catch_test_macros.hpp>
+
+#include <algorithm>
+#include <string>
+#include <thread>
+#include <vector>
+
+using chimera::library::object::Object;
+using chimera::library::object::PoolAllocator;
+using chimera::library::object::Symbol;
+namespace pool = chimera::library::object::pool;
+
+TEST_CASE("object pool reuse") {
+  auto *first = pool::allocate(24);
+  pool::deallocate(first, 24);
+  auto *second = pool::allocate(32);
+  REQUIRE(second == first);
+  auto *third = pool::allocate(48);
+  REQUIRE(third != first);
+  pool::deallocate(second, 32);
+  pool::deallocate(third, 48);
+}
+
+TEST_CASE("object pool cross thread free") {
+  std::vector<void *> blocks;
+  blocks.reserve(64);
+  for (auto count = 0; count < 64; ++count) {
+    blocks.push_back(pool::allocate(64));
+  }
+  std::thread([&blocks] {
+    for (auto *block : blocks) {
+      pool::deallocate(block, 64);
+    }
+  }).join();
+  // the freed blocks come back once the thread's own free list runs dry
+  std::vector<void *> taken;
+  bool found = false;
+  while (!found && taken.size() < 4096) {
+    taken.push_back(pool::allocate(64));
+    found = std::find(blocks.begin(), blocks.end(), taken.back()) !=
+            blocks.end();
+  }
+  REQUIRE(found);
+  for (auto *block : taken) {
+    pool::deallocate(block, 64);
+  }
+}
+
+TEST_CASE("object PoolAllocator") {
+  REQUIRE(pool::enabled());
+  const PoolAllocator<Object> pooled;
+  pool::enable(false);
+  const PoolAllocator<Object> plain;
+  pool::enable(true);
+  REQUIRE(pooled == PoolAllocator<int>(pooled));
+  REQUIRE_FALSE(pooled == plain);
+  Object object;
+  object.set_attribute(Symbol("a"), Object());
+  REQUIRE(object.has_attribute(Symbol("a")));
+}
+
+namespace chimera::library::object {
+  static auto run(const char *script) -> int {
+    const Options options{.chimera = "chimera",
+                          .exec = options::Command{script}};
+    return virtual_machine::make_global(options)->execute_script_string();
+  }
+} // namespace chimera::library::object
+
+TEST_CASE("object pool scripts", "[.][benchmark]") {
+  static constexpr auto TUPLES = "i = 0\n"
+                                 "while i < 2000:\n"
+                                 "    t = (i, (i, 'a'), (i, (i, None)))\n"
+                                 "    i = i + 1\n";
+  static constexpr auto STRINGS = "i = 0\n"
+                                  "while i < 2000:\n"
+                                  "    s = 'abc' + 'def' + 'ghi'\n"
+                                  "    i = i + 1\n";
+  for (const auto pooled : {true, false}) {
+    pool::enable(pooled);
+    const auto *name = pooled ? "pool" : "default";
+    BENCHMARK(std::string("tuples ") + name) {
+      return chimera::library::object::run(TUPLES);
+    };
+    BENCHMARK(std::string("strings ") + name) {
+      return chimera::library::object::run(STRINGS);
+    };
+  }
+  pool::enable(true);
+}
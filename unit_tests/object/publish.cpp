@@ -0,0 +1,28 @@
+#include "container/atomic_container.hpp"
+#include "object/object.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <cstdint>
+#include <limits>
+#include <optional>
+#include <thread>
+
+using chimera::library::object::Object;
+
+TEST_CASE("object Object publish number") {
+  using chimera::library::container::Confine;
+  using chimera::library::object::Number;
+  const Number huge(std::numeric_limits<std::uint64_t>::max());
+  std::optional<Object> object;
+  {
+    const Confine confine;
+    object.emplace(huge * huge, Object::BasicAttributes{});
+  }
+  object->publish();
+  bool same = false;
+  std::thread([&object, &huge, &same] {
+    same = *object->get<Number>() == huge * huge;
+  }).join();
+  REQUIRE(same);
+}
@@ -0,0 +1,41 @@
+#include "object/object.hpp"
+#include "object/registry.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <thread>
+
+using chimera::library::object::Object;
+using chimera::library::object::Registry;
+
+TEST_CASE("object Object id") {
+  const Object first;
+  const Object second;
+  REQUIRE(first.id() != 0);
+  REQUIRE(first.id() != second.id());
+  REQUIRE(Object(first).id() == first.id());
+  chimera::library::object::Id other = 0;
+  std::thread([&other] { other = Object().id(); }).join();
+  REQUIRE(other != 0);
+  REQUIRE(other != first.id());
+  REQUIRE(other != second.id());
+}
+
+TEST_CASE("object Registry") {
+  Registry registry;
+  const Object kept;
+  registry.insert(kept);
+  auto id = chimera::library::object::Id{};
+  {
+    const Object dropped;
+    id = dropped.id();
+    registry.insert(dropped);
+    REQUIRE(registry.find(id));
+  }
+  REQUIRE(registry.size() == 2);
+  REQUIRE(registry.find(kept.id())->id() == kept.id());
+  REQUIRE_FALSE(registry.find(id));
+  registry.prune();
+  REQUIRE(registry.size() == 1);
+  REQUIRE_FALSE(registry.find(0));
+}
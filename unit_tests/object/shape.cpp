@@ -0,0 +1,105 @@
+#include "object/object.hpp"
+#include "object/shape.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <string>
+#include <vector>
+
+using namespace std::literals;
+using chimera::library::object::Object;
+using chimera::library::object::Symbol;
+using chimera::library::object::Tuple;
+using chimera::library::object::internal::Shape;
+
+TEST_CASE("object Shape transitions") {
+  const auto empty = Shape::root();
+  REQUIRE(empty->size() == 0);
+  const auto first = empty->add(Symbol("a"));
+  REQUIRE(first == empty->add(Symbol("a")));
+  const auto second = first->add(Symbol("b"));
+  REQUIRE(second == Shape::of({Symbol("a"), Symbol("b")}));
+  REQUIRE(second != Shape::of({Symbol("b"), Symbol("a")}));
+  REQUIRE(second->find(Symbol("a")) == 0);
+  REQUIRE(second->find(Symbol("b")) == 1);
+  REQUIRE_FALSE(second->find(Symbol("c")));
+  REQUIRE(second->parent() == first);
+  REQUIRE(second->keys() == std::vector<std::string>{"a", "b"});
+  const auto branch = first->add(Symbol("c"));
+  REQUIRE(branch->find(Symbol("c")) == 1);
+  REQUIRE_FALSE(branch->find(Symbol("b")));
+  REQUIRE_FALSE(second->find(Symbol("c")));
+}
+
+TEST_CASE("object Shape limits") {
+  auto shape = Shape::root();
+  for (std::size_t count = 0; count < Shape::MAX_SIZE; ++count) {
+    shape = shape->add(Symbol("limit" + std::to_string(count)));
+  }
+  REQUIRE(shape->find(Symbol("limit0")) == 0);
+  REQUIRE(shape->find(Symbol("limit1023")) == Shape::MAX_SIZE - 1);
+  REQUIRE_FALSE(shape->add(Symbol("past")));
+  const auto wide = Shape::root()->add(Symbol("wide"));
+  std::vector<Shape::Pointer> children;
+  for (std::size_t count = 0; count < Shape::MAX_TRANSITIONS; ++count) {
+    children.push_back(wide->add(Symbol("wide" + std::to_string(count))));
+  }
+  REQUIRE_FALSE(wide->add(Symbol("past")));
+  children.pop_back();
+  REQUIRE(wide->add(Symbol("past")));
+}
+
+TEST_CASE("object Object attributes") {
+  Object object;
+  Object value;
+  object.set_attribute(Symbol("b"), value);
+  object.set_attribute(Symbol("a"), value);
+  REQUIRE(object.has_attribute(Symbol("a")));
+  REQUIRE(object.dir() == std::vector<std::string>{"a", "b"});
+  REQUIRE(object.dir_size() == 2);
+  object.delete_attribute(Symbol("b"));
+  REQUIRE_FALSE(object.has_attribute(Symbol("b")));
+  REQUIRE(object.dir() == std::vector<std::string>{"a"});
+  object.set_attribute(Symbol("b"), object.get_attribute(Symbol("a")));
+  REQUIRE(object.dir_size() == 2);
+}
+
+TEST_CASE("object Object dictionary") {
+  Object object;
+  Object first;
+  Object second;
+  Object third;
+  object.set_attribute(Symbol("a"), first);
+  object.set_attribute(Symbol("b"), second);
+  object.set_attribute(Symbol("c"), third);
+  object.delete_attribute(Symbol("a"));
+  REQUIRE(object.dir() == std::vector<std::string>{"b", "c"});
+  REQUIRE(object.get_attribute(Symbol("b")).id() == second.id());
+  REQUIRE(object.get_attribute(Symbol("c")).id() == third.id());
+  object.set_attribute(Symbol("a"), first);
+  REQUIRE(object.get_attribute(Symbol("a")).id() == first.id());
+  REQUIRE(object.dir_size() == 3);
+  Object large;
+  for (std::size_t count = 0; count <= Shape::MAX_SIZE; ++count) {
+    large.set_attribute(Symbol("large" + std::to_string(count)), first);
+  }
+  REQUIRE(large.dir_size() == Shape::MAX_SIZE + 1);
+  REQUIRE(large.has_attribute(Symbol("large1024")));
+}
+
+TEST_CASE("object Object lookup") {
+  Object base;
+  Object other;
+  Object type({{Symbol("__mro__"), Object(Tuple{other, base}, {})}});
+  base.set_attribute(Symbol("method"), Object("base"s, {}));
+  REQUIRE(type.lookup(Symbol("method"))->get<std::string>() == "base");
+  REQUIRE_FALSE(type.lookup(Symbol("missing")));
+  base.set_attribute(Symbol("method"), Object("replaced"s, {}));
+  REQUIRE(type.lookup(Symbol("method"))->get<std::string>() == "replaced");
+  other.set_attribute(Symbol("method"), Object("other"s, {}));
+  REQUIRE(type.lookup(Symbol("method"))->get<std::string>() == "other");
+  other.delete_attribute(Symbol("method"));
+  REQUIRE(type.lookup(Symbol("method"))->get<std::string>() == "replaced");
+  other.set_attribute(Symbol("missing"), Object("other"s, {}));
+  REQUIRE(type.lookup(Symbol("missing")));
+}
@@ -0,0 +1,51 @@
+#include "object/object.hpp"
+#include "virtual_machine/evaluator.hpp"
+#include "virtual_machine/global_context.hpp"
+#include "virtual_machine/thread_context.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <string>
+
+using namespace std::literals;
+using chimera::library::object::Object;
+using chimera::library::object::Symbol;
+using chimera::library::object::Tuple;
+
+TEST_CASE("object singleton") {
+  using chimera::library::object::None;
+  using chimera::library::object::singleton;
+  using chimera::library::object::True;
+  REQUIRE(singleton<None>().id() == singleton<None>().id());
+  REQUIRE(singleton<None>().id() != singleton<True>().id());
+  REQUIRE(singleton<None>().get<None>());
+  REQUIRE(singleton<Tuple>().get<Tuple>()->empty());
+  REQUIRE(singleton<True>().dir_size() == 0);
+}
+
+TEST_CASE("object singleton class_of") {
+  using namespace chimera::library;
+  const Options options{.chimera = "chimera",
+                        .exec = options::Script{"test.py"}};
+  auto globalContext = virtual_machine::make_global(options);
+  auto processContext = virtual_machine::make_process(globalContext);
+  auto threadContext = virtual_machine::make_thread(
+      processContext, processContext->make_module("__main__"));
+  const virtual_machine::Evaluator evaluator(threadContext);
+  const auto &builtins = evaluator.builtins();
+  const auto boolClass = builtins.get_attribute(Symbol("bool")).id();
+  REQUIRE(evaluator.class_of(object::singleton<object::True>()).id() ==
+          boolClass);
+  REQUIRE(evaluator.class_of(object::singleton<object::False>()).id() ==
+          boolClass);
+  REQUIRE(evaluator.class_of(object::singleton<Tuple>()).id() ==
+          builtins.get_attribute(Symbol("tuple")).id());
+  REQUIRE(evaluator.class_of(Object("text"s, {})).id() ==
+          builtins.get_attribute(Symbol("str")).id());
+  Object classed;
+  classed.set_attribute(Symbol("__class__"),
+                        builtins.get_attribute(Symbol("tuple")));
+  REQUIRE(evaluator.class_of(classed).id() ==
+          builtins.get_attribute(Symbol("tuple")).id());
+  REQUIRE_THROWS_AS(evaluator.class_of(Object()), object::AttributeError);
+}
@@ -0,0 +1,32 @@
+#include "object/symbol.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <string>
+
+using namespace std::literals;
+using chimera::library::object::Symbol;
+
+TEST_CASE("object Symbol") {
+  const Symbol empty;
+  REQUIRE(empty.id() == 0);
+  REQUIRE(empty.name().empty());
+  REQUIRE(empty == Symbol(""));
+  const Symbol symbol("object Symbol"s);
+  REQUIRE(symbol != empty);
+  REQUIRE(symbol == Symbol("object Symbol"));
+  REQUIRE(symbol == chimera::library::object::Symbol("object Symbol"sv));
+  REQUIRE(symbol.name() == "object Symbol");
+  REQUIRE(chimera::library::object::symbols::ADD.name() == "__add__");
+}
+
+TEST_CASE("object Symbol names stay put") {
+  const Symbol first("object Symbol names 0");
+  const auto &name = first.name();
+  for (int idx = 1; idx < 1000; ++idx) {
+    const auto text = "object Symbol names "s + std::to_string(idx);
+    REQUIRE(Symbol(text).name() == text);
+  }
+  REQUIRE(&first.name() == &name);
+  REQUIRE(name == "object Symbol names 0");
+}
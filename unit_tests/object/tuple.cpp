@@ -0,0 +1,31 @@
+#include "object/object.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+using chimera::library::object::Object;
+using chimera::library::object::Tuple;
+
+TEST_CASE("object Tuple slice") {
+  const Object first;
+  const Object second;
+  const Object third;
+  const Tuple tuple{first, second, third};
+  const auto count = first.use_count();
+  const auto slice = tuple.slice(1, 10);
+  REQUIRE(slice.size() == 2);
+  REQUIRE(slice.front().id() == second.id());
+  REQUIRE(slice[1].id() == third.id());
+  REQUIRE(second.use_count() == count);
+  REQUIRE(tuple.slice(2, 1).empty());
+  REQUIRE(slice.slice(1, 2).front().id() == third.id());
+}
+
+TEST_CASE("object Tuple move") {
+  const Object item;
+  Tuple tuple{item};
+  const Tuple moved(std::move(tuple));
+  // NOLINTNEXTLINE(bugprone-use-after-move,hicpp-invalid-access-moved)
+  REQUIRE(tuple.empty());
+  REQUIRE(moved.size() == 1);
+  REQUIRE(Object(Tuple{}, {}).get<Tuple>()->empty());
+}
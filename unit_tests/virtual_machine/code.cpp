@@ -0,0 +1,296 @@
+#include "virtual_machine/code.hpp"
+#include "virtual_machine/evaluator.hpp"
+#include "virtual_machine/global_context.hpp"
+#include "virtual_machine/thread_context.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <algorithm>
+#include <sstream>
+#include <string>
+#include <string_view>
+#include <utility>
+#include <vector>
+
+using namespace std::literals;
+using chimera::library::object::Symbol;
+using chimera::library::virtual_machine::OpCode;
+
+namespace chimera::library::virtual_machine {
+  static auto parse_module(const char *data) -> asdl::Module {
+    const Options options{.chimera = "chimera",
+                          .exec = options::Script{"test.py"}};
+    auto globalContext = make_global(options);
+    auto processContext = make_process(globalContext);
+    std::istringstream input{data};
+    return processContext->parse_file(input, "<test>");
+  }
+} // namespace chimera::library::virtual_machine
+
+TEST_CASE("virtual_machine compile while") {
+  const auto module = chimera::library::virtual_machine::parse_module(
+      "a = 1\nwhile a:\n    break\nelse:\n    a = 2\n");
+  const auto code = chimera::library::virtual_machine::compile(module);
+  std::vector<OpCode> ops;
+  for (const auto &instruction : code.instructions) {
+    ops.push_back(instruction.op);
+  }
+  REQUIRE(ops == std::vector<OpCode>{OpCode::CONST, OpCode::STORE_NAME,
+                                     OpCode::CONST, OpCode::STORE_NAME,
+                                     OpCode::LOAD_NAME, OpCode::JUMP_IF_FALSE,
+                                     OpCode::JUMP, OpCode::JUMP, OpCode::CONST,
+                                     OpCode::STORE_NAME});
+  REQUIRE(code.instructions[5].arg == 8);
+  REQUIRE(code.instructions[6].arg == 10);
+  REQUIRE(code.instructions[7].arg == 4);
+}
+
+TEST_CASE("virtual_machine compile fallback") {
+  const auto module =
+      chimera::library::virtual_machine::parse_module("import sys\nx[0] = 1\n");
+  const auto code = chimera::library::virtual_machine::compile(module);
+  REQUIRE(code.instructions.size() == 5);
+  REQUIRE(code.instructions[2].op == OpCode::STMT);
+  REQUIRE(code.instructions[4].op == OpCode::STORE);
+  REQUIRE(code.stmts.size() == 1);
+  REQUIRE(code.exprs.size() == 1);
+}
+
+TEST_CASE("virtual_machine compile attributes and calls") {
+  const auto module =
+      chimera::library::virtual_machine::parse_module("a.b = f(x, 1).c\n");
+  const auto code = chimera::library::virtual_machine::compile(module);
+  std::vector<OpCode> ops;
+  for (const auto &instruction : code.instructions) {
+    ops.push_back(instruction.op);
+  }
+  REQUIRE(ops == std::vector<OpCode>{
+                     OpCode::CONST, OpCode::STORE_NAME, OpCode::LOAD_NAME,
+                     OpCode::LOAD_NAME, OpCode::CONST, OpCode::CALL,
+                     OpCode::LOAD_ATTR, OpCode::LOAD_NAME, OpCode::STORE_ATTR});
+  REQUIRE(code.instructions[5].arg == 2);
+  REQUIRE(code.names[code.instructions[6].arg] == Symbol("c"));
+  REQUIRE(code.names[code.instructions[8].arg] == Symbol("b"));
+  REQUIRE(code.exprs.empty());
+}
+
+TEST_CASE("virtual_machine compile return") {
+  using chimera::library::virtual_machine::compile;
+  using chimera::library::virtual_machine::parse_module;
+  const auto bare = compile(parse_module("return\n"));
+  REQUIRE(bare.instructions.size() == 1);
+  REQUIRE(bare.instructions[0].op == OpCode::RETURN);
+  REQUIRE(bare.instructions[0].arg == 0);
+  const auto value = compile(parse_module("return 1\n"));
+  REQUIRE(value.instructions.size() == 2);
+  REQUIRE(value.instructions[1].op == OpCode::RETURN);
+  REQUIRE(value.instructions[1].arg == 1);
+}
+
+TEST_CASE("virtual_machine evaluate code") {
+  using namespace chimera::library;
+  const Options options{.bytecode = true,
+                        .chimera = "chimera",
+                        .exec = options::Script{"test.py"}};
+  auto globalContext = virtual_machine::make_global(options);
+  auto processContext = virtual_machine::make_process(globalContext);
+  std::istringstream input{"a = b = (None, True)\n"};
+  const auto module = processContext->parse_file(input, "<test>");
+  auto main = processContext->make_module("__main__");
+  auto threadContext = virtual_machine::make_thread(processContext, main);
+  const auto code = virtual_machine::compile(module);
+  virtual_machine::Evaluator(threadContext).evaluate(code);
+  REQUIRE(main.get_attribute(Symbol("a")).id() ==
+          main.get_attribute(Symbol("b")).id());
+  REQUIRE(main.get_attribute(Symbol("a")).get<object::Tuple>()->size() == 2);
+}
+
+TEST_CASE("virtual_machine evaluate name cache") {
+  using namespace chimera::library;
+  const Options options{.bytecode = true,
+                        .chimera = "chimera",
+                        .exec = options::Script{"test.py"}};
+  auto globalContext = virtual_machine::make_global(options);
+  auto processContext = virtual_machine::make_process(globalContext);
+  // b is bound before a is read so the module keeps its shape after
+  std::istringstream input{"a = 1\nb = None\nb = a\nb = a\n"};
+  const auto module = processContext->parse_file(input, "<test>");
+  auto main = processContext->make_module("__main__");
+  auto threadContext = virtual_machine::make_thread(processContext, main);
+  const auto code = virtual_machine::compile(module);
+  virtual_machine::Evaluator(threadContext).evaluate(code);
+  const auto load = std::ranges::find(code.instructions, OpCode::LOAD_NAME,
+                                      &virtual_machine::Instruction::op);
+  REQUIRE(load != code.instructions.end());
+  const auto cached = main.find_cached(code.caches[load->arg]);
+  REQUIRE(cached);
+  REQUIRE(cached->id() == main.get_attribute(Symbol("a")).id());
+}
+
+TEST_CASE("virtual_machine evaluate numbers") {
+  using namespace chimera::library;
+  for (const auto bytecode : {false, true}) {
+    const Options options{.bytecode = bytecode,
+                          .chimera = "chimera",
+                          .exec = options::Script{"test.py"}};
+    auto globalContext = virtual_machine::make_global(options);
+    auto processContext = virtual_machine::make_process(globalContext);
+    std::istringstream input{
+        "a = 7 - 2 - 1\nb = 2 ** 3 ** 2\nc = -a << 2 | 1\nd = not 0\n"
+        "e = -7 // 2\nf = -7 % 3\ng = ~5\nh = +(-5)\ni = 1 << 3 >> 1\n"
+        "j = a + 2 + a * a * 3\n"};
+    const auto module = processContext->parse_file(input, "<test>");
+    auto main = processContext->make_module("__main__");
+    auto threadContext = virtual_machine::make_thread(processContext, main);
+    if (bytecode) {
+      const auto code = virtual_machine::compile(module);
+      virtual_machine::Evaluator(threadContext).evaluate(code);
+    } else {
+      virtual_machine::Evaluator(threadContext).evaluate(module);
+    }
+    REQUIRE(*main.get_attribute(Symbol("a")).get<object::Number>() ==
+            object::Number(4));
+    REQUIRE(*main.get_attribute(Symbol("b")).get<object::Number>() ==
+            object::Number(512));
+    REQUIRE(*main.get_attribute(Symbol("c")).get<object::Number>() ==
+            -object::Number(15));
+    REQUIRE(main.get_attribute(Symbol("d")).get_bool());
+    REQUIRE(*main.get_attribute(Symbol("e")).get<object::Number>() ==
+            -object::Number(4));
+    REQUIRE(*main.get_attribute(Symbol("f")).get<object::Number>() ==
+            object::Number(2));
+    REQUIRE(*main.get_attribute(Symbol("g")).get<object::Number>() ==
+            -object::Number(6));
+    REQUIRE(*main.get_attribute(Symbol("h")).get<object::Number>() ==
+            -object::Number(5));
+    REQUIRE(*main.get_attribute(Symbol("i")).get<object::Number>() ==
+            object::Number(4));
+    REQUIRE(*main.get_attribute(Symbol("j")).get<object::Number>() ==
+            object::Number(54));
+  }
+}
+
+TEST_CASE("virtual_machine evaluate strings") {
+  using namespace chimera::library;
+  for (const auto bytecode : {false, true}) {
+    const Options options{.bytecode = bytecode,
+                          .chimera = "chimera",
+                          .exec = options::Script{"test.py"}};
+    auto globalContext = virtual_machine::make_global(options);
+    auto processContext = virtual_machine::make_process(globalContext);
+    std::istringstream input{
+        "s = 'ab'\nt = s + 'c'\nu = s * 3\nv = 2 * s\nw = s * -1\n"};
+    const auto module = processContext->parse_file(input, "<test>");
+    auto main = processContext->make_module("__main__");
+    auto threadContext = virtual_machine::make_thread(processContext, main);
+    if (bytecode) {
+      const auto code = virtual_machine::compile(module);
+      virtual_machine::Evaluator(threadContext).evaluate(code);
+    } else {
+      virtual_machine::Evaluator(threadContext).evaluate(module);
+    }
+    REQUIRE(*main.get_attribute(Symbol("t")).get<object::String>() == "abc"s);
+    REQUIRE(*main.get_attribute(Symbol("u")).get<object::String>() ==
+            "ababab"s);
+    REQUIRE(*main.get_attribute(Symbol("v")).get<object::String>() == "abab"s);
+    REQUIRE(main.get_attribute(Symbol("w")).get<object::String>()->empty());
+  }
+}
+
+TEST_CASE("virtual_machine evaluate number errors") {
+  using namespace chimera::library;
+  for (const auto bytecode : {false, true}) {
+    for (const auto &[source, error] :
+         {std::pair{"x = 1 // 0\n", "ZeroDivisionError"},
+          std::pair{"x = 1 / 0\n", "ZeroDivisionError"},
+          std::pair{"x = 1 % 0\n", "ZeroDivisionError"},
+          std::pair{"x = 0 ** -1\n", "ZeroDivisionError"},
+          std::pair{"x = 1 << -1\n", "ValueError"},
+          std::pair{"x = 1 // 0 // y\n", "ZeroDivisionError"},
+          std::pair{"x = 1 + 2 + 3 - 1 % 0 - y\n", "ZeroDivisionError"},
+          std::pair{"x = 'ab' * 10 ** 30\n", "OverflowError"},
+          std::pair{"x = id()\n", "TypeError"}}) {
+      const Options options{.bytecode = bytecode,
+                            .chimera = "chimera",
+                            .exec = options::Script{"test.py"}};
+      auto globalContext = virtual_machine::make_global(options);
+      auto processContext = virtual_machine::make_process(globalContext);
+      std::istringstream input{source};
+      const auto module = processContext->parse_file(input, "<test>");
+      auto main = processContext->make_module("__main__");
+      auto threadContext = virtual_machine::make_thread(processContext, main);
+      virtual_machine::Evaluator evaluator(threadContext);
+      const auto expected =
+          evaluator.builtins().get_attribute(Symbol(error)).id();
+      try {
+        if (bytecode) {
+          evaluator.evaluate(virtual_machine::compile(module));
+        } else {
+          evaluator.evaluate(module);
+        }
+        FAIL(source);
+      } catch (const object::BaseException &exception) {
+        REQUIRE(exception.id() == expected);
+      }
+    }
+  }
+}
+
+TEST_CASE("virtual_machine evaluate native calls") {
+  using namespace chimera::library;
+  for (const auto bytecode : {false, true}) {
+    const Options options{.bytecode = bytecode,
+                          .chimera = "chimera",
+                          .exec = options::Script{"test.py"}};
+    auto globalContext = virtual_machine::make_global(options);
+    auto processContext = virtual_machine::make_process(globalContext);
+    std::istringstream input{
+        "stats = sys._number_stats()\na = ()\nb = id(a)\n"};
+    const auto module = processContext->parse_file(input, "<test>");
+    auto main = processContext->make_module("__main__");
+    auto threadContext = virtual_machine::make_thread(processContext, main);
+    main.set_attribute(Symbol("sys"),
+                       threadContext->import_object("__main__"sv, "sys"sv));
+    virtual_machine::Evaluator evaluator(threadContext);
+    if (bytecode) {
+      evaluator.evaluate(virtual_machine::compile(module));
+    } else {
+      evaluator.evaluate(module);
+    }
+    const auto stats = main.get_attribute(Symbol("stats")).get<object::Tuple>();
+    REQUIRE(stats);
+    REQUIRE(stats->size() == 7);
+    REQUIRE(*main.get_attribute(Symbol("b")).get<object::Number>() ==
+            object::Number(main.get_attribute(Symbol("a")).id()));
+  }
+}
+
+TEST_CASE("virtual_machine evaluate attributes") {
+  using namespace chimera::library;
+  for (const auto bytecode : {false, true}) {
+    const Options options{.bytecode = bytecode,
+                          .chimera = "chimera",
+                          .exec = options::Script{"test.py"}};
+    auto globalContext = virtual_machine::make_global(options);
+    auto processContext = virtual_machine::make_process(globalContext);
+    std::istringstream input{"sys.x = id(())\ny = sys.x\nsys.z = w = 1\n"};
+    const auto module = processContext->parse_file(input, "<test>");
+    auto main = processContext->make_module("__main__");
+    auto threadContext = virtual_machine::make_thread(processContext, main);
+    const auto sys = threadContext->import_object("__main__"sv, "sys"sv);
+    main.set_attribute(Symbol("sys"), sys);
+    virtual_machine::Evaluator evaluator(threadContext);
+    if (bytecode) {
+      evaluator.evaluate(virtual_machine::compile(module));
+    } else {
+      evaluator.evaluate(module);
+    }
+    REQUIRE(sys.get_attribute(Symbol("x")).get<object::Number>());
+    REQUIRE(main.get_attribute(Symbol("y")).id() ==
+            sys.get_attribute(Symbol("x")).id());
+    REQUIRE(*sys.get_attribute(Symbol("z")).get<object::Number>() ==
+            object::Number(1));
+    REQUIRE(*main.get_attribute(Symbol("w")).get<object::Number>() ==
+            object::Number(1));
+  }
+}
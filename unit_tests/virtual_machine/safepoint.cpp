@@ -0,0 +1,58 @@
+#include "virtual_machine/safepoint.hpp"
+
+#include "object/object.hpp"
+#include "virtual_machine/evaluator.hpp"
+#include "virtual_machine/global_context.hpp"
+#include "virtual_machine/thread_context.hpp"
+
+#include <catch2/catch_test_macros.hpp>
+
+#include <cstdint>
+#include <sstream>
+#include <thread>
+
+TEST_CASE("virtual_machine Safepoint requests") {
+  using namespace chimera::library;
+  auto &safepoint = virtual_machine::Safepoint::current();
+  REQUIRE_NOTHROW(safepoint.poll());
+  const auto epoch = safepoint.epoch();
+  safepoint.request(virtual_machine::Request::COLLECT);
+  safepoint.request(virtual_machine::Request::PREEMPT);
+  REQUIRE(safepoint.epoch() == epoch);
+  REQUIRE_NOTHROW(safepoint.poll());
+  REQUIRE(safepoint.epoch() == epoch + 1);
+  safepoint.request(virtual_machine::Request::INTERRUPT);
+  REQUIRE_THROWS_AS(safepoint.poll(), object::KeyboardInterrupt);
+  REQUIRE_NOTHROW(safepoint.poll());
+}
+
+TEST_CASE("virtual_machine Safepoint request_all") {
+  using namespace chimera::library;
+  auto &safepoint = virtual_machine::Safepoint::current();
+  std::uint64_t epoch = 0;
+  std::thread([&epoch] {
+    auto &other = virtual_machine::Safepoint::current();
+    virtual_machine::Safepoint::request_all(virtual_machine::Request::COLLECT);
+    other.poll();
+    epoch = other.epoch();
+  }).join();
+  REQUIRE(epoch == 1);
+  const auto before = safepoint.epoch();
+  safepoint.poll();
+  REQUIRE(safepoint.epoch() == before + 1);
+}
+
+TEST_CASE("virtual_machine Safepoint signal") {
+  using namespace chimera::library;
+  const Options options{.chimera = "chimera",
+                        .exec = options::Script{"test.py"}};
+  auto globalContext = virtual_machine::make_global(options);
+  auto processContext = virtual_machine::make_process(globalContext);
+  std::istringstream input{"while 1:\n    pass\n"};
+  auto module = processContext->parse_file(input, "<test>");
+  auto threadContext = virtual_machine::make_thread(
+      processContext, processContext->make_module("__main__"));
+  virtual_machine::Safepoint::signal(virtual_machine::Request::INTERRUPT);
+  REQUIRE_THROWS_AS(virtual_machine::Evaluator(threadContext).evaluate(module),
+                    object::KeyboardInterrupt);
+}
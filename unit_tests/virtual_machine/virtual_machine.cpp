@@ -22,6 +22,28 @@ namespace chimera::library::virtual_machine {
   }
 } // namespace chimera::library::virtual_machine
 
+TEST_CASE("virtual_machine Evaluator stack windows") {
+  using namespace chimera::library;
+  const Options options{.chimera = "chimera",
+                        .exec = options::Script{"test.py"}};
+  auto globalContext = virtual_machine::make_global(options);
+  auto processContext = virtual_machine::make_process(globalContext);
+  auto main = processContext->make_module("__main__");
+  auto threadContext = virtual_machine::make_thread(processContext, main);
+  virtual_machine::Evaluator evaluator(threadContext);
+  const auto first = object::singleton<object::None>();
+  const auto second = object::singleton<object::True>();
+  evaluator.stack_push(first);
+  evaluator.stack_push(second);
+  evaluator.stack_push(first);
+  REQUIRE(evaluator.stack_window(1).size() == 2);
+  REQUIRE(evaluator.stack_window(1).front().id() == second.id());
+  REQUIRE(evaluator.stack_window(0).size() == 3);
+  evaluator.stack_truncate(1);
+  REQUIRE(evaluator.stack_size() == 1);
+  REQUIRE(evaluator.stack_remove().id() == first.id());
+}
+
 TEST_CASE("grammar VirtualMachine ``") {
   SECTION("destructor") {
     REQUIRE_NOTHROW(chimera::library::virtual_machine::parse_file(""sv));
@@ -40,9 +62,8 @@ TEST_CASE("grammar VirtualMachine `a@b=c`") {
 }
 
 TEST_CASE("grammar VirtualMachine `0x10 & 0x01`") {
-  REQUIRE_THROWS_AS(
-      chimera::library::virtual_machine::parse_file("0x10 & 0x01"sv),
-      chimera::library::object::BaseException);
+  REQUIRE_NOTHROW(
+      chimera::library::virtual_machine::parse_file("0x10 & 0x01"sv));
 }
 
 TEST_CASE("grammar VirtualMachine `()`") {